@@ -4,6 +4,7 @@ from app.models.pydantic.models import AuditLogCreate, AuditLogResponse, UserInD
 from app.core.auth import get_current_user
 from app.core.database import get_db
 from datetime import datetime, date
+from app.utils.date_utils import date_range_condition
 import json
 import logging
 
@@ -32,13 +33,13 @@ async def get_audit_logs(
         conditions = []
         params = []
         
-        if from_date:
-            conditions.append("DATE(timestamp) >= %s")
-            params.append(from_date)
-        
-        if to_date:
-            conditions.append("DATE(timestamp) <= %s")
-            params.append(to_date)
+        try:
+            date_condition, date_params = date_range_condition("timestamp", from_date, to_date)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if date_condition:
+            conditions.append(date_condition)
+            params.extend(date_params)
         
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
@@ -76,6 +77,8 @@ async def get_audit_logs(
         logger.info(f"✅ Returning {len(logs)} audit logs")
         return logs
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting audit logs: {e}")
         import traceback
@@ -176,13 +179,13 @@ async def get_audit_logs_count(
         conditions = []
         params = []
         
-        if from_date:
-            conditions.append("DATE(timestamp) >= %s")
-            params.append(from_date)
-        
-        if to_date:
-            conditions.append("DATE(timestamp) <= %s")
-            params.append(to_date)
+        try:
+            date_condition, date_params = date_range_condition("timestamp", from_date, to_date)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if date_condition:
+            conditions.append(date_condition)
+            params.extend(date_params)
         
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
@@ -191,6 +194,8 @@ async def get_audit_logs_count(
         
         return {"count": result[0]['count']}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting audit logs count: {e}")
         raise HTTPException(
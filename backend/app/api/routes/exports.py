@@ -0,0 +1,172 @@
+"""
+Data Export API Routes
+======================
+Typed columnar dataset files (Parquet / Arrow) for analytics - Super Admin only
+
+GET /exports/datasets                              datasets, formats, watermark kind
+GET /exports/{dataset}?format=parquet&since=...    the file; X-Export-Watermark is the
+                                                   `since` of the next incremental export
+
+IMPORTANT: ALL business logic in backend, NO logic in frontend
+Writing the files lives in app/services/storage/columnar_exports.py
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
+from datetime import datetime
+from typing import Optional
+import asyncio
+import time
+from app.models.pydantic.models import UserInDB
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.permissions import log_unauthorized_access
+from app.services.storage.columnar_exports import (
+    EXPORT_DATASETS,
+    COLUMNAR_EXPORT_FORMATS,
+    columnar_export_available,
+    parse_export_watermark,
+    run_columnar_export
+)
+from app.services.storage.report_artifacts import staging_path
+from app.utils.report_logger import log_report_generation
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/exports", tags=["Data Exports"])
+
+# format → report_logs.report_type
+EXPORT_LOG_TYPES = {'parquet': 'Parquet', 'arrow': 'Arrow'}
+
+
+def _check_super_admin(db, current_user: UserInDB, endpoint: str):
+    if current_user.role != "Super Admin":
+        log_unauthorized_access(db, current_user, endpoint, "Super Admin")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access Denied: Only Super Admin can export datasets"
+        )
+
+
+@router.get("/datasets")
+async def get_export_datasets(
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Datasets that can be exported, their columns and how incremental exports are tracked
+    REQUIRES: Super Admin
+    """
+    try:
+        db = get_db()
+        _check_super_admin(db, current_user, "get_export_datasets")
+
+        return {
+            'datasets': [
+                {
+                    'dataset': dataset,
+                    'watermark': spec['watermark'],
+                    'columns': [{'name': column, 'type': kind} for column, kind in spec['columns']]
+                }
+                for dataset, spec in EXPORT_DATASETS.items()
+            ],
+            'formats': list(COLUMNAR_EXPORT_FORMATS),
+            'available': columnar_export_available()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error listing export datasets: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing export datasets: {str(e)}"
+        )
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: str,
+    format: str = "parquet",
+    since: Optional[str] = None,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Export a dataset as a Parquet / Arrow IPC file
+    - since: watermark from the previous export (X-Export-Watermark) - only rows changed
+      since then; omit for a full export
+    REQUIRES: Super Admin
+    """
+    db = get_db()
+    _check_super_admin(db, current_user, "export_dataset")
+
+    file_format = format.lower()
+    try:
+        if file_format not in COLUMNAR_EXPORT_FORMATS:
+            raise ValueError(f"Invalid format '{format}'. Must be one of: {', '.join(COLUMNAR_EXPORT_FORMATS)}")
+        since_value = parse_export_watermark(dataset, since)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not columnar_export_available():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Columnar exports need the pyarrow package on the server (pip install -r requirements.txt)"
+        )
+
+    extension, media_type = COLUMNAR_EXPORT_FORMATS[file_format]
+    report_name = f"Data Export - {dataset}"
+    filters = {'dataset': dataset, 'since': since} if since else {'dataset': dataset}
+    file_name = f"{dataset}{'_incremental' if since_value is not None else ''}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    staged = staging_path(file_name)
+    started = time.perf_counter()
+
+    try:
+        # Streams on its own connection in a worker thread - the event loop stays free
+        result = await asyncio.to_thread(run_columnar_export, dataset, file_format, staged, since_value)
+    except Exception as e:
+        staged.unlink(missing_ok=True)
+        logger.error(f"❌ Error exporting {dataset}: {e}")
+        log_report_generation(
+            db=db,
+            report_name=report_name,
+            report_type=EXPORT_LOG_TYPES[file_format],
+            user_id=current_user.id,
+            user_name=current_user.full_name or current_user.username,
+            user_role=current_user.role,
+            report_filters=filters,
+            generation_time_ms=int((time.perf_counter() - started) * 1000),
+            status="failed",
+            error_message=str(e)
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error exporting {dataset}: {str(e)}"
+        )
+
+    log_report_generation(
+        db=db,
+        report_name=report_name,
+        report_type=EXPORT_LOG_TYPES[file_format],
+        user_id=current_user.id,
+        user_name=current_user.full_name or current_user.username,
+        user_role=current_user.role,
+        report_filters=filters,
+        record_count=result['row_count'],
+        file_size_kb=round(result['size_bytes'] / 1024, 2),
+        generation_time_ms=result['export_time_ms'],
+        status="success"
+    )
+
+    return FileResponse(
+        staged,
+        media_type=media_type,
+        filename=file_name,
+        headers={
+            "X-Export-Watermark": result['watermark'],
+            "X-Export-Row-Count": str(result['row_count']),
+            "X-Export-Row-Groups": str(result['row_groups'])
+        },
+        background=BackgroundTask(staged.unlink, missing_ok=True)
+    )
@@ -15,6 +15,7 @@ from app.models.pydantic.models import (
 from app.core.auth import get_current_user
 from app.core.database import get_db
 from app.core.permissions import has_permission, log_unauthorized_access
+from app.utils.date_utils import date_range_condition
 from datetime import datetime
 import logging
 import json
@@ -147,13 +148,13 @@ async def get_grievances(
             query += " AND g.investor_id = %s"
             params.append(investor_id)
 
-        if from_date:
-            query += " AND DATE(g.created_at) >= %s"
-            params.append(from_date)
-
-        if to_date:
-            query += " AND DATE(g.created_at) <= %s"
-            params.append(to_date)
+        try:
+            date_condition, date_params = date_range_condition("g.created_at", from_date, to_date)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if date_condition:
+            query += f" AND {date_condition}"
+            params.extend(date_params)
 
         if search:
             query += """ AND (
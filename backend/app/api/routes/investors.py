@@ -9,10 +9,14 @@ from app.core.database import get_db
 from app.models.pydantic.models import (
     InvestorCreate, InvestorUpdate, InvestorResponse, InvestorWithDetails,
     InvestmentCreate, InvestmentResponse, InvestorDocumentResponse,
-    MessageResponse, InvestmentValidationRequest
+    MessageResponse, InvestmentValidationRequest, AccruedInterestRequest
 )
 from app.core.auth import get_current_user
 from app.services.storage.s3_service import s3_service
+from app.utils.date_utils import parse_date_flexible
+from app.utils.import_utils import chunked, clean_text_column
+from app.services.interest.accrual import AccrualIndex, MAX_AS_OF_YEARS_AHEAD, latest_as_of
+from pydantic import ValidationError
 import logging
 import json
 
@@ -80,6 +84,189 @@ def date_to_str(date_obj):
         return date_obj
     return date_obj.strftime('%d/%m/%Y')
 
+# Bulk investor import (background job) - sheet column → investors column
+INVESTOR_IMPORT_COLUMNS = {
+    'Investor ID': 'investor_id',
+    'Full Name': 'full_name',
+    'Email': 'email',
+    'Phone': 'phone',
+    'Date of Birth': 'dob',
+    'Residential Address': 'residential_address',
+    'Correspondence Address': 'correspondence_address',
+    'PAN': 'pan',
+    'Aadhaar': 'aadhaar',
+    'Bank Name': 'bank_name',
+    'Account Number': 'account_number',
+    'IFSC Code': 'ifsc_code',
+    'Occupation': 'occupation',
+    'KYC Status': 'kyc_status',
+    'Source of Funds': 'source_of_funds',
+    'Nominee Name': 'nominee_name',
+    'Nominee Relationship': 'nominee_relationship',
+    'Nominee Mobile': 'nominee_mobile',
+    'Nominee Email': 'nominee_email',
+    'Nominee Address': 'nominee_address',
+}
+
+INVESTOR_IMPORT_REQUIRED_COLUMNS = [
+    'Investor ID', 'Full Name', 'Email', 'Phone', 'Date of Birth', 'Residential Address',
+    'PAN', 'Aadhaar', 'Bank Name', 'Account Number', 'IFSC Code', 'Occupation', 'Source of Funds'
+]
+
+# Fields with UNIQUE keys on the investors table
+INVESTOR_UNIQUE_FIELDS = ['investor_id', 'email', 'phone', 'pan', 'aadhaar', 'account_number']
+
+
+def _format_import_dob(value) -> str:
+    """Date cell (date, DD/MM/YYYY, YYYY-MM-DD, DD-MM-YYYY) → YYYY-MM-DD, '' if unparseable"""
+    if not isinstance(value, str) and not hasattr(value, 'strftime'):
+        return ''
+    parsed = parse_date_flexible(value)
+    return parsed.strftime('%Y-%m-%d') if parsed else ''
+
+
+def normalize_investor_import_frame(df):
+    """
+    Map sheet columns to investor fields and normalize every cell at once
+    Dates of birth become YYYY-MM-DD strings ('' when unparseable)
+    """
+    for column, field in INVESTOR_IMPORT_COLUMNS.items():
+        if column in df.columns:
+            df[field] = clean_text_column(df[column])
+        else:
+            df[field] = ''
+
+    if 'Date of Birth' in df.columns:
+        df['dob'] = df['Date of Birth'].map(_format_import_dob)
+
+    df['pan'] = df['pan'].str.upper()
+    df['ifsc_code'] = df['ifsc_code'].str.upper()
+    df['kyc_status'] = df['kyc_status'].replace('', 'Pending')
+    return df
+
+
+def _load_existing_investor_keys(db, df):
+    """field → set of casefolded values already taken in the investors table"""
+    existing = {field: set() for field in INVESTOR_UNIQUE_FIELDS}
+
+    for chunk in chunked(range(len(df))):
+        rows = df.iloc[chunk]
+        conditions = []
+        params = []
+        for field in INVESTOR_UNIQUE_FIELDS:
+            values = sorted({value for value in rows[field] if value})
+            if values:
+                conditions.append(f"{field} IN ({', '.join(['%s'] * len(values))})")
+                params.extend(values)
+
+        if not conditions:
+            continue
+
+        result = db.execute_query(f"""
+        SELECT {', '.join(INVESTOR_UNIQUE_FIELDS)}
+        FROM investors
+        WHERE {' OR '.join(conditions)}
+        """, tuple(params))
+
+        for row in result:
+            for field in INVESTOR_UNIQUE_FIELDS:
+                if row.get(field):
+                    existing[field].add(str(row[field]).casefold())
+
+    return existing
+
+
+def apply_investor_import(db, df):
+    """
+    Validate a normalized investor frame and insert all valid rows in one batch
+
+    Each row is validated with the same InvestorCreate model as POST /investors.
+    Duplicates against the database and within the file are rejected per row.
+
+    Returns (created_count, errors) where errors is a list of
+    {'row': sheet row number, 'error': message} in sheet order.
+    """
+    errors = []
+    existing = _load_existing_investor_keys(db, df)
+    fields = list(INVESTOR_IMPORT_COLUMNS.values())
+    inserts = []
+
+    for row in df[['sheet_row'] + fields].to_dict('records'):
+        row_number = row.pop('sheet_row')
+
+        missing = [column for column in INVESTOR_IMPORT_REQUIRED_COLUMNS if not row[INVESTOR_IMPORT_COLUMNS[column]]]
+        if missing:
+            errors.append({'row': row_number, 'error': f"Missing or invalid value for: {', '.join(missing)}"})
+            continue
+
+        try:
+            investor = InvestorCreate(**{field: (value or None) for field, value in row.items()})
+        except ValidationError as validation_error:
+            details = '; '.join(f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in validation_error.errors())
+            errors.append({'row': row_number, 'error': details})
+            continue
+
+        duplicate = next(
+            (field for field in INVESTOR_UNIQUE_FIELDS if str(getattr(investor, field)).casefold() in existing[field]),
+            None
+        )
+        if duplicate:
+            errors.append({'row': row_number, 'error': f"{duplicate.replace('_', ' ').title()} '{getattr(investor, duplicate)}' already exists"})
+            continue
+
+        for field in INVESTOR_UNIQUE_FIELDS:
+            existing[field].add(str(getattr(investor, field)).casefold())
+
+        inserts.append((
+            investor.investor_id, investor.full_name, investor.email,
+            investor.phone, investor.dob, investor.residential_address,
+            investor.correspondence_address, investor.pan, investor.aadhaar,
+            investor.bank_name, investor.account_number, investor.ifsc_code,
+            investor.occupation, investor.kyc_status.value, investor.source_of_funds,
+            investor.is_active, investor.nominee_name, investor.nominee_relationship,
+            investor.nominee_mobile, investor.nominee_email, investor.nominee_address
+        ))
+
+    if inserts:
+        insert_query = """
+        INSERT INTO investors (
+            investor_id, full_name, email, phone, dob,
+            residential_address, correspondence_address,
+            pan, aadhaar, bank_name, account_number, ifsc_code,
+            occupation, kyc_status, source_of_funds, is_active,
+            nominee_name, nominee_relationship, nominee_mobile,
+            nominee_email, nominee_address
+        ) VALUES (
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+        )
+        """
+        db.execute_many(insert_query, inserts)
+
+    errors.sort(key=lambda error: error['row'])
+    return len(inserts), errors
+
+
+def log_investor_import_audit(db, file_name: str, admin_name: str, admin_role: str, created_count: int, errors: list):
+    """Write one summarized audit_logs entry for a bulk investor import"""
+    create_audit_log(
+        db=db,
+        action="Investors Imported" if created_count > 0 else "Investor Import Failed",
+        admin_name=admin_name,
+        admin_role=admin_role,
+        details=f"Imported {created_count} investor(s) from file '{file_name}' - {len(errors)} error(s)",
+        entity_type="Investor",
+        entity_id="Import Operation",
+        changes={
+            "fileName": file_name,
+            "successCount": created_count,
+            "errorCount": len(errors),
+            "errors": errors[:5],
+            "action": "investor_import"
+        }
+    )
+
+
 @router.post("", response_model=InvestorResponse)
 async def create_investor(
     investor: InvestorCreate,
@@ -255,6 +442,81 @@ async def get_investors(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ============================================
+# ACCRUED INTEREST
+# ============================================
+
+def _parse_as_of(as_of: Optional[str]):
+    """as_of query value → date (default today)"""
+    if not as_of:
+        return datetime.now().date()
+    parsed = parse_date_flexible(as_of)
+    if not parsed:
+        raise HTTPException(status_code=400, detail="Invalid as_of date. Use YYYY-MM-DD or DD/MM/YYYY")
+    if parsed > latest_as_of():
+        raise HTTPException(
+            status_code=400,
+            detail=f"as_of can be at most {MAX_AS_OF_YEARS_AHEAD} years ahead (until {latest_as_of().isoformat()})"
+        )
+    return parsed
+
+
+def iter_investment_accruals(db, as_of, investor_db_ids=None, series_id=None, include_exited: bool = True):
+    """
+    Generator: (investor row, accrual dict) per investment, in investor order
+
+    Series accrual schedules are built once (AccrualIndex), then every investment
+    is one lookup - no month walking. Exited investments accrue up to the exit date.
+    """
+    index = AccrualIndex.load(db, as_of, [series_id] if series_id else None)
+
+    statuses = ('confirmed', 'cancelled') if include_exited else ('confirmed',)
+    query = f"""
+    SELECT
+        inv.id as investor_db_id,
+        inv.investor_id,
+        inv.full_name as investor_name,
+        i.id as investment_id,
+        i.series_id,
+        i.amount,
+        i.exit_date,
+        i.status
+    FROM investments i
+    INNER JOIN investors inv ON inv.id = i.investor_id
+    WHERE i.status IN ({', '.join(['%s'] * len(statuses))})
+    """
+    params = list(statuses)
+
+    if series_id:
+        query += " AND i.series_id = %s"
+        params.append(series_id)
+
+    def rows():
+        if investor_db_ids is None:
+            yield from db.iter_query(query + " ORDER BY inv.investor_id, i.id", tuple(params))
+            return
+        for chunk in chunked(sorted(set(investor_db_ids))):
+            placeholders = ', '.join(['%s'] * len(chunk))
+            yield from db.execute_query(
+                query + f" AND i.investor_id IN ({placeholders}) ORDER BY inv.investor_id, i.id",
+                tuple(params) + tuple(chunk)
+            )
+
+    for row in rows():
+        accrual = index.accrued_for(row, as_of)
+        if accrual is not None:
+            yield row, accrual
+
+
+def _accrual_totals(accruals) -> dict:
+    return {
+        'investment_count': len(accruals),
+        'principal': round(sum(accrual['principal'] for accrual in accruals), 2),
+        'accrued_interest': round(sum(accrual['accrued_interest'] for accrual in accruals), 2),
+        'current_period_interest': round(sum(accrual['current_period_interest'] for accrual in accruals), 2)
+    }
+
+
 # ============================================
 # SPECIFIC ROUTES (must come before /{investor_id})
 # ============================================
@@ -298,6 +560,78 @@ async def generate_investor_id(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/accrued")
+async def get_bulk_accrued_interest(
+    request: AccruedInterestRequest,
+    current_user: dict = Depends(get_current_user),
+    db = Depends(get_db)
+):
+    """
+    Accrued interest for many investors at once (portfolio valuation)
+
+    - as_of: valuation date (default today)
+    - investor_ids: investor codes - omit for the whole portfolio
+    - series_id: only investments in this series
+    - include_exited: also report exited investments (accrued up to their exit date)
+    - include_investments: return the per-investment breakdown as well
+
+    Each investment is an O(1) lookup into per-series cumulative day-count factors
+    """
+    try:
+        as_of = _parse_as_of(request.as_of)
+
+        investor_db_ids = None
+        not_found = []
+        if request.investor_ids is not None:
+            codes = sorted({code.strip() for code in request.investor_ids if code and code.strip()})
+            found = {}
+            for chunk in chunked(codes):
+                placeholders = ', '.join(['%s'] * len(chunk))
+                for row in db.execute_query(
+                    f"SELECT id, investor_id FROM investors WHERE investor_id IN ({placeholders})",
+                    tuple(chunk)
+                ):
+                    found[row['investor_id']] = row['id']
+            investor_db_ids = list(found.values())
+            not_found = [code for code in codes if code not in found]
+
+        investors = []
+        current = None
+        all_accruals = []
+
+        for row, accrual in iter_investment_accruals(
+            db, as_of, investor_db_ids, request.series_id, request.include_exited
+        ):
+            if current is None or current['investor_id'] != row['investor_id']:
+                current = {
+                    'investor_id': row['investor_id'],
+                    'investor_name': row['investor_name'],
+                    'investments': []
+                }
+                investors.append(current)
+            current['investments'].append(accrual)
+            all_accruals.append(accrual)
+
+        for investor in investors:
+            investor.update(_accrual_totals(investor['investments']))
+            if not request.include_investments:
+                del investor['investments']
+
+        return {
+            'as_of': as_of.isoformat(),
+            'investor_count': len(investors),
+            'totals': _accrual_totals(all_accruals),
+            'investors': investors,
+            'not_found': not_found
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error calculating accrued interest: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/search")
 async def search_investors(
     q: Optional[str] = None,
@@ -1438,6 +1772,57 @@ async def get_investor_investments(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{investor_id}/accrued")
+async def get_investor_accrued_interest(
+    investor_id: str,
+    as_of: Optional[str] = None,
+    series_id: Optional[int] = None,
+    current_user: dict = Depends(get_current_user),
+    db = Depends(get_db)
+):
+    """
+    Interest accrued on each of an investor's investments up to as_of (inclusive)
+
+    - investor_id: investor code like "INV001"
+    - as_of: YYYY-MM-DD or DD/MM/YYYY (default today)
+
+    Per investment:
+    - accrued_interest: since series start (capped at exit / maturity)
+    - current_period_interest: since the 1st of the month - not paid out yet;
+      on the exit or maturity date this is the final prorated payout
+    """
+    try:
+        as_of_date = _parse_as_of(as_of)
+
+        investor_result = db.execute_query(
+            "SELECT id, investor_id, full_name FROM investors WHERE investor_id = %s",
+            (investor_id,)
+        )
+        if not investor_result:
+            raise HTTPException(status_code=404, detail="Investor not found")
+
+        investor_data = investor_result[0]
+        investments = [
+            accrual for _, accrual in iter_investment_accruals(
+                db, as_of_date, [investor_data['id']], series_id
+            )
+        ]
+
+        return {
+            'investor_id': investor_data['investor_id'],
+            'investor_name': investor_data['full_name'],
+            'as_of': as_of_date.isoformat(),
+            **_accrual_totals(investments),
+            'investments': investments
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error calculating accrued interest for investor {investor_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/{investor_id}/series/{series_id}/exit")
 async def exit_investor_from_series(
     investor_id: int,
@@ -1527,7 +1912,14 @@ async def exit_investor_from_series(
         db.execute_query(update_investment, (today, investment_id))
         
         logger.info(f"✅ Set exit_date = {today} for investment {investment_id}")
-        logger.info(f"💰 Final prorated interest will be calculated from last payout to {today}")
+        
+        # Final prorated interest (1st of the month → exit date) - same figure the payout run uses
+        series_accrual = AccrualIndex.load(db, today, [series_id]).series.get(series_id)
+        final_interest = (
+            series_accrual.accrued(investment_amount, today, today)['current_period_interest']
+            if series_accrual else None
+        )
+        logger.info(f"💰 Final prorated interest up to {today}: {final_interest}")
         
         # 7. DO NOT update investor total_investment - it's LIFETIME history, not current balance
         # The investor's total_investment should NEVER decrease because it represents
@@ -1626,6 +2018,7 @@ async def exit_investor_from_series(
             "investor_id": investor_data['investor_id'],
             "series_name": series_data['name'],
             "amount_exited": investment_amount,
+            "final_interest": final_interest,
             "exit_date": today.strftime('%d/%m/%Y')
         }
         
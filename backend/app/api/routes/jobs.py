@@ -0,0 +1,219 @@
+"""
+Background Job API Routes
+==========================
+Upload large payout / investor files for background processing and poll progress
+
+IMPORTANT: ALL business logic in backend, NO logic in frontend
+Processing itself lives in app/services/jobs/import_jobs.py
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi.responses import Response
+from typing import Optional
+from app.models.pydantic.models import UserInDB
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.permissions import has_permission, log_unauthorized_access
+from app.services.jobs.import_jobs import (
+    IMPORT_JOB_PERMISSIONS,
+    submit_import_job,
+    get_import_job,
+    list_import_jobs,
+    build_error_sheet
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["Background Jobs"])
+
+ALLOWED_IMPORT_EXTENSIONS = ('.xlsx', '.xls', '.csv')
+
+
+async def _queue_import(job_type: str, file: UploadFile, current_user: UserInDB, endpoint: str):
+    """Shared upload handling for the import job endpoints"""
+    db = get_db()
+
+    create_permission = IMPORT_JOB_PERMISSIONS[job_type][0]
+    if not has_permission(current_user, create_permission, db):
+        log_unauthorized_access(db, current_user, endpoint, create_permission)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access Denied: You don't have permission to import this data"
+        )
+
+    if not file.filename.lower().endswith(ALLOWED_IMPORT_EXTENSIONS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file type. Please upload an Excel or CSV file (.xlsx, .xls or .csv)"
+        )
+
+    contents = await file.read()
+    job = submit_import_job(db, job_type, file.filename, contents, current_user)
+
+    return {
+        'success': True,
+        'message': f"Import queued for processing (job {job['id']})",
+        'job_id': job['id'],
+        'job': job
+    }
+
+
+def _get_visible_job(db, job_id: int, current_user: UserInDB, endpoint: str, include_errors: bool = False) -> dict:
+    """Load a job and check the caller may see it"""
+    job = get_import_job(db, job_id, include_errors=include_errors)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found"
+        )
+
+    view_permission = IMPORT_JOB_PERMISSIONS[job['job_type']][1]
+    if job['created_by'] != current_user.id and not has_permission(current_user, view_permission, db):
+        log_unauthorized_access(db, current_user, endpoint, view_permission)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access Denied: You don't have permission to view this job"
+        )
+
+    return job
+
+
+@router.post("/payout-import")
+async def create_payout_import_job(
+    file: UploadFile = File(...),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Queue a payout file (same layout as POST /payouts/import)
+    Returns the job id immediately
+    PERMISSION REQUIRED: edit_interestPayout
+    """
+    try:
+        return await _queue_import('payout_import', file, current_user, "create_payout_import_job")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error queueing payout import: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error queueing payout import: {str(e)}"
+        )
+
+
+@router.post("/investor-import")
+async def create_investor_import_job(
+    file: UploadFile = File(...),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Queue an investor file for bulk creation
+    Columns: see INVESTOR_IMPORT_COLUMNS in investors.py
+    Returns the job id immediately
+    PERMISSION REQUIRED: create_investors
+    """
+    try:
+        return await _queue_import('investor_import', file, current_user, "create_investor_import_job")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error queueing investor import: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error queueing investor import: {str(e)}"
+        )
+
+
+@router.get("/")
+async def get_my_jobs(
+    job_type: Optional[str] = None,
+    limit: int = 20,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Recent import jobs started by the current user
+    """
+    try:
+        db = get_db()
+        jobs = list_import_jobs(db, user_id=current_user.id, job_type=job_type, limit=min(limit, 100))
+        return {'jobs': jobs, 'count': len(jobs)}
+    except Exception as e:
+        logger.error(f"❌ Error listing jobs: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing jobs: {str(e)}"
+        )
+
+
+@router.get("/{job_id}")
+async def get_job_status(
+    job_id: int,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Job status and progress: status, total/processed rows, success and error counts
+    """
+    try:
+        db = get_db()
+        job = _get_visible_job(db, job_id, current_user, "get_job_status")
+        
+        # First few rejected rows so the UI can show them without downloading the sheet
+        job['errors'] = []
+        if job['status'] == 'completed' and job['error_count']:
+            error_rows = get_import_job(db, job_id, include_errors=True)['error_rows']
+            job['errors'] = [f"Row {error['row']}: {error['error']}" for error in error_rows[:10]]
+        
+        return job
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error fetching job {job_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching job: {str(e)}"
+        )
+
+
+@router.get("/{job_id}/errors")
+async def download_job_errors(
+    job_id: int,
+    format: str = 'xlsx',
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Download the rejected rows of a job as a sheet (xlsx or csv)
+    Original columns are kept, plus 'Row' and 'Error', so the file can be fixed and re-uploaded
+    """
+    try:
+        db = get_db()
+        job = _get_visible_job(db, job_id, current_user, "download_job_errors", include_errors=True)
+
+        if format not in ('xlsx', 'csv'):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid format. Must be 'xlsx' or 'csv'"
+            )
+
+        content = build_error_sheet(job, format)
+        filename = f"import-job-{job_id}-errors.{format}"
+        media_type = (
+            "text/csv; charset=utf-8" if format == 'csv'
+            else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+
+        return Response(
+            content=content,
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}"
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error building error sheet for job {job_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error building error sheet: {str(e)}"
+        )
@@ -7,13 +7,35 @@ IMPORTANT: ALL business logic in backend, NO logic in frontend
 Data fetched from investors and ncd_series tables
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
-from app.models.pydantic.models import UserInDB
+from app.models.pydantic.models import UserInDB, PayoutBulkStatusUpdate
 from app.core.auth import get_current_user
-from app.core.database import get_db
+from app.core.database import Database, get_db
 from app.core.permissions import has_permission, log_unauthorized_access
+from app.utils.import_utils import chunked, read_import_sheet, clean_text_column
+from app.utils.xlsx_stream import stream_xlsx, XLSX_MEDIA_TYPE
+from app.utils.date_utils import month_start
+from app.services.payments.bank_files import (
+    BANK_FILE_LAYOUTS,
+    BANK_FILE_DEFAULT_MAX_RECORDS,
+    BANK_FILE_MAX_RECORDS_LIMIT,
+    stream_bank_payment_zip
+)
+from app.services.payments.reconciliation import (
+    RECONCILIATION_DEFAULT_WINDOW_DAYS,
+    RECONCILIATION_MAX_WINDOW_DAYS,
+    EXCEPTION_REPORT_HEADERS,
+    parse_statement,
+    statement_interest_months,
+    build_expected_index,
+    match_statement,
+    exception_report_rows
+)
 from datetime import datetime, date
+from itertools import islice
+import calendar
 import logging
 import json
 
@@ -434,17 +456,888 @@ def generate_payout_month(year: int, month: int) -> str:
         return f"Month-{month} {year}"
 
 
+def generate_payout_period(year: int, month: int) -> date:
+    """
+    Canonical payout period: first day of the interest month (interest_payouts.payout_period)
+    Stored records are looked up by this, never by the payout_month string
+    """
+    return date(year, month, 1)
+
+
+def next_payout_period(period: date) -> date:
+    """First day of the following month - exclusive upper bound for period ranges"""
+    return date(period.year + 1, 1, 1) if period.month == 12 else date(period.year, period.month + 1, 1)
+
+
+# ============================================
+# PAYOUT ENGINE - ONE ROW PER INVESTMENT PER INTEREST MONTH
+# Shared by the payout list, export, downloads and reports
+# ============================================
+
+PAYOUT_INVESTMENTS_COLUMNS = """
+    inv.id as investor_id,
+    inv.investor_id as investor_code,
+    inv.full_name as investor_name,
+    inv.bank_name,
+    inv.account_number,
+    inv.ifsc_code,
+    i.id as investment_id,
+    i.amount as investment_amount,
+    i.exit_date,
+    i.status as investment_status,
+    i.series_id,
+    s.name as series_name,
+    s.interest_rate,
+    s.interest_payment_day,
+    s.series_start_date,
+    s.maturity_date,
+    s.lock_in_date,
+    s.status as series_status
+"""
+
+# RULE 1: Include ACTIVE investments (status = 'confirmed')
+# RULE 2: Include EXITED investments (status = 'cancelled') ONLY if exit is in the interest month or later
+# RULE 3: Exclude investments where exit/maturity was in past months (already paid final payout)
+# RULE 4: Show payouts for ANY series that has started (series_start_date <= CURDATE())
+# RULE 5: Exclude investments where maturity date is BEFORE the interest month
+# Every %s is the first day of the interest month (plain column comparisons keep the dates indexable)
+PAYOUT_INVESTMENTS_FROM = """
+FROM investors inv
+INNER JOIN investments i ON inv.id = i.investor_id
+INNER JOIN ncd_series s ON i.series_id = s.id
+WHERE (
+    (i.status = 'confirmed' AND inv.is_active = 1)
+    OR 
+    (i.status = 'cancelled' AND i.exit_date IS NOT NULL 
+     AND i.exit_date >= %s)
+)
+AND (i.exit_date IS NULL OR i.exit_date >= %s)
+AND s.is_active = 1
+AND s.series_start_date <= CURDATE()
+AND (s.maturity_date IS NULL OR s.maturity_date >= %s)
+"""
+
+# Supported sort keys → (SQL column, payout field) in ORDER BY order.
+# The trailing columns make every key unique, so keyset cursors are stable.
+PAYOUT_SORTS = {
+    'investor_id': [('inv.investor_id', 'investor_id'), ('s.name', 'series_name'), ('i.id', 'investment_id')],
+    'investor_name': [('inv.full_name', 'investor_name'), ('inv.investor_id', 'investor_id'), ('s.name', 'series_name'), ('i.id', 'investment_id')],
+    'series_name': [('s.name', 'series_name'), ('inv.investor_id', 'investor_id'), ('i.id', 'investment_id')],
+}
+
+
+def _as_date(value):
+    """DB value → date (strings in YYYY-MM-DD are parsed, bad values become None)"""
+    if isinstance(value, str):
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            return None
+    return value
+
+
+def calculate_payout_amount(row: dict, interest_year: int, interest_month: int) -> Optional[float]:
+    """
+    Interest for one investment row for one interest month
+    Returns None when the investment has no payout for that month (past maturity / exit)
+
+    RULE 1: Exit → Calculate from series start (or 1st of month) to exit date (HIGHEST PRIORITY)
+    RULE 2: Maturity → Calculate from series start (or 1st of month) to maturity date
+    RULE 3: First partial month → Calculate from series start to END OF MONTH
+    RULE 4: Regular full months → FIXED monthly amount (1st to last day)
+    """
+    series_start_date = _as_date(row['series_start_date'])
+    maturity_date = _as_date(row.get('maturity_date'))
+    exit_date = _as_date(row.get('exit_date'))
+    payment_day = row['interest_payment_day'] or 15
+
+    # The payout_date_obj is used for checking exit/maturity month
+    # It is in the interest month, not the payment month
+    max_day_in_month = calendar.monthrange(interest_year, interest_month)[1]
+    payout_date_obj = date(interest_year, interest_month, min(payment_day, max_day_in_month))
+
+    last_payout_date = get_last_payout_date(
+        series_start_date if series_start_date else payout_date_obj,
+        payment_day,
+        payout_date_obj
+    )
+
+    if should_skip_payout(payout_date_obj, maturity_date, exit_date, last_payout_date):
+        return None
+
+    principal = float(row['investment_amount'])
+    rate = float(row['interest_rate'])
+    is_first = bool(series_start_date) and is_first_payout(series_start_date, interest_month, interest_year)
+    previous_month = interest_month - 1 if interest_month > 1 else 12
+    previous_year = interest_year if interest_month > 1 else interest_year - 1
+
+    if exit_date and is_final_payout_after_exit(payout_date_obj, exit_date):
+        if is_first:
+            # Exit in first month: series start to exit date
+            days_from_start_to_exit = (exit_date - series_start_date).days + 1
+            days_in_year = 366 if calendar.isleap(exit_date.year) else 365
+            return (principal * rate * days_from_start_to_exit) / 100 / days_in_year
+        return calculate_exit_interest(principal, rate, exit_date, previous_month, previous_year)
+
+    if maturity_date and is_last_payout_before_maturity(payout_date_obj, maturity_date):
+        if is_first:
+            # Maturity in first month: series start to maturity date
+            days_from_start_to_maturity = (maturity_date - series_start_date).days + 1
+            days_in_year = 366 if calendar.isleap(maturity_date.year) else 365
+            return (principal * rate * days_from_start_to_maturity) / 100 / days_in_year
+        return calculate_maturity_interest(principal, rate, maturity_date, previous_month, previous_year)
+
+    if is_first:
+        return calculate_first_month_interest(
+            principal, rate, series_start_date, interest_month, interest_year, payment_day
+        )
+
+    return calculate_monthly_interest(principal, rate, interest_month, interest_year)
+
+
+def load_payout_records(
+    db,
+    period_from: Optional[date] = None,
+    period_to: Optional[date] = None,
+    series_id: Optional[int] = None,
+    investor_ids: Optional[list] = None,
+    investor_code: Optional[str] = None
+) -> dict:
+    """
+    Stored payout records for interest months in [period_from, period_to)
+    Range scan on payout_period (idx_payout_period_series_investor) - no string matching
+    Returns {(investor db id, series id, payout_period): record}
+    If a month was stored in both formats (March 2026 / 2026-03) the new format wins
+    """
+    query = """
+    SELECT id, investor_id, series_id, payout_period, payout_month,
+           payout_date, amount, status, paid_date
+    FROM interest_payouts
+    WHERE is_active = 1
+    """
+    params = []
+
+    if period_from:
+        query += " AND payout_period >= %s"
+        params.append(period_from)
+    else:
+        query += " AND payout_period IS NOT NULL"
+
+    if period_to:
+        query += " AND payout_period < %s"
+        params.append(period_to)
+
+    if series_id:
+        query += " AND series_id = %s"
+        params.append(series_id)
+
+    if investor_code:
+        query += " AND investor_id = (SELECT id FROM investors WHERE investor_id = %s)"
+        params.append(investor_code)
+
+    records = {}
+
+    def add(rows):
+        for record in rows:
+            period = _as_date(record['payout_period'])
+            key = (record['investor_id'], record['series_id'], period)
+            if key not in records or record['payout_month'] == generate_payout_month(period.year, period.month):
+                records[key] = record
+
+    if investor_ids is not None:
+        for chunk in chunked(sorted(set(investor_ids))):
+            placeholders = ', '.join(['%s'] * len(chunk))
+            add(db.execute_query(f"{query} AND investor_id IN ({placeholders})", tuple(params) + tuple(chunk)))
+    else:
+        add(db.execute_query(query, tuple(params)))
+
+    return records
+
+
+def load_month_payout_records(db, interest_year: int, interest_month: int, series_id: Optional[int] = None) -> dict:
+    """
+    Stored payout records for one interest month in ONE query
+    Returns {(investor db id, series id): record}
+    """
+    period = generate_payout_period(interest_year, interest_month)
+    records = load_payout_records(db, period, next_payout_period(period), series_id=series_id)
+    return {(investor_id, record_series_id): record for (investor_id, record_series_id, _), record in records.items()}
+
+
+PAYOUT_PERIOD_BACKFILL_CHUNK_SIZE = 5000
+
+
+def backfill_payout_periods(db, chunk_size: int = PAYOUT_PERIOD_BACKFILL_CHUNK_SIZE) -> int:
+    """
+    Fill interest_payouts.payout_period from payout_month for rows written before the column existed
+    Works through id ranges of `chunk_size` so no single UPDATE locks the whole table
+    Rows with an unrecognised payout_month are left NULL (and logged)
+    Returns the number of rows updated
+    """
+    bounds = db.execute_query("""
+    SELECT MIN(id) AS min_id, MAX(id) AS max_id
+    FROM interest_payouts
+    WHERE payout_period IS NULL
+    """)
+    if not bounds or bounds[0]['min_id'] is None:
+        return 0
+
+    min_id, max_id = bounds[0]['min_id'], bounds[0]['max_id']
+
+    # REGEXP guards keep STR_TO_DATE away from values it cannot parse (strict mode would raise)
+    update_query = """
+    UPDATE interest_payouts
+    SET payout_period = CASE
+        WHEN payout_month REGEXP '^[0-9]{4}-[0-9]{2}$'
+            THEN STR_TO_DATE(CONCAT(payout_month, '-01'), '%%Y-%%m-%%d')
+        WHEN payout_month REGEXP '^[A-Za-z]+ [0-9]{4}$'
+            THEN STR_TO_DATE(CONCAT('01 ', payout_month), '%%d %%M %%Y')
+    END
+    WHERE id BETWEEN %s AND %s
+    AND payout_period IS NULL
+    """
+
+    updated = 0
+    for start_id in range(min_id, max_id + 1, chunk_size):
+        updated += db.execute_query(update_query, (start_id, min(start_id + chunk_size - 1, max_id))) or 0
+
+    if updated:
+        logger.info(f"✅ Backfilled payout_period for {updated} payout records")
+
+    remaining = db.execute_query("SELECT COUNT(*) AS count FROM interest_payouts WHERE payout_period IS NULL")
+    if remaining and remaining[0]['count']:
+        logger.warning(f"⚠️ {remaining[0]['count']} payout records have an unrecognised payout_month and no payout_period")
+
+    return updated
+
+
+def parse_payout_sort(sort: Optional[str]):
+    """
+    'series_name' → ('series_name', False), '-series_name' → ('series_name', True)
+    Raises ValueError for unknown keys
+    """
+    sort = sort or 'investor_id'
+    descending = sort.startswith('-')
+    key = sort.lstrip('-')
+    if key not in PAYOUT_SORTS:
+        raise ValueError(f"Invalid sort '{sort}'. Must be one of: {', '.join(PAYOUT_SORTS)} (prefix with '-' for descending)")
+    return key, descending
+
+
+def _keyset_condition(columns: list, values: list, descending: bool):
+    """
+    Row-after-cursor condition for a multi-column ORDER BY
+    (a, b, c) > (x, y, z) → a > x OR (a = x AND (b > y OR (b = y AND c > z)))
+    Written out instead of a row constructor so MySQL can use indexes on the leading column
+    """
+    op = '<' if descending else '>'
+    clause = f"{columns[-1]} {op} %s"
+    params = [values[-1]]
+    for column, value in zip(reversed(columns[:-1]), reversed(values[:-1])):
+        clause = f"({column} {op} %s OR ({column} = %s AND {clause}))"
+        params = [value, value] + params
+    return clause, params
+
+
+def encode_payout_cursor(sort: str, payout: dict) -> str:
+    """Opaque cursor pointing just after `payout` for the given sort"""
+    import base64
+
+    key, descending = parse_payout_sort(sort)
+    values = [payout[field] for _, field in PAYOUT_SORTS[key]]
+    raw = json.dumps({'s': sort, 'k': values}, separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_payout_cursor(cursor: str, sort: str) -> list:
+    """Cursor → keyset values. Raises ValueError if it is malformed or was made for another sort"""
+    import base64
+
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        values = data['k']
+        cursor_sort = data['s']
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    key, _ = parse_payout_sort(sort)
+    if cursor_sort != sort or len(values) != len(PAYOUT_SORTS[key]):
+        raise ValueError("Cursor does not match the requested sort - start again without a cursor")
+    return values
+
+
+def _payout_investments_filter(
+    interest_year: int,
+    interest_month: int,
+    series_id: Optional[int] = None,
+    search: Optional[str] = None
+):
+    """FROM / WHERE clause and params shared by the payout list and count queries"""
+    # "exit / maturity in the interest month or later" = on or after its first day
+    first_day = month_start(interest_year, interest_month)
+    query = PAYOUT_INVESTMENTS_FROM
+    params = [first_day, first_day, first_day]
+
+    if series_id:
+        query += " AND s.id = %s"
+        params.append(series_id)
+
+    if search:
+        query += " AND (inv.full_name LIKE %s OR inv.investor_id LIKE %s OR s.name LIKE %s)"
+        search_pattern = f"%{search}%"
+        params.extend([search_pattern, search_pattern, search_pattern])
+
+    return query, params
+
+
+def iter_month_payouts(
+    db,
+    interest_year: int,
+    interest_month: int,
+    series_id: Optional[int] = None,
+    search: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    sort: str = 'investor_id',
+    after: Optional[list] = None,
+    batch_size: Optional[int] = None
+):
+    """
+    Generator: payout rows for one interest month, in `sort` order
+    (default: investor ID, then series name)
+
+    Stored statuses are loaded once up front, then investments are streamed
+    from the database - so rows come out as soon as they are calculated and
+    memory does not grow with the number of investments.
+    Interest for interest_month is PAID in the NEXT month (see generate_payout_date)
+
+    after:      keyset values from decode_payout_cursor() - start after that row
+    batch_size: read investments in keyset pages of this size instead of one
+                streaming query (cheap to stop early, used for paged responses)
+    """
+    month_str = generate_payout_month(interest_year, interest_month)
+    payout_records = load_month_payout_records(db, interest_year, interest_month, series_id)
+
+    sort_key, descending = parse_payout_sort(sort)
+    sort_columns = [column for column, _ in PAYOUT_SORTS[sort_key]]
+    order_by = ', '.join(f"{column} DESC" if descending else column for column in sort_columns)
+
+    from_clause, filter_params = _payout_investments_filter(interest_year, interest_month, series_id, search)
+
+    def fetch(after_values, limit=None):
+        query = f"SELECT {PAYOUT_INVESTMENTS_COLUMNS} {from_clause}"
+        params = list(filter_params)
+        if after_values:
+            condition, condition_params = _keyset_condition(sort_columns, after_values, descending)
+            query += f" AND {condition}"
+            params.extend(condition_params)
+        query += f" ORDER BY {order_by}"
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+            return db.execute_query(query, tuple(params))
+        return db.iter_query(query, tuple(params))
+
+    def investment_rows():
+        if not batch_size:
+            yield from fetch(after)
+            return
+        after_values = after
+        while True:
+            rows = fetch(after_values, batch_size)
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            # Payout field 'investor_id' is the investor code column of the query row
+            after_values = [
+                rows[-1]['investor_code' if field == 'investor_id' else field]
+                for _, field in PAYOUT_SORTS[sort_key]
+            ]
+
+    for row in investment_rows():
+        amount = calculate_payout_amount(row, interest_year, interest_month)
+        if amount is None:
+            continue
+
+        payout_record = payout_records.get((row['investor_id'], row['series_id']))
+        payout_status = payout_record['status'] if payout_record else 'Scheduled'
+
+        if status_filter and payout_status != status_filter:
+            continue
+
+        # Always use the current interest_payment_day from series to calculate payout date
+        yield {
+            'investment_id': row['investment_id'],
+            'investor_id': row['investor_code'],
+            'investor_name': row['investor_name'],
+            'series_id': row['series_id'],
+            'series_name': row['series_name'],
+            'interest_month': payout_record['payout_month'] if payout_record else month_str,
+            'interest_date': generate_payout_date(interest_year, interest_month, row['interest_payment_day'] or 15),
+            'amount': amount,
+            'status': payout_status,
+            'bank_name': row['bank_name'] or 'N/A',
+            'bank_account_number': row['account_number'] or 'N/A',
+            'ifsc_code': row['ifsc_code'] or 'N/A'
+        }
+
+
+class PayoutTotals:
+    """
+    Running totals over payout rows (count, amount, investors, per status)
+    Investors are counted on change, so rows must arrive in investor order
+    """
+
+    def __init__(self):
+        self.payout_count = 0
+        self.total_amount = 0.0
+        self.investor_count = 0
+        self.by_status = {}
+        self._last_investor = None
+
+    def add(self, payout: dict):
+        self.payout_count += 1
+        self.total_amount += payout['amount']
+        if payout['investor_id'] != self._last_investor:
+            self.investor_count += 1
+            self._last_investor = payout['investor_id']
+
+        status_totals = self.by_status.setdefault(payout['status'], {'count': 0, 'amount': 0.0})
+        status_totals['count'] += 1
+        status_totals['amount'] += payout['amount']
+
+    @property
+    def avg_per_investor(self) -> float:
+        return self.total_amount / self.investor_count if self.investor_count > 0 else 0
+
+    def as_dict(self) -> dict:
+        return {
+            'payout_count': self.payout_count,
+            'investor_count': self.investor_count,
+            'total_amount': round(self.total_amount, 2),
+            'avg_per_investor': round(self.avg_per_investor, 2),
+            'by_status': {
+                payout_status: {'count': totals['count'], 'amount': round(totals['amount'], 2)}
+                for payout_status, totals in sorted(self.by_status.items())
+            }
+        }
+
+
+def count_month_payouts(
+    db,
+    interest_year: int,
+    interest_month: int,
+    series_id: Optional[int] = None,
+    search: Optional[str] = None,
+    status_filter: Optional[str] = None
+) -> int:
+    """
+    Number of payout rows iter_month_payouts would yield - one COUNT query, no interest maths
+    (PAYOUT_INVESTMENTS_FROM already excludes everything should_skip_payout skips)
+    """
+    from_clause, params = _payout_investments_filter(interest_year, interest_month, series_id, search)
+    query = f"SELECT COUNT(*) AS total {from_clause}"
+
+    if status_filter:
+        # Stored status for the month (new month format wins), 'Scheduled' when there is none
+        query += """
+        AND COALESCE((
+            SELECT ip.status FROM interest_payouts ip
+            WHERE ip.payout_period = %s
+            AND ip.series_id = i.series_id
+            AND ip.investor_id = inv.id
+            AND ip.is_active = 1
+            ORDER BY ip.payout_month = %s DESC
+            LIMIT 1
+        ), 'Scheduled') = %s
+        """
+        params.extend([
+            generate_payout_period(interest_year, interest_month),
+            generate_payout_month(interest_year, interest_month),
+            status_filter
+        ])
+
+    result = db.execute_query(query, tuple(params))
+    return int(result[0]['total']) if result else 0
+
+
+def summarize_month_payouts(
+    db,
+    interest_year: int,
+    interest_month: int,
+    series_id: Optional[int] = None,
+    search: Optional[str] = None
+) -> dict:
+    """Totals for one interest month in a single streamed pass (rows are not kept)"""
+    totals = PayoutTotals()
+    for payout in iter_month_payouts(db, interest_year, interest_month, series_id=series_id, search=search):
+        totals.add(payout)
+    return totals.as_dict()
+
+
+# ============================================
+# CASH-FLOW FORECAST
+# ============================================
+
+FORECAST_MIN_MONTHS = 3
+FORECAST_MAX_MONTHS = 36
+
+
+def _add_months(year: int, month: int, count: int):
+    """(2026, 11) + 3 → (2027, 2)"""
+    month_index = year * 12 + (month - 1) + count
+    return month_index // 12, month_index % 12 + 1
+
+
+def forecast_payouts(db, from_year: int, from_month: int, months: int) -> dict:
+    """
+    Interest + principal outflows per payment month, per series and in total
+
+    Months are PAYMENT months: interest for month M is paid in M + 1 (same rule
+    as generate_payout_date), principal is repaid in the maturity / exit month.
+
+    The investment book is read ONCE, grouped by (series, amount, exit date) -
+    every investment in a group pays exactly the same - and each group only
+    walks the months it is live in. Interest comes from calculate_payout_amount,
+    so forecast figures match what the payout list will show for that month.
+    """
+    month_keys = [_add_months(from_year, from_month, offset) for offset in range(months)]
+    first_interest = _add_months(from_year, from_month, -1)
+    last_interest = _add_months(*month_keys[-1], -1)
+    last_key = month_keys[-1]
+
+    first_interest_start = month_start(*first_interest)
+    horizon_end = date(last_key[0], last_key[1], calendar.monthrange(*last_key)[1])
+
+    # Same inclusion rules as PAYOUT_INVESTMENTS_FROM, but for the whole horizon:
+    # series starting later in the horizon are included too
+    rows = db.execute_query("""
+    SELECT 
+        i.series_id,
+        s.name as series_name,
+        s.interest_rate,
+        s.interest_payment_day,
+        s.series_start_date,
+        s.maturity_date,
+        i.amount as investment_amount,
+        i.exit_date,
+        COUNT(*) as investment_count
+    FROM investments i
+    INNER JOIN investors inv ON inv.id = i.investor_id
+    INNER JOIN ncd_series s ON i.series_id = s.id
+    WHERE (
+        (i.status = 'confirmed' AND inv.is_active = 1)
+        OR 
+        (i.status = 'cancelled' AND i.exit_date IS NOT NULL 
+         AND i.exit_date >= %s)
+    )
+    AND (i.exit_date IS NULL OR i.exit_date >= %s)
+    AND s.is_active = 1
+    AND s.series_start_date <= %s
+    AND (s.maturity_date IS NULL OR s.maturity_date >= %s)
+    GROUP BY i.series_id, s.name, s.interest_rate, s.interest_payment_day,
+             s.series_start_date, s.maturity_date, i.amount, i.exit_date
+    """, (first_interest_start, first_interest_start, horizon_end, first_interest_start))
+
+    month_index = {key: index for index, key in enumerate(month_keys)}
+    interest_totals = [0.0] * months
+    maturity_totals = [0.0] * months
+    exit_totals = [0.0] * months
+    series_flows = {}
+
+    for row in rows:
+        count = int(row['investment_count'])
+        principal = float(row['investment_amount'])
+        start_date = _as_date(row['series_start_date'])
+        maturity_date = _as_date(row['maturity_date'])
+        exit_date = _as_date(row['exit_date'])
+
+        flows = series_flows.get(row['series_id'])
+        if flows is None:
+            flows = series_flows[row['series_id']] = {
+                'series_id': row['series_id'],
+                'series_name': row['series_name'],
+                'interest': [0.0] * months,
+                'principal': [0.0] * months
+            }
+
+        # Interest months this group is live in: series start .. earliest of exit / maturity / horizon
+        interest_year, interest_month = max(first_interest, (start_date.year, start_date.month)) if start_date else first_interest
+        end = last_interest
+        for stop in (exit_date, maturity_date):
+            if stop:
+                end = min(end, (stop.year, stop.month))
+
+        while (interest_year, interest_month) <= end:
+            amount = calculate_payout_amount(row, interest_year, interest_month)
+            if amount is not None:
+                index = month_index[_add_months(interest_year, interest_month, 1)]
+                interest_totals[index] += amount * count
+                flows['interest'][index] += amount * count
+            interest_year, interest_month = _add_months(interest_year, interest_month, 1)
+
+        # Principal goes back in the exit month, or the maturity month if still invested then
+        if exit_date and (not maturity_date or exit_date <= maturity_date):
+            index = month_index.get((exit_date.year, exit_date.month))
+            if index is not None:
+                exit_totals[index] += principal * count
+                flows['principal'][index] += principal * count
+        elif maturity_date:
+            index = month_index.get((maturity_date.year, maturity_date.month))
+            if index is not None:
+                maturity_totals[index] += principal * count
+                flows['principal'][index] += principal * count
+
+    month_rows = []
+    for index, (year, month) in enumerate(month_keys):
+        principal_total = maturity_totals[index] + exit_totals[index]
+        month_rows.append({
+            'month': f"{year}-{month:02d}",
+            'label': generate_payout_month(year, month),
+            'interest_month': generate_payout_month(*_add_months(year, month, -1)),
+            'interest': round(interest_totals[index], 2),
+            'maturity_principal': round(maturity_totals[index], 2),
+            'exit_principal': round(exit_totals[index], 2),
+            'principal': round(principal_total, 2),
+            'total': round(interest_totals[index] + principal_total, 2)
+        })
+
+    series_rows = []
+    for flows in sorted(series_flows.values(), key=lambda item: item['series_name']):
+        interest = [round(value, 2) for value in flows['interest']]
+        principal = [round(value, 2) for value in flows['principal']]
+        if not any(interest) and not any(principal):
+            continue
+        series_rows.append({
+            'series_id': flows['series_id'],
+            'series_name': flows['series_name'],
+            'interest': interest,
+            'principal': principal,
+            'total_interest': round(sum(flows['interest']), 2),
+            'total_principal': round(sum(flows['principal']), 2),
+            'total': round(sum(flows['interest']) + sum(flows['principal']), 2)
+        })
+
+    total_interest = sum(interest_totals)
+    total_principal = sum(maturity_totals) + sum(exit_totals)
+
+    return {
+        'from': month_rows[0]['month'],
+        'to': month_rows[-1]['month'],
+        'months': month_rows,
+        'series': series_rows,
+        'totals': {
+            'interest': round(total_interest, 2),
+            'principal': round(total_principal, 2),
+            'total': round(total_interest + total_principal, 2)
+        }
+    }
+
+
+def series_payout_schedule(rows, until_year: int, until_month: int, investors_from=None) -> dict:
+    """
+    Interest per (series, payment month) for investment rows (PAYOUT_INVESTMENTS_COLUMNS
+    shape), for interest months from each series' start up to (until_year, until_month)
+
+    Investments with the same terms (series, amount, exit date) pay exactly the same, so
+    each group walks its live months ONCE with calculate_payout_amount and the amount is
+    multiplied by the group size. For payment months from investors_from (year, month)
+    on, the ids of the investors paid are collected too.
+
+    Returns {(series_id, (payment year, payment month)): {'interest_month', 'amount', 'investor_ids'}}
+    """
+    groups = {}
+    for row in rows:
+        key = (row['series_id'], float(row['investment_amount']), _as_date(row['exit_date']))
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {'row': row, 'count': 0, 'investor_ids': set()}
+        group['count'] += 1
+        group['investor_ids'].add(row['investor_id'])
+
+    schedule = {}
+    for group in groups.values():
+        row = group['row']
+        start_date = _as_date(row['series_start_date'])
+        if not start_date:
+            continue
+
+        interest_year, interest_month = start_date.year, start_date.month
+        end = (until_year, until_month)
+        for stop in (_as_date(row['exit_date']), _as_date(row['maturity_date'])):
+            if stop:
+                end = min(end, (stop.year, stop.month))
+
+        while (interest_year, interest_month) <= end:
+            amount = calculate_payout_amount(row, interest_year, interest_month)
+            if amount is not None:
+                payment_month = _add_months(interest_year, interest_month, 1)
+                entry = schedule.get((row['series_id'], payment_month))
+                if entry is None:
+                    entry = schedule[(row['series_id'], payment_month)] = {
+                        'interest_month': (interest_year, interest_month),
+                        'amount': 0.0,
+                        'investor_ids': set()
+                    }
+                entry['amount'] += amount * group['count']
+                if investors_from and payment_month >= investors_from:
+                    entry['investor_ids'] |= group['investor_ids']
+            interest_year, interest_month = _add_months(interest_year, interest_month, 1)
+
+    return schedule
+
+
+def payout_amount_matrix(rows: list, from_year: int, from_month: int, months: int):
+    """
+    Interest of every investment row for `months` consecutive interest months from
+    (from_year, from_month), as a (len(rows), months) numpy array - NaN where the
+    investment has no payout that month
+
+    Rows with the same terms (series, amount, exit date) share one row of cells:
+    each group is calculated once per live month with calculate_payout_amount and
+    the investments pick their group's row by index.
+    """
+    import numpy as np
+
+    group_index = {}
+    group_rows = []
+    row_groups = np.empty(len(rows), dtype=np.int64)
+    for index, row in enumerate(rows):
+        key = (row['series_id'], float(row['investment_amount']), _as_date(row['exit_date']))
+        position = group_index.get(key)
+        if position is None:
+            position = group_index[key] = len(group_rows)
+            group_rows.append(row)
+        row_groups[index] = position
+
+    first = (from_year, from_month)
+    last = _add_months(from_year, from_month, months - 1)
+    cells = np.full((len(group_rows), months), np.nan)
+
+    for position, row in enumerate(group_rows):
+        start_date = _as_date(row['series_start_date'])
+        year, month = max(first, (start_date.year, start_date.month)) if start_date else first
+        end = last
+        for stop in (_as_date(row['exit_date']), _as_date(row['maturity_date'])):
+            if stop:
+                end = min(end, (stop.year, stop.month))
+
+        while (year, month) <= end:
+            amount = calculate_payout_amount(row, year, month)
+            if amount is not None:
+                cells[position, (year - from_year) * 12 + month - from_month] = amount
+            year, month = _add_months(year, month, 1)
+
+    return cells[row_groups]
+
+
+def load_series_payout_statuses(db, period_from: Optional[date] = None, period_to: Optional[date] = None,
+                                series_id: Optional[int] = None) -> dict:
+    """
+    Status of every stored series-month for interest months in [period_from, period_to) - ONE grouped query
+    A series-month is Paid once all its stored payouts are, Pending while any is pending
+    Returns {(series id, payout_period): status}
+    """
+    query = """
+    SELECT
+        series_id,
+        payout_period,
+        CASE
+            WHEN SUM(status = 'Paid') = COUNT(*) THEN 'Paid'
+            WHEN SUM(status = 'Pending') > 0 THEN 'Pending'
+            ELSE 'Scheduled'
+        END as status
+    FROM interest_payouts
+    WHERE is_active = 1
+    """
+    params = []
+
+    if period_from:
+        query += " AND payout_period >= %s"
+        params.append(period_from)
+    else:
+        query += " AND payout_period IS NOT NULL"
+
+    if period_to:
+        query += " AND payout_period < %s"
+        params.append(period_to)
+
+    if series_id:
+        query += " AND series_id = %s"
+        params.append(series_id)
+
+    query += " GROUP BY series_id, payout_period"
+
+    return {
+        (row['series_id'], _as_date(row['payout_period'])): row['status']
+        for row in db.execute_query(query, tuple(params))
+    }
+
+
+def get_export_month(month_type: str = 'current'):
+    """
+    Interest (year, month) for an export
+    'current'  = interest for THIS month (paid next month)
+    'upcoming' = interest for NEXT month (paid the month after)
+    """
+    current_date = datetime.now()
+    if month_type == 'upcoming':
+        if current_date.month == 12:
+            return current_date.year + 1, 1
+        return current_date.year, current_date.month + 1
+    return current_date.year, current_date.month
+
+
+PAYOUT_PAGE_DEFAULT_LIMIT = 100
+PAYOUT_PAGE_MAX_LIMIT = 500
+
+PAYOUT_FIELDS = [
+    'id', 'investment_id', 'investor_id', 'investor_name', 'series_id', 'series_name',
+    'interest_month', 'interest_date', 'amount', 'status',
+    'bank_name', 'bank_account_number', 'ifsc_code'
+]
+
+
+def _parse_payout_fields(fields: Optional[str]) -> Optional[list]:
+    """'investor_name,amount' → ['id', 'investor_name', 'amount'] ('id' is always kept)"""
+    if not fields:
+        return None
+    selected = [field.strip() for field in fields.split(',') if field.strip()]
+    unknown = [field for field in selected if field not in PAYOUT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(PAYOUT_FIELDS)}")
+    return ['id'] + [field for field in selected if field != 'id']
+
+
+def _select_payout_fields(payout: dict, selected_fields: Optional[list]) -> dict:
+    if not selected_fields:
+        return payout
+    return {field: payout[field] for field in selected_fields}
+
+
 @router.get("/")
 async def get_all_payouts(
     series_id: Optional[int] = None,
     status_filter: Optional[str] = None,
     search: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    sort: str = 'investor_id',
+    fields: Optional[str] = None,
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Get all interest payouts
+    Get interest payouts for the current month
     Fetches data from investors and ncd_series tables
     ALL CALCULATIONS AND FILTERING IN BACKEND
+
+    Paging (keyset - stable while data changes):
+    - limit:  page size (max 500). Without limit/cursor every row is returned
+    - cursor: next_cursor from the previous page
+    - sort:   investor_id | investor_name | series_name, '-' prefix for descending
+    - fields: comma separated payout fields to return (e.g. investor_name,amount,status)
+    Paged responses use the investment id as 'id' so it stays unique across pages.
+    Use /payouts/count and /payouts/totals for the numbers behind the list.
     """
     try:
         db = get_db()
@@ -481,1137 +1374,1872 @@ async def get_all_payouts(
         interest_year = current_date.year
         interest_month = current_date.month
         
-        current_month_str = generate_payout_month(interest_year, interest_month)
-        
-        # FIXED: Query to get investments for payout calculation
-        # RULE 1: Include ACTIVE investments (status = 'confirmed')
-        # RULE 2: Include EXITED investments (status = 'cancelled') ONLY if exit is in current month or future
-        #         This ensures we generate the final prorated payout for exit month
-        # RULE 3: Exclude investments where exit/maturity was in past months (already paid final payout)
-        # RULE 4: Show payouts for ANY series that has started (series_start_date <= CURDATE())
-        #         regardless of series status (DRAFT, upcoming, accepting, active, matured, etc.)
-        # RULE 5: Exclude investments where maturity date is BEFORE the current payout month
-        query = """
-        SELECT 
-            inv.id as investor_id,
-            inv.investor_id as investor_code,
-            inv.full_name as investor_name,
-            inv.bank_name,
-            inv.account_number,
-            inv.ifsc_code,
-            i.id as investment_id,
-            i.amount as investment_amount,
-            i.exit_date,
-            i.status as investment_status,
-            i.series_id,
-            s.name as series_name,
-            s.interest_rate,
-            s.interest_payment_day,
-            s.series_start_date,
-            s.maturity_date,
-            s.lock_in_date,
-            s.status as series_status
-        FROM investors inv
-        INNER JOIN investments i ON inv.id = i.investor_id
-        INNER JOIN ncd_series s ON i.series_id = s.id
-        WHERE (
-            (i.status = 'confirmed' AND inv.is_active = 1)
-            OR 
-            (i.status = 'cancelled' AND i.exit_date IS NOT NULL 
-             AND YEAR(i.exit_date) * 12 + MONTH(i.exit_date) >= %s)
-        )
-        AND s.is_active = 1
-        AND s.series_start_date <= CURDATE()
-        AND (s.maturity_date IS NULL OR YEAR(s.maturity_date) * 12 + MONTH(s.maturity_date) >= %s)
-        """
+        try:
+            parse_payout_sort(sort)
+            after = decode_payout_cursor(cursor, sort) if cursor else None
+            selected_fields = _parse_payout_fields(fields)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
         
-        # Calculate current month as a comparable number (YYYY * 12 + MM)
-        current_month_number = current_date.year * 12 + current_date.month
-        params = [current_month_number, current_month_number]
+        paged = limit is not None or cursor is not None
         
-        if series_id:
-            query += " AND s.id = %s"
-            params.append(series_id)
+        # Rules for which investments get a payout and how much: see
+        # PAYOUT_INVESTMENTS_FROM and calculate_payout_amount
+        if not paged:
+            payouts = []
+            for payout_id, payout in enumerate(iter_month_payouts(
+                db,
+                interest_year,
+                interest_month,
+                series_id=series_id,
+                search=search,
+                status_filter=status_filter,
+                sort=sort
+            ), start=1):
+                payouts.append(_select_payout_fields({'id': payout_id, **payout}, selected_fields))
+            
+            logger.info(f"✅ Generated {len(payouts)} payout records")
+            
+            return {
+                'payouts': payouts,
+                'count': len(payouts)
+            }
         
-        # Add search filter
-        if search:
-            query += " AND (inv.full_name LIKE %s OR inv.investor_id LIKE %s OR s.name LIKE %s)"
-            search_pattern = f"%{search}%"
-            params.extend([search_pattern, search_pattern, search_pattern])
+        page_size = min(max(limit or PAYOUT_PAGE_DEFAULT_LIMIT, 1), PAYOUT_PAGE_MAX_LIMIT)
         
-        query += " ORDER BY inv.investor_id, s.name"
+        # One extra row tells us whether there is a next page
+        rows = list(islice(iter_month_payouts(
+            db,
+            interest_year,
+            interest_month,
+            series_id=series_id,
+            search=search,
+            status_filter=status_filter,
+            sort=sort,
+            after=after,
+            batch_size=page_size + 1
+        ), page_size + 1))
         
-        result = db.execute_query(query, tuple(params) if params else None)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
         
-        logger.info(f"✅ Found {len(result)} investment records")
+        return {
+            'payouts': [_select_payout_fields({'id': row['investment_id'], **row}, selected_fields) for row in rows],
+            'count': len(rows),
+            'limit': page_size,
+            'sort': sort,
+            'has_more': has_more,
+            'next_cursor': encode_payout_cursor(sort, rows[-1]) if has_more else None
+        }
         
-        # Generate payout records
-        payouts = []
-        payout_id = 1
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error fetching payouts: {e}")
+        import traceback
+        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching payouts: {str(e)}"
+        )
+
+
+@router.get("/export")
+async def get_export_payouts(
+    series_id: Optional[int] = None,
+    month_type: str = 'current',  # 'current' or 'upcoming'
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Get payouts for export (current or upcoming month)
+    ALL CALCULATIONS IN BACKEND
+    """
+    try:
+        db = get_db()
         
-        for row in result:
-            # Get series start date
-            series_start_date = row['series_start_date']
-            if isinstance(series_start_date, str):
-                # Parse date if it's a string
-                try:
-                    series_start_date = datetime.strptime(series_start_date, '%Y-%m-%d').date()
-                except:
-                    series_start_date = None
-            
-            # Get maturity date
-            maturity_date = row['maturity_date']
-            if isinstance(maturity_date, str):
-                try:
-                    maturity_date = datetime.strptime(maturity_date, '%Y-%m-%d').date()
-                except:
-                    maturity_date = None
-            
-            # Get exit date
-            exit_date = row['exit_date']
-            if isinstance(exit_date, str):
-                try:
-                    exit_date = datetime.strptime(exit_date, '%Y-%m-%d').date()
-                except:
-                    exit_date = None
-            
-            # Generate payout date for the interest period
-            # CRITICAL: Interest for interest_month is PAID in the NEXT month
-            # Use proper calendar logic to handle months with different days
-            import calendar
-            payment_day = row['interest_payment_day'] or 15
-            
-            # The payout_date_obj is used for checking exit/maturity month
-            # It should be in the interest month, not the payment month
-            max_day_in_month = calendar.monthrange(interest_year, interest_month)[1]
-            actual_payment_day = min(payment_day, max_day_in_month)
-            
-            payout_date_obj = date(
-                interest_year,
-                interest_month,
-                actual_payment_day
+        # CHECK PERMISSION
+        if not has_permission(current_user, "view_interestPayout", db):
+            log_unauthorized_access(db, current_user, "get_export_payouts", "view_interestPayout")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: You don't have permission to view payouts"
             )
-            
-            # Get last payout date for period calculation
-            last_payout_date = get_last_payout_date(
-                series_start_date if series_start_date else payout_date_obj,
-                row['interest_payment_day'] or 15,
-                payout_date_obj
+        
+        logger.info(f"📊 Fetching export payouts: month_type={month_type}, series_id={series_id}")
+        
+        # CRITICAL BUSINESS RULE:
+        # Interest for a month is PAID in the NEXT month
+        # 
+        # "Current Month" Export = Interest for THIS month (to be paid NEXT month)
+        #   - Interest Period: CURRENT month
+        #   - Payout Date: NEXT month
+        #   Example: In February, show February interest (to be paid in March)
+        #
+        # "Upcoming Month" Export = Interest for NEXT month (to be paid in month after)
+        #   - Interest Period: NEXT month
+        #   - Payout Date: Month after next
+        #   Example: In February, show March interest (to be paid in April)
+        
+        interest_year, interest_month = get_export_month(month_type)
+        target_month_str = generate_payout_month(interest_year, interest_month)
+        
+        logger.info(f"📅 Target month: {target_month_str}")
+        
+        payouts = []
+        for payout_id, payout in enumerate(iter_month_payouts(
+            db,
+            interest_year,
+            interest_month,
+            series_id=series_id
+        ), start=1):
+            payouts.append({'id': payout_id, **payout, 'interest_month': target_month_str})
+        
+        # Calculate summary
+        total_amount = sum(p['amount'] for p in payouts)
+        investor_count = len(set(p['investor_id'] for p in payouts))
+        avg_per_investor = total_amount / investor_count if investor_count > 0 else 0
+        
+        logger.info(f"✅ Generated {len(payouts)} export payout records")
+        
+        return {
+            'payouts': payouts,
+            'summary': {
+                'total_amount': round(total_amount, 2),
+                'investor_count': investor_count,
+                'avg_per_investor': round(avg_per_investor, 2),
+                'payout_count': len(payouts)
+            }
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error fetching export payouts: {e}")
+        import traceback
+        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching export payouts: {str(e)}"
+        )
+
+
+@router.get("/summary")
+async def get_payout_summary(
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Get payout summary statistics for current month
+    ALL CALCULATIONS IN BACKEND
+    """
+    try:
+        db = get_db()
+        
+        # CHECK PERMISSION
+        if not has_permission(current_user, "view_interestPayout", db):
+            log_unauthorized_access(db, current_user, "get_payout_summary", "view_interestPayout")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: You don't have permission to view payouts"
+            )
+        
+        current_date = datetime.now()
+        current_month_str = generate_payout_month(current_date.year, current_date.month)
+        
+        # One streamed pass over the current month - rows are not kept
+        totals = summarize_month_payouts(db, current_date.year, current_date.month)
+        
+        return {
+            'total_interest_paid': totals['by_status'].get('Paid', {}).get('amount', 0),
+            'total_payouts': totals['payout_count'],
+            'total_investors': totals['investor_count'],
+            'current_month': current_month_str
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error fetching payout summary: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching payout summary: {str(e)}"
+        )
+
+
+@router.get("/count")
+async def get_payout_count(
+    series_id: Optional[int] = None,
+    status_filter: Optional[str] = None,
+    search: Optional[str] = None,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Number of payout rows GET /payouts/ would return for the same filters
+    Single COUNT query - no interest calculation
+    """
+    try:
+        db = get_db()
+        
+        # CHECK PERMISSION
+        if not has_permission(current_user, "view_interestPayout", db):
+            log_unauthorized_access(db, current_user, "get_payout_count", "view_interestPayout")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: You don't have permission to view payouts"
+            )
+        
+        current_date = datetime.now()
+        count = count_month_payouts(
+            db,
+            current_date.year,
+            current_date.month,
+            series_id=series_id,
+            search=search,
+            status_filter=status_filter
+        )
+        
+        return {
+            'count': count,
+            'interest_month': generate_payout_month(current_date.year, current_date.month)
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error counting payouts: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error counting payouts: {str(e)}"
+        )
+
+
+@router.get("/totals")
+async def get_payout_totals(
+    series_id: Optional[int] = None,
+    search: Optional[str] = None,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Totals for the current month's payouts: count, investors, amount, and
+    count / amount per status - without sending the rows
+    """
+    try:
+        db = get_db()
+        
+        # CHECK PERMISSION
+        if not has_permission(current_user, "view_interestPayout", db):
+            log_unauthorized_access(db, current_user, "get_payout_totals", "view_interestPayout")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: You don't have permission to view payouts"
+            )
+        
+        current_date = datetime.now()
+        totals = summarize_month_payouts(
+            db,
+            current_date.year,
+            current_date.month,
+            series_id=series_id,
+            search=search
+        )
+        totals['interest_month'] = generate_payout_month(current_date.year, current_date.month)
+        
+        return totals
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error calculating payout totals: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error calculating payout totals: {str(e)}"
+        )
+
+
+@router.get("/forecast")
+async def get_payout_forecast(
+    from_month: Optional[str] = Query(None, alias="from"),
+    months: int = 12,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Cash-flow forecast: interest + principal outflows for the next 3-36 months
+    
+    - from:   first PAYMENT month as YYYY-MM (default: next month)
+    - months: horizon length, 3 to 36 (default 12)
+    
+    Returns per-month totals, per-series monthly arrays (aligned with `months`)
+    and grand totals. Interest shown in a month is the previous month's interest.
+    ALL CALCULATIONS IN BACKEND
+    """
+    try:
+        db = get_db()
+        
+        # CHECK PERMISSION
+        if not has_permission(current_user, "view_interestPayout", db):
+            log_unauthorized_access(db, current_user, "get_payout_forecast", "view_interestPayout")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: You don't have permission to view payouts"
+            )
+        
+        if months < FORECAST_MIN_MONTHS or months > FORECAST_MAX_MONTHS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"months must be between {FORECAST_MIN_MONTHS} and {FORECAST_MAX_MONTHS}"
+            )
+        
+        if from_month:
+            try:
+                start = datetime.strptime(from_month, '%Y-%m')
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid 'from' month. Expected format: YYYY-MM (e.g. 2026-04)"
+                )
+            from_year, from_month_number = start.year, start.month
+        else:
+            current_date = datetime.now()
+            from_year, from_month_number = _add_months(current_date.year, current_date.month, 1)
+        
+        logger.info(f"📈 Payout forecast: from {from_year}-{from_month_number:02d} for {months} months")
+        
+        forecast = forecast_payouts(db, from_year, from_month_number, months)
+        forecast['generated_at'] = datetime.now().isoformat()
+        
+        return forecast
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error building payout forecast: {e}")
+        import traceback
+        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error building payout forecast: {str(e)}"
+        )
+
+
+PAYOUT_IMPORT_REQUIRED_COLUMNS = ['Investor ID', 'Series Name', 'Status']
+PAYOUT_IMPORT_VALID_STATUSES = ['Paid', 'Pending', 'Scheduled']
+
+# Formats tried (in order) when normalizing the "Interest Month" / "Interest Date"
+# columns. Each format is applied to the whole column at once; anything still
+# unparsed afterwards falls back to pandas' mixed-format parser.
+IMPORT_MONTH_FORMATS = ['%B %Y', '%b %Y', '%b-%y', '%B-%y', '%b-%Y', '%Y-%m', '%m/%Y', '%m-%Y']
+IMPORT_DATE_FORMATS = ['%d-%b-%Y', '%d-%b-%y', '%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y', '%B %d, %Y', '%d %B %Y']
+
+def normalize_series_key(name) -> str:
+    """
+    Normalize a series name for import matching
+    "SERIES-B", "Series B" and "series-b" all map to the same key
+    (replaces the per-row REPLACE(name, ' ', '-') SQL match)
+    """
+    return ' '.join(str(name).replace('-', ' ').split()).casefold()
+
+
+def _parse_import_dates(column, formats):
+    """
+    Vectorized date parsing for an import column
+
+    Handles datetime cells, Excel serial numbers and the text formats listed in
+    `formats`. Returns a datetime64 Series with NaT for blank/unparseable cells.
+    """
+    import pandas as pd
+
+    is_datetime = column.map(lambda v: hasattr(v, 'year'))
+    parsed = pd.to_datetime(column.where(is_datetime), errors='coerce')
+
+    # Excel serial numbers (e.g. 46082 → 2026-03-01)
+    is_number = column.map(lambda v: isinstance(v, (int, float)) and not isinstance(v, bool))
+    numeric = pd.to_numeric(column.where(is_number), errors='coerce')
+    parsed = parsed.fillna(pd.to_datetime(numeric, origin='1899-12-30', unit='D', errors='coerce'))
+
+    text = column.map(lambda v: v.strip() if isinstance(v, str) and v.strip() else None)
+    for fmt in formats:
+        remaining = parsed.isna() & text.notna()
+        if not remaining.any():
+            break
+        parsed = parsed.fillna(pd.to_datetime(text.where(remaining), format=fmt, errors='coerce'))
+
+    remaining = parsed.isna() & text.notna()
+    if remaining.any():
+        parsed = parsed.fillna(pd.to_datetime(text.where(remaining), format='mixed', errors='coerce'))
+
+    return parsed
+
+
+def normalize_payout_import_frame(df):
+    """
+    Normalize identifiers, status and dates for every row at once
+
+    Adds the columns used by apply_payout_import():
+    - investor_code / series_name / payout_status (stripped strings)
+    - payout_period (first of month) and payout_month ("March 2026")
+    - payout_date ("05-Apr-2026") or None when not supplied
+    - raw_month / raw_date and month_error / date_error for unparseable cells
+    """
+    import pandas as pd
+
+    df['investor_code'] = clean_text_column(df['Investor ID'])
+    df['series_name'] = clean_text_column(df['Series Name'])
+    df['payout_status'] = clean_text_column(df['Status'])
+
+    current_date = datetime.now()
+    default_period = pd.Timestamp(current_date.year, current_date.month, 1)
+
+    if 'Interest Month' in df.columns:
+        df['raw_month'] = clean_text_column(df['Interest Month'])
+        month_values = _parse_import_dates(df['Interest Month'].where(df['raw_month'] != ''), IMPORT_MONTH_FORMATS)
+        df['month_error'] = (df['raw_month'] != '') & month_values.isna()
+        df['payout_period'] = month_values.dt.to_period('M').dt.to_timestamp().fillna(default_period)
+    else:
+        df['raw_month'] = ''
+        df['month_error'] = False
+        df['payout_period'] = default_period
+
+    df['payout_month'] = df['payout_period'].dt.strftime('%B %Y')
+
+    if 'Interest Date' in df.columns:
+        df['raw_date'] = clean_text_column(df['Interest Date'])
+        date_values = _parse_import_dates(df['Interest Date'].where(df['raw_date'] != ''), IMPORT_DATE_FORMATS)
+        df['date_error'] = (df['raw_date'] != '') & date_values.isna()
+        df['payout_date'] = date_values.dt.strftime('%d-%b-%Y').where(date_values.notna(), '')
+    else:
+        df['raw_date'] = ''
+        df['date_error'] = False
+        df['payout_date'] = ''
+
+    return df
+
+
+def load_payout_import_lookups(db, investor_codes):
+    """
+    Resolve everything the import needs with set-based queries
+
+    Returns (investors, series, investments):
+    - investors:   casefolded investor code → {id, investor_id}
+    - series:      normalize_series_key(name) → {id, name, interest_payment_day, interest_rate}
+    - investments: (investor db id, series db id) → confirmed investment amount
+    """
+    investors = {}
+    for chunk in chunked(sorted(set(investor_codes))):
+        placeholders = ', '.join(['%s'] * len(chunk))
+        rows = db.execute_query(f"""
+        SELECT id, investor_id
+        FROM investors
+        WHERE investor_id IN ({placeholders}) AND is_active = 1
+        """, tuple(chunk))
+        for row in rows:
+            investors[str(row['investor_id']).strip().casefold()] = row
+
+    # ncd_series is small; load active series once and match on the normalized key
+    series = {}
+    for row in db.execute_query("""
+    SELECT id, name, interest_payment_day, interest_rate
+    FROM ncd_series
+    WHERE is_active = 1
+    ORDER BY id
+    """):
+        series.setdefault(normalize_series_key(row['name']), row)
+
+    investments = {}
+    investor_ids = sorted({row['id'] for row in investors.values()})
+    for chunk in chunked(investor_ids):
+        placeholders = ', '.join(['%s'] * len(chunk))
+        rows = db.execute_query(f"""
+        SELECT investor_id, series_id, amount
+        FROM investments
+        WHERE investor_id IN ({placeholders}) AND status = 'confirmed'
+        ORDER BY id
+        """, tuple(chunk))
+        for row in rows:
+            investments.setdefault((row['investor_id'], row['series_id']), float(row['amount']))
+
+    return investors, series, investments
+
+
+def _load_existing_payout_statuses(db, investor_ids, payout_periods):
+    """(investor id, series id, payout_period) → status for the rows touched by an import"""
+    periods = sorted(set(payout_periods))
+    if not periods:
+        return {}
+
+    records = load_payout_records(db, periods[0], next_payout_period(periods[-1]), investor_ids=investor_ids)
+    return {key: record['status'] for key, record in records.items()}
+
+
+def apply_payout_import(db, df):
+    """
+    Validate a normalized import frame and write it in one batched upsert
+
+    Existing (investor, series, month) rows get status / payout_date / paid_date
+    updated; new rows are inserted with the calculated monthly interest.
+    Rows changing a 'Paid' payout back to 'Scheduled'/'Pending' are rejected.
+
+    Returns (updated_count, errors) where errors is a list of
+    {'row': sheet row number, 'error': message} in sheet order.
+    """
+    errors = []
+
+    investors, series_map, investments = load_payout_import_lookups(
+        db, df['investor_code'].str.casefold().tolist()
+    )
+
+    # First pass: resolve ids in memory, collect per-row errors
+    candidates = []
+    for row in df.itertuples(index=False):
+        row_number = row.sheet_row
+        investor_code = row.investor_code
+        series_name = row.series_name
+        payout_status = row.payout_status
+
+        if payout_status not in PAYOUT_IMPORT_VALID_STATUSES:
+            errors.append({'row': row_number, 'error': f"Invalid status '{payout_status}'. Must be one of: {', '.join(PAYOUT_IMPORT_VALID_STATUSES)}"})
+            continue
+
+        investor = investors.get(investor_code.casefold())
+        if not investor:
+            errors.append({'row': row_number, 'error': f"Investor '{investor_code}' not found"})
+            continue
+
+        series = series_map.get(normalize_series_key(series_name))
+        if not series:
+            errors.append({'row': row_number, 'error': f"Series '{series_name}' not found"})
+            continue
+
+        investment_amount = investments.get((investor['id'], series['id']))
+        if investment_amount is None:
+            errors.append({'row': row_number, 'error': f"Investor '{investor_code}' is not invested in series '{series_name}'"})
+            continue
+
+        if row.month_error:
+            errors.append({'row': row_number, 'error': f"Invalid Interest Month format '{row.raw_month}'. Expected formats: 'Mar-26', 'March 2026', or '2026-03'"})
+            continue
+
+        if row.date_error:
+            errors.append({'row': row_number, 'error': f"Invalid Interest Date format '{row.raw_date}'. Expected formats: '05-Apr-26', 'April 5, 2026', or '2026-04-05'"})
+            continue
+
+        candidates.append((row, investor, series, investment_amount))
+
+    existing_statuses = _load_existing_payout_statuses(
+        db,
+        [investor['id'] for _, investor, _, _ in candidates],
+        [row.payout_period.date() for row, _, _, _ in candidates]
+    )
+
+    # Second pass: audit-compliance guard and build the upsert batch.
+    # Later rows for the same (investor, series, month) win, like sequential updates did.
+    current_date = datetime.now()
+    today = current_date.date()
+    upserts = {}
+    updated_count = 0
+
+    for row, investor, series, investment_amount in candidates:
+        key = (investor['id'], series['id'], row.payout_period.date())
+        existing_status = existing_statuses.get(key)
+
+        if existing_status == 'Paid' and row.payout_status in ['Scheduled', 'Pending']:
+            errors.append({'row': row.sheet_row, 'error': f"Cannot change status from 'Paid' to '{row.payout_status}' for {row.investor_code}. This is not allowed for audit compliance."})
+            continue
+
+        payout_date = row.payout_date or generate_payout_date(
+            current_date.year,
+            current_date.month,
+            series['interest_payment_day'] or 15
+        )
+
+        amount = calculate_monthly_interest(
+            investment_amount,
+            float(series['interest_rate']),
+            row.payout_period.month,
+            row.payout_period.year
+        )
+
+        upserts[key] = (
+            investor['id'],
+            series['id'],
+            row.payout_month,
+            row.payout_period.date(),
+            payout_date,
+            amount,
+            row.payout_status,
+            today if row.payout_status == 'Paid' else None
+        )
+        existing_statuses[key] = row.payout_status
+        updated_count += 1
+
+    if upserts:
+        # amount is only set on insert - existing payouts keep their stored amount
+        upsert_query = """
+        INSERT INTO interest_payouts (
+            investor_id,
+            series_id,
+            payout_month,
+            payout_period,
+            payout_date,
+            amount,
+            status,
+            paid_date,
+            created_at,
+            updated_at
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
+        ON DUPLICATE KEY UPDATE
+            payout_period = VALUES(payout_period),
+            status = VALUES(status),
+            payout_date = VALUES(payout_date),
+            paid_date = VALUES(paid_date),
+            updated_at = NOW()
+        """
+        db.execute_many(upsert_query, list(upserts.values()))
+
+    errors.sort(key=lambda error: error['row'])
+    return updated_count, errors
+
+
+def log_payout_import_audit(db, file_name: str, admin_name: str, admin_role: str, updated_count: int, errors: list):
+    """
+    Write the audit_logs entry for a payout import (inline or background job)
+    """
+    try:
+        audit_query = """
+        INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
+        """
+        
+        success = updated_count > 0
+        error_count = len(errors)
+        
+        if success:
+            action = 'Payout Data Imported'
+            details = f"Successfully imported {updated_count} payout record(s) from file '{file_name}'"
+        else:
+            action = 'Payout Data Import Failed'
+            details = f"Failed to import payout data from file '{file_name}' - {error_count} error(s), {updated_count} record(s) processed"
+        
+        changes_json = json.dumps({
+            'fileName': file_name,
+            'successCount': updated_count,
+            'errorCount': error_count,
+            'errors': errors[:5],  # Store first 5 errors
+            'action': 'payout_import' if success else 'payout_import_failed'
+        })
+        
+        db.execute_query(audit_query, (
+            action,
+            admin_name,
+            admin_role,
+            details,
+            'Interest Payout',
+            'Import Operation',
+            changes_json
+        ))
+        logger.info(f"✅ Audit log created for payout import: {file_name}")
+    except Exception as audit_error:
+        logger.error(f"⚠️ Failed to create audit log for payout import: {audit_error}")
+
+
+@router.post("/import")
+async def import_payouts(
+    file: UploadFile = File(...),
+    background: bool = False,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Import payout data from Excel/CSV file
+    Updates payout status, interest month, and interest date
+
+    Pipeline: stream sheet → vectorized date normalization → set-based lookups
+    → one batched INSERT ... ON DUPLICATE KEY UPDATE
+
+    background=true: returns a job id immediately and processes the file in a
+    background worker (poll GET /jobs/{job_id} for progress)
+    ALL LOGIC IN BACKEND - NO FRONTEND CALCULATIONS
+    """
+    try:
+        db = get_db()
+        
+        # CHECK PERMISSION
+        if not has_permission(current_user, "edit_interestPayout", db):
+            log_unauthorized_access(db, current_user, "import_payouts", "edit_interestPayout")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: You don't have permission to import payouts"
+            )
+        
+        logger.info(f"📤 Importing payouts from file: {file.filename}")
+        
+        # Validate file type
+        if not file.filename.lower().endswith(('.xlsx', '.xls', '.csv')):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid file type. Please upload an Excel or CSV file (.xlsx, .xls or .csv)"
+            )
+        
+        contents = await file.read()
+        
+        if background:
+            from app.services.jobs.import_jobs import submit_import_job
+            
+            job = submit_import_job(db, 'payout_import', file.filename, contents, current_user)
+            return {
+                'success': True,
+                'message': f"Import queued for processing (job {job['id']})",
+                'job_id': job['id'],
+                'status': job['status']
+            }
+        
+        # Read the sheet
+        try:
+            df = read_import_sheet(contents, file.filename)
+            
+            logger.info(f"📊 Read {len(df)} rows from import file")
+            logger.info(f"📊 Columns: {df.columns.tolist()}")
+            
+        except Exception as e:
+            logger.error(f"❌ Error reading import file: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Error reading import file: {str(e)}"
+            )
+        
+        # Validate required columns
+        missing_columns = [col for col in PAYOUT_IMPORT_REQUIRED_COLUMNS if col not in df.columns]
+        if missing_columns:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Missing required columns: {', '.join(missing_columns)}"
+            )
+        
+        # Process all rows as one batch
+        df = normalize_payout_import_frame(df)
+        updated_count, row_errors = apply_payout_import(db, df)
+        
+        error_count = len(row_errors)
+        errors = [f"Row {error['row']}: {error['error']}" for error in row_errors]
+        
+        # Prepare response
+        success = updated_count > 0
+        message = f"Successfully processed {updated_count} payout(s)"
+        
+        if error_count > 0:
+            message += f". {error_count} error(s) encountered."
+        
+        logger.info(f"✅ Import complete: {updated_count} updated, {error_count} errors")
+        
+        # Log all errors for debugging
+        if errors:
+            logger.error(f"❌ Import errors encountered:")
+            for error in errors[:10]:
+                logger.error(f"   - {error}")
+        
+        # Log to audit_logs table
+        log_payout_import_audit(
+            db,
+            file.filename,
+            current_user.full_name or current_user.username,
+            current_user.role,
+            updated_count,
+            errors
+        )
+        
+        return {
+            'success': success,
+            'message': message,
+            'updated_count': updated_count,
+            'error_count': error_count,
+            'errors': errors[:10]  # Return first 10 errors
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error importing payouts: {e}")
+        import traceback
+        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error importing payouts: {str(e)}"
+        )
+
+
+@router.put("/update-status/{payout_id}")
+async def update_payout_status(
+    payout_id: int,
+    new_status: str,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Update payout status for a single payout
+    
+    PERMISSION REQUIRED: edit_interestPayout
+    
+    Parameters:
+    - payout_id: ID of the payout to update
+    - new_status: New status ('Paid', 'Pending', 'Scheduled', 'Processing')
+    
+    ALL LOGIC IN BACKEND
+    """
+    try:
+        db = get_db()
+        
+        if not has_permission(current_user, "edit_interestPayout", db):
+            log_unauthorized_access(db, current_user, "update_payout_status", "edit_interestPayout")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: You don't have permission to update payouts"
             )
-            
-            # Check if we should skip this payout (already past maturity or exit)
-            if should_skip_payout(payout_date_obj, maturity_date, exit_date, last_payout_date):
-                logger.info(f"Skipping payout for {row['investor_code']}: Already past maturity/exit")
-                continue
-            
-            # Calculate interest amount based on CORRECT LOGIC
-            # RULE 1: Exit → Calculate from series start (or 1st of month) to exit date (HIGHEST PRIORITY)
-            # RULE 2: Maturity → Calculate from series start (or 1st of month) to maturity date
-            # RULE 3: First partial month → Calculate from series start to END OF MONTH
-            # RULE 4: Regular full months → FIXED monthly amount (1st to last day)
-            
-            # DEBUG: Log the check
-            is_first = is_first_payout(series_start_date, interest_month, interest_year) if series_start_date else False
-            logger.info(f"🔍 DEBUG {row['investor_code']}: series_start={series_start_date}, interest_period={interest_year}-{interest_month}, is_first={is_first}, exit={exit_date}")
-            
-            if exit_date and is_final_payout_after_exit(payout_date_obj, exit_date):
-                if series_start_date and is_first_payout(series_start_date, interest_month, interest_year):
-                    days_from_start_to_exit = (exit_date - series_start_date).days + 1
-                    import calendar
-                    days_in_year = 366 if calendar.isleap(exit_date.year) else 365
-                    monthly_interest = (float(row['investment_amount']) * float(row['interest_rate']) * days_from_start_to_exit) / 100 / days_in_year
-                else:
-                    monthly_interest = calculate_exit_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        exit_date,
-                        interest_month - 1 if interest_month > 1 else 12,
-                        interest_year if interest_month > 1 else interest_year - 1
-                    )
-            
-            elif maturity_date and is_last_payout_before_maturity(payout_date_obj, maturity_date):
-                if series_start_date and is_first_payout(series_start_date, interest_month, interest_year):
-                    days_from_start_to_maturity = (maturity_date - series_start_date).days + 1
-                    import calendar
-                    days_in_year = 366 if calendar.isleap(maturity_date.year) else 365
-                    monthly_interest = (float(row['investment_amount']) * float(row['interest_rate']) * days_from_start_to_maturity) / 100 / days_in_year
-                else:
-                    monthly_interest = calculate_maturity_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        maturity_date,
-                        interest_month - 1 if interest_month > 1 else 12,
-                        interest_year if interest_month > 1 else interest_year - 1
-                    )
-            
-            elif series_start_date and is_first_payout(series_start_date, interest_month, interest_year):
-                monthly_interest = calculate_first_month_interest(
-                    float(row['investment_amount']),
-                    float(row['interest_rate']),
-                    series_start_date,
-                    interest_month,
-                    interest_year,
-                    row['interest_payment_day'] or 15
-                )
-            
-            else:
-                monthly_interest = calculate_monthly_interest(
-                    float(row['investment_amount']),
-                    float(row['interest_rate']),
-                    interest_month,
-                    interest_year
-                )
-            
-            # Check if payout record exists in database
-            # Handle both old format (2026-03) and new format (March 2026)
-            payout_query = """
-            SELECT id, status, payout_month, payout_date, paid_date, amount
-            FROM interest_payouts
-            WHERE investor_id = %s 
-            AND series_id = %s 
-            AND (payout_month = %s OR payout_month = %s)
-            AND is_active = 1
-            """
-            
-            # Generate both formats for backward compatibility
-            month_format_new = current_month_str  # "March 2026"
-            month_format_old = f"{interest_year}-{interest_month:02d}"  # "2026-03"
-            
-            payout_result = db.execute_query(payout_query, (
-                row['investor_id'],
-                row['series_id'],
-                month_format_new,
-                month_format_old
-            ))
-            
-            # Always use the current interest_payment_day from series to calculate payout date
-            # This ensures dates are always up-to-date with series settings
-            payment_day = row['interest_payment_day'] or 15
-            logger.info(f"🔍 DEBUG: Investor {row['investor_code']}, Series {row['series_name']}, Payment Day: {payment_day}")
-            
-            payout_date = generate_payout_date(
-                interest_year,
-                interest_month,
-                payment_day
+        
+        # Validate status
+        valid_statuses = ['Paid', 'Pending', 'Scheduled', 'Processing']
+        if new_status not in valid_statuses:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
             )
+        
+        # Get existing payout
+        existing_query = """
+        SELECT id, status, investor_id, series_id, amount
+        FROM interest_payouts
+        WHERE id = %s AND is_active = 1
+        """
+        
+        existing_result = db.execute_query(existing_query, (payout_id,))
+        
+        if not existing_result or len(existing_result) == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Payout with ID {payout_id} not found"
+            )
+        
+        existing_payout = existing_result[0]
+        existing_status = existing_payout['status']
+        
+        # SECURITY CHECK: Prevent changing "Paid" back to "Scheduled" or "Pending"
+        if existing_status == 'Paid' and new_status in ['Scheduled', 'Pending']:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot change status from 'Paid' to 'Scheduled' or 'Pending'. This is not allowed for audit compliance."
+            )
+        
+        # Update payout status
+        paid_date = datetime.now().date() if new_status == 'Paid' else None
+        
+        update_query = """
+        UPDATE interest_payouts
+        SET status = %s,
+            paid_date = %s,
+            updated_at = NOW()
+        WHERE id = %s
+        """
+        
+        db.execute_query(update_query, (new_status, paid_date, payout_id))
+        
+        logger.info(f"✅ Payout {payout_id} status updated from '{existing_status}' to '{new_status}' by {current_user.username}")
+        
+        # Log to audit_logs table
+        try:
+            audit_query = """
+            INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
+            """
             
-            logger.info(f"🔍 DEBUG: Generated payout date: {payout_date}")
-            
-            if payout_result and len(payout_result) > 0:
-                # Use existing payout record for status and month
-                payout_record = payout_result[0]
-                payout_status = payout_record['status']
-                payout_month = payout_record['payout_month']
-                # Always use CALCULATED amount, not stored amount
-                # Note: We use the calculated payout_date, not the stored one
-            else:
-                # Generate default payout for current month
-                payout_status = 'Scheduled'
-                payout_month = current_month_str
-            
-            # Apply status filter if provided
-            if status_filter and payout_status != status_filter:
-                continue
-            
-            payouts.append({
-                'id': payout_id,
-                'investor_id': row['investor_code'],
-                'investor_name': row['investor_name'],
-                'series_id': row['series_id'],
-                'series_name': row['series_name'],
-                'interest_month': payout_month,
-                'interest_date': payout_date,
-                'amount': monthly_interest,
-                'status': payout_status,
-                'bank_name': row['bank_name'] or 'N/A',
-                'bank_account_number': row['account_number'] or 'N/A',
-                'ifsc_code': row['ifsc_code'] or 'N/A'
+            changes_json = json.dumps({
+                'payout_id': payout_id,
+                'old_status': existing_status,
+                'new_status': new_status,
+                'paid_date': paid_date.isoformat() if paid_date else None,
+                'amount': float(existing_payout['amount']),
+                'action': 'payout_status_updated'
             })
             
-            payout_id += 1
-        
-        logger.info(f"✅ Generated {len(payouts)} payout records")
+            db.execute_query(audit_query, (
+                'Payout Status Updated',
+                current_user.full_name or current_user.username,
+                current_user.role,
+                f"Updated payout status from '{existing_status}' to '{new_status}' for payout ID {payout_id}",
+                'Interest Payout',
+                str(payout_id),
+                changes_json
+            ))
+            logger.info(f"✅ Audit log created for payout status update: {payout_id}")
+        except Exception as audit_error:
+            logger.error(f"⚠️ Failed to create audit log for payout status update: {audit_error}")
         
         return {
-            'payouts': payouts,
-            'count': len(payouts)
+            "success": True,
+            "message": f"Payout status updated to '{new_status}' successfully",
+            "payout_id": payout_id,
+            "old_status": existing_status,
+            "new_status": new_status,
+            "paid_date": paid_date.isoformat() if paid_date else None
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error fetching payouts: {e}")
+        logger.error(f"❌ Error updating payout status: {e}")
         import traceback
         logger.error(f"❌ Traceback: {traceback.format_exc()}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching payouts: {str(e)}"
+            detail=f"Error updating payout status: {str(e)}"
         )
 
 
-@router.get("/export")
-async def get_export_payouts(
+# ============================================
+# BULK STATUS UPDATES
+# ============================================
+
+PAYOUT_BULK_UPDATE_CHUNK_SIZE = 1000
+
+# Statuses a 'Paid' payout may never go back to (audit compliance)
+PAID_LOCKED_STATUSES = ('Scheduled', 'Pending')
+
+
+def _select_bulk_payouts(db, payout_ids=None, period=None, series_id=None, current_status=None) -> list:
+    """Payouts targeted by a bulk update: [{'id', 'status', 'amount'}] (by ids, or by filters)"""
+    query = """
+    SELECT id, status, amount
+    FROM interest_payouts
+    WHERE is_active = 1
+    """
+    params = []
+
+    if period:
+        query += " AND payout_period = %s"
+        params.append(period)
+
+    if series_id:
+        query += " AND series_id = %s"
+        params.append(series_id)
+
+    if current_status:
+        query += " AND status = %s"
+        params.append(current_status)
+
+    if payout_ids is None:
+        return db.execute_query(query, tuple(params))
+
+    rows = []
+    for chunk in chunked(sorted(set(payout_ids)), PAYOUT_BULK_UPDATE_CHUNK_SIZE):
+        placeholders = ', '.join(['%s'] * len(chunk))
+        rows.extend(db.execute_query(f"{query} AND id IN ({placeholders})", tuple(params) + tuple(chunk)))
+    return rows
+
+
+def bulk_update_payout_statuses(
+    db,
+    new_status: str,
+    payout_ids: Optional[list] = None,
+    period: Optional[date] = None,
+    series_id: Optional[int] = None,
+    current_status: Optional[str] = None
+) -> dict:
+    """
+    Move many payouts to new_status in one transaction
+
+    Rows are picked once, then updated with one set-based UPDATE per chunk of ids.
+    The UPDATE repeats the status guards, so a row changed by someone else in the
+    meantime is not overwritten with a disallowed transition.
+    Paid payouts are never moved back to Scheduled / Pending - they are counted as skipped.
+    """
+    rows = _select_bulk_payouts(db, payout_ids, period, series_id, current_status)
+
+    unchanged = [row for row in rows if row['status'] == new_status]
+    locked = [row for row in rows if row['status'] == 'Paid' and new_status in PAID_LOCKED_STATUSES]
+    eligible = [row for row in rows if row['status'] != new_status and not (row['status'] == 'Paid' and new_status in PAID_LOCKED_STATUSES)]
+
+    old_status_counts = {}
+    for row in eligible:
+        old_status_counts[row['status']] = old_status_counts.get(row['status'], 0) + 1
+
+    paid_date = datetime.now().date() if new_status == 'Paid' else None
+    guard = " AND status <> 'Paid'" if new_status in PAID_LOCKED_STATUSES else ""
+
+    updated_count = 0
+    eligible_ids = [row['id'] for row in eligible]
+
+    if eligible_ids:
+        with db.transaction():
+            for chunk in chunked(eligible_ids, PAYOUT_BULK_UPDATE_CHUNK_SIZE):
+                placeholders = ', '.join(['%s'] * len(chunk))
+                updated_count += db.execute_query(f"""
+                UPDATE interest_payouts
+                SET status = %s,
+                    paid_date = %s,
+                    updated_at = NOW()
+                WHERE id IN ({placeholders})
+                AND is_active = 1
+                AND status <> %s{guard}
+                """, (new_status, paid_date) + tuple(chunk) + (new_status,)) or 0
+
+    found_ids = {row['id'] for row in rows}
+
+    return {
+        'new_status': new_status,
+        'paid_date': paid_date.isoformat() if paid_date else None,
+        'matched_count': len(rows),
+        'updated_count': updated_count,
+        'unchanged_count': len(unchanged),
+        'skipped_paid_count': len(locked),
+        'not_found_count': len(set(payout_ids) - found_ids) if payout_ids is not None else 0,
+        'old_status_counts': old_status_counts,
+        'total_amount': round(sum(float(row['amount']) for row in eligible), 2),
+        'payout_id_range': [min(eligible_ids), max(eligible_ids)] if eligible_ids else None
+    }
+
+
+@router.put("/bulk-update-status")
+async def bulk_update_payout_status(
+    request: PayoutBulkStatusUpdate,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Update the status of many payouts in one call
+
+    PERMISSION REQUIRED: edit_interestPayout
+
+    Body:
+    - new_status: 'Paid', 'Pending' or 'Scheduled'
+    - payout_ids: list of payout ids, OR
+    - month ("2026-03", interest month) with optional series_id / current_status filters
+
+    Runs in one transaction and writes ONE summarized audit record (counts, id range,
+    filters and total amount - not the individual ids).
+    Paid payouts are never moved back to Scheduled/Pending (reported as skipped).
+
+    ALL LOGIC IN BACKEND
+    """
+    try:
+        db = get_db()
+
+        if not has_permission(current_user, "edit_interestPayout", db):
+            log_unauthorized_access(db, current_user, "bulk_update_payout_status", "edit_interestPayout")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: You don't have permission to update payouts"
+            )
+
+        new_status = request.new_status.value
+        current_status = request.current_status.value if request.current_status else None
+
+        if request.payout_ids is not None and request.month:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Send either payout_ids or filters (month, series_id, current_status), not both"
+            )
+
+        period = None
+        if request.payout_ids is not None:
+            if not request.payout_ids:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="payout_ids must not be empty"
+                )
+        elif request.month:
+            try:
+                month_date = datetime.strptime(request.month, '%Y-%m')
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid month format. Use YYYY-MM (e.g., 2026-03)"
+                )
+            period = generate_payout_period(month_date.year, month_date.month)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide payout_ids or a month (YYYY-MM) to select payouts"
+            )
+
+        result = bulk_update_payout_statuses(
+            db,
+            new_status,
+            payout_ids=request.payout_ids,
+            period=period,
+            series_id=request.series_id,
+            current_status=current_status
+        )
+
+        logger.info(f"✅ Bulk status update to '{new_status}' by {current_user.username}: {result['updated_count']} updated, {result['skipped_paid_count']} Paid skipped")
+
+        # One audit record for the whole batch
+        if result['updated_count']:
+            try:
+                audit_query = """
+                INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
+                """
+
+                changes_json = json.dumps({
+                    'new_status': new_status,
+                    'paid_date': result['paid_date'],
+                    'filters': {
+                        'month': request.month,
+                        'series_id': request.series_id,
+                        'current_status': current_status
+                    } if request.payout_ids is None else None,
+                    'requested_count': len(request.payout_ids) if request.payout_ids is not None else None,
+                    'matched_count': result['matched_count'],
+                    'updated_count': result['updated_count'],
+                    'skipped_paid_count': result['skipped_paid_count'],
+                    'old_status_counts': result['old_status_counts'],
+                    'total_amount': result['total_amount'],
+                    'payout_id_range': result['payout_id_range'],
+                    'action': 'payout_status_bulk_updated'
+                })
+
+                db.execute_query(audit_query, (
+                    'Payout Status Bulk Updated',
+                    current_user.full_name or current_user.username,
+                    current_user.role,
+                    f"Updated {result['updated_count']} payouts to '{new_status}' (Rs.{result['total_amount']:,.2f})",
+                    'Interest Payout',
+                    f"{request.series_id}" if request.series_id else 'bulk',
+                    changes_json
+                ))
+            except Exception as audit_error:
+                logger.error(f"⚠️ Failed to create audit log for bulk payout status update: {audit_error}")
+
+        return {
+            "success": True,
+            "message": f"{result['updated_count']} payout(s) updated to '{new_status}'",
+            "new_status": new_status,
+            "paid_date": result['paid_date'],
+            "matched_count": result['matched_count'],
+            "updated_count": result['updated_count'],
+            "unchanged_count": result['unchanged_count'],
+            "skipped_paid_count": result['skipped_paid_count'],
+            "not_found_count": result['not_found_count'],
+            "total_amount": result['total_amount']
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error in bulk payout status update: {e}")
+        import traceback
+        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error updating payout statuses: {str(e)}"
+        )
+
+
+# ============================================
+# STREAMING DOWNLOADS
+# Rows are written as iter_month_payouts yields them - nothing is held in memory
+# ============================================
+
+PAYOUT_LIST_DOWNLOAD_HEADERS = [
+    'Investor ID', 'Investor Name', 'Series Name', 
+    'Interest Month', 'Interest Date', 'Amount', 
+    'Status', 'Bank Name', 'Account Number', 'IFSC Code'
+]
+
+PAYOUT_EXPORT_DOWNLOAD_HEADERS = [
+    'Investor ID', 'Investor Name', 'Series', 
+    'Month', 'Date', 'Amount', 
+    'Status', 'Bank Account', 'IFSC Code', 'Bank Name'
+]
+
+DOWNLOAD_FORMATS = ('csv', 'xlsx')
+
+# Column widths / styles for the Excel variants (Amount is column 6)
+PAYOUT_DOWNLOAD_XLSX_OPTIONS = {
+    'widths': [15, 30, 25, 16, 14, 14, 12, 25, 22, 15],
+    'column_styles': [None, None, None, None, None, 'currency', None, None, None, None]
+}
+
+
+def iter_csv(headers: list, rows, trailer_rows=None, flush_every: int = 500):
+    """
+    Generator yielding CSV text in blocks of rows
+    Starts with the UTF-8 BOM for Excel. trailer_rows is called after the
+    last row (so it can use totals gathered while streaming).
+    """
+    import csv
+    import io
+
+    output = io.StringIO()
+    output.write('\ufeff')
+    writer = csv.writer(output)
+    writer.writerow(headers)
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % flush_every == 0:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+
+    if trailer_rows:
+        writer.writerows(trailer_rows())
+
+    yield output.getvalue()
+    output.close()
+
+
+def _open_stream_db() -> Database:
+    """
+    Dedicated connection for a streaming response
+    The generator runs in a worker thread while other requests use the global one
+    """
+    stream_db = Database()
+    stream_db.connect()
+    return stream_db
+
+
+def _download_response(content, file_format: str, filename: str) -> StreamingResponse:
+    media_type = XLSX_MEDIA_TYPE if file_format == 'xlsx' else "text/csv; charset=utf-8"
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}"
+        }
+    )
+
+
+def _validate_download_format(file_format: str):
+    if file_format not in DOWNLOAD_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid format. Must be 'csv' or 'xlsx'"
+        )
+
+
+@router.get("/download/csv")
+async def download_payouts_csv(
     series_id: Optional[int] = None,
-    month_type: str = 'current',  # 'current' or 'upcoming'
+    status_filter: Optional[str] = None,
+    format: str = 'csv',
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Get payouts for export (current or upcoming month)
-    ALL CALCULATIONS IN BACKEND
+    Download payouts as a CSV (default) or Excel file
+    Streamed row by row - the download starts before the last payout is calculated
+    ALL CSV GENERATION IN BACKEND
     """
     try:
         db = get_db()
         
-        print("=" * 100)
-        print("🚀🚀🚀 EXPORT PAYOUTS CALLED - NEW CODE IS RUNNING 🚀🚀🚀")
-        print("=" * 100)
-        
         # CHECK PERMISSION
         if not has_permission(current_user, "view_interestPayout", db):
-            log_unauthorized_access(db, current_user, "get_export_payouts", "view_interestPayout")
+            log_unauthorized_access(db, current_user, "download_payouts_csv", "view_interestPayout")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access Denied: You don't have permission to view payouts"
+                detail="Access Denied: You don't have permission to download payouts"
             )
         
-        logger.info(f"📊 Fetching export payouts: month_type={month_type}, series_id={series_id}")
+        _validate_download_format(format)
         
-        # CRITICAL BUSINESS RULE:
-        # Interest for a month is PAID in the NEXT month
-        # 
-        # "Current Month" Export = Interest for THIS month (to be paid NEXT month)
-        #   - Interest Period: CURRENT month
-        #   - Payout Date: NEXT month
-        #   Example: In February, show February interest (to be paid in March)
-        #
-        # "Upcoming Month" Export = Interest for NEXT month (to be paid in month after)
-        #   - Interest Period: NEXT month
-        #   - Payout Date: Month after next
-        #   Example: In February, show March interest (to be paid in April)
+        logger.info(f"📥 Generating payouts {format} for user: {current_user.username}")
         
+        # Interest month is ALWAYS the current month (same as GET /payouts/)
         current_date = datetime.now()
+        filename = f"interest-payouts-{current_date.strftime('%Y-%m-%d')}.{format}"
+        admin_name = current_user.full_name or current_user.username
+        admin_role = current_user.role
         
-        if month_type == 'upcoming':
-            # Upcoming = Interest for NEXT month
-            if current_date.month == 12:
-                interest_year = current_date.year + 1
-                interest_month = 1
-            else:
-                interest_year = current_date.year
-                interest_month = current_date.month + 1
-        else:
-            # Current = Interest for THIS month
-            interest_year = current_date.year
-            interest_month = current_date.month
-        
-        target_year = interest_year
-        target_month = interest_month
-        
-        target_month_str = generate_payout_month(target_year, target_month)
-        
-        logger.info(f"📅 Target month: {target_month_str}")
-        
-        # FIXED: Query to get investments for payout calculation
-        # RULE 1: Include ACTIVE investments (status = 'confirmed')
-        # RULE 2: Include EXITED investments (status = 'cancelled') ONLY if exit is in target month or future
-        # RULE 3: Exclude investments where exit/maturity was in past months
-        # RULE 4: Show payouts for ANY series that has started (series_start_date <= CURDATE())
-        #         regardless of series status (DRAFT, upcoming, accepting, active, matured, etc.)
-        # RULE 5: Exclude investments where maturity date is BEFORE the target payout month
-        query = """
-        SELECT 
-            inv.id as investor_id,
-            inv.investor_id as investor_code,
-            inv.full_name as investor_name,
-            inv.bank_name,
-            inv.account_number,
-            inv.ifsc_code,
-            i.id as investment_id,
-            i.amount as investment_amount,
-            i.exit_date,
-            i.status as investment_status,
-            i.series_id,
-            s.name as series_name,
-            s.interest_rate,
-            s.interest_payment_day,
-            s.series_start_date,
-            s.maturity_date,
-            s.lock_in_date
-        FROM investors inv
-        INNER JOIN investments i ON inv.id = i.investor_id
-        INNER JOIN ncd_series s ON i.series_id = s.id
-        WHERE (
-            (i.status = 'confirmed' AND inv.is_active = 1)
-            OR 
-            (i.status = 'cancelled' AND i.exit_date IS NOT NULL 
-             AND YEAR(i.exit_date) * 12 + MONTH(i.exit_date) >= %s)
-        )
-        AND s.is_active = 1
-        AND s.series_start_date <= CURDATE()
-        AND (s.maturity_date IS NULL OR YEAR(s.maturity_date) * 12 + MONTH(s.maturity_date) >= %s)
-        """
-        
-        # Calculate target month as a comparable number (YYYY * 12 + MM)
-        target_month_number = target_year * 12 + target_month
-        params = [target_month_number, target_month_number]
-        
-        if series_id:
-            query += " AND s.id = %s"
-            params.append(series_id)
-        
-        query += " ORDER BY inv.investor_id, s.name"
-        
-        result = db.execute_query(query, tuple(params) if params else None)
-        
-        # Generate payout records
-        payouts = []
-        payout_id = 1
-        
-        for row in result:
-            # Get series start date
-            series_start_date = row['series_start_date']
-            if isinstance(series_start_date, str):
-                try:
-                    series_start_date = datetime.strptime(series_start_date, '%Y-%m-%d').date()
-                except:
-                    series_start_date = None
-            
-            # Get maturity date
-            maturity_date = row.get('maturity_date')
-            if isinstance(maturity_date, str):
-                try:
-                    maturity_date = datetime.strptime(maturity_date, '%Y-%m-%d').date()
-                except:
-                    maturity_date = None
-            
-            # Get exit date
-            exit_date = row.get('exit_date')
-            if isinstance(exit_date, str):
-                try:
-                    exit_date = datetime.strptime(exit_date, '%Y-%m-%d').date()
-                except:
-                    exit_date = None
-            
-            # Generate payout date for target month
-            # Use proper calendar logic to handle months with different days
-            import calendar
-            payment_day = row['interest_payment_day'] or 15
-            max_day_in_month = calendar.monthrange(target_year, target_month)[1]
-            actual_payment_day = min(payment_day, max_day_in_month)
-            
-            payout_date_obj = date(
-                target_year,
-                target_month,
-                actual_payment_day
-            )
+        def generate():
+            stream_db = _open_stream_db()
+            totals = PayoutTotals()
             
-            # Get last payout date for period calculation
-            last_payout_date = get_last_payout_date(
-                series_start_date if series_start_date else payout_date_obj,
-                row['interest_payment_day'] or 15,
-                payout_date_obj
-            )
-            
-            # Check if we should skip this payout (already past maturity or exit)
-            if should_skip_payout(payout_date_obj, maturity_date, exit_date, last_payout_date):
-                logger.info(f"Skipping export payout for {row['investor_code']}: Already past maturity/exit")
-                continue
+            def rows():
+                for payout in iter_month_payouts(
+                    stream_db,
+                    current_date.year,
+                    current_date.month,
+                    series_id=series_id,
+                    status_filter=status_filter
+                ):
+                    totals.add(payout)
+                    yield [
+                        payout['investor_id'],
+                        payout['investor_name'],
+                        payout['series_name'],
+                        payout['interest_month'],
+                        payout['interest_date'],
+                        payout['amount'],
+                        payout['status'],
+                        payout['bank_name'] or 'N/A',
+                        payout['bank_account_number'] or 'N/A',
+                        payout['ifsc_code'] or 'N/A'
+                    ]
             
-            # Calculate interest amount based on CORRECT LOGIC
-            # RULE 1: Exit → Calculate from series start (or 1st of month) to exit date (HIGHEST PRIORITY)
-            # RULE 2: Maturity → Calculate from series start (or 1st of month) to maturity date
-            # RULE 3: First partial month → Calculate from series start to END OF MONTH
-            # RULE 4: Regular full months → FIXED monthly amount (1st to last day)
-            
-            if exit_date and is_final_payout_after_exit(payout_date_obj, exit_date):
-                # SCENARIO 1: Investor has exited - Calculate from series start (or 1st) to exit date
-                # This takes PRIORITY over first month calculation
-                
-                print(f"\n{'='*100}")
-                print(f"🚨 EXPORT: EXIT DETECTED for {row['investor_code']}")
-                print(f"   Series Start: {series_start_date}")
-                print(f"   Exit Date: {exit_date}")
-                print(f"   Target Month: {target_month}/{target_year}")
-                print(f"   Is First Payout: {is_first_payout(series_start_date, target_month, target_year) if series_start_date else False}")
-                print(f"{'='*100}\n")
-                
-                if series_start_date and is_first_payout(series_start_date, target_month, target_year):
-                    # Exit in first month: Calculate from series start to exit date
-                    days_from_start_to_exit = (exit_date - series_start_date).days + 1
-                    import calendar
-                    days_in_year = 366 if calendar.isleap(exit_date.year) else 365
-                    monthly_interest = (float(row['investment_amount']) * float(row['interest_rate']) * days_from_start_to_exit) / 100 / days_in_year
-                    
-                    print(f"\n{'='*100}")
-                    print(f"💰 EXPORT: EXIT IN FIRST MONTH CALCULATION for {row['investor_code']}")
-                    print(f"   Principal: Rs.{row['investment_amount']:,.2f}")
-                    print(f"   Rate: {row['interest_rate']}%")
-                    print(f"   Period: {series_start_date} to {exit_date}")
-                    print(f"   Days: {days_from_start_to_exit}")
-                    print(f"   Formula: ({row['investment_amount']} × {row['interest_rate']}% × {days_from_start_to_exit}) / {days_in_year}")
-                    print(f"   RESULT: Rs.{monthly_interest:,.2f}")
-                    print(f"{'='*100}\n")
-                    
-                    logger.info(f"Final payout (exit in first month) for {row['investor_code']}: {series_start_date} to {exit_date} = {days_from_start_to_exit} days")
+            try:
+                if format == 'xlsx':
+                    yield from stream_xlsx([
+                        ('Interest Payouts', PAYOUT_LIST_DOWNLOAD_HEADERS, rows(), PAYOUT_DOWNLOAD_XLSX_OPTIONS)
+                    ])
                 else:
-                    # Exit in later month: Calculate from 1st of month to exit date
-                    monthly_interest = calculate_exit_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        exit_date,
-                        target_month - 1 if target_month > 1 else 12,
-                        target_year if target_month > 1 else target_year - 1
-                    )
+                    yield from iter_csv(PAYOUT_LIST_DOWNLOAD_HEADERS, rows())
+                
+                # Log to audit_logs table once the whole file has been sent
+                try:
+                    audit_query = """
+                    INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
+                    """
                     
-                    print(f"\n{'='*100}")
-                    print(f"💰 EXPORT: EXIT IN LATER MONTH CALCULATION for {row['investor_code']}")
-                    print(f"   Exit Date: {exit_date}")
-                    print(f"   RESULT: Rs.{monthly_interest:,.2f}")
-                    print(f"{'='*100}\n")
+                    changes_json = json.dumps({
+                        'fileName': filename,
+                        'recordCount': totals.payout_count,
+                        'seriesId': series_id,
+                        'statusFilter': status_filter,
+                        'action': 'payouts_list_download'
+                    })
                     
-                    logger.info(f"Final payout (exit) for {row['investor_code']}: 1st of month to exit date")
-            
-            elif maturity_date and is_last_payout_before_maturity(payout_date_obj, maturity_date):
-                # SCENARIO 2: Series has matured - Calculate from series start (or 1st) to maturity date
-                if series_start_date and is_first_payout(series_start_date, target_month, target_year):
-                    # Maturity in first month: Calculate from series start to maturity date
-                    days_from_start_to_maturity = (maturity_date - series_start_date).days + 1
-                    import calendar
-                    days_in_year = 366 if calendar.isleap(maturity_date.year) else 365
-                    monthly_interest = (float(row['investment_amount']) * float(row['interest_rate']) * days_from_start_to_maturity) / 100 / days_in_year
-                    logger.info(f"Last payout (maturity in first month) for {row['investor_code']}: {series_start_date} to {maturity_date} = {days_from_start_to_maturity} days")
-                else:
-                    # Maturity in later month: Calculate from 1st of month to maturity date
-                    monthly_interest = calculate_maturity_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        maturity_date,
-                        target_month - 1 if target_month > 1 else 12,
-                        target_year if target_month > 1 else target_year - 1
-                    )
-                    logger.info(f"Last payout (maturity) for {row['investor_code']}: 1st of month to maturity date")
-            
-            elif series_start_date and is_first_payout(series_start_date, target_month, target_year):
-                # SCENARIO 3: First payout - Calculate from series start to END OF MONTH
-                # Example: Series starts Feb 2 → Calculate Feb 2 to Feb 28 = 27 days = Rs.8,876.71
-                # Payment day is just a PROMISE (when we PAY), not used in calculation
-                
-                print(f"\n{'='*80}")
-                print(f"CALCULATING FIRST MONTH FOR {row['investor_code']}")
-                print(f"Principal: {row['investment_amount']}")
-                print(f"Rate: {row['interest_rate']}%")
-                print(f"Series Start: {series_start_date}")
-                print(f"Target Month: {target_month}/{target_year}")
-                print(f"{'='*80}\n")
-                
-                monthly_interest = calculate_first_month_interest(
-                    float(row['investment_amount']),
-                    float(row['interest_rate']),
-                    series_start_date,
-                    target_month,
-                    target_year,
-                    row['interest_payment_day'] or 15
-                )
-                
-                print(f"\n{'='*80}")
-                print(f"RESULT FOR {row['investor_code']}: Rs.{monthly_interest:.2f}")
-                print(f"{'='*80}\n")
-                
-                logger.info(f"First payout for {row['investor_code']}: Series start to end of month")
-            
-            else:
-                # SCENARIO 4: Regular monthly interest (Days-based)
-                monthly_interest = calculate_monthly_interest(
-                    float(row['investment_amount']),
-                    float(row['interest_rate']),
-                    target_month,
-                    target_year
-                )
-            
-            # Check if payout record exists
-            payout_query = """
-            SELECT id, status, payout_date
-            FROM interest_payouts
-            WHERE investor_id = %s 
-            AND series_id = %s 
-            AND payout_month = %s
-            AND is_active = 1
-            """
-            
-            payout_result = db.execute_query(payout_query, (
-                row['investor_id'],
-                row['series_id'],
-                target_month_str
-            ))
-            
-            # Always use the current interest_payment_day from series to calculate payout date
-            # This ensures dates are always up-to-date with series settings
-            payout_date = generate_payout_date(
-                target_year,
-                target_month,
-                row['interest_payment_day'] or 15
-            )
-            
-            if payout_result and len(payout_result) > 0:
-                payout_status = payout_result[0]['status']
-                # Note: We use the calculated payout_date, not the stored one
-            else:
-                # Default status: Always 'Scheduled' for future payouts
-                # Status should only be 'Paid' if marked in database
-                payout_status = 'Scheduled'
-            
-            payouts.append({
-                'id': payout_id,
-                'investor_id': row['investor_code'],
-                'investor_name': row['investor_name'],
-                'series_id': row['series_id'],
-                'series_name': row['series_name'],
-                'interest_month': target_month_str,
-                'interest_date': payout_date,
-                'amount': monthly_interest,
-                'status': payout_status,
-                'bank_name': row['bank_name'] or 'N/A',
-                'bank_account_number': row['account_number'] or 'N/A',
-                'ifsc_code': row['ifsc_code'] or 'N/A'
-            })
-            
-            logger.info(f"✅ EXPORT: {row['investor_code']} - {row['series_name']} - Rs.{monthly_interest:.2f}")
-            
-            payout_id += 1
-        
-        # Calculate summary
-        total_amount = sum(p['amount'] for p in payouts)
-        investor_count = len(set(p['investor_id'] for p in payouts))
-        avg_per_investor = total_amount / investor_count if investor_count > 0 else 0
-        
-        logger.info(f"✅ Generated {len(payouts)} export payout records")
-        
-        return {
-            'payouts': payouts,
-            'summary': {
-                'total_amount': round(total_amount, 2),
-                'investor_count': investor_count,
-                'avg_per_investor': round(avg_per_investor, 2),
-                'payout_count': len(payouts)
-            }
-        }
+                    stream_db.execute_query(audit_query, (
+                        'Interest Payouts List Downloaded',
+                        admin_name,
+                        admin_role,
+                        f"Downloaded interest payouts list - {totals.payout_count} records",
+                        'Interest Payout',
+                        filename,
+                        changes_json
+                    ))
+                    logger.info(f"✅ Audit log created for payouts list download: {filename}")
+                except Exception as audit_error:
+                    logger.error(f"⚠️ Failed to create audit log for payouts list download: {audit_error}")
+            except Exception as e:
+                # Headers are already sent - the client sees a truncated file
+                logger.error(f"❌ Error streaming payouts download {filename}: {e}")
+                raise
+            finally:
+                stream_db.disconnect()
+        
+        return _download_response(generate(), format, filename)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error fetching export payouts: {e}")
+        logger.error(f"❌ Error generating CSV: {e}")
         import traceback
         logger.error(f"❌ Traceback: {traceback.format_exc()}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching export payouts: {str(e)}"
+            detail=f"Error generating CSV: {str(e)}"
         )
 
 
-@router.get("/summary")
-async def get_payout_summary(
+@router.get("/download/export-csv")
+async def download_export_csv(
+    series_id: Optional[int] = None,
+    month_type: str = 'current',
+    format: str = 'csv',
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Get payout summary statistics for current month
-    ALL CALCULATIONS IN BACKEND
+    Download export payouts as a CSV (default) or Excel file, with summary rows
+    Streamed row by row - totals are gathered on the way and written at the end
+    ALL CSV GENERATION IN BACKEND
     """
     try:
         db = get_db()
         
         # CHECK PERMISSION
         if not has_permission(current_user, "view_interestPayout", db):
-            log_unauthorized_access(db, current_user, "get_payout_summary", "view_interestPayout")
+            log_unauthorized_access(db, current_user, "download_export_csv", "view_interestPayout")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access Denied: You don't have permission to view payouts"
+                detail="Access Denied: You don't have permission to download payouts"
             )
         
-        current_date = datetime.now()
-        current_month_str = generate_payout_month(current_date.year, current_date.month)
-        
-        # Get all payouts for current month
-        payouts_response = await get_all_payouts(current_user=current_user)
-        payouts = payouts_response['payouts']
+        _validate_download_format(format)
         
-        # Calculate summary
-        total_interest_paid = sum(
-            p['amount'] for p in payouts if p['status'] == 'Paid'
-        )
+        logger.info(f"📥 Generating export {format}: series_id={series_id}, month_type={month_type}")
         
-        total_payouts = len(payouts)
+        interest_year, interest_month = get_export_month(month_type)
+        target_month_str = generate_payout_month(interest_year, interest_month)
         
-        total_investors = len(set(p['investor_id'] for p in payouts))
+        series_name = 'all' if not series_id else f'series-{series_id}'
+        filename = f"interest-payout-{series_name}-{month_type}-{datetime.now().strftime('%Y-%m-%d')}.{format}"
+        admin_name = current_user.full_name or current_user.username
+        admin_role = current_user.role
         
-        return {
-            'total_interest_paid': round(total_interest_paid, 2),
-            'total_payouts': total_payouts,
-            'total_investors': total_investors,
-            'current_month': current_month_str
-        }
+        def generate():
+            stream_db = _open_stream_db()
+            totals = PayoutTotals()
+            
+            def rows():
+                for payout in iter_month_payouts(stream_db, interest_year, interest_month, series_id=series_id):
+                    totals.add(payout)
+                    yield [
+                        payout['investor_id'],
+                        payout['investor_name'],
+                        payout['series_name'],
+                        target_month_str,
+                        payout['interest_date'],
+                        payout['amount'],
+                        payout['status'],
+                        payout['bank_account_number'] or 'N/A',
+                        payout['ifsc_code'] or 'N/A',
+                        payout['bank_name'] or 'N/A'
+                    ]
+            
+            def summary_rows():
+                return [
+                    ['Total Amount', round(totals.total_amount, 2)],
+                    ['Total Investors', totals.investor_count],
+                    ['Average per Investor', round(totals.avg_per_investor, 2)],
+                    ['Total Payouts', totals.payout_count]
+                ]
+            
+            def sheets():
+                yield ('Interest Payouts', PAYOUT_EXPORT_DOWNLOAD_HEADERS, rows(), PAYOUT_DOWNLOAD_XLSX_OPTIONS)
+                # Built after the payout sheet has been fully streamed
+                yield ('Summary', ['Summary', 'Value'], summary_rows(), {'widths': [25, 18]})
+            
+            try:
+                if format == 'xlsx':
+                    yield from stream_xlsx(sheets())
+                else:
+                    yield from iter_csv(
+                        PAYOUT_EXPORT_DOWNLOAD_HEADERS,
+                        rows(),
+                        trailer_rows=lambda: [[], ['Summary']] + summary_rows()
+                    )
+                
+                # Log to audit_logs table once the whole file has been sent
+                try:
+                    audit_query = """
+                    INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
+                    """
+                    
+                    total_amount = round(totals.total_amount, 2)
+                    changes_json = json.dumps({
+                        'fileName': filename,
+                        'recordCount': totals.payout_count,
+                        'seriesId': series_id,
+                        'monthType': month_type,
+                        'totalAmount': float(total_amount),
+                        'investorCount': totals.investor_count,
+                        'action': 'export_download'
+                    })
+                    
+                    stream_db.execute_query(audit_query, (
+                        'Interest Payout Export Downloaded',
+                        admin_name,
+                        admin_role,
+                        f"Downloaded interest payout export ({month_type} month) - {totals.payout_count} records, ₹{total_amount}",
+                        'Interest Payout',
+                        filename,
+                        changes_json
+                    ))
+                    logger.info(f"✅ Audit log created for export download: {filename}")
+                except Exception as audit_error:
+                    logger.error(f"⚠️ Failed to create audit log for export download: {audit_error}")
+            except Exception as e:
+                # Headers are already sent - the client sees a truncated file
+                logger.error(f"❌ Error streaming export download {filename}: {e}")
+                raise
+            finally:
+                stream_db.disconnect()
+        
+        return _download_response(generate(), format, filename)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error fetching payout summary: {e}")
+        logger.error(f"❌ Error generating export CSV: {e}")
+        import traceback
+        logger.error(f"❌ Traceback: {traceback.format_exc()}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching payout summary: {str(e)}"
+            detail=f"Error generating export CSV: {str(e)}"
         )
 
 
-@router.post("/import")
-async def import_payouts(
-    file: UploadFile = File(...),
+@router.get("/bank-file-layouts")
+async def get_bank_file_layouts(
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Import payout data from Excel file
-    Updates payout status, interest month, and interest date
-    ALL LOGIC IN BACKEND - NO FRONTEND CALCULATIONS
+    Bank payment file layouts available for /download/bank-file
+
+    PERMISSION REQUIRED: view_interestPayout
+    """
+    db = get_db()
+    
+    # CHECK PERMISSION
+    if not has_permission(current_user, "view_interestPayout", db):
+        log_unauthorized_access(db, current_user, "get_bank_file_layouts", "view_interestPayout")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access Denied: You don't have permission to view payouts"
+        )
+    
+    return {
+        'layouts': [
+            {'key': key, 'label': layout['label'], 'format': layout['format']}
+            for key, layout in BANK_FILE_LAYOUTS.items()
+        ],
+        'default_max_records': BANK_FILE_DEFAULT_MAX_RECORDS,
+        'max_records_limit': BANK_FILE_MAX_RECORDS_LIMIT
+    }
+
+
+@router.get("/download/bank-file")
+async def download_bank_payment_file(
+    layout: str = 'neft_csv',
+    month_type: str = 'current',
+    series_id: Optional[int] = None,
+    max_records: int = BANK_FILE_DEFAULT_MAX_RECORDS,
+    value_date: Optional[str] = None,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Download NEFT/RTGS bulk payment files for a month's payouts as a zip
+
+    PERMISSION REQUIRED: edit_interestPayout
+
+    - layout: bank file layout (see /payouts/bank-file-layouts)
+    - month_type: 'current' or 'upcoming' interest month (same as the export)
+    - max_records: records per file - a new file is started when it is reached
+    - value_date: YYYY-MM-DD (default: today)
+
+    Payouts already marked Paid are left out. Payouts without a valid account
+    number / IFSC are listed in exceptions.csv inside the zip.
+    Streamed straight from the payout calculation - memory stays flat for 100k+ payouts.
     """
     try:
         db = get_db()
         
-        # CHECK PERMISSION
         if not has_permission(current_user, "edit_interestPayout", db):
-            log_unauthorized_access(db, current_user, "import_payouts", "edit_interestPayout")
+            log_unauthorized_access(db, current_user, "download_bank_payment_file", "edit_interestPayout")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access Denied: You don't have permission to import payouts"
-            )
-        
-        logger.info(f"📤 Importing payouts from file: {file.filename}")
-        
-        # Validate file type
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid file type. Please upload an Excel file (.xlsx or .xls)"
+                detail="Access Denied: You don't have permission to generate bank payment files"
             )
         
-        # Read Excel file
-        try:
-            import pandas as pd
-            import io
-            
-            contents = await file.read()
-            excel_file = io.BytesIO(contents)
-            df = pd.read_excel(excel_file)
-            
-            logger.info(f"📊 Read {len(df)} rows from Excel file")
-            logger.info(f"📊 Columns: {df.columns.tolist()}")
-            
-        except Exception as e:
-            logger.error(f"❌ Error reading Excel file: {e}")
+        if layout not in BANK_FILE_LAYOUTS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Error reading Excel file: {str(e)}"
+                detail=f"Invalid layout. Must be one of: {', '.join(BANK_FILE_LAYOUTS)}"
             )
         
-        # Validate required columns
-        required_columns = ['Investor ID', 'Series Name', 'Status']
-        optional_columns = ['Interest Month', 'Interest Date']
-        
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
+        if not 1 <= max_records <= BANK_FILE_MAX_RECORDS_LIMIT:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Missing required columns: {', '.join(missing_columns)}"
+                detail=f"max_records must be between 1 and {BANK_FILE_MAX_RECORDS_LIMIT}"
             )
         
-        # Process each row
-        updated_count = 0
-        error_count = 0
-        errors = []
-        
-        for index, row in df.iterrows():
+        if value_date:
             try:
-                investor_code = str(row['Investor ID']).strip()
-                series_name = str(row['Series Name']).strip()
-                payout_status = str(row['Status']).strip()
-                
-                # Optional fields
-                interest_month = None
-                interest_date = None
-                
-                if 'Interest Month' in df.columns and pd.notna(row['Interest Month']):
-                    raw_month = row['Interest Month']
-                    # Handle Excel date serial numbers
-                    if isinstance(raw_month, (int, float)):
-                        # Convert Excel serial date to datetime
-                        interest_month = pd.to_datetime(raw_month, origin='1899-12-30', unit='D').strftime('%B %Y')
-                    else:
-                        interest_month = str(raw_month).strip()
-                
-                if 'Interest Date' in df.columns and pd.notna(row['Interest Date']):
-                    raw_date = row['Interest Date']
-                    # Handle Excel date serial numbers
-                    if isinstance(raw_date, (int, float)):
-                        # Convert Excel serial date to datetime
-                        interest_date = pd.to_datetime(raw_date, origin='1899-12-30', unit='D').strftime('%d-%b-%Y')
-                    else:
-                        interest_date = str(raw_date).strip()
-                
-                logger.info(f"📋 Row {index + 1}: investor={investor_code}, series={series_name}, status={payout_status}, month={interest_month}, date={interest_date}")
-                
-                # Validate status
-                valid_statuses = ['Paid', 'Pending', 'Scheduled']
-                if payout_status not in valid_statuses:
-                    errors.append(f"Row {index + 2}: Invalid status '{payout_status}'. Must be one of: {', '.join(valid_statuses)}")
-                    error_count += 1
-                    continue
-                
-                # Find investor by investor_id (code)
-                investor_query = """
-                SELECT id, investor_id, full_name
-                FROM investors
-                WHERE investor_id = %s AND is_active = 1
-                """
-                
-                investor_result = db.execute_query(investor_query, (investor_code,))
-                
-                if not investor_result or len(investor_result) == 0:
-                    errors.append(f"Row {index + 2}: Investor '{investor_code}' not found")
-                    error_count += 1
-                    continue
-                
-                investor = investor_result[0]
-                investor_db_id = investor['id']
-                
-                # Find series by name (flexible matching - handle hyphens vs spaces)
-                series_query = """
-                SELECT id, name, interest_payment_day
-                FROM ncd_series
-                WHERE (name = %s OR REPLACE(name, ' ', '-') = %s OR REPLACE(name, '-', ' ') = %s)
-                AND is_active = 1
-                """
-                
-                series_result = db.execute_query(series_query, (series_name, series_name, series_name))
-                
-                if not series_result or len(series_result) == 0:
-                    errors.append(f"Row {index + 2}: Series '{series_name}' not found")
-                    error_count += 1
-                    continue
-                
-                series = series_result[0]
-                series_db_id = series['id']
-                
-                # Check if investor is invested in this series
-                investment_query = """
-                SELECT id, amount
-                FROM investments
-                WHERE investor_id = %s AND series_id = %s AND status = 'confirmed'
-                """
-                
-                investment_result = db.execute_query(investment_query, (investor_db_id, series_db_id))
-                
-                if not investment_result or len(investment_result) == 0:
-                    errors.append(f"Row {index + 2}: Investor '{investor_code}' is not invested in series '{series_name}'")
-                    error_count += 1
-                    continue
-                
-                # Determine payout month
-                if interest_month:
-                    # Parse various date formats and convert to "Month YYYY" format (e.g., "March 2026")
-                    try:
-                        from dateutil import parser as date_parser
-                        parsed_date = date_parser.parse(interest_month, fuzzy=True)
-                        payout_month = parsed_date.strftime('%B %Y')  # Format: "March 2026"
-                        logger.info(f"✅ Parsed interest month '{interest_month}' to '{payout_month}'")
-                    except Exception as parse_error:
-                        errors.append(f"Row {index + 2}: Invalid Interest Month format '{interest_month}'. Expected formats: 'Mar-26', 'March 2026', or '2026-03'")
-                        error_count += 1
-                        logger.error(f"❌ Failed to parse interest month '{interest_month}': {parse_error}")
-                        continue
-                else:
-                    # Use current month as default
-                    current_date = datetime.now()
-                    payout_month = generate_payout_month(current_date.year, current_date.month)
-                
-                # Determine payout date
-                if interest_date:
-                    # Parse various date formats and convert to DD-MMM-YYYY format
-                    try:
-                        from dateutil import parser as date_parser
-                        parsed_date = date_parser.parse(interest_date, fuzzy=True)
-                        payout_date = parsed_date.strftime('%d-%b-%Y')
-                        logger.info(f"✅ Parsed interest date '{interest_date}' to '{payout_date}'")
-                    except Exception as parse_error:
-                        errors.append(f"Row {index + 2}: Invalid Interest Date format '{interest_date}'. Expected formats: '05-Apr-26', 'April 5, 2026', or '2026-04-05'")
-                        error_count += 1
-                        logger.error(f"❌ Failed to parse interest date '{interest_date}': {parse_error}")
-                        continue
-                else:
-                    # Generate default date based on interest_payment_day
-                    current_date = datetime.now()
-                    payout_date = generate_payout_date(
-                        current_date.year,
-                        current_date.month,
-                        series['interest_payment_day'] or 15
-                    )
-                
-                # Check if payout record already exists
-                check_query = """
-                SELECT id, status
-                FROM interest_payouts
-                WHERE investor_id = %s 
-                AND series_id = %s 
-                AND payout_month = %s
-                AND is_active = 1
-                """
-                
-                existing_payout = db.execute_query(check_query, (
-                    investor_db_id,
-                    series_db_id,
-                    payout_month
-                ))
-                
-                if existing_payout and len(existing_payout) > 0:
-                    # SECURITY CHECK: Prevent changing "Paid" back to "Scheduled" or "Pending"
-                    existing_status = existing_payout[0]['status']
-                    
-                    if existing_status == 'Paid' and payout_status in ['Scheduled', 'Pending']:
-                        errors.append(f"Row {index + 2}: Cannot change status from 'Paid' to '{payout_status}' for {investor_code}. This is not allowed for audit compliance.")
-                        error_count += 1
-                        logger.warning(f"⚠️ BLOCKED: Attempt to change Paid status back to {payout_status} for {investor_code}")
-                        continue
-                    
-                    # Update existing payout
-                    update_query = """
-                    UPDATE interest_payouts
-                    SET status = %s,
-                        payout_date = %s,
-                        paid_date = %s,
-                        updated_at = NOW()
-                    WHERE id = %s
-                    """
-                    
-                    paid_date = datetime.now().date() if payout_status == 'Paid' else None
-                    
-                    db.execute_query(update_query, (
-                        payout_status,
-                        payout_date,
-                        paid_date,
-                        existing_payout[0]['id']
-                    ))
-                    
-                    logger.info(f"✅ Updated payout for {investor_code} - {series_name} - {payout_month}")
-                else:
-                    # Create new payout record
-                    # First get the investment details to calculate amount
-                    investment = investment_result[0]
-                    
-                    # Get series interest rate
-                    series_detail_query = """
-                    SELECT interest_rate
-                    FROM ncd_series
-                    WHERE id = %s
-                    """
-                    
-                    series_detail = db.execute_query(series_detail_query, (series_db_id,))
-                    interest_rate = float(series_detail[0]['interest_rate'])
-                    
-                    # Parse month and year from payout_month (format: "March 2026")
-                    try:
-                        from dateutil import parser as date_parser
-                        parsed_date = date_parser.parse(payout_month, fuzzy=True)
-                        payout_year = parsed_date.year
-                        payout_month_num = parsed_date.month
-                    except Exception as parse_error:
-                        errors.append(f"Row {index + 2}: Failed to parse payout month '{payout_month}'")
-                        error_count += 1
-                        logger.error(f"❌ Failed to parse payout month '{payout_month}': {parse_error}")
-                        continue
-                    
-                    # Calculate monthly interest based on actual days
-                    monthly_interest = calculate_monthly_interest(
-                        float(investment['amount']),
-                        interest_rate,
-                        payout_month_num,
-                        payout_year
-                    )
-                    
-                    insert_query = """
-                    INSERT INTO interest_payouts (
-                        investor_id,
-                        series_id,
-                        payout_month,
-                        payout_date,
-                        amount,
-                        status,
-                        paid_date,
-                        created_at,
-                        updated_at
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-                    """
-                    
-                    paid_date = datetime.now().date() if payout_status == 'Paid' else None
-                    
-                    db.execute_query(insert_query, (
-                        investor_db_id,
-                        series_db_id,
-                        payout_month,
-                        payout_date,
-                        monthly_interest,
-                        payout_status,
-                        paid_date
-                    ))
-                    
-                    logger.info(f"✅ Created payout for {investor_code} - {series_name} - {payout_month}")
-                
-                updated_count += 1
-                
-            except Exception as row_error:
-                logger.error(f"❌ Error processing row {index + 2}: {row_error}")
-                errors.append(f"Row {index + 2}: {str(row_error)}")
-                error_count += 1
-                continue
+                payment_value_date = datetime.strptime(value_date, '%Y-%m-%d').date()
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid value_date format. Use YYYY-MM-DD"
+                )
+        else:
+            payment_value_date = datetime.now().date()
         
-        # Prepare response
-        success = updated_count > 0
-        message = f"Successfully processed {updated_count} payout(s)"
+        interest_year, interest_month = get_export_month(month_type)
         
-        if error_count > 0:
-            message += f". {error_count} error(s) encountered."
+        from app.core.config import settings
+        debit_account = settings.bank_debit_account
         
-        logger.info(f"✅ Import complete: {updated_count} updated, {error_count} errors")
+        file_prefix = f"{layout}_{interest_year}{interest_month:02d}"
+        filename = f"bank-payments-{layout}-{interest_year}-{interest_month:02d}-{datetime.now().strftime('%Y-%m-%d')}.zip"
+        admin_name = current_user.full_name or current_user.username
+        admin_role = current_user.role
         
-        # Log all errors for debugging
-        if errors:
-            logger.error(f"❌ Import errors encountered:")
-            for error in errors[:10]:
-                logger.error(f"   - {error}")
+        logger.info(f"🏦 Generating bank payment files ({layout}) for {interest_year}-{interest_month:02d} by {current_user.username}")
         
-        # Log to audit_logs table
-        try:
-            audit_query = """
-            INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
-            """
-            
-            if success:
-                action = 'Payout Data Imported'
-                details = f"Successfully imported {updated_count} payout record(s) from file '{file.filename}'"
-            else:
-                action = 'Payout Data Import Failed'
-                details = f"Failed to import payout data from file '{file.filename}' - {error_count} error(s), {updated_count} record(s) processed"
+        def generate():
+            stream_db = _open_stream_db()
+            totals = {}
+            skipped_paid = 0
             
-            changes_json = json.dumps({
-                'fileName': file.filename,
-                'successCount': updated_count,
-                'errorCount': error_count,
-                'errors': errors[:5],  # Store first 5 errors
-                'action': 'payout_import' if success else 'payout_import_failed'
-            })
+            def unpaid_payouts():
+                nonlocal skipped_paid
+                for payout in iter_month_payouts(stream_db, interest_year, interest_month, series_id=series_id):
+                    if payout['status'] == 'Paid':
+                        skipped_paid += 1
+                        continue
+                    yield payout
             
-            db.execute_query(audit_query, (
-                action,
-                current_user.full_name or current_user.username,
-                current_user.role,
-                details,
-                'Interest Payout',
-                'Import Operation',
-                changes_json
-            ))
-            logger.info(f"✅ Audit log created for payout import: {file.filename}")
-        except Exception as audit_error:
-            logger.error(f"⚠️ Failed to create audit log for payout import: {audit_error}")
-        
-        return {
-            'success': success,
-            'message': message,
-            'updated_count': updated_count,
-            'error_count': error_count,
-            'errors': errors[:10]  # Return first 10 errors
-        }
+            try:
+                yield from stream_bank_payment_zip(
+                    unpaid_payouts(),
+                    interest_year,
+                    interest_month,
+                    layout,
+                    payment_value_date,
+                    max_records=max_records,
+                    file_prefix=file_prefix,
+                    debit_account=debit_account,
+                    totals=totals
+                )
+                
+                # Log to audit_logs table once the whole zip has been sent
+                try:
+                    audit_query = """
+                    INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
+                    """
+                    
+                    changes_json = json.dumps({
+                        'fileName': filename,
+                        'layout': layout,
+                        'interestMonth': generate_payout_month(interest_year, interest_month),
+                        'seriesId': series_id,
+                        'valueDate': payment_value_date.isoformat(),
+                        'files': totals['files'],
+                        'recordCount': totals['record_count'],
+                        'totalAmount': totals['total_amount'],
+                        'exceptionCount': totals['exception_count'],
+                        'skippedPaid': skipped_paid,
+                        'action': 'bank_payment_file_download'
+                    })
+                    
+                    stream_db.execute_query(audit_query, (
+                        'Bank Payment File Generated',
+                        admin_name,
+                        admin_role,
+                        f"Generated {totals['files']} bank payment file(s) - {totals['record_count']} payments, Rs.{totals['total_amount']:,.2f}",
+                        'Interest Payout',
+                        filename,
+                        changes_json
+                    ))
+                    logger.info(f"✅ Audit log created for bank payment file: {filename}")
+                except Exception as audit_error:
+                    logger.error(f"⚠️ Failed to create audit log for bank payment file: {audit_error}")
+            except Exception as e:
+                # Headers are already sent - the client sees a truncated file
+                logger.error(f"❌ Error streaming bank payment file {filename}: {e}")
+                raise
+            finally:
+                stream_db.disconnect()
+        
+        return StreamingResponse(
+            generate(),
+            media_type="application/zip",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}"
+            }
+        )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error importing payouts: {e}")
+        logger.error(f"❌ Error generating bank payment file: {e}")
         import traceback
         logger.error(f"❌ Traceback: {traceback.format_exc()}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error importing payouts: {str(e)}"
+            detail=f"Error generating bank payment file: {str(e)}"
         )
 
 
-@router.put("/update-status/{payout_id}")
-async def update_payout_status(
-    payout_id: int,
-    new_status: str,
+# ============================================
+# BANK STATEMENT RECONCILIATION
+# ============================================
+
+RECONCILIATION_FILE_EXTENSIONS = ('.csv', '.xlsx', '.sta', '.mt940', '.940', '.txt')
+
+
+def apply_reconciliation_matches(db, matches: list) -> dict:
+    """
+    Mark the matched payouts Paid (paid_date = statement value date) in one transaction
+
+    Payouts not stored yet are inserted with the calculated amount, like the import does.
+    The upsert never touches a row that is already Paid, so running the same
+    statement twice changes nothing - those payouts are counted as already paid.
+    """
+    investor_ids = {}
+    for chunk in chunked(sorted({expected.investor_code for _, expected in matches})):
+        placeholders = ', '.join(['%s'] * len(chunk))
+        for row in db.execute_query(f"""
+        SELECT id, investor_id
+        FROM investors
+        WHERE investor_id IN ({placeholders})
+        """, tuple(chunk)):
+            investor_ids[row['investor_id']] = row['id']
+
+    upserts = []
+    already_paid_count = 0
+    for line, expected in matches:
+        if expected.status == 'Paid':
+            already_paid_count += 1
+            continue
+
+        upserts.append((
+            investor_ids[expected.investor_code],
+            expected.series_id,
+            generate_payout_month(expected.interest_year, expected.interest_month),
+            generate_payout_period(expected.interest_year, expected.interest_month),
+            expected.payout_date_str,
+            expected.amount,
+            line.value_date
+        ))
+
+    # paid_date is assigned before status: MySQL evaluates the assignments left to right
+    upsert_query = """
+    INSERT INTO interest_payouts (
+        investor_id,
+        series_id,
+        payout_month,
+        payout_period,
+        payout_date,
+        amount,
+        status,
+        paid_date,
+        created_at,
+        updated_at
+    ) VALUES (%s, %s, %s, %s, %s, %s, 'Paid', %s, NOW(), NOW())
+    ON DUPLICATE KEY UPDATE
+        payout_period = VALUES(payout_period),
+        paid_date = IF(status = 'Paid', paid_date, VALUES(paid_date)),
+        updated_at = IF(status = 'Paid', updated_at, NOW()),
+        status = 'Paid'
+    """
+
+    if upserts:
+        with db.transaction():
+            for chunk in chunked(upserts, PAYOUT_BULK_UPDATE_CHUNK_SIZE):
+                db.execute_many(upsert_query, chunk)
+
+    return {
+        'applied_count': len(upserts),
+        'already_paid_count': already_paid_count
+    }
+
+
+def _reconciliation_summary(row: dict) -> dict:
+    return {
+        'id': row['id'],
+        'file_name': row['file_name'],
+        'window_days': row['window_days'],
+        'applied': bool(row['applied']),
+        'total_lines': row['total_lines'],
+        'matched_count': row['matched_count'],
+        'applied_count': row['applied_count'],
+        'already_paid_count': row['already_paid_count'],
+        'exception_count': row['exception_count'],
+        'matched_amount': float(row['matched_amount'] or 0),
+        'created_by_name': row['created_by_name'],
+        'created_at': row['created_at'].isoformat() if row.get('created_at') else None
+    }
+
+
+@router.post("/reconcile")
+async def reconcile_bank_statement(
+    file: UploadFile = File(...),
+    window_days: int = RECONCILIATION_DEFAULT_WINDOW_DAYS,
+    apply: bool = True,
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Update payout status for a single payout
-    
+    Reconcile a bank statement against the expected interest payouts
+
     PERMISSION REQUIRED: edit_interestPayout
-    
-    Parameters:
-    - payout_id: ID of the payout to update
-    - new_status: New status ('Paid', 'Pending', 'Scheduled', 'Processing')
-    
-    ALL LOGIC IN BACKEND
+
+    - file: .csv / .xlsx statement (Account Number, Amount, Value Date, Reference / Narration
+      columns) or an MT940-style file (.sta / .mt940 / .940 / .txt)
+    - window_days: how far the value date may be from the payout date
+    - apply: false = dry run, nothing is marked Paid
+
+    Lines are matched on account number + amount + value date window with one hash
+    join, matched payouts are marked Paid in one transaction. Unmatched, ambiguous
+    and duplicate lines are returned (first 50) and kept for
+    GET /payouts/reconciliations/{id}/exceptions
     """
     try:
         db = get_db()
         
         if not has_permission(current_user, "edit_interestPayout", db):
-            log_unauthorized_access(db, current_user, "update_payout_status", "edit_interestPayout")
+            log_unauthorized_access(db, current_user, "reconcile_bank_statement", "edit_interestPayout")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access Denied: You don't have permission to update payouts"
+                detail="Access Denied: You don't have permission to reconcile payouts"
             )
         
-        # Validate status
-        valid_statuses = ['Paid', 'Pending', 'Scheduled', 'Processing']
-        if new_status not in valid_statuses:
+        if not file.filename.lower().endswith(RECONCILIATION_FILE_EXTENSIONS):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
+                detail=f"Invalid file type. Please upload a bank statement ({', '.join(RECONCILIATION_FILE_EXTENSIONS)})"
             )
         
-        # Get existing payout
-        existing_query = """
-        SELECT id, status, investor_id, series_id, amount
-        FROM interest_payouts
-        WHERE id = %s AND is_active = 1
-        """
-        
-        existing_result = db.execute_query(existing_query, (payout_id,))
-        
-        if not existing_result or len(existing_result) == 0:
+        if not 0 <= window_days <= RECONCILIATION_MAX_WINDOW_DAYS:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Payout with ID {payout_id} not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"window_days must be between 0 and {RECONCILIATION_MAX_WINDOW_DAYS}"
             )
         
-        existing_payout = existing_result[0]
-        existing_status = existing_payout['status']
+        logger.info(f"🏦 Reconciling bank statement: {file.filename} (window {window_days} days, apply={apply})")
         
-        # SECURITY CHECK: Prevent changing "Paid" back to "Scheduled" or "Pending"
-        if existing_status == 'Paid' and new_status in ['Scheduled', 'Pending']:
+        contents = await file.read()
+        try:
+            lines, parse_errors = parse_statement(contents, file.filename)
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot change status from 'Paid' to 'Scheduled' or 'Pending'. This is not allowed for audit compliance."
+                detail=str(e)
             )
         
-        # Update payout status
-        paid_date = datetime.now().date() if new_status == 'Paid' else None
-        
-        update_query = """
-        UPDATE interest_payouts
-        SET status = %s,
-            paid_date = %s,
-            updated_at = NOW()
-        WHERE id = %s
-        """
-        
-        db.execute_query(update_query, (new_status, paid_date, payout_id))
+        if not lines:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No payment lines found in the statement"
+            )
         
-        logger.info(f"✅ Payout {payout_id} status updated from '{existing_status}' to '{new_status}' by {current_user.username}")
+        # Expected payouts of every interest month the statement can cover, hashed once
+        index = build_expected_index(
+            (interest_year, interest_month, iter_month_payouts(db, interest_year, interest_month))
+            for interest_year, interest_month in statement_interest_months(lines, window_days)
+        )
+        matches, exceptions = match_statement(lines, index, window_days)
+        
+        for error in parse_errors:
+            exceptions.append({
+                'line': error['line'],
+                'account_number': '',
+                'amount': None,
+                'value_date': None,
+                'reference': '',
+                'reason': error['error'],
+                'candidates': 0
+            })
+        exceptions.sort(key=lambda row: row['line'])
+        
+        result = {'applied_count': 0, 'already_paid_count': sum(1 for _, expected in matches if expected.status == 'Paid')}
+        if apply and matches:
+            result = apply_reconciliation_matches(db, matches)
+        
+        matched_amount = round(sum(line.amount_paise for line, _ in matches) / 100, 2)
+        admin_name = current_user.full_name or current_user.username
+        
+        db.execute_query("""
+        INSERT INTO payout_reconciliations (
+            file_name, window_days, applied, total_lines, matched_count, applied_count,
+            already_paid_count, exception_count, matched_amount, exception_rows,
+            created_by, created_by_name
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, (
+            file.filename,
+            window_days,
+            1 if apply else 0,
+            len(lines) + len(parse_errors),
+            len(matches),
+            result['applied_count'],
+            result['already_paid_count'],
+            len(exceptions),
+            matched_amount,
+            json.dumps(exceptions),
+            current_user.id,
+            admin_name
+        ))
+        reconciliation_id = db.execute_query("SELECT LAST_INSERT_ID() as id")[0]['id']
         
         # Log to audit_logs table
         try:
@@ -1621,303 +3249,154 @@ async def update_payout_status(
             """
             
             changes_json = json.dumps({
-                'payout_id': payout_id,
-                'old_status': existing_status,
-                'new_status': new_status,
-                'paid_date': paid_date.isoformat() if paid_date else None,
-                'amount': float(existing_payout['amount']),
-                'action': 'payout_status_updated'
+                'reconciliationId': reconciliation_id,
+                'fileName': file.filename,
+                'windowDays': window_days,
+                'applied': apply,
+                'totalLines': len(lines) + len(parse_errors),
+                'matchedCount': len(matches),
+                'appliedCount': result['applied_count'],
+                'alreadyPaidCount': result['already_paid_count'],
+                'exceptionCount': len(exceptions),
+                'matchedAmount': matched_amount,
+                'action': 'bank_statement_reconciliation' if apply else 'bank_statement_reconciliation_dry_run'
             })
             
             db.execute_query(audit_query, (
-                'Payout Status Updated',
-                current_user.full_name or current_user.username,
+                'Bank Statement Reconciled' if apply else 'Bank Statement Reconciliation Preview',
+                admin_name,
                 current_user.role,
-                f"Updated payout status from '{existing_status}' to '{new_status}' for payout ID {payout_id}",
+                f"Reconciled '{file.filename}' - {len(matches)} matched, {result['applied_count']} marked Paid, {len(exceptions)} exception(s)",
                 'Interest Payout',
-                str(payout_id),
+                f"Reconciliation {reconciliation_id}",
                 changes_json
             ))
-            logger.info(f"✅ Audit log created for payout status update: {payout_id}")
+            logger.info(f"✅ Audit log created for reconciliation {reconciliation_id}")
         except Exception as audit_error:
-            logger.error(f"⚠️ Failed to create audit log for payout status update: {audit_error}")
+            logger.error(f"⚠️ Failed to create audit log for reconciliation: {audit_error}")
+        
+        logger.info(f"✅ Reconciliation {reconciliation_id}: {len(matches)} matched, {result['applied_count']} applied, {len(exceptions)} exceptions")
         
         return {
-            "success": True,
-            "message": f"Payout status updated to '{new_status}' successfully",
-            "payout_id": payout_id,
-            "old_status": existing_status,
-            "new_status": new_status,
-            "paid_date": paid_date.isoformat() if paid_date else None
+            'success': True,
+            'message': f"{len(matches)} statement line(s) matched, {result['applied_count']} payout(s) marked Paid, {len(exceptions)} exception(s)",
+            'reconciliation_id': reconciliation_id,
+            'applied': apply,
+            'total_lines': len(lines) + len(parse_errors),
+            'matched_count': len(matches),
+            'applied_count': result['applied_count'],
+            'already_paid_count': result['already_paid_count'],
+            'exception_count': len(exceptions),
+            'matched_amount': matched_amount,
+            'exceptions': exceptions[:50]
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error updating payout status: {e}")
+        logger.error(f"❌ Error reconciling bank statement: {e}")
         import traceback
         logger.error(f"❌ Traceback: {traceback.format_exc()}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating payout status: {str(e)}"
+            detail=f"Error reconciling bank statement: {str(e)}"
         )
 
 
-@router.get("/download/csv")
-async def download_payouts_csv(
-    series_id: Optional[int] = None,
-    status_filter: Optional[str] = None,
+@router.get("/reconciliations")
+async def get_reconciliations(
+    limit: int = 20,
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Download payouts as CSV file
-    ALL CSV GENERATION IN BACKEND
+    Recent bank statement reconciliations (newest first)
+    PERMISSION REQUIRED: view_interestPayout
     """
     try:
         db = get_db()
         
-        # CHECK PERMISSION
         if not has_permission(current_user, "view_interestPayout", db):
-            log_unauthorized_access(db, current_user, "download_payouts_csv", "view_interestPayout")
+            log_unauthorized_access(db, current_user, "get_reconciliations", "view_interestPayout")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access Denied: You don't have permission to download payouts"
+                detail="Access Denied: You don't have permission to view payouts"
             )
         
-        logger.info(f"📥 Generating CSV for user: {current_user.username}")
-        
-        # Get payouts data
-        payouts_response = await get_all_payouts(
-            series_id=series_id,
-            status_filter=status_filter,
-            current_user=current_user
-        )
-        
-        payouts = payouts_response['payouts']
-        
-        # Generate CSV content
-        import csv
-        import io
-        
-        output = io.StringIO()
-        
-        # Add UTF-8 BOM for Excel
-        output.write('\ufeff')
-        
-        writer = csv.writer(output)
-        
-        # Write headers
-        headers = [
-            'Investor ID', 'Investor Name', 'Series Name', 
-            'Interest Month', 'Interest Date', 'Amount', 
-            'Status', 'Bank Name', 'Account Number', 'IFSC Code'
-        ]
-        writer.writerow(headers)
-        
-        # Write data rows
-        for payout in payouts:
-            writer.writerow([
-                payout['investor_id'],
-                payout['investor_name'],
-                payout['series_name'],
-                payout['interest_month'],
-                payout['interest_date'],
-                payout['amount'],
-                payout['status'],
-                payout['bank_name'] or 'N/A',
-                payout['bank_account_number'] or 'N/A',
-                payout['ifsc_code'] or 'N/A'
-            ])
-        
-        # Get CSV content
-        csv_content = output.getvalue()
-        output.close()
-        
-        # Return as downloadable file
-        from fastapi.responses import Response
-        
-        filename = f"interest-payouts-{datetime.now().strftime('%Y-%m-%d')}.csv"
-        
-        # Log to audit_logs table
-        try:
-            audit_query = """
-            INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
-            """
-            
-            changes_json = json.dumps({
-                'fileName': filename,
-                'recordCount': len(payouts),
-                'seriesId': series_id,
-                'statusFilter': status_filter,
-                'action': 'payouts_list_download'
-            })
-            
-            db.execute_query(audit_query, (
-                'Interest Payouts List Downloaded',
-                current_user.full_name or current_user.username,
-                current_user.role,
-                f"Downloaded interest payouts list - {len(payouts)} records",
-                'Interest Payout',
-                filename,
-                changes_json
-            ))
-            logger.info(f"✅ Audit log created for payouts list download: {filename}")
-        except Exception as audit_error:
-            logger.error(f"⚠️ Failed to create audit log for payouts list download: {audit_error}")
+        rows = db.execute_query("""
+        SELECT id, file_name, window_days, applied, total_lines, matched_count, applied_count,
+               already_paid_count, exception_count, matched_amount, created_by_name, created_at
+        FROM payout_reconciliations
+        ORDER BY id DESC
+        LIMIT %s
+        """, (min(max(limit, 1), 100),))
         
-        return Response(
-            content=csv_content,
-            media_type="text/csv; charset=utf-8",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        reconciliations = [_reconciliation_summary(row) for row in rows]
+        return {'reconciliations': reconciliations, 'count': len(reconciliations)}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error generating CSV: {e}")
-        import traceback
-        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        logger.error(f"❌ Error listing reconciliations: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error generating CSV: {str(e)}"
+            detail=f"Error listing reconciliations: {str(e)}"
         )
 
 
-@router.get("/download/export-csv")
-async def download_export_csv(
-    series_id: Optional[int] = None,
-    month_type: str = 'current',
+@router.get("/reconciliations/{reconciliation_id}/exceptions")
+async def download_reconciliation_exceptions(
+    reconciliation_id: int,
+    format: str = 'csv',
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Download export payouts as CSV file
-    ALL CSV GENERATION IN BACKEND
+    Download the unmatched / ambiguous / duplicate lines of a reconciliation (csv or xlsx)
+    PERMISSION REQUIRED: view_interestPayout
     """
     try:
         db = get_db()
         
-        # CHECK PERMISSION
         if not has_permission(current_user, "view_interestPayout", db):
-            log_unauthorized_access(db, current_user, "download_export_csv", "view_interestPayout")
+            log_unauthorized_access(db, current_user, "download_reconciliation_exceptions", "view_interestPayout")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access Denied: You don't have permission to download payouts"
+                detail="Access Denied: You don't have permission to view payouts"
             )
         
-        logger.info(f"📥 Generating export CSV: series_id={series_id}, month_type={month_type}")
+        _validate_download_format(format)
         
-        # Get export data
-        export_response = await get_export_payouts(
-            series_id=series_id,
-            month_type=month_type,
-            current_user=current_user
+        rows = db.execute_query(
+            "SELECT id, exception_rows FROM payout_reconciliations WHERE id = %s",
+            (reconciliation_id,)
         )
+        if not rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Reconciliation with ID {reconciliation_id} not found"
+            )
         
-        payouts = export_response['payouts']
-        summary = export_response['summary']
-        
-        # Generate CSV content
-        import csv
-        import io
-        
-        output = io.StringIO()
-        
-        # Add UTF-8 BOM for Excel
-        output.write('\ufeff')
-        
-        writer = csv.writer(output)
-        
-        # Write headers
-        headers = [
-            'Investor ID', 'Investor Name', 'Series', 
-            'Month', 'Date', 'Amount', 
-            'Status', 'Bank Account', 'IFSC Code', 'Bank Name'
-        ]
-        writer.writerow(headers)
-        
-        # Write data rows
-        for payout in payouts:
-            writer.writerow([
-                payout['investor_id'],
-                payout['investor_name'],
-                payout['series_name'],
-                payout['interest_month'],
-                payout['interest_date'],
-                payout['amount'],
-                payout['status'],
-                payout['bank_account_number'] or 'N/A',
-                payout['ifsc_code'] or 'N/A',
-                payout['bank_name'] or 'N/A'
-            ])
-        
-        # Add summary rows
-        writer.writerow([])
-        writer.writerow(['Summary'])
-        writer.writerow(['Total Amount', summary['total_amount']])
-        writer.writerow(['Total Investors', summary['investor_count']])
-        writer.writerow(['Average per Investor', round(summary['avg_per_investor'], 2)])
-        writer.writerow(['Total Payouts', summary['payout_count']])
-        
-        # Get CSV content
-        csv_content = output.getvalue()
-        output.close()
-        
-        # Return as downloadable file
-        from fastapi.responses import Response
-        
-        series_name = 'all' if not series_id else f'series-{series_id}'
-        filename = f"interest-payout-{series_name}-{month_type}-{datetime.now().strftime('%Y-%m-%d')}.csv"
+        exceptions = json.loads(rows[0]['exception_rows'] or '[]')
+        filename = f"reconciliation-{reconciliation_id}-exceptions.{format}"
         
-        # Log to audit_logs table
-        try:
-            audit_query = """
-            INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
-            """
-            
-            changes_json = json.dumps({
-                'fileName': filename,
-                'recordCount': len(payouts),
-                'seriesId': series_id,
-                'monthType': month_type,
-                'totalAmount': float(summary['total_amount']),
-                'investorCount': summary['investor_count'],
-                'action': 'export_download'
-            })
-            
-            db.execute_query(audit_query, (
-                'Interest Payout Export Downloaded',
-                current_user.full_name or current_user.username,
-                current_user.role,
-                f"Downloaded interest payout export ({month_type} month) - {len(payouts)} records, ₹{summary['total_amount']}",
-                'Interest Payout',
-                filename,
-                changes_json
-            ))
-            logger.info(f"✅ Audit log created for export download: {filename}")
-        except Exception as audit_error:
-            logger.error(f"⚠️ Failed to create audit log for export download: {audit_error}")
+        if format == 'xlsx':
+            content = stream_xlsx([(
+                'Exceptions',
+                EXCEPTION_REPORT_HEADERS,
+                exception_report_rows(exceptions),
+                {'widths': [8, 22, 14, 12, 40, 60, 12], 'column_styles': [None, None, 'currency']}
+            )])
+        else:
+            content = iter_csv(EXCEPTION_REPORT_HEADERS, exception_report_rows(exceptions))
         
-        return Response(
-            content=csv_content,
-            media_type="text/csv; charset=utf-8",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
+        return _download_response(content, format, filename)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error generating export CSV: {e}")
-        import traceback
-        logger.error(f"❌ Traceback: {traceback.format_exc()}")
+        logger.error(f"❌ Error downloading reconciliation exceptions: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error generating export CSV: {str(e)}"
+            detail=f"Error downloading reconciliation exceptions: {str(e)}"
         )
 
 
@@ -2068,8 +3547,7 @@ async def get_unique_series_names(
         
         # Get unique series names from ALL active investments (not just saved payouts)
         # This ensures series with scheduled/calculated payouts also appear in filter
-        current_date = datetime.now()
-        current_month_number = current_date.year * 12 + current_date.month
+        current_month_start = date.today().replace(day=1)
 
         query = """
         SELECT DISTINCT s.name as series_name
@@ -2081,13 +3559,13 @@ async def get_unique_series_names(
             (i.status = 'confirmed')
             OR
             (i.status = 'cancelled' AND i.exit_date IS NOT NULL
-             AND YEAR(i.exit_date) * 12 + MONTH(i.exit_date) >= %s)
+             AND i.exit_date >= %s)
         )
-        AND (s.maturity_date IS NULL OR YEAR(s.maturity_date) * 12 + MONTH(s.maturity_date) >= %s)
+        AND (s.maturity_date IS NULL OR s.maturity_date >= %s)
         ORDER BY s.name ASC
         """
         
-        result = db.execute_query(query, (current_month_number, current_month_number))
+        result = db.execute_query(query, (current_month_start, current_month_start))
         
         series_names = [row['series_name'] for row in result]
         
@@ -2133,8 +3611,7 @@ async def get_unique_series_for_export(
         logger.info("📊 Fetching unique series for export dropdown")
         
         # Get unique series with IDs from ALL active investments (not just saved payouts)
-        current_date = datetime.now()
-        current_month_number = current_date.year * 12 + current_date.month
+        current_month_start = date.today().replace(day=1)
 
         query = """
         SELECT DISTINCT s.id, s.name
@@ -2146,13 +3623,13 @@ async def get_unique_series_for_export(
             (i.status = 'confirmed')
             OR
             (i.status = 'cancelled' AND i.exit_date IS NOT NULL
-             AND YEAR(i.exit_date) * 12 + MONTH(i.exit_date) >= %s)
+             AND i.exit_date >= %s)
         )
-        AND (s.maturity_date IS NULL OR YEAR(s.maturity_date) * 12 + MONTH(s.maturity_date) >= %s)
+        AND (s.maturity_date IS NULL OR s.maturity_date >= %s)
         ORDER BY s.name ASC
         """
         
-        result = db.execute_query(query, (current_month_number, current_month_number))
+        result = db.execute_query(query, (current_month_start, current_month_start))
         
         series_list = [
             {
@@ -0,0 +1,213 @@
+"""
+Report Job API Routes
+=====================
+Generate reports in the background and download the file when it is ready
+
+IMPORTANT: ALL business logic in backend, NO logic in frontend
+Processing itself lives in app/services/jobs/report_jobs.py
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.models.pydantic.models import UserInDB, ReportJobCreate
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.permissions import has_permission, log_unauthorized_access
+from app.services.jobs.report_jobs import (
+    REPORT_JOB_TYPES,
+    REPORT_JOB_FORMATS,
+    submit_report_job,
+    get_report_job,
+    list_report_jobs
+)
+from app.services.storage.report_artifacts import report_artifact_exists, iter_report_artifact
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/reports/jobs", tags=["Report Jobs"])
+
+
+def _check_view_reports(db, current_user: UserInDB, endpoint: str):
+    if not has_permission(current_user, "view_reports", db):
+        log_unauthorized_access(db, current_user, endpoint, "view_reports")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access Denied: You don't have permission to generate reports"
+        )
+
+
+@router.get("/types")
+async def get_report_job_types(
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Reports that can be generated in the background, with their filters and formats
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "get_report_job_types")
+
+        return {
+            'reports': [
+                {'report': key, 'name': definition['name'], 'filters': list(definition['filters'])}
+                for key, definition in REPORT_JOB_TYPES.items()
+            ],
+            'formats': list(REPORT_JOB_FORMATS)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error listing report job types: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing report types: {str(e)}"
+        )
+
+
+@router.post("")
+async def create_report_job(
+    request: ReportJobCreate,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Queue a report: {"report": "monthly-collection", "format": "excel", "filters": {"from_date": ...}}
+    Returns the job id immediately - poll GET /reports/jobs/{job_id} and download when completed
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "create_report_job")
+
+        try:
+            job = submit_report_job(db, request.report, request.format.lower(), request.filters, current_user)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        return {
+            'success': True,
+            'message': f"{job['report_name']} queued for generation (job {job['id']})",
+            'job_id': job['id'],
+            'job': job
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error queueing report job: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error queueing report: {str(e)}"
+        )
+
+
+@router.get("")
+async def get_my_report_jobs(
+    report: Optional[str] = None,
+    limit: int = 20,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Recent report jobs started by the current user
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "get_my_report_jobs")
+
+        jobs = list_report_jobs(db, user_id=current_user.id, report_key=report, limit=min(max(limit, 1), 100))
+        return {'jobs': jobs, 'count': len(jobs)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error listing report jobs: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing report jobs: {str(e)}"
+        )
+
+
+@router.get("/{job_id}")
+async def get_report_job_status(
+    job_id: int,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Job status: queued / processing / completed / failed, row count, file size, generation time
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "get_report_job_status")
+
+        job = get_report_job(db, job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Report job with ID {job_id} not found"
+            )
+        return job
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error fetching report job {job_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching report job: {str(e)}"
+        )
+
+
+@router.get("/{job_id}/download")
+async def download_report_job(
+    job_id: int,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Download the generated file of a completed job (streamed from local disk or S3)
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "download_report_job")
+
+        job = get_report_job(db, job_id, include_location=True)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Report job with ID {job_id} not found"
+            )
+
+        if job['status'] != 'completed':
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Report job {job_id} is {job['status']} - the file is available once it has completed"
+            )
+
+        if not report_artifact_exists(job['storage'], job['artifact_location']):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail=f"The file of report job {job_id} is no longer stored - generate the report again"
+            )
+
+        media_type = REPORT_JOB_FORMATS[job['file_format']][2]
+        return StreamingResponse(
+            iter_report_artifact(job['storage'], job['artifact_location']),
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f"attachment; filename={job['file_name']}"
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error downloading report job {job_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error downloading report: {str(e)}"
+        )
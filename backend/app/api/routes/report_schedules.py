@@ -0,0 +1,158 @@
+"""
+Report Schedule API Routes
+==========================
+Reports precomputed overnight - list the schedules, change them, download the latest file
+
+IMPORTANT: ALL business logic in backend, NO logic in frontend
+Scheduling itself lives in app/services/jobs/report_scheduler.py
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from app.models.pydantic.models import UserInDB, ReportScheduleUpdate
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.permissions import has_permission, log_unauthorized_access
+from app.services.jobs.report_jobs import REPORT_JOB_FORMATS
+from app.services.jobs.report_scheduler import (
+    list_report_schedules,
+    update_report_schedule,
+    latest_scheduled_job
+)
+from app.services.storage.report_artifacts import report_artifact_exists, iter_report_artifact
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/reports/schedules", tags=["Report Schedules"])
+
+
+def _check_view_reports(db, current_user: UserInDB, endpoint: str):
+    if not has_permission(current_user, "view_reports", db):
+        log_unauthorized_access(db, current_user, endpoint, "view_reports")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access Denied: You don't have permission to view reports"
+        )
+
+
+@router.get("")
+async def get_report_schedules(
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Scheduled reports with their next run and the latest generated file (generated_at)
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "get_report_schedules")
+
+        schedules = list_report_schedules(db)
+        return {'schedules': schedules, 'count': len(schedules)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error listing report schedules: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing report schedules: {str(e)}"
+        )
+
+
+@router.put("/{schedule_id}")
+async def update_schedule(
+    schedule_id: int,
+    request: ReportScheduleUpdate,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Change when / whether a report is precomputed
+    REQUIRES: Super Admin
+    """
+    try:
+        db = get_db()
+
+        if current_user.role != "Super Admin":
+            log_unauthorized_access(db, current_user, "update_schedule", "Super Admin")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access Denied: Only Super Admin can change report schedules"
+            )
+
+        try:
+            schedule = update_report_schedule(db, schedule_id, request.model_dump())
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        if not schedule:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Report schedule with ID {schedule_id} not found"
+            )
+
+        logger.info(f"🗓️ Report schedule {schedule_id} updated by {current_user.username}")
+        return {'success': True, 'schedule': schedule}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error updating report schedule {schedule_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error updating report schedule: {str(e)}"
+        )
+
+
+@router.get("/{schedule_id}/download")
+async def download_scheduled_report(
+    schedule_id: int,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    The latest precomputed file of a schedule, served as stored
+    X-Generated-At: when it was generated, X-Report-Period: the month it covers
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "download_scheduled_report")
+
+        job = latest_scheduled_job(db, schedule_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Report schedule {schedule_id} has not produced a file yet"
+            )
+
+        if not report_artifact_exists(job['storage'], job['artifact_location']):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail=f"The file of report schedule {schedule_id} is no longer stored - it is generated again on the next run"
+            )
+
+        headers = {
+            "Content-Disposition": f"attachment; filename={job['file_name']}",
+            "X-Generated-At": job['completed_at'].isoformat() if job['completed_at'] else '',
+            "X-Report-Job-Id": str(job['id'])
+        }
+        if job['report_period']:
+            headers["X-Report-Period"] = job['report_period']
+        if job['page_count'] is not None:
+            headers["X-Page-Count"] = str(job['page_count'])
+
+        return StreamingResponse(
+            iter_report_artifact(job['storage'], job['artifact_location']),
+            media_type=REPORT_JOB_FORMATS[job['file_format']][2],
+            headers=headers
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error downloading scheduled report {schedule_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error downloading scheduled report: {str(e)}"
+        )
@@ -0,0 +1,150 @@
+"""
+Report Snapshot API Routes
+==========================
+Report summaries first, detail tables page by page
+
+GET /reports/{report}/summary?<report filters>
+    Runs the report (or reuses a snapshot of it over unchanged data) and returns the
+    summary values; each detail table comes as {'count', 'cursor'} under detail_sections
+GET /reports/{report}/sections/{section}?cursor=...&limit=...
+    One page of a detail table from the same snapshot; next_cursor while has_more
+
+IMPORTANT: ALL business logic in backend, NO logic in frontend
+Snapshots live in app/services/storage/report_snapshots.py
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import Optional
+from app.models.pydantic.models import UserInDB
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.permissions import has_permission, log_unauthorized_access
+from app.services.jobs.report_jobs import REPORT_JOB_TYPES, normalize_report_filters
+from app.services.storage.report_snapshots import (
+    open_report_snapshot,
+    get_report_snapshot,
+    report_summary,
+    section_page,
+    decode_section_cursor
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/reports", tags=["Report Snapshots"])
+
+
+def _check_view_reports(db, current_user: UserInDB, endpoint: str):
+    if not has_permission(current_user, "view_reports", db):
+        log_unauthorized_access(db, current_user, endpoint, "view_reports")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access Denied: You don't have permission to view reports"
+        )
+
+
+@router.get("/{report}/summary")
+async def get_report_summary(
+    report: str,
+    request: Request,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Summary of a report with cursors for its detail tables
+    Query parameters are the report's own filters (same as GET /reports/<report>)
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "get_report_summary")
+
+        try:
+            filters = normalize_report_filters(report, dict(request.query_params))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        from app.api.routes import reports
+
+        definition = REPORT_JOB_TYPES[report]
+        snapshot_id, data = await open_report_snapshot(
+            db,
+            report,
+            definition['name'],
+            getattr(reports, definition['function']),
+            filters,
+            current_user
+        )
+
+        summary = report_summary(snapshot_id, data)
+        summary['report'] = report
+        return summary
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error generating report summary for {report}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating report summary: {str(e)}"
+        )
+
+
+@router.get("/{report}/sections/{section}")
+async def get_report_section_page(
+    report: str,
+    section: str,
+    cursor: str,
+    limit: Optional[int] = None,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    One page of a report detail table - cursor comes from /summary or the previous page
+    PERMISSION REQUIRED: view_reports
+    """
+    try:
+        db = get_db()
+        _check_view_reports(db, current_user, "get_report_section_page")
+
+        try:
+            snapshot_id, cursor_section, offset = decode_section_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        if cursor_section != section:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cursor belongs to section '{cursor_section}', not '{section}'"
+            )
+
+        snapshot = get_report_snapshot(db, snapshot_id)
+        if not snapshot:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="This report snapshot has expired - load the report summary again"
+            )
+
+        if snapshot['report'] != report:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cursor belongs to report '{snapshot['report']}', not '{report}'"
+            )
+
+        try:
+            page = section_page(snapshot_id, snapshot['data'], section, offset, limit)
+        except KeyError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Report '{report}' has no section '{section}'"
+            )
+
+        page['report'] = report
+        return page
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error fetching {report} section {section}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching report section: {str(e)}"
+        )
@@ -13,6 +13,9 @@ from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.pydantic.models import UserInDB
 from app.core.permissions import has_permission, log_unauthorized_access
+from app.services.storage.report_facts import refresh_report_facts
+from app.utils.date_utils import date_range_condition
+from app.services.jobs.report_sections import run_report_sections, query_section
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 logger = logging.getLogger(__name__)
@@ -58,13 +61,14 @@ async def get_report_statistics(
             # Get reports generated this month
             first_day_of_month = date.today().replace(day=1)
             
-            reports_month_query = """
+            month_condition, month_params = date_range_condition("generated_at", first_day_of_month)
+            reports_month_query = f"""
             SELECT COUNT(*) as count
             FROM report_logs
-            WHERE DATE(generated_at) >= %s
+            WHERE {month_condition}
             AND status = 'success'
             """
-            reports_result = db.execute_query(reports_month_query, (first_day_of_month,))
+            reports_result = db.execute_query(reports_month_query, month_params)
             reports_generated = reports_result[0]['count'] if reports_result else 0
             
             # Get total reports generated lifetime
@@ -92,13 +96,14 @@ async def get_report_statistics(
             # Get reports generated this month from audit logs
             first_day_of_month = date.today().replace(day=1)
             
-            reports_query = """
+            month_condition, month_params = date_range_condition("timestamp", first_day_of_month)
+            reports_query = f"""
             SELECT COUNT(*) as count
             FROM audit_logs
             WHERE action IN ('Generated Report', 'Downloaded Report')
-            AND DATE(timestamp) >= %s
+            AND {month_condition}
             """
-            reports_result = db.execute_query(reports_query, (first_day_of_month,))
+            reports_result = db.execute_query(reports_query, month_params)
             reports_generated = reports_result[0]['count'] if reports_result else 0
             
             # Get total reports generated lifetime from audit logs
@@ -171,53 +176,30 @@ async def get_monthly_collection_report(
         
         logger.info(f"📅 Report date range: {from_date} to {to_date}")
         
-        # Build series filter condition
-        series_filter = ""
-        series_params = [from_date, to_date]
-        if series_id:
-            series_filter = "AND s.id = %s"
-            series_params.append(series_id)
-        
-        # Get total funds raised (ACTUAL funds raised from investments - LIFETIME total)
-        # This represents the total amount that has EVER been invested across all series
-        # Includes both 'confirmed' (active) and 'cancelled' (exited) investments
-        funds_raised_query = f"""
-        SELECT 
-            COALESCE(SUM(i.amount), 0) as total_funds_raised
-        FROM investments i
-        INNER JOIN ncd_series s ON i.series_id = s.id
-        WHERE i.status IN ('confirmed', 'cancelled')
-        AND s.is_active = 1
-        {series_filter.replace('s.id', 'i.series_id') if series_filter else ''}
-        """
-        
-        # Adjust params if series filter exists
-        if series_id:
-            funds_raised_params = [series_id]
-        else:
-            funds_raised_params = []
-        
-        funds_raised_result = db.execute_query(funds_raised_query, funds_raised_params)
-        total_funds_raised = float(funds_raised_result[0]['total_funds_raised']) if funds_raised_result else 0.0
+        # Funds raised / period totals come from the daily investment facts
+        refresh_report_facts(db, ['fact_daily_investments', 'fact_monthly_payouts'])
         
-        # Get total investment in the date range (includes both active and exited investments)
-        # This shows the ACTUAL investment that happened in this period
-        investment_params = [from_date, to_date]
-        investment_filter = ""
+        fact_filter = ""
+        fact_params = []
         if series_id:
-            investment_filter = "AND i.series_id = %s"
-            investment_params.append(series_id)
+            fact_filter = "AND f.series_id = %s"
+            fact_params.append(series_id)
         
-        investment_query = f"""
+        # total_funds_raised: ACTUAL funds raised - LIFETIME total over active series
+        # total_investment: investment that happened in this period
+        # Both include 'confirmed' (active) and 'cancelled' (exited) investments
+        totals_query = f"""
         SELECT 
-            COALESCE(SUM(i.amount), 0) as total_investment
-        FROM investments i
-        WHERE i.status IN ('confirmed', 'cancelled')
-        AND i.date_received BETWEEN %s AND %s
-        {investment_filter}
+            COALESCE(SUM(CASE WHEN s.is_active = 1 THEN f.total_amount END), 0) as total_funds_raised,
+            COALESCE(SUM(CASE WHEN f.day BETWEEN %s AND %s THEN f.total_amount END), 0) as total_investment
+        FROM fact_daily_investments f
+        LEFT JOIN ncd_series s ON f.series_id = s.id
+        WHERE f.status IN ('confirmed', 'cancelled')
+        {fact_filter}
         """
-        investment_result = db.execute_query(investment_query, investment_params)
-        total_investment = float(investment_result[0]['total_investment']) if investment_result else 0.0
+        totals_result = db.execute_query(totals_query, [from_date, to_date] + fact_params)
+        total_funds_raised = float(totals_result[0]['total_funds_raised']) if totals_result else 0.0
+        total_investment = float(totals_result[0]['total_investment']) if totals_result else 0.0
         
         logger.info(f"💰 Total investment in period: {total_investment}")
         
@@ -275,11 +257,11 @@ async def get_monthly_collection_report(
         logger.info(f"✅ Processed {len(investment_details)} investment records")
         logger.info(f"✅ Sample data: {investment_details[:2] if investment_details else 'No data'}")
         
-        # Calculate series-wise breakdown
+        # Calculate series-wise breakdown (amounts / transactions from the facts)
         series_breakdown_params = [from_date, to_date]
         series_breakdown_filter = ""
         if series_id:
-            series_breakdown_filter = "AND i.series_id = %s"
+            series_breakdown_filter = "AND s.id = %s"
             series_breakdown_params.append(series_id)
         
         series_breakdown_query = f"""
@@ -288,13 +270,12 @@ async def get_monthly_collection_report(
             s.name as series_name,
             s.series_code,
             s.target_amount,
-            COALESCE(SUM(i.amount), 0) as collected_amount,
-            COUNT(DISTINCT i.investor_id) as investor_count,
-            COUNT(i.id) as transaction_count
+            COALESCE(SUM(f.total_amount), 0) as collected_amount,
+            COALESCE(SUM(f.investment_count), 0) as transaction_count
         FROM ncd_series s
-        LEFT JOIN investments i ON s.id = i.series_id 
-            AND i.status IN ('confirmed', 'cancelled')
-            AND i.date_received BETWEEN %s AND %s
+        LEFT JOIN fact_daily_investments f ON s.id = f.series_id 
+            AND f.status IN ('confirmed', 'cancelled')
+            AND f.day BETWEEN %s AND %s
         WHERE s.is_active = 1
         {series_breakdown_filter}
         GROUP BY s.id, s.name, s.series_code, s.target_amount
@@ -302,11 +283,28 @@ async def get_monthly_collection_report(
         """
         series_breakdown_result = db.execute_query(series_breakdown_query, series_breakdown_params)
         
+        # Distinct investors don't add up across days - counted from the period's rows
+        series_investors_query = f"""
+        SELECT 
+            i.series_id,
+            COUNT(DISTINCT i.investor_id) as investor_count
+        FROM investments i
+        WHERE i.status IN ('confirmed', 'cancelled')
+        AND i.date_received BETWEEN %s AND %s
+        {details_filter}
+        GROUP BY i.series_id
+        """
+        series_investors = {
+            row['series_id']: row['investor_count']
+            for row in db.execute_query(series_investors_query, details_params)
+        }
+        
         series_breakdown = []
         for row in series_breakdown_result:
             collected = float(row['collected_amount'])
             target = float(row['target_amount'])
             achievement_percentage = (collected / target * 100) if target > 0 else 0
+            investor_count = series_investors.get(row['series_id'], 0)
             
             series_breakdown.append({
                 'series_id': row['series_id'],
@@ -315,59 +313,39 @@ async def get_monthly_collection_report(
                 'target_amount': target,
                 'collected_amount': collected,
                 'achievement_percentage': round(achievement_percentage, 2),
-                'investor_count': row['investor_count'],
-                'transaction_count': row['transaction_count'],
-                'average_investment': round(collected / row['investor_count'], 2) if row['investor_count'] > 0 else 0
+                'investor_count': investor_count,
+                'transaction_count': int(row['transaction_count']),
+                'average_investment': round(collected / investor_count, 2) if investor_count > 0 else 0
             })
         
         logger.info(f"📊 Series breakdown: {len(series_breakdown)} series")
         
         # Calculate investor statistics
-        # New investors: Investors whose first investment is in this period
-        new_investors_query = f"""
-        SELECT COUNT(DISTINCT i.investor_id) as new_investor_count
-        FROM investments i
-        WHERE i.status IN ('confirmed', 'cancelled')
-        AND i.date_received BETWEEN %s AND %s
-        AND i.investor_id IN (
-            SELECT inv.id
-            FROM investors inv
-            INNER JOIN investments first_inv ON inv.id = first_inv.investor_id
-            WHERE first_inv.status IN ('confirmed', 'cancelled')
-            GROUP BY inv.id
-            HAVING MIN(first_inv.date_received) BETWEEN %s AND %s
-        )
-        {details_filter}
-        """
-        new_investors_params = [from_date, to_date, from_date, to_date]
-        if series_id:
-            new_investors_params.append(series_id)
-        
-        new_investors_result = db.execute_query(new_investors_query, new_investors_params)
-        new_investor_count = new_investors_result[0]['new_investor_count'] if new_investors_result else 0
-        
-        # Returning investors: Investors who have made investments before this period and also in this period
-        returning_investors_query = f"""
-        SELECT COUNT(DISTINCT i.investor_id) as returning_investor_count
-        FROM investments i
-        WHERE i.status IN ('confirmed', 'cancelled')
-        AND i.date_received BETWEEN %s AND %s
-        AND i.investor_id IN (
-            SELECT inv.id
-            FROM investors inv
-            INNER JOIN investments prev_inv ON inv.id = prev_inv.investor_id
-            WHERE prev_inv.status IN ('confirmed', 'cancelled')
-            AND prev_inv.date_received < %s
-            GROUP BY inv.id
-        )
-        {details_filter}
+        # Returning investors: invested in this period AND before it
+        # New investors: invested in this period and never before (first investment is in the period)
+        # Only the period's investors are checked - each against its own earlier investments
+        investor_statistics_query = f"""
+        SELECT 
+            COUNT(*) as investor_count,
+            COALESCE(SUM(EXISTS (
+                SELECT 1
+                FROM investments prev_inv
+                WHERE prev_inv.investor_id = p.investor_id
+                AND prev_inv.status IN ('confirmed', 'cancelled')
+                AND prev_inv.date_received < %s
+            )), 0) as returning_investor_count
+        FROM (
+            SELECT DISTINCT i.investor_id
+            FROM investments i
+            WHERE i.status IN ('confirmed', 'cancelled')
+            AND i.date_received BETWEEN %s AND %s
+            {details_filter}
+        ) p
         """
-        returning_investors_params = [from_date, to_date, from_date]
-        if series_id:
-            returning_investors_params.append(series_id)
-        
-        returning_investors_result = db.execute_query(returning_investors_query, returning_investors_params)
-        returning_investor_count = returning_investors_result[0]['returning_investor_count'] if returning_investors_result else 0
+        investor_statistics_result = db.execute_query(investor_statistics_query, [from_date] + details_params)
+        period_investor_count = investor_statistics_result[0]['investor_count'] if investor_statistics_result else 0
+        returning_investor_count = int(investor_statistics_result[0]['returning_investor_count']) if investor_statistics_result else 0
+        new_investor_count = period_investor_count - returning_investor_count
         
         # Calculate retention rate
         total_investors_in_period = new_investor_count + returning_investor_count
@@ -377,6 +355,24 @@ async def get_monthly_collection_report(
         
         logger.info(f"📊 New investors: {new_investor_count}, Returning: {returning_investor_count}, Retention: {retention_rate:.2f}%")
         
+        # Interest payouts for the months the period touches (monthly payout facts)
+        payout_summary_query = f"""
+        SELECT 
+            f.status,
+            COALESCE(SUM(f.payout_count), 0) as payout_count,
+            COALESCE(SUM(f.total_amount), 0) as total_amount
+        FROM fact_monthly_payouts f
+        WHERE f.month BETWEEN %s AND %s
+        {fact_filter}
+        GROUP BY f.status
+        """
+        payout_summary = {payout_status: {'count': 0, 'amount': 0.0} for payout_status in ('Paid', 'Pending', 'Scheduled')}
+        for row in db.execute_query(payout_summary_query, [f"{from_date[:7]}-01", to_date] + fact_params):
+            payout_summary[row['status']] = {
+                'count': int(row['payout_count']),
+                'amount': float(row['total_amount'])
+            }
+        
         return {
             "from_date": from_date,
             "to_date": to_date,
@@ -392,6 +388,7 @@ async def get_monthly_collection_report(
                 "returning_investors": returning_investor_count,
                 "retention_rate": round(retention_rate, 2)
             },
+            "payout_summary": payout_summary,
             "investment_details": investment_details,
             "total_records": len(investment_details),
             "timestamp": datetime.now().isoformat()
@@ -441,17 +438,14 @@ async def get_payout_statement_report(
         
         # Import calculation functions from payouts module
         from app.api.routes.payouts import (
-            calculate_monthly_interest,
-            calculate_first_month_interest,
-            calculate_exit_interest,
-            calculate_maturity_interest,
-            is_first_payout,
-            is_final_payout_after_exit,
-            is_last_payout_before_maturity,
-            should_skip_payout,
-            get_last_payout_date,
-            generate_payout_month
+            payout_amount_matrix,
+            generate_payout_month,
+            next_payout_period,
+            load_payout_records,
+            _add_months
         )
+        import calendar
+        import numpy as np
         
         # Determine date range
         if month:
@@ -459,14 +453,12 @@ async def get_payout_statement_report(
             year, month_num = month.split('-')
             from_date = f"{year}-{month_num}-01"
             # Get last day of month
-            import calendar
             last_day = calendar.monthrange(int(year), int(month_num))[1]
             to_date = f"{year}-{month_num}-{last_day}"
         elif not from_date or not to_date:
             # Default to current month
             today = date.today()
             from_date = f"{today.year}-{today.month:02d}-01"
-            import calendar
             last_day = calendar.monthrange(today.year, today.month)[1]
             to_date = f"{today.year}-{today.month:02d}-{last_day}"
         
@@ -481,6 +473,8 @@ async def get_payout_statement_report(
         # RULE: Show payouts for ANY series that has started (series_start_date <= CURDATE())
         #       regardless of series status (DRAFT, upcoming, accepting, active, matured, etc.)
         # RULE: Exclude investments where maturity date is BEFORE the current date
+        # RULE: Only investments live in the range - series started by its end,
+        #       not exited before its first month
         query = """
         SELECT 
             inv.id as investor_id,
@@ -515,9 +509,13 @@ async def get_payout_statement_report(
         AND s.is_active = 1
         AND s.series_start_date <= CURDATE()
         AND (s.maturity_date IS NULL OR s.maturity_date >= CURDATE())
+        AND s.series_start_date <= %s
+        AND (i.exit_date IS NULL OR i.exit_date >= %s)
         """
         
-        params = []
+        first_period = from_date_obj.replace(day=1)
+        last_period = to_date_obj.replace(day=1)
+        params = [to_date_obj, first_period]
         
         if series_id:
             query += " AND s.id = %s"
@@ -525,205 +523,125 @@ async def get_payout_statement_report(
         
         query += " ORDER BY inv.investor_id, s.name"
         
-        result = db.execute_query(query, tuple(params) if params else None)
+        result = db.execute_query(query, tuple(params))
         
         logger.info(f"✅ Found {len(result)} investment records for payout calculation")
         
         # Get existing payout records from interest_payouts table to check payment status
         # This tells us which calculated payouts have actually been paid
-        existing_payouts_query = """
-        SELECT 
-            investor_id,
-            series_id,
-            payout_month,
-            status,
-            paid_date,
-            amount
-        FROM interest_payouts
-        WHERE is_active = 1
-        """
-        
-        existing_payouts_result = db.execute_query(existing_payouts_query)
-        
-        # Create a lookup dictionary for existing payouts
-        # Key: (investor_id, series_id, payout_month)
-        existing_payouts_lookup = {}
-        for payout in existing_payouts_result:
-            key = (payout['investor_id'], payout['series_id'], payout['payout_month'])
-            existing_payouts_lookup[key] = {
-                'status': payout['status'],
-                'paid_date': payout['paid_date'],
-                'amount': float(payout['amount'])
-            }
+        # Only the months in the statement range are read (range scan on payout_period)
+        # Key: (investor_id, series_id, payout_period)
+        existing_payouts_lookup = load_payout_records(
+            db,
+            first_period,
+            next_payout_period(last_period),
+            series_id=series_id
+        )
         
         logger.info(f"✅ Found {len(existing_payouts_lookup)} existing payout records in database")
         
-        # Calculate payouts for each month in the date range
+        # ============================================================
+        # (investment × month) CELLS
+        # amounts: interest per investment per interest month (NaN = no payout)
+        # statuses: index into status_names (0 = Scheduled, not stored yet)
+        # ============================================================
+        month_keys = []
+        year, month_number = first_period.year, first_period.month
+        while (year, month_number) <= (last_period.year, last_period.month):
+            month_keys.append((year, month_number))
+            year, month_number = _add_months(year, month_number, 1)
+        
+        amounts = payout_amount_matrix(result, first_period.year, first_period.month, len(month_keys))
+        has_payout = ~np.isnan(amounts)
+        
+        rows_by_holding = {}
+        for index, row in enumerate(result):
+            rows_by_holding.setdefault((row['investor_id'], row['series_id']), []).append(index)
+        
+        status_names = ['Scheduled']
+        status_codes = {'Scheduled': 0}
+        statuses = np.zeros(amounts.shape, dtype=np.int64)
+        paid_dates = {}
+        
+        for (record_investor_id, record_series_id, period), record in existing_payouts_lookup.items():
+            row_indexes = rows_by_holding.get((record_investor_id, record_series_id))
+            if not row_indexes:
+                continue
+            month_index = (period.year - first_period.year) * 12 + period.month - first_period.month
+            code = status_codes.get(record['status'])
+            if code is None:
+                code = status_codes[record['status']] = len(status_names)
+                status_names.append(record['status'])
+            statuses[row_indexes, month_index] = code
+            if record['paid_date']:
+                paid_dates[(record_investor_id, record_series_id, month_index)] = record['paid_date']
+        
+        is_paid = has_payout & (statuses == status_codes.get('Paid', -1))
+        payout_cells = np.where(has_payout, amounts, 0.0)
+        paid_cells = np.where(is_paid, amounts, 0.0)
+        
+        # ============================================================
+        # PAYOUT DETAILS (month by month, investments in query order)
+        # ============================================================
         payout_details = []
-        total_payout = 0.0
-        paid_amount = 0.0
-        to_be_paid_amount = 0.0
-        paid_count = 0
-        pending_count = 0
-        
-        # Iterate through each month in the date range
-        current_month_date = from_date_obj.replace(day=1)
-        while current_month_date <= to_date_obj:
-            interest_year = current_month_date.year
-            interest_month = current_month_date.month
-            
-            logger.info(f"📅 Calculating payouts for {interest_year}-{interest_month:02d}")
-            
-            # Calculate payouts for this month
-            for row in result:
-                # Get series start date
-                series_start_date = row['series_start_date']
-                if isinstance(series_start_date, str):
-                    try:
-                        series_start_date = datetime.strptime(series_start_date, '%Y-%m-%d').date()
-                    except:
-                        series_start_date = None
-                
-                # Skip if series hasn't started yet by the end of this month
-                # We need to check against the last day of the current month
-                import calendar
-                last_day_of_month = calendar.monthrange(current_month_date.year, current_month_date.month)[1]
-                end_of_month = date(current_month_date.year, current_month_date.month, last_day_of_month)
-                
-                if series_start_date and series_start_date > end_of_month:
-                    logger.info(f"  Skipping {row['investor_code']} - Series hasn't started yet (starts {series_start_date}, month ends {end_of_month})")
-                    continue
-                
-                # Get maturity date
-                maturity_date = row['maturity_date']
-                if isinstance(maturity_date, str):
-                    try:
-                        maturity_date = datetime.strptime(maturity_date, '%Y-%m-%d').date()
-                    except:
-                        maturity_date = None
-                
-                # Get exit date
-                exit_date = row['exit_date']
-                if isinstance(exit_date, str):
-                    try:
-                        exit_date = datetime.strptime(exit_date, '%Y-%m-%d').date()
-                    except:
-                        exit_date = None
-                
-                # Generate payout date
-                import calendar
-                payment_day = row['interest_payment_day'] or 15
-                max_day_in_month = calendar.monthrange(interest_year, interest_month)[1]
-                actual_payment_day = min(payment_day, max_day_in_month)
-                
-                payout_date_obj = datetime(interest_year, interest_month, actual_payment_day).date()
-                
-                # Get last payout date
-                last_payout_date = get_last_payout_date(
-                    series_start_date if series_start_date else payout_date_obj,
-                    row['interest_payment_day'] or 15,
-                    payout_date_obj
+        month_labels = [generate_payout_month(year, month_number) for year, month_number in month_keys]
+        payout_dates = {}
+        
+        month_indexes, row_indexes = np.nonzero(has_payout.T)
+        for month_index, row_index, amount, code in zip(
+            month_indexes.tolist(),
+            row_indexes.tolist(),
+            amounts.T[has_payout.T].tolist(),
+            statuses.T[has_payout.T].tolist()
+        ):
+            row = result[row_index]
+            year, month_number = month_keys[month_index]
+            
+            # Payout date in the interest month, on the series payment day
+            payment_day = row['interest_payment_day'] or 15
+            payout_date_str = payout_dates.get((payment_day, month_index))
+            if payout_date_str is None:
+                max_day_in_month = calendar.monthrange(year, month_number)[1]
+                payout_date_str = payout_dates[(payment_day, month_index)] = (
+                    date(year, month_number, min(payment_day, max_day_in_month)).strftime('%d-%b-%Y')
                 )
-                
-                # Check if we should skip this payout
-                if should_skip_payout(payout_date_obj, maturity_date, exit_date, last_payout_date):
-                    continue
-                
-                # Calculate interest amount using SAME logic as Interest Payout page
-                if series_start_date and is_first_payout(series_start_date, interest_month, interest_year):
-                    monthly_interest = calculate_first_month_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        series_start_date,
-                        interest_month,
-                        interest_year
-                    )
-                elif exit_date and is_final_payout_after_exit(payout_date_obj, exit_date):
-                    monthly_interest = calculate_exit_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        exit_date,
-                        interest_month,
-                        interest_year
-                    )
-                elif maturity_date and is_last_payout_before_maturity(payout_date_obj, maturity_date):
-                    monthly_interest = calculate_maturity_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        maturity_date,
-                        interest_month,
-                        interest_year
-                    )
-                else:
-                    monthly_interest = calculate_monthly_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        interest_month,
-                        interest_year
-                    )
-                
-                # Generate payout month string BEFORE using it
-                payout_month = generate_payout_month(interest_year, interest_month)
-                
-                # Determine status by checking if this payout exists in interest_payouts table
-                # Key: (investor_id, series_id, payout_month)
-                payout_key = (row['investor_id'], row['series_id'], payout_month)
-                
-                if payout_key in existing_payouts_lookup:
-                    # Payout exists in database - use its status
-                    existing_payout = existing_payouts_lookup[payout_key]
-                    payout_status = existing_payout['status']
-                    paid_date_value = existing_payout['paid_date']
-                else:
-                    # Payout doesn't exist in database - it's scheduled
-                    payout_status = 'Scheduled'
-                    paid_date_value = None
-                
-                # Format payout date for display
-                payout_date_str = payout_date_obj.strftime('%d-%b-%Y')
-                
-                # Format paid date if exists
-                paid_date_str = None
-                if paid_date_value:
-                    if isinstance(paid_date_value, str):
-                        paid_date_str = paid_date_value
-                    else:
-                        paid_date_str = paid_date_value.strftime('%d-%b-%Y')
-                
-                # Add to details
-                payout_details.append({
-                    'id': len(payout_details) + 1,
-                    'investor_id': row['investor_code'],
-                    'investor_name': row['investor_name'],
-                    'investor_email': row.get('email'),
-                    'investor_phone': row.get('phone'),
-                    'investor_pan': row.get('pan'),
-                    'series_code': row['series_code'],
-                    'series_name': row['series_name'],
-                    'amount': monthly_interest,
-                    'status': payout_status,
-                    'payout_date': payout_date_str,
-                    'paid_date': paid_date_str,
-                    'bank_name': row.get('bank_name'),
-                    'account_number': row.get('account_number'),
-                    'ifsc_code': row.get('ifsc_code'),
-                    'payout_month': payout_month
-                })
-                
-                # Update totals based on status
-                total_payout += monthly_interest
-                if payout_status == 'Paid':
-                    paid_amount += monthly_interest
-                    paid_count += 1
+            
+            # Format paid date if exists
+            paid_date_value = paid_dates.get((row['investor_id'], row['series_id'], month_index))
+            paid_date_str = None
+            if paid_date_value:
+                if isinstance(paid_date_value, str):
+                    paid_date_str = paid_date_value
                 else:
-                    to_be_paid_amount += monthly_interest
-                    pending_count += 1
+                    paid_date_str = paid_date_value.strftime('%d-%b-%Y')
             
-            # Move to next month
-            if current_month_date.month == 12:
-                current_month_date = current_month_date.replace(year=current_month_date.year + 1, month=1)
-            else:
-                current_month_date = current_month_date.replace(month=current_month_date.month + 1)
+            payout_details.append({
+                'id': len(payout_details) + 1,
+                'investor_id': row['investor_code'],
+                'investor_name': row['investor_name'],
+                'investor_email': row.get('email'),
+                'investor_phone': row.get('phone'),
+                'investor_pan': row.get('pan'),
+                'series_code': row['series_code'],
+                'series_name': row['series_name'],
+                'amount': amount,
+                'status': status_names[code],
+                'payout_date': payout_date_str,
+                'paid_date': paid_date_str,
+                'bank_name': row.get('bank_name'),
+                'account_number': row.get('account_number'),
+                'ifsc_code': row.get('ifsc_code'),
+                'payout_month': month_labels[month_index]
+            })
+        
+        # ============================================================
+        # SUMMARY & BREAKDOWNS (grouped reductions over the cells)
+        # ============================================================
+        paid_amount = float(paid_cells.sum())
+        to_be_paid_amount = float(payout_cells.sum()) - paid_amount
+        paid_count = int(is_paid.sum())
+        pending_count = int(has_payout.sum()) - paid_count
+        total_payout = paid_amount + to_be_paid_amount
         
         logger.info(f"✅ Calculated {len(payout_details)} payouts, Total: ₹{total_payout:,.2f}")
         
@@ -737,86 +655,63 @@ async def get_payout_statement_report(
             'pending_count': pending_count
         }
         
-        # Query 3: Get series breakdown from calculated payouts
-        series_breakdown_dict = {}
-        for payout in payout_details:
-            series_code = payout['series_code']
-            series_name = payout['series_name']
-            
-            if series_code not in series_breakdown_dict:
-                series_breakdown_dict[series_code] = {
-                    'series_code': series_code,
-                    'series_name': series_name,
-                    'total_payout': 0.0,
-                    'paid_amount': 0.0,
-                    'pending_amount': 0.0,
-                    'investor_count': set()
-                }
-            
-            series_breakdown_dict[series_code]['total_payout'] += payout['amount']
-            if payout['status'] == 'Paid':
-                series_breakdown_dict[series_code]['paid_amount'] += payout['amount']
-            else:
-                series_breakdown_dict[series_code]['pending_amount'] += payout['amount']
-            series_breakdown_dict[series_code]['investor_count'].add(payout['investor_id'])
+        # Series breakdown: per-investment row totals summed by series
+        series_codes = sorted({row['series_code'] for row in result})
+        series_position = {code: position for position, code in enumerate(series_codes)}
+        row_series = np.array([series_position[row['series_code']] for row in result], dtype=np.int64)
+        series_total = np.bincount(row_series, weights=payout_cells.sum(axis=1), minlength=len(series_codes))
+        series_paid = np.bincount(row_series, weights=paid_cells.sum(axis=1), minlength=len(series_codes))
+        
+        series_names = {}
+        series_investors = {}
+        for row, paid_any in zip(result, has_payout.any(axis=1).tolist()):
+            series_names.setdefault(row['series_code'], row['series_name'])
+            if paid_any:
+                series_investors.setdefault(row['series_code'], set()).add(row['investor_code'])
         
         series_breakdown = []
-        for series_code, data in series_breakdown_dict.items():
+        for code in series_investors:
+            position = series_position[code]
             series_breakdown.append({
-                'series_code': data['series_code'],
-                'series_name': data['series_name'],
-                'total_payout': data['total_payout'],
-                'paid_amount': data['paid_amount'],
-                'pending_amount': data['pending_amount'],
-                'investor_count': len(data['investor_count'])
+                'series_code': code,
+                'series_name': series_names[code],
+                'total_payout': float(series_total[position]),
+                'paid_amount': float(series_paid[position]),
+                'pending_amount': float(series_total[position] - series_paid[position]),
+                'investor_count': len(series_investors[code])
             })
         
         # Sort by total payout descending
         series_breakdown.sort(key=lambda x: x['total_payout'], reverse=True)
         
-        # Query 4: Get status breakdown from calculated payouts
-        status_breakdown_dict = {}
-        for payout in payout_details:
-            payout_status_value = payout['status']
-            if payout_status_value not in status_breakdown_dict:
-                status_breakdown_dict[payout_status_value] = {
-                    'count': 0,
-                    'total_amount': 0.0
-                }
-            status_breakdown_dict[payout_status_value]['count'] += 1
-            status_breakdown_dict[payout_status_value]['total_amount'] += payout['amount']
-        
-        status_breakdown = []
-        for payout_status_value, data in status_breakdown_dict.items():
-            status_breakdown.append({
-                'status': payout_status_value,
-                'count': data['count'],
-                'total_amount': data['total_amount']
-            })
+        # Status breakdown: cells counted / summed by status code
+        status_count = np.bincount(statuses[has_payout], minlength=len(status_names))
+        status_amount = np.bincount(statuses[has_payout], weights=amounts[has_payout], minlength=len(status_names))
         
-        # Query 5: Get monthly trend from calculated payouts
-        monthly_trend_dict = {}
-        for payout in payout_details:
-            month = payout['payout_month']
-            if month not in monthly_trend_dict:
-                monthly_trend_dict[month] = {
-                    'total_amount': 0.0,
-                    'paid_amount': 0.0,
-                    'payout_count': 0
-                }
-            monthly_trend_dict[month]['total_amount'] += payout['amount']
-            if payout['status'] == 'Paid':
-                monthly_trend_dict[month]['paid_amount'] += payout['amount']
-            monthly_trend_dict[month]['payout_count'] += 1
-        
-        monthly_trend = []
-        for month, data in sorted(monthly_trend_dict.items()):
-            monthly_trend.append({
-                'month': month,
-                'total_amount': data['total_amount'],
-                'paid_amount': data['paid_amount'],
-                'payout_count': data['payout_count']
-            })
+        status_breakdown = [
+            {
+                'status': name,
+                'count': int(status_count[code]),
+                'total_amount': float(status_amount[code])
+            }
+            for code, name in enumerate(status_names) if status_count[code]
+        ]
+        status_breakdown.sort(key=lambda x: x['total_amount'], reverse=True)
+        
+        # Monthly trend: column sums, in calendar order
+        month_total = payout_cells.sum(axis=0)
+        month_paid = paid_cells.sum(axis=0)
+        month_count = has_payout.sum(axis=0)
+        
+        monthly_trend = [
+            {
+                'month': month_labels[month_index],
+                'total_amount': float(month_total[month_index]),
+                'paid_amount': float(month_paid[month_index]),
+                'payout_count': int(month_count[month_index])
+            }
+            for month_index in range(len(month_keys)) if month_count[month_index]
+        ]
         
         logger.info(f"✅ Payout statement fetched: {len(payout_details)} records, {len(series_breakdown)} series, {len(status_breakdown)} statuses")
         
@@ -860,19 +755,37 @@ async def get_payout_statement_report(
 
 
 
+def parse_series_ids(series_ids: Optional[str]) -> Optional[list]:
+    """'3,5,8' → [3, 5, 8] (None when empty). Raises ValueError on anything that is not an id"""
+    if not series_ids or not series_ids.strip():
+        return None
+    try:
+        ids = sorted({int(part) for part in series_ids.split(',') if part.strip()})
+    except ValueError:
+        raise ValueError("series_ids must be a comma separated list of series ids, e.g. 3,5,8")
+    return ids or None
+
+
 @router.get("/series-performance")
 async def get_series_performance_report(
+    series_ids: Optional[str] = None,
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
     Get Series Performance Report data
     PERMISSION REQUIRED: view_reports
     
+    Parameters:
+    - series_ids: Optional comma separated series ids (e.g. 3,5,8) - all series when not given
+    
     Returns comprehensive series performance data:
     - Summary metrics (total series, active series, total investments, total investors)
     - Series comparison table (all series with key metrics)
     - Detailed per-series breakdown with graphs
     
+    Every dataset is read ONCE for all requested series (grouped by series_id) and
+    split per series in memory - the query count does not grow with the number of series.
+    
     ALL LOGIC IN BACKEND
     """
     try:
@@ -885,8 +798,23 @@ async def get_series_performance_report(
                 detail="Access Denied: You don't have permission to view reports"
             )
         
+        try:
+            requested_series = parse_series_ids(series_ids)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        series_filter = ""
+        series_filter_params = ()
+        if requested_series:
+            series_filter = f" AND s.id IN ({', '.join(['%s'] * len(requested_series))})"
+            series_filter_params = tuple(requested_series)
+            logger.info(f"🔍 Filtering by series_ids: {requested_series}")
+        
         # Query 1: Get summary metrics (LIFETIME totals - includes both active and exited investments)
-        summary_query = """
+        summary_query = f"""
         SELECT 
             COUNT(DISTINCT s.id) as total_series,
             COUNT(DISTINCT CASE 
@@ -896,28 +824,16 @@ async def get_series_performance_report(
             COUNT(DISTINCT i.investor_id) as total_investors
         FROM ncd_series s
         LEFT JOIN investments i ON s.id = i.series_id AND i.status IN ('confirmed', 'cancelled')
-        WHERE s.is_active = 1
+        WHERE s.is_active = 1{series_filter}
         """
-        summary_result = db.execute_query(summary_query)
+        summary_result = db.execute_query(summary_query, series_filter_params)
         summary_data = summary_result[0] if summary_result else {}
         
-        # DEBUG: Check ALL series in database (before filtering)
-        debug_query = "SELECT id, series_code, name, status, is_active, subscription_start_date, subscription_end_date, maturity_date FROM ncd_series"
-        debug_result = db.execute_query(debug_query)
-        logger.info(f"🔍 ALL SERIES IN DATABASE ({len(debug_result)} total):")
-        for row in debug_result:
-            logger.info(f"  - {row['series_code']}: status={row['status']}, is_active={row['is_active']}, sub_start={row['subscription_start_date']}, sub_end={row['subscription_end_date']}, maturity={row['maturity_date']}")
-        
-        # DEBUG: Log summary data
         logger.info(f"📊 Summary Data: {summary_data}")
-        logger.info(f"📊 Total Series: {summary_data.get('total_series', 0)}")
-        logger.info(f"📊 Active Series: {summary_data.get('active_series', 0)}")
-        logger.info(f"📊 Total Investment Amount: ₹{summary_data.get('total_investment_amount', 0)}")
-        logger.info(f"📊 Total Investors: {summary_data.get('total_investors', 0)}")
         
         # Query 2: Get all series with comprehensive metrics (LIFETIME totals)
         # CRITICAL: Use backend status directly - it's already calculated correctly
-        series_query = """
+        series_query = f"""
         SELECT 
             s.id,
             s.name,
@@ -944,17 +860,14 @@ async def get_series_performance_report(
             END) as repeated_investors
         FROM ncd_series s
         LEFT JOIN investments i ON s.id = i.series_id AND i.status IN ('confirmed', 'cancelled')
-        WHERE s.is_active = 1
+        WHERE s.is_active = 1{series_filter}
         GROUP BY s.id, s.name, s.series_code, s.target_amount, s.interest_rate, 
                  s.interest_frequency, s.issue_date, s.maturity_date, s.status,
                  s.subscription_start_date, s.subscription_end_date, s.series_start_date, s.is_active
         """
-        series_result = db.execute_query(series_query)
+        series_result = db.execute_query(series_query, series_filter_params)
         
-        # DEBUG: Log series result
         logger.info(f"📊 Series Query returned {len(series_result)} series")
-        for row in series_result:
-            logger.info(f"📊 Series: {row['series_code']} - Status: {row['status']} - Investments: {row['total_investments']}")
         
         # Define status priority for sorting (same order as frontend)
         status_priority = {
@@ -1016,58 +929,54 @@ async def get_series_performance_report(
                 'status_display': status_display
             })
         
-        # Query 3: Get detailed per-series data with monthly trends
+        # Query 3+: Detailed per-series data - each dataset ONCE for every listed series,
+        # grouped by series_id and partitioned in memory
         detailed_series_data = []
+        listed_ids = [series['id'] for series in series_list]
         
-        for series in series_list:
-            series_id = series['id']
+        if listed_ids:
+            from app.api.routes.payouts import (
+                payout_amount_matrix,
+                generate_payout_period,
+                next_payout_period,
+                load_payout_records,
+                _as_date
+            )
+            import numpy as np
             
-            # Get monthly investment trend for this series (LIFETIME - includes exited)
-            monthly_trend_query = """
+            id_placeholders = ', '.join(['%s'] * len(listed_ids))
+            id_params = tuple(listed_ids)
+            
+            # Monthly investment trend (LIFETIME - includes exited)
+            monthly_trend_query = f"""
             SELECT 
+                i.series_id,
                 DATE_FORMAT(i.date_received, '%Y-%m') as month,
                 COUNT(*) as investment_count,
                 COALESCE(SUM(i.amount), 0) as total_amount,
                 COUNT(DISTINCT i.investor_id) as investor_count
             FROM investments i
-            WHERE i.series_id = %s AND i.status IN ('confirmed', 'cancelled')
-            GROUP BY DATE_FORMAT(i.date_received, '%Y-%m')
-            ORDER BY month
+            WHERE i.series_id IN ({id_placeholders}) AND i.status IN ('confirmed', 'cancelled')
+            GROUP BY i.series_id, DATE_FORMAT(i.date_received, '%Y-%m')
+            ORDER BY i.series_id, month
             """
-            monthly_result = db.execute_query(monthly_trend_query, (series_id,))
-            
-            monthly_trend = []
-            for row in monthly_result:
-                monthly_trend.append({
+            monthly_trends = {}
+            for row in db.execute_query(monthly_trend_query, id_params):
+                monthly_trends.setdefault(row['series_id'], []).append({
                     'month': row['month'],
                     'investment_count': row['investment_count'],
                     'total_amount': float(row['total_amount']),
                     'investor_count': row['investor_count']
                 })
             
-            # Get payout statistics for this series
+            # Payout statistics
             # CRITICAL: Calculate ACTUAL payouts from series start till current date
             # Then check payment status from interest_payouts table
             # This ensures we show REAL calculated amounts, not just manually imported data
-            
-            # Import calculation functions
-            from app.api.routes.payouts import (
-                calculate_monthly_interest,
-                calculate_first_month_interest,
-                calculate_exit_interest,
-                calculate_maturity_interest,
-                is_first_payout,
-                is_final_payout_after_exit,
-                is_last_payout_before_maturity,
-                should_skip_payout,
-                get_last_payout_date,
-                generate_payout_month
-            )
-            
-            # Get all investments for this series (active and exited)
-            investments_query = """
+            investments_query = f"""
             SELECT 
                 inv.id as investor_id,
+                i.series_id,
                 i.amount as investment_amount,
                 i.exit_date,
                 i.status as investment_status,
@@ -1078,175 +987,64 @@ async def get_series_performance_report(
             FROM investments i
             INNER JOIN investors inv ON i.investor_id = inv.id
             INNER JOIN ncd_series s ON i.series_id = s.id
-            WHERE i.series_id = %s 
+            WHERE i.series_id IN ({id_placeholders})
             AND i.status IN ('confirmed', 'cancelled')
             AND s.series_start_date IS NOT NULL
+            AND s.series_start_date <= CURDATE()
             """
-            investments_result = db.execute_query(investments_query, (series_id,))
-            
-            # Get existing payouts from interest_payouts table for status checking
-            existing_payouts_query = """
-            SELECT investor_id, series_id, payout_month, status, amount
-            FROM interest_payouts
-            WHERE series_id = %s AND is_active = 1
-            """
-            existing_payouts_result = db.execute_query(existing_payouts_query, (series_id,))
-            existing_payouts_lookup = {}
-            for payout in existing_payouts_result:
-                key = (payout['investor_id'], payout['series_id'], payout['payout_month'])
-                existing_payouts_lookup[key] = {
-                    'status': payout['status'],
-                    'amount': float(payout['amount'])
-                }
+            investments_result = db.execute_query(investments_query, id_params)
             
-            # Calculate payouts from series start till current month
             current_date = datetime.now()
-            total_payout_amount = 0.0
-            total_payouts = 0
-            paid_amount = 0.0
-            paid_count = 0
-            pending_amount = 0.0
-            pending_count = 0
-            
-            # Get series start date from first investment
-            if investments_result and len(investments_result) > 0:
-                series_start_date = investments_result[0]['series_start_date']
-                if isinstance(series_start_date, str):
-                    try:
-                        series_start_date = datetime.strptime(series_start_date, '%Y-%m-%d').date()
-                    except:
-                        series_start_date = None
+            current_period = generate_payout_period(current_date.year, current_date.month)
+            payout_totals = {}
+            
+            if investments_result:
+                # (investment × interest month) cells from the earliest series start to the current month
+                first_period = min(_as_date(row['series_start_date']) for row in investments_result).replace(day=1)
+                months = (current_period.year - first_period.year) * 12 + current_period.month - first_period.month + 1
+                amounts = payout_amount_matrix(investments_result, first_period.year, first_period.month, months)
+                has_payout = ~np.isnan(amounts)
                 
-                if series_start_date and series_start_date <= current_date.date():
-                    # Calculate from series start month to current month
-                    start_month_date = series_start_date.replace(day=1)
-                    current_month_date = current_date.date().replace(day=1)
-                    
-                    # Iterate through each month from start to current
-                    month_date = start_month_date
-                    while month_date <= current_month_date:
-                        interest_year = month_date.year
-                        interest_month = month_date.month
-                        
-                        # Calculate payouts for this month
-                        for inv_row in investments_result:
-                            # Parse dates
-                            inv_series_start = inv_row['series_start_date']
-                            if isinstance(inv_series_start, str):
-                                try:
-                                    inv_series_start = datetime.strptime(inv_series_start, '%Y-%m-%d').date()
-                                except:
-                                    inv_series_start = None
-                            
-                            maturity_date = inv_row['maturity_date']
-                            if isinstance(maturity_date, str):
-                                try:
-                                    maturity_date = datetime.strptime(maturity_date, '%Y-%m-%d').date()
-                                except:
-                                    maturity_date = None
-                            
-                            exit_date = inv_row['exit_date']
-                            if isinstance(exit_date, str):
-                                try:
-                                    exit_date = datetime.strptime(exit_date, '%Y-%m-%d').date()
-                                except:
-                                    exit_date = None
-                            
-                            # Generate payout date
-                            import calendar
-                            payment_day = inv_row['interest_payment_day'] or 15
-                            max_day_in_month = calendar.monthrange(interest_year, interest_month)[1]
-                            actual_payment_day = min(payment_day, max_day_in_month)
-                            payout_date_obj = datetime(interest_year, interest_month, actual_payment_day).date()
-                            
-                            # Get last payout date
-                            last_payout_date = get_last_payout_date(
-                                inv_series_start if inv_series_start else payout_date_obj,
-                                inv_row['interest_payment_day'] or 15,
-                                payout_date_obj
-                            )
-                            
-                            # Check if we should skip this payout
-                            if should_skip_payout(payout_date_obj, maturity_date, exit_date, last_payout_date):
-                                continue
-                            
-                            # Calculate interest amount
-                            if inv_series_start and is_first_payout(inv_series_start, interest_month, interest_year):
-                                monthly_interest = calculate_first_month_interest(
-                                    float(inv_row['investment_amount']),
-                                    float(inv_row['interest_rate']),
-                                    inv_series_start,
-                                    interest_month,
-                                    interest_year
-                                )
-                            elif exit_date and is_final_payout_after_exit(payout_date_obj, exit_date):
-                                monthly_interest = calculate_exit_interest(
-                                    float(inv_row['investment_amount']),
-                                    float(inv_row['interest_rate']),
-                                    exit_date,
-                                    interest_month,
-                                    interest_year
-                                )
-                            elif maturity_date and is_last_payout_before_maturity(payout_date_obj, maturity_date):
-                                monthly_interest = calculate_maturity_interest(
-                                    float(inv_row['investment_amount']),
-                                    float(inv_row['interest_rate']),
-                                    maturity_date,
-                                    interest_month,
-                                    interest_year
-                                )
-                            else:
-                                monthly_interest = calculate_monthly_interest(
-                                    float(inv_row['investment_amount']),
-                                    float(inv_row['interest_rate']),
-                                    interest_month,
-                                    interest_year
-                                )
-                            
-                            # Generate payout month
-                            payout_month = generate_payout_month(interest_year, interest_month)
-                            
-                            # Check status from interest_payouts table
-                            payout_key = (inv_row['investor_id'], series_id, payout_month)
-                            if payout_key in existing_payouts_lookup:
-                                payout_status = existing_payouts_lookup[payout_key]['status']
-                            else:
-                                # If not in table, consider it Scheduled (not yet paid)
-                                payout_status = 'Scheduled'
-                            
-                            # Update totals - count ALL calculated payouts
-                            total_payout_amount += monthly_interest
-                            total_payouts += 1
-                            
-                            # But separate by status
-                            if payout_status == 'Paid':
-                                paid_amount += monthly_interest
-                                paid_count += 1
-                            else:
-                                pending_amount += monthly_interest
-                                pending_count += 1
-                        
-                        # Move to next month
-                        if month_date.month == 12:
-                            month_date = month_date.replace(year=month_date.year + 1, month=1)
-                        else:
-                            month_date = month_date.replace(month=month_date.month + 1)
-            
-            # Create payout stats dictionary
-            # CRITICAL: total_payout_amount = ONLY Paid amounts (what user wants to see)
-            payout_stats = {
-                'total_payouts': paid_count,  # Count of PAID payouts
-                'total_payout_amount': paid_amount,  # Sum of PAID amounts (how much payout happened till date)
-                'paid_count': paid_count,
-                'paid_amount': paid_amount,
-                'pending_count': pending_count,
-                'pending_amount': pending_amount
-            }
+                # Stored payouts up to the current month - ONE range query for all series
+                rows_by_holding = {}
+                for index, row in enumerate(investments_result):
+                    rows_by_holding.setdefault((row['investor_id'], row['series_id']), []).append(index)
+                
+                is_paid = np.zeros(amounts.shape, dtype=bool)
+                for (record_investor_id, record_series_id, period), record in load_payout_records(
+                    db, first_period, next_payout_period(current_period)
+                ).items():
+                    row_indexes = rows_by_holding.get((record_investor_id, record_series_id))
+                    if row_indexes and record['status'] == 'Paid':
+                        is_paid[row_indexes, (period.year - first_period.year) * 12 + period.month - first_period.month] = True
+                is_paid &= has_payout
+                
+                # Per-investment totals, summed by series
+                row_series_ids = [row['series_id'] for row in investments_result]
+                series_position = {value: position for position, value in enumerate(sorted(set(row_series_ids)))}
+                row_series = np.array([series_position[value] for value in row_series_ids], dtype=np.int64)
+                
+                def by_series(values):
+                    return np.bincount(row_series, weights=values, minlength=len(series_position))
+                
+                total_amount = by_series(np.where(has_payout, amounts, 0.0).sum(axis=1))
+                total_count = by_series(has_payout.sum(axis=1))
+                paid_amount = by_series(np.where(is_paid, amounts, 0.0).sum(axis=1))
+                paid_count = by_series(is_paid.sum(axis=1))
+                
+                for value, position in series_position.items():
+                    payout_totals[value] = {
+                        'paid_count': int(paid_count[position]),
+                        'paid_amount': float(paid_amount[position]),
+                        'pending_count': int(total_count[position] - paid_count[position]),
+                        'pending_amount': float(total_amount[position] - paid_amount[position])
+                    }
             
-            # Get investor details for this series (grouped by investor - one row per investor)
+            # Investor details (grouped by investor - one row per investor per series)
             # INCLUDES both active and exited investors for LIFETIME history
-            investor_details_query = """
+            investor_details_query = f"""
             SELECT 
+                i.series_id,
                 inv.investor_id,
                 inv.full_name as investor_name,
                 inv.email,
@@ -1258,17 +1056,13 @@ async def get_series_performance_report(
                 MAX(CASE WHEN i.status = 'cancelled' THEN 'exited' ELSE 'confirmed' END) as investment_status
             FROM investments i
             INNER JOIN investors inv ON i.investor_id = inv.id
-            WHERE i.series_id = %s AND i.status IN ('confirmed', 'cancelled')
-            GROUP BY inv.investor_id, inv.full_name, inv.email, inv.phone, inv.pan
-            ORDER BY investment_amount DESC
+            WHERE i.series_id IN ({id_placeholders}) AND i.status IN ('confirmed', 'cancelled')
+            GROUP BY i.series_id, inv.investor_id, inv.full_name, inv.email, inv.phone, inv.pan
+            ORDER BY i.series_id, investment_amount DESC
             """
-            investor_details_result = db.execute_query(investor_details_query, (series_id,))
-            
-            logger.info(f"📊 Series {series['series_code']}: Found {len(investor_details_result)} investors (including exited)")
-            
-            investor_details = []
-            for row in investor_details_result:
-                investor_details.append({
+            investor_details_by_series = {}
+            for row in db.execute_query(investor_details_query, id_params):
+                investor_details_by_series.setdefault(row['series_id'], []).append({
                     'investor_id': row['investor_id'],
                     'investor_name': row['investor_name'],
                     'email': row['email'],
@@ -1280,9 +1074,10 @@ async def get_series_performance_report(
                     'investment_status': row['investment_status']
                 })
             
-            # Get investor distribution (ticket size distribution) - LIFETIME
-            distribution_query = """
+            # Investor distribution (ticket size distribution) - LIFETIME
+            distribution_query = f"""
             SELECT 
+                i.series_id,
                 CASE 
                     WHEN i.amount < 100000 THEN 'Small (<1L)'
                     WHEN i.amount >= 100000 AND i.amount < 500000 THEN 'Medium (1L-5L)'
@@ -1292,68 +1087,76 @@ async def get_series_performance_report(
                 COUNT(*) as count,
                 COALESCE(SUM(i.amount), 0) as total_amount
             FROM investments i
-            WHERE i.series_id = %s AND i.status IN ('confirmed', 'cancelled')
-            GROUP BY ticket_category
-            ORDER BY MIN(i.amount)
+            WHERE i.series_id IN ({id_placeholders}) AND i.status IN ('confirmed', 'cancelled')
+            GROUP BY i.series_id, ticket_category
+            ORDER BY i.series_id, MIN(i.amount)
             """
-            distribution_result = db.execute_query(distribution_query, (series_id,))
-            
-            ticket_distribution = []
-            for row in distribution_result:
-                ticket_distribution.append({
+            ticket_distributions = {}
+            for row in db.execute_query(distribution_query, id_params):
+                ticket_distributions.setdefault(row['series_id'], []).append({
                     'category': row['ticket_category'],
                     'count': row['count'],
                     'total_amount': float(row['total_amount'])
                 })
             
-            # Get compliance status for this series
-            compliance_query = """
+            # Compliance status
+            compliance_query = f"""
             SELECT 
+                series_id,
                 COUNT(*) as total,
                 SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
                 SUM(CASE WHEN status = 'received' THEN 1 ELSE 0 END) as received,
                 SUM(CASE WHEN status = 'submitted' THEN 1 ELSE 0 END) as submitted
             FROM series_compliance_status
-            WHERE series_id = %s
+            WHERE series_id IN ({id_placeholders})
+            GROUP BY series_id
             """
-            compliance_result = db.execute_query(compliance_query, (series_id,))
+            compliance_by_series = {row['series_id']: row for row in db.execute_query(compliance_query, id_params)}
             
-            if compliance_result and compliance_result[0]['total'] > 0:
-                comp_stats = compliance_result[0]
+            for series in series_list:
+                series_id = series['id']
+                investor_details = investor_details_by_series.get(series_id, [])
+                
+                logger.info(f"📊 Series {series['series_code']}: Found {len(investor_details)} investors (including exited)")
+                
+                # CRITICAL: total_payout_amount = ONLY Paid amounts (what user wants to see)
+                payouts = payout_totals.get(series_id, {'paid_count': 0, 'paid_amount': 0.0, 'pending_count': 0, 'pending_amount': 0.0})
+                
+                comp_stats = compliance_by_series.get(series_id)
                 total_requirements = 42  # Always 42 compliance items
-                completed = comp_stats['received'] + comp_stats['submitted']
-                pending_actions = comp_stats['pending']
-            else:
-                # No compliance entries yet - all pending
-                total_requirements = 42
-                completed = 0
-                pending_actions = 42
-            
-            completion_percentage = round((completed / total_requirements * 100), 2) if total_requirements > 0 else 0
-            
-            detailed_series_data.append({
-                'series_id': series_id,
-                'series_code': series['series_code'],
-                'series_name': series['name'],
-                'monthly_trend': monthly_trend,
-                'investor_details': investor_details,
-                'payout_stats': {
-                    'total_payouts': payout_stats.get('total_payouts', 0),
-                    'total_payout_amount': float(payout_stats.get('total_payout_amount', 0)),
-                    'paid_count': payout_stats.get('paid_count', 0),
-                    'paid_amount': float(payout_stats.get('paid_amount', 0)),
-                    'pending_count': payout_stats.get('pending_count', 0),
-                    'pending_amount': float(payout_stats.get('pending_amount', 0)),
-                    'payout_success_rate': round((payout_stats.get('paid_count', 0) / payout_stats.get('total_payouts', 1) * 100), 2) if payout_stats.get('total_payouts', 0) > 0 else 0
-                },
-                'compliance_stats': {
-                    'total_requirements': total_requirements,
-                    'completed': completed,
-                    'pending_actions': pending_actions,
-                    'completion_percentage': completion_percentage
-                },
-                'ticket_distribution': ticket_distribution
-            })
+                if comp_stats and comp_stats['total'] > 0:
+                    completed = int(comp_stats['received'] or 0) + int(comp_stats['submitted'] or 0)
+                    pending_actions = int(comp_stats['pending'] or 0)
+                else:
+                    # No compliance entries yet - all pending
+                    completed = 0
+                    pending_actions = 42
+                
+                completion_percentage = round((completed / total_requirements * 100), 2) if total_requirements > 0 else 0
+                
+                detailed_series_data.append({
+                    'series_id': series_id,
+                    'series_code': series['series_code'],
+                    'series_name': series['name'],
+                    'monthly_trend': monthly_trends.get(series_id, []),
+                    'investor_details': investor_details,
+                    'payout_stats': {
+                        'total_payouts': payouts['paid_count'],  # Count of PAID payouts
+                        'total_payout_amount': payouts['paid_amount'],  # Sum of PAID amounts (how much payout happened till date)
+                        'paid_count': payouts['paid_count'],
+                        'paid_amount': payouts['paid_amount'],
+                        'pending_count': payouts['pending_count'],
+                        'pending_amount': payouts['pending_amount'],
+                        'payout_success_rate': 100.0 if payouts['paid_count'] > 0 else 0
+                    },
+                    'compliance_stats': {
+                        'total_requirements': total_requirements,
+                        'completed': completed,
+                        'pending_actions': pending_actions,
+                        'completion_percentage': completion_percentage
+                    },
+                    'ticket_distribution': ticket_distributions.get(series_id, [])
+                })
         
         # Sort series_list by calculated status priority (accepting → active → upcoming → DRAFT → REJECTED → matured)
         series_list.sort(key=lambda x: status_priority.get(x['status'], 999))
@@ -1372,6 +1175,8 @@ async def get_series_performance_report(
             "timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting series performance report: {e}")
         raise HTTPException(
@@ -1597,8 +1402,12 @@ async def get_new_investors_report(
         query_params = []
         
         # Add date filter - filter by investor created_at date
-        where_conditions.append("DATE(i.created_at) BETWEEN %s AND %s")
-        query_params.extend([from_date, to_date])
+        try:
+            created_condition, created_params = date_range_condition("i.created_at", from_date, to_date)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        where_conditions.append(created_condition)
+        query_params.extend(created_params)
         
         # Add investor ID filter if provided
         if investor_id:
@@ -1645,7 +1454,9 @@ async def get_new_investors_report(
                 is_last_payout_before_maturity,
                 should_skip_payout,
                 get_last_payout_date,
-                generate_payout_month
+                generate_payout_period,
+                next_payout_period,
+                load_payout_records
             )
             
             # Get all investments for these investors
@@ -1674,19 +1485,11 @@ async def get_new_investors_report(
                 investments_data = db.execute_query(investments_query, tuple(investor_ids))
                 
                 # Get existing payouts for status checking
-                existing_payouts_query = f"""
-                SELECT investor_id, series_id, payout_month, status, amount
-                FROM interest_payouts
-                WHERE investor_id IN ({placeholders}) AND is_active = 1
-                """
-                existing_payouts_result = db.execute_query(existing_payouts_query, tuple(investor_ids))
-                existing_payouts_lookup = {}
-                for payout in existing_payouts_result:
-                    key = (payout['investor_id'], payout['series_id'], payout['payout_month'])
-                    existing_payouts_lookup[key] = {
-                        'status': payout['status'],
-                        'amount': float(payout['amount'])
-                    }
+                existing_payouts_lookup = load_payout_records(
+                    db,
+                    period_to=next_payout_period(generate_payout_period(datetime.now().year, datetime.now().month)),
+                    investor_ids=investor_ids
+                )
                 
                 # Calculate payouts per investor
                 current_date = datetime.now()
@@ -1802,11 +1605,8 @@ async def get_new_investors_report(
                                     interest_year
                                 )
                             
-                            # Generate payout month
-                            payout_month = generate_payout_month(interest_year, interest_month)
-                            
                             # Check status
-                            payout_key = (investor_id, series_id, payout_month)
+                            payout_key = (investor_id, series_id, generate_payout_period(interest_year, interest_month))
                             if payout_key in existing_payouts_lookup:
                                 payout_status = existing_payouts_lookup[payout_key]['status']
                             else:
@@ -1960,6 +1760,23 @@ async def get_new_investors_report(
         
         logger.info(f"📊 Personal Details: {len(personal_details)} records")
         
+        # Day-wise registrations over the range (daily new investor facts)
+        refresh_report_facts(db, ['fact_daily_new_investors'])
+        daily_new_investors_query = """
+        SELECT day, new_investors, active_investors
+        FROM fact_daily_new_investors
+        WHERE day BETWEEN %s AND %s
+        ORDER BY day
+        """
+        daily_new_investors = [
+            {
+                'date': row['day'].strftime('%Y-%m-%d'),
+                'new_investors': row['new_investors'],
+                'active_investors': row['active_investors']
+            }
+            for row in db.execute_query(daily_new_investors_query, (from_date, to_date))
+        ]
+        
         return {
             "from_date": from_date,
             "to_date": to_date,
@@ -1969,9 +1786,12 @@ async def get_new_investors_report(
             "banking_details": banking_details,
             "kyc_details": kyc_details,
             "personal_details": personal_details,
+            "daily_new_investors": daily_new_investors,
             "timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting new investors report: {e}")
         raise HTTPException(
@@ -2012,7 +1832,9 @@ async def get_rbi_compliance_report(
         
         series_where_clause = " AND ".join(series_where)
         
-        # Query 1: Get Summary Metrics
+        # Every query below is independent of the others - they run concurrently on
+        # pooled connections; compliance counts come grouped for all series at once
+        
         summary_query = f"""
         SELECT 
             COALESCE(SUM(inv.amount), 0) as total_aum,
@@ -2023,30 +1845,8 @@ async def get_rbi_compliance_report(
         LEFT JOIN investors i ON inv.investor_id = i.id
         WHERE {series_where_clause}
         """
-        summary_result = db.execute_query(summary_query, tuple(series_params) if series_params else None)
-        summary_data = summary_result[0] if summary_result else {}
-        
-        total_aum = float(summary_data.get('total_aum', 0))
-        kyc_pending = summary_data.get('kyc_pending', 0)
-        
-        # Query 2: Get upcoming payouts (UPCOMING MONTH - same as Interest Payout page)
-        # Calculate next month
-        from datetime import datetime
-        current_date = datetime.now()
-        
-        if current_date.month == 12:
-            next_year = current_date.year + 1
-            next_month = 1
-        else:
-            next_year = current_date.year
-            next_month = current_date.month + 1
-        
-        # Generate payout_month string for next month (format: YYYY-MM)
-        next_month_str = f"{next_year}-{next_month:02d}"
         
-        logger.info(f"📅 Calculating upcoming payouts for month: {next_month_str}")
-        
-        # Query upcoming payouts from the SAME source as Interest Payout page
+        # Upcoming payouts come from the SAME source as Interest Payout page
         # This matches the "Upcoming Month" tab in Interest Payout
         # RULE: Show payouts for ANY series that has started (series_start_date <= CURDATE())
         #       regardless of series status (DRAFT, upcoming, accepting, active, matured, etc.)
@@ -2082,7 +1882,155 @@ async def get_rbi_compliance_report(
         ORDER BY inv.investor_id, s.name
         """
         
-        upcoming_result = db.execute_query(upcoming_query, tuple(series_params) if series_params else None)
+        # Use subqueries to ensure accurate counting without row multiplication from JOINs
+        series_query = f"""
+        SELECT 
+            s.id,
+            s.series_code,
+            s.name as series_name,
+            s.security_type,
+            s.credit_rating,
+            s.debenture_trustee_name,
+            s.issue_date,
+            s.maturity_date,
+            DATEDIFF(s.maturity_date, s.issue_date) as tenure_days,
+            (SELECT COUNT(*) FROM series_documents sd WHERE sd.series_id = s.id AND sd.is_active = 1) as documents_count,
+            (SELECT COUNT(DISTINCT inv.investor_id) 
+             FROM investments inv 
+             WHERE inv.series_id = s.id AND inv.status = 'confirmed') as total_investors_in_series,
+            (SELECT COUNT(DISTINCT i.id)
+             FROM investments inv
+             INNER JOIN investors i ON inv.investor_id = i.id
+             WHERE inv.series_id = s.id 
+             AND inv.status = 'confirmed'
+             AND i.kyc_status = 'Completed') as kyc_completed_count,
+            (SELECT COUNT(DISTINCT p.id)
+             FROM interest_payouts p
+             WHERE p.series_id = s.id
+             AND p.status = 'Paid' 
+             AND DATEDIFF(p.paid_date, p.payout_date) > 1) as paid_late_count,
+            (SELECT COUNT(DISTINCT p.id)
+             FROM interest_payouts p
+             WHERE p.series_id = s.id
+             AND p.status IN ('Pending', 'Scheduled') 
+             AND p.payout_date < CURDATE()) as overdue_count,
+            (SELECT COUNT(DISTINCT p.id)
+             FROM interest_payouts p
+             WHERE p.series_id = s.id
+             AND p.status IN ('Pending', 'Scheduled') 
+             AND p.payout_date >= CURDATE()) as upcoming_count
+        FROM ncd_series s
+        WHERE {series_where_clause}
+        ORDER BY s.series_code
+        """
+        
+        compliance_sections_query = f"""
+        SELECT 
+            c.series_id,
+            c.section,
+            COUNT(*) as total_items,
+            SUM(CASE WHEN c.status IN ('received', 'submitted') THEN 1 ELSE 0 END) as completed_items
+        FROM series_compliance_status c
+        INNER JOIN ncd_series s ON s.id = c.series_id
+        WHERE {series_where_clause}
+        GROUP BY c.series_id, c.section
+        """
+        
+        master_counts_query = """
+        SELECT 
+            section,
+            COUNT(*) as total_items
+        FROM compliance_master_items
+        WHERE is_active = 1
+        GROUP BY section
+        """
+        
+        investor_summary_query = """
+        SELECT 
+            COUNT(DISTINCT i.id) as total_investors,
+            SUM(CASE WHEN i.kyc_status = 'Completed' THEN 1 ELSE 0 END) as kyc_completed,
+            SUM(CASE WHEN i.kyc_status = 'Pending' THEN 1 ELSE 0 END) as kyc_pending,
+            SUM(CASE WHEN i.kyc_status = 'Rejected' THEN 1 ELSE 0 END) as kyc_rejected
+        FROM investors i
+        WHERE i.is_active = 1
+        """
+        
+        holdings_query = f"""
+        SELECT 
+            i.investor_id,
+            i.full_name as investor_name,
+            s.series_code,
+            SUM(inv.amount) as amount_invested,
+            (SUM(inv.amount) / s.target_amount * 100) as percent_of_series
+        FROM investments inv
+        INNER JOIN investors i ON inv.investor_id = i.id
+        INNER JOIN ncd_series s ON inv.series_id = s.id
+        WHERE inv.status = 'confirmed'
+        AND {series_where_clause}
+        GROUP BY i.investor_id, i.full_name, s.series_code, s.target_amount
+        HAVING amount_invested > 0
+        ORDER BY amount_invested DESC
+        """
+        
+        payment_query = f"""
+        SELECT 
+            s.series_code,
+            COALESCE(SUM(CASE WHEN p.status = 'Paid' THEN p.amount ELSE 0 END), 0) as total_payouts,
+            COALESCE(SUM(CASE WHEN p.status = 'Paid' AND DATEDIFF(p.paid_date, p.payout_date) <= 1 THEN p.amount ELSE 0 END), 0) as ontime_amount,
+            COUNT(CASE WHEN p.status = 'Paid' AND DATEDIFF(p.paid_date, p.payout_date) <= 1 THEN 1 END) as ontime_count,
+            COALESCE(SUM(CASE WHEN p.status = 'Paid' AND DATEDIFF(p.paid_date, p.payout_date) > 1 THEN p.amount ELSE 0 END), 0) as paid_late_amount,
+            COUNT(CASE WHEN p.status = 'Paid' AND DATEDIFF(p.paid_date, p.payout_date) > 1 THEN 1 END) as paid_late_count,
+            COALESCE(SUM(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date < CURDATE() THEN p.amount ELSE 0 END), 0) as overdue_amount,
+            COUNT(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date < CURDATE() THEN 1 END) as overdue_count,
+            COALESCE(SUM(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL 30 DAY) THEN p.amount ELSE 0 END), 0) as upcoming_amount,
+            COUNT(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL 30 DAY) THEN 1 END) as upcoming_count,
+            COALESCE(SUM(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date > DATE_ADD(CURDATE(), INTERVAL 30 DAY) THEN p.amount ELSE 0 END), 0) as future_amount,
+            COUNT(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date > DATE_ADD(CURDATE(), INTERVAL 30 DAY) THEN 1 END) as future_count
+        FROM ncd_series s
+        LEFT JOIN interest_payouts p ON s.id = p.series_id
+        WHERE {series_where_clause}
+        GROUP BY s.series_code
+        ORDER BY s.series_code
+        """
+        
+        series_query_params = tuple(series_params) if series_params else None
+        section_results, section_timings = run_report_sections({
+            'summary': query_section(summary_query, series_query_params),
+            'upcoming': query_section(upcoming_query, series_query_params),
+            'series': query_section(series_query, series_query_params),
+            'compliance_sections': query_section(compliance_sections_query, series_query_params),
+            'master_counts': query_section(master_counts_query),
+            'investor_summary': query_section(investor_summary_query),
+            'holdings': query_section(holdings_query, series_query_params),
+            'payments': query_section(payment_query, series_query_params),
+        })
+        
+        # Query 1: Get Summary Metrics
+        summary_result = section_results['summary']
+        summary_data = summary_result[0] if summary_result else {}
+        
+        total_aum = float(summary_data.get('total_aum', 0))
+        kyc_pending = summary_data.get('kyc_pending', 0)
+        
+        # Query 2: Get upcoming payouts (UPCOMING MONTH - same as Interest Payout page)
+        # Calculate next month
+        from datetime import datetime
+        current_date = datetime.now()
+        
+        if current_date.month == 12:
+            next_year = current_date.year + 1
+            next_month = 1
+        else:
+            next_year = current_date.year
+            next_month = current_date.month + 1
+        
+        # Generate payout_month string for next month (format: YYYY-MM)
+        next_month_str = f"{next_year}-{next_month:02d}"
+        
+        logger.info(f"📅 Calculating upcoming payouts for month: {next_month_str}")
+        
+        # Query upcoming payouts from the SAME source as Interest Payout page
+        upcoming_result = section_results['upcoming']
         
         # Calculate upcoming payouts using the SAME logic as Interest Payout page
         # Import calculation functions from payouts module
@@ -2183,48 +2131,7 @@ async def get_rbi_compliance_report(
         logger.info(f"✅ Calculated upcoming payouts for {next_month_str}: ₹{upcoming_payouts:,.2f}")
         
         # Query 3: Get Series Compliance Details
-        # Use subqueries to ensure accurate counting without row multiplication from JOINs
-        series_query = f"""
-        SELECT 
-            s.id,
-            s.series_code,
-            s.name as series_name,
-            s.security_type,
-            s.credit_rating,
-            s.debenture_trustee_name,
-            s.issue_date,
-            s.maturity_date,
-            DATEDIFF(s.maturity_date, s.issue_date) as tenure_days,
-            (SELECT COUNT(*) FROM series_documents sd WHERE sd.series_id = s.id AND sd.is_active = 1) as documents_count,
-            (SELECT COUNT(DISTINCT inv.investor_id) 
-             FROM investments inv 
-             WHERE inv.series_id = s.id AND inv.status = 'confirmed') as total_investors_in_series,
-            (SELECT COUNT(DISTINCT i.id)
-             FROM investments inv
-             INNER JOIN investors i ON inv.investor_id = i.id
-             WHERE inv.series_id = s.id 
-             AND inv.status = 'confirmed'
-             AND i.kyc_status = 'Completed') as kyc_completed_count,
-            (SELECT COUNT(DISTINCT p.id)
-             FROM interest_payouts p
-             WHERE p.series_id = s.id
-             AND p.status = 'Paid' 
-             AND DATEDIFF(p.paid_date, p.payout_date) > 1) as paid_late_count,
-            (SELECT COUNT(DISTINCT p.id)
-             FROM interest_payouts p
-             WHERE p.series_id = s.id
-             AND p.status IN ('Pending', 'Scheduled') 
-             AND p.payout_date < CURDATE()) as overdue_count,
-            (SELECT COUNT(DISTINCT p.id)
-             FROM interest_payouts p
-             WHERE p.series_id = s.id
-             AND p.status IN ('Pending', 'Scheduled') 
-             AND p.payout_date >= CURDATE()) as upcoming_count
-        FROM ncd_series s
-        WHERE {series_where_clause}
-        ORDER BY s.series_code
-        """
-        series_result = db.execute_query(series_query, tuple(series_params) if series_params else None)
+        series_result = section_results['series']
         
         # DEBUG: Log the query results to verify KYC calculation
         logger.info(f"📊 Series Compliance Query returned {len(series_result)} series")
@@ -2234,6 +2141,28 @@ async def get_rbi_compliance_report(
         series_compliance = []
         attention_items = []
         
+        # Compliance document counts per (series, section) - one grouped query for all series
+        compliance_counts = {}
+        for sec_row in section_results['compliance_sections']:
+            compliance_counts.setdefault(sec_row['series_id'], {})[sec_row['section']] = {
+                'total': sec_row['total_items'],
+                'completed': sec_row['completed_items'] or 0
+            }
+        
+        # Master item counts for each section
+        # Default totals (26 pre, 11 post, 5 recurring)
+        pre_total = 26
+        post_total = 11
+        recurring_total = 5
+        
+        for mc_row in section_results['master_counts']:
+            if mc_row['section'] == 'pre':
+                pre_total = mc_row['total_items']
+            elif mc_row['section'] == 'post':
+                post_total = mc_row['total_items']
+            elif mc_row['section'] == 'recurring':
+                recurring_total = mc_row['total_items']
+        
         # Calculate compliance score based on ACTUAL 42 compliance items
         total_compliance_items = 0
         completed_compliance_items = 0
@@ -2241,19 +2170,12 @@ async def get_rbi_compliance_report(
         for row in series_result:
             series_id = row['id']
             
-            # Get actual compliance status for this series (42 items)
-            compliance_count_query = """
-            SELECT 
-                COUNT(*) as total_items,
-                SUM(CASE WHEN status IN ('received', 'submitted') THEN 1 ELSE 0 END) as completed_items
-            FROM series_compliance_status
-            WHERE series_id = %s
-            """
-            compliance_count = db.execute_query(compliance_count_query, (series_id,))
+            # Actual compliance status of this series (42 items), from the per-section counts
+            section_counts = compliance_counts.get(series_id, {})
+            series_total_items = sum(counts['total'] for counts in section_counts.values())
             
-            if compliance_count and compliance_count[0]['total_items'] > 0:
-                series_total_items = compliance_count[0]['total_items']
-                series_completed_items = compliance_count[0]['completed_items'] or 0
+            if series_total_items > 0:
+                series_completed_items = sum(counts['completed'] for counts in section_counts.values())
             else:
                 # If no status entries exist, assume all 42 items are pending
                 series_total_items = 42
@@ -2335,50 +2257,6 @@ async def get_rbi_compliance_report(
             # Build attention items with compliance document status
             series_code = row['series_code']
             
-            # Get compliance document counts by section for this series
-            compliance_sections_query = """
-            SELECT 
-                section,
-                COUNT(*) as total_items,
-                SUM(CASE WHEN status IN ('received', 'submitted') THEN 1 ELSE 0 END) as completed_items
-            FROM series_compliance_status
-            WHERE series_id = %s
-            GROUP BY section
-            """
-            sections_result = db.execute_query(compliance_sections_query, (series_id,))
-            
-            # Create lookup for section counts
-            section_counts = {}
-            for sec_row in sections_result:
-                section_counts[sec_row['section']] = {
-                    'total': sec_row['total_items'],
-                    'completed': sec_row['completed_items'] or 0
-                }
-            
-            # Get master item counts for each section
-            master_counts_query = """
-            SELECT 
-                section,
-                COUNT(*) as total_items
-            FROM compliance_master_items
-            WHERE is_active = 1
-            GROUP BY section
-            """
-            master_counts = db.execute_query(master_counts_query)
-            
-            # Default totals (26 pre, 11 post, 5 recurring)
-            pre_total = 26
-            post_total = 11
-            recurring_total = 5
-            
-            for mc_row in master_counts:
-                if mc_row['section'] == 'pre':
-                    pre_total = mc_row['total_items']
-                elif mc_row['section'] == 'post':
-                    post_total = mc_row['total_items']
-                elif mc_row['section'] == 'recurring':
-                    recurring_total = mc_row['total_items']
-            
             # Calculate pending documents for each section
             pre_completed = section_counts.get('pre', {}).get('completed', 0)
             post_completed = section_counts.get('post', {}).get('completed', 0)
@@ -2407,36 +2285,11 @@ async def get_rbi_compliance_report(
         logger.info(f"✅ Compliance Score: {compliance_score:.1f}% ({completed_compliance_items}/{total_compliance_items} items)")
         
         # Query 4: Investor Summary
-        investor_summary_query = """
-        SELECT 
-            COUNT(DISTINCT i.id) as total_investors,
-            SUM(CASE WHEN i.kyc_status = 'Completed' THEN 1 ELSE 0 END) as kyc_completed,
-            SUM(CASE WHEN i.kyc_status = 'Pending' THEN 1 ELSE 0 END) as kyc_pending,
-            SUM(CASE WHEN i.kyc_status = 'Rejected' THEN 1 ELSE 0 END) as kyc_rejected
-        FROM investors i
-        WHERE i.is_active = 1
-        """
-        investor_summary_result = db.execute_query(investor_summary_query)
+        investor_summary_result = section_results['investor_summary']
         investor_summary_data = investor_summary_result[0] if investor_summary_result else {}
         
         # Query 5: Top Investor Holdings (Concentration Risk)
-        holdings_query = f"""
-        SELECT 
-            i.investor_id,
-            i.full_name as investor_name,
-            s.series_code,
-            SUM(inv.amount) as amount_invested,
-            (SUM(inv.amount) / s.target_amount * 100) as percent_of_series
-        FROM investments inv
-        INNER JOIN investors i ON inv.investor_id = i.id
-        INNER JOIN ncd_series s ON inv.series_id = s.id
-        WHERE inv.status = 'confirmed'
-        AND {series_where_clause}
-        GROUP BY i.investor_id, i.full_name, s.series_code, s.target_amount
-        HAVING amount_invested > 0
-        ORDER BY amount_invested DESC
-        """
-        holdings_result = db.execute_query(holdings_query, tuple(series_params) if series_params else None)
+        holdings_result = section_results['holdings']
         
         top_holdings = []
         for row in holdings_result:
@@ -2449,27 +2302,7 @@ async def get_rbi_compliance_report(
             })
         
         # Query 6: Payment Compliance per Series
-        payment_query = f"""
-        SELECT 
-            s.series_code,
-            COALESCE(SUM(CASE WHEN p.status = 'Paid' THEN p.amount ELSE 0 END), 0) as total_payouts,
-            COALESCE(SUM(CASE WHEN p.status = 'Paid' AND DATEDIFF(p.paid_date, p.payout_date) <= 1 THEN p.amount ELSE 0 END), 0) as ontime_amount,
-            COUNT(CASE WHEN p.status = 'Paid' AND DATEDIFF(p.paid_date, p.payout_date) <= 1 THEN 1 END) as ontime_count,
-            COALESCE(SUM(CASE WHEN p.status = 'Paid' AND DATEDIFF(p.paid_date, p.payout_date) > 1 THEN p.amount ELSE 0 END), 0) as paid_late_amount,
-            COUNT(CASE WHEN p.status = 'Paid' AND DATEDIFF(p.paid_date, p.payout_date) > 1 THEN 1 END) as paid_late_count,
-            COALESCE(SUM(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date < CURDATE() THEN p.amount ELSE 0 END), 0) as overdue_amount,
-            COUNT(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date < CURDATE() THEN 1 END) as overdue_count,
-            COALESCE(SUM(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL 30 DAY) THEN p.amount ELSE 0 END), 0) as upcoming_amount,
-            COUNT(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL 30 DAY) THEN 1 END) as upcoming_count,
-            COALESCE(SUM(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date > DATE_ADD(CURDATE(), INTERVAL 30 DAY) THEN p.amount ELSE 0 END), 0) as future_amount,
-            COUNT(CASE WHEN p.status IN ('Pending', 'Scheduled') AND p.payout_date > DATE_ADD(CURDATE(), INTERVAL 30 DAY) THEN 1 END) as future_count
-        FROM ncd_series s
-        LEFT JOIN interest_payouts p ON s.id = p.series_id
-        WHERE {series_where_clause}
-        GROUP BY s.series_code
-        ORDER BY s.series_code
-        """
-        payment_result = db.execute_query(payment_query, tuple(series_params) if series_params else None)
+        payment_result = section_results['payments']
         
         payment_compliance = []
         for row in payment_result:
@@ -2523,6 +2356,7 @@ async def get_rbi_compliance_report(
             },
             "payment_compliance": payment_compliance,
             "attention_items": attention_items,
+            "section_timings": section_timings,
             "timestamp": datetime.now().isoformat()
         }
         
@@ -2579,6 +2413,8 @@ async def get_audit_trail_report(
         # SUMMARY CARDS
         # ============================================================
         
+        received_condition, received_params = date_range_condition("i.date_received", start_date, end_date)
+        
         # Build series filter condition
         series_filter = ""
         series_params = []
@@ -2591,13 +2427,12 @@ async def get_audit_trail_report(
         SELECT COALESCE(SUM(i.amount), 0) as total
         FROM investments i
         WHERE i.status IN ('confirmed', 'cancelled')
-        AND DATE(i.date_received) >= %s 
-        AND DATE(i.date_received) <= %s
+        AND {received_condition}
         {series_filter}
         """
         total_investments_result = db.execute_query(
             total_investments_query, 
-            [start_date, end_date] + series_params
+            received_params + series_params
         )
         total_investments = total_investments_result[0]['total'] if total_investments_result else 0
         
@@ -2623,7 +2458,9 @@ async def get_audit_trail_report(
                 is_last_payout_before_maturity,
                 should_skip_payout,
                 get_last_payout_date,
-                generate_payout_month
+                generate_payout_period,
+                next_payout_period,
+                load_payout_records
             )
             
             # Get all investments (filtered by series if provided)
@@ -2648,47 +2485,12 @@ async def get_audit_trail_report(
             investments_result = db.execute_query(investments_query, series_params if series_id else [])
             
             # Get existing payouts from interest_payouts table for status checking
-            existing_payouts_query = f"""
-            SELECT investor_id, series_id, payout_month, status, amount
-            FROM interest_payouts
-            WHERE is_active = 1
-            {series_filter.replace('i.series_id', 'series_id') if series_id else ''}
-            """
-            existing_payouts_result = db.execute_query(existing_payouts_query, series_params if series_id else [])
-            existing_payouts_lookup = {}
-            for payout in existing_payouts_result:
-                payout_month_from_db = payout['payout_month']
-                
-                # Store with original format
-                key = (payout['investor_id'], payout['series_id'], payout_month_from_db)
-                existing_payouts_lookup[key] = {
-                    'status': payout['status'],
-                    'amount': float(payout['amount'])
-                }
-                
-                # Also store with converted format (if it's "February 2026", convert to "2026-02")
-                try:
-                    # Try to parse as "February 2026"
-                    month_date = datetime.strptime(payout_month_from_db, '%B %Y')
-                    payout_month_numeric = month_date.strftime('%Y-%m')
-                    key_numeric = (payout['investor_id'], payout['series_id'], payout_month_numeric)
-                    existing_payouts_lookup[key_numeric] = {
-                        'status': payout['status'],
-                        'amount': float(payout['amount'])
-                    }
-                except:
-                    # Try to parse as "2026-02"
-                    try:
-                        year, month = payout_month_from_db.split('-')
-                        month_date = datetime(int(year), int(month), 1).date()
-                        payout_month_text = month_date.strftime('%B %Y')
-                        key_text = (payout['investor_id'], payout['series_id'], payout_month_text)
-                        existing_payouts_lookup[key_text] = {
-                            'status': payout['status'],
-                            'amount': float(payout['amount'])
-                        }
-                    except:
-                        pass
+            # Keyed by payout_period, so both stored month formats match without conversion
+            existing_payouts_lookup = load_payout_records(
+                db,
+                period_to=next_payout_period(generate_payout_period(datetime.now().year, datetime.now().month)),
+                series_id=series_id
+            )
             
             # Calculate payouts from series start till current month
             current_date = datetime.now()
@@ -2802,11 +2604,8 @@ async def get_audit_trail_report(
                                 interest_year
                             )
                         
-                        # Generate payout month in YYYY-MM format to match all_payouts_by_key
-                        payout_month = f"{interest_year}-{interest_month:02d}"
-                        
                         # Check status from interest_payouts table
-                        payout_key = (inv_row['investor_id'], inv_row['series_id'], payout_month)
+                        payout_key = (inv_row['investor_id'], inv_row['series_id'], generate_payout_period(interest_year, interest_month))
                         if payout_key in existing_payouts_lookup:
                             payout_status = existing_payouts_lookup[payout_key]['status']
                         else:
@@ -2922,15 +2721,14 @@ async def get_audit_trail_report(
         LEFT JOIN investors inv ON i.investor_id = inv.id
         LEFT JOIN ncd_series s ON i.series_id = s.id
         WHERE i.status IN ('confirmed', 'cancelled')
-        AND DATE(i.date_received) >= %s 
-        AND DATE(i.date_received) <= %s
+        AND {received_condition}
         {series_filter}
         ORDER BY i.date_received DESC, i.created_at DESC
         """
         
         investments_result = db.execute_query(
             investments_query,
-            [start_date, end_date] + series_params
+            received_params + series_params
         )
         
         investments = []
@@ -3446,17 +3244,320 @@ async def get_audit_trail_report(
             detail=f"Error retrieving audit trail report: {str(e)}"
         )
 
+# ============================================
+# INVESTOR PORTFOLIO - BATCHED PER-INVESTOR DETAIL
+# ============================================
+
+PORTFOLIO_PAGE_DEFAULT_LIMIT = 100
+PORTFOLIO_PAGE_MAX_LIMIT = 1000
+
+# Investors whose detail sections are fetched together (one IN query per section)
+PORTFOLIO_DETAIL_BATCH_SIZE = 500
+
+
+def encode_portfolio_cursor(investor: dict) -> str:
+    """Opaque cursor pointing just after `investor` in the investor breakdown order"""
+    import base64
+    import json
+
+    raw = json.dumps({'k': [repr(investor['total_investment']), investor['investor_id']]}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_portfolio_cursor(cursor: str) -> list:
+    """Cursor → [total_investment, investor_id]. Raises ValueError if it is malformed"""
+    import base64
+    import json
+
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))['k']
+        Decimal(values[0])
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if len(values) != 2:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def load_investor_breakdown(db, investor_id: Optional[str] = None, series_id: Optional[int] = None,
+                            limit: Optional[int] = None, after: Optional[list] = None) -> list:
+    """
+    Investor-wise totals, largest investment first (investor id breaks ties so the order is stable)
+    limit / after: one keyset page - `after` is a decoded portfolio cursor
+    """
+    investor_breakdown_query = """
+    SELECT 
+        inv.investor_id,
+        inv.full_name as investor_name,
+        inv.email,
+        inv.phone,
+        inv.pan,
+        COALESCE(SUM(CASE WHEN i.id IS NOT NULL THEN i.amount ELSE 0 END), 0) as total_investment,
+        COUNT(DISTINCT CASE WHEN i.series_id IS NOT NULL THEN i.series_id END) as series_count,
+        COUNT(CASE WHEN i.id IS NOT NULL THEN i.id END) as investment_count,
+        MIN(CASE WHEN i.date_received IS NOT NULL THEN i.date_received END) as first_investment_date,
+        MAX(CASE WHEN i.date_received IS NOT NULL THEN i.date_received END) as last_investment_date,
+        CASE 
+            WHEN COUNT(DISTINCT CASE WHEN s.status = 'active' AND i.series_id IS NOT NULL THEN i.series_id END) > 0 THEN 'Active'
+            ELSE 'Inactive'
+        END as status
+    FROM investors inv
+    LEFT JOIN investments i ON inv.id = i.investor_id
+    LEFT JOIN ncd_series s ON i.series_id = s.id
+    WHERE inv.status = 'active'
+    """
+    
+    params = []
+    
+    # Add investor filter if provided
+    if investor_id:
+        investor_breakdown_query += " AND inv.investor_id = %s"
+        params.append(investor_id)
+    
+    # Add series filter if provided
+    if series_id:
+        investor_breakdown_query += " AND i.series_id = %s"
+        params.append(series_id)
+    
+    investor_breakdown_query += """
+    GROUP BY inv.investor_id, inv.full_name, inv.email, inv.phone, inv.pan
+    """
+    
+    if after:
+        investor_breakdown_query += """
+    HAVING (total_investment < %s OR (total_investment = %s AND inv.investor_id > %s))
+    """
+        params.extend([after[0], after[0], after[1]])
+    
+    investor_breakdown_query += """
+    ORDER BY total_investment DESC, inv.investor_id ASC
+    """
+    
+    if limit:
+        investor_breakdown_query += f" LIMIT {int(limit)}"
+    
+    investor_breakdown = []
+    for row in db.execute_query(investor_breakdown_query, tuple(params)):
+        investor_breakdown.append({
+            'investor_id': row['investor_id'],
+            'investor_name': row['investor_name'],
+            'email': row['email'],
+            'phone': row['phone'],
+            'pan': row['pan'],
+            'total_investment': float(row['total_investment'] or 0),
+            'series_count': row['series_count'] or 0,
+            'investment_count': row['investment_count'] or 0,
+            'total_payouts_received': 0,
+            'pending_payouts': 0,
+            'first_investment_date': row['first_investment_date'].strftime('%d/%m/%Y') if row['first_investment_date'] else None,
+            'last_investment_date': row['last_investment_date'].strftime('%d/%m/%Y') if row['last_investment_date'] else None,
+            'status': row['status']
+        })
+    
+    return investor_breakdown
+
+
+def _investor_portfolio_details_batch(db, investors: list, series_id: Optional[int] = None) -> list:
+    """
+    Detailed data for a batch of investor breakdown entries - TWO queries for the whole batch
+    (confirmed investments + KYC / bank details); the charts are built from the investments
+    """
+    codes = [investor['investor_id'] for investor in investors]
+    placeholders = ', '.join(['%s'] * len(codes))
+    
+    series_investments_query = f"""
+    SELECT 
+        inv.investor_id,
+        s.series_code,
+        s.name as series_name,
+        i.amount as investment_amount,
+        i.date_received,
+        i.date_transferred,
+        s.interest_rate,
+        s.interest_frequency,
+        s.maturity_date,
+        CASE 
+            WHEN CURDATE() < s.maturity_date THEN 'Active'
+            WHEN CURDATE() >= s.maturity_date THEN 'Matured'
+            ELSE s.status
+        END as status
+    FROM investments i
+    JOIN investors inv ON inv.id = i.investor_id
+    JOIN ncd_series s ON i.series_id = s.id
+    WHERE inv.investor_id IN ({placeholders})
+        AND i.status = 'confirmed'
+    """
+    series_params = list(codes)
+    
+    if series_id:
+        series_investments_query += " AND i.series_id = %s"
+        series_params.append(series_id)
+    
+    series_investments_query += " ORDER BY inv.investor_id, i.date_received DESC"
+    
+    investments_by_investor = {}
+    for row in db.execute_query(series_investments_query, tuple(series_params)):
+        investments_by_investor.setdefault(row['investor_id'], []).append(row)
+    
+    accounts_query = f"""
+    SELECT 
+        investor_id,
+        kyc_status,
+        bank_name,
+        account_number,
+        ifsc_code
+    FROM investors
+    WHERE investor_id IN ({placeholders})
+    """
+    accounts = {row['investor_id']: row for row in db.execute_query(accounts_query, tuple(codes))}
+    
+    details = []
+    for investor in investors:
+        inv_id = investor['investor_id']
+        rows = investments_by_investor.get(inv_id, [])
+        account = accounts.get(inv_id, {})
+        
+        # A. Investment Summary (already have from breakdown)
+        investment_summary = {
+            'total_invested': investor['total_investment'],
+            'number_of_series': investor['series_count'],
+            'number_of_investments': investor['investment_count'],
+            'average_investment_size': round(investor['total_investment'] / investor['investment_count'], 2) if investor['investment_count'] > 0 else 0,
+            'first_investment_date': investor['first_investment_date'],
+            'last_investment_date': investor['last_investment_date']
+        }
+        
+        # B. Series-wise Investment Details
+        series_investments = []
+        # G. Investment Distribution by Series (Pie Chart) / H. Yearly Investment Trend (Line/Bar Chart)
+        by_series = {}
+        by_year = {}
+        
+        for row in rows:
+            amount = float(row['investment_amount'] or 0)
+            series_investments.append({
+                'series_code': row['series_code'],
+                'series_name': row['series_name'],
+                'investment_amount': amount,
+                'date_received': row['date_received'].strftime('%d/%m/%Y') if row['date_received'] else None,
+                'date_transferred': row['date_transferred'].strftime('%d/%m/%Y') if row['date_transferred'] else None,
+                'interest_rate': float(row['interest_rate'] or 0),
+                'interest_frequency': row['interest_frequency'],
+                'maturity_date': row['maturity_date'].strftime('%d/%m/%Y') if row['maturity_date'] else None,
+                'status': row['status']
+            })
+            
+            series_total = by_series.setdefault(
+                (row['series_code'], row['series_name']),
+                {'series_code': row['series_code'], 'series_name': row['series_name'], 'amount': 0.0}
+            )
+            series_total['amount'] += amount
+            
+            year = row['date_received'].year if row['date_received'] else None
+            year_total = by_year.setdefault(year, {'year': str(year), 'total_amount': 0.0, 'investment_count': 0})
+            year_total['total_amount'] += amount
+            year_total['investment_count'] += 1
+        
+        investment_distribution = sorted(by_series.values(), key=lambda item: item['amount'], reverse=True)
+        yearly_investment_trend = [by_year[year] for year in sorted(by_year, key=lambda year: (year is not None, year or 0))]
+        
+        details.append({
+            'investor_id': inv_id,
+            'investor_name': investor['investor_name'],
+            'email': investor['email'],
+            'phone': investor['phone'],
+            'pan': investor['pan'],
+            'investment_summary': investment_summary,
+            'series_investments': series_investments,
+            # C / D / I / J: payout history and charts - DISABLED (no payouts table)
+            'payout_history': {
+                'total_payouts_received': 0,
+                'paid_count': 0,
+                'paid_amount': 0,
+                'pending_count': 0,
+                'pending_amount': 0,
+                'last_payout_date': None,
+                'next_expected_payout': None
+            },
+            'payout_details': [],
+            # E. KYC & Compliance Status
+            'kyc_status': {
+                'kyc_status': account.get('kyc_status', 'Pending'),
+                'last_updated_date': None
+            },
+            # F. Bank Details
+            'bank_details': {
+                'bank_name': account.get('bank_name'),
+                'account_number': account.get('account_number'),
+                'ifsc_code': account.get('ifsc_code')
+            },
+            'investment_distribution': investment_distribution,
+            'yearly_investment_trend': yearly_investment_trend,
+            'payout_trend': [],
+            'payout_status_distribution': []
+        })
+    
+    return details
+
+
+def iter_investor_portfolio_details(db, investors: list, series_id: Optional[int] = None,
+                                    batch_size: int = PORTFOLIO_DETAIL_BATCH_SIZE):
+    """Detailed data for every investor, fetched batch_size investors at a time (a constant number of queries per batch)"""
+    from app.utils.import_utils import chunked
+
+    for batch in chunked(investors, batch_size):
+        yield from _investor_portfolio_details_batch(db, batch, series_id)
+
+
 @router.get("/investor-portfolio")
 async def get_investor_portfolio_report(
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     investor_id: Optional[str] = None,
     series_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
     Get Investor Portfolio Summary Report data
     PERMISSION REQUIRED: view_reports
+    Always one page of investors (limit, default 100) - the whole book is read with
+    next_cursor or generated as a file through a report job
+    """
+    return await build_investor_portfolio_report(
+        from_date, to_date, investor_id, series_id, limit, cursor, current_user
+    )
+
+
+async def get_investor_portfolio_book(
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    investor_id: Optional[str] = None,
+    series_id: Optional[int] = None,
+    current_user: UserInDB = None
+):
+    """The report over every investor in one result - report jobs / snapshots, not an HTTP response"""
+    return await build_investor_portfolio_report(
+        from_date, to_date, investor_id, series_id, None, None, current_user, full_book=True
+    )
+
+
+async def build_investor_portfolio_report(
+    from_date: Optional[str],
+    to_date: Optional[str],
+    investor_id: Optional[str],
+    series_id: Optional[int],
+    limit: Optional[int],
+    cursor: Optional[str],
+    current_user: UserInDB,
+    full_book: bool = False
+):
+    """
+    Investor Portfolio Summary Report
+    PERMISSION REQUIRED: view_reports
     Parameters:
     - from_date: Start date (YYYY-MM-DD format) - optional
     - to_date: End date (YYYY-MM-DD format) - optional
@@ -3466,6 +3567,13 @@ async def get_investor_portfolio_report(
     - Overall summary (if all investors)
     - Investor-wise breakdown
     - Per investor detailed view with investments, payouts, charts data
+
+    Paging (keyset over the investor breakdown, largest investment first):
+    - limit:  investors per page (default 100, max 1000)
+    - cursor: next_cursor from the previous page
+    - full_book: every investor, no paging (report jobs only)
+    The first page carries the whole report with the first `limit` investors; pages
+    requested with a cursor only carry investor_breakdown and detailed_investor_data.
     """
     try:
         db = get_db()
@@ -3478,6 +3586,50 @@ async def get_investor_portfolio_report(
                 detail="Access Denied: You don't have permission to view reports"
             )
         
+        try:
+            after = decode_portfolio_cursor(cursor) if cursor else None
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        paged = not full_book
+        page_size = min(max(limit or PORTFOLIO_PAGE_DEFAULT_LIMIT, 1), PORTFOLIO_PAGE_MAX_LIMIT) if paged else None
+        
+        def investor_page():
+            """Investor breakdown + detailed data for this page (every investor when not paged)"""
+            # One extra row tells us whether there is a next page
+            breakdown = load_investor_breakdown(
+                db, investor_id, series_id,
+                limit=page_size + 1 if paged else None,
+                after=after
+            )
+            has_more = paged and len(breakdown) > page_size
+            if paged:
+                breakdown = breakdown[:page_size]
+            
+            details = list(iter_investor_portfolio_details(db, breakdown, series_id))
+            
+            paging = {}
+            if paged:
+                paging = {
+                    'count': len(breakdown),
+                    'limit': page_size,
+                    'has_more': has_more,
+                    'next_cursor': encode_portfolio_cursor(breakdown[-1]) if has_more else None
+                }
+            return breakdown, details, paging
+        
+        if cursor:
+            investor_breakdown, detailed_investor_data, paging = investor_page()
+            return {
+                "investor_breakdown": investor_breakdown,
+                "detailed_investor_data": detailed_investor_data,
+                **paging,
+                "timestamp": datetime.now().isoformat()
+            }
+        
         # ============================================================
         # 1. OVERALL SUMMARY (when viewing all investors)
         # ============================================================
@@ -3556,7 +3708,9 @@ async def get_investor_portfolio_report(
                 is_last_payout_before_maturity,
                 should_skip_payout,
                 get_last_payout_date,
-                generate_payout_month
+                generate_payout_period,
+                next_payout_period,
+                load_payout_records
             )
             
             # Get all investments (filtered by investor_id and series_id if provided)
@@ -3590,29 +3744,13 @@ async def get_investor_portfolio_report(
             investments_result = db.execute_query(investments_query, tuple(payout_params) if payout_params else ())
             
             # Get existing payouts from interest_payouts table for status checking
-            existing_payouts_query = """
-            SELECT investor_id, series_id, payout_month, status, amount
-            FROM interest_payouts
-            WHERE is_active = 1
-            """
-            
-            existing_payouts_params = []
-            if investor_id:
-                existing_payouts_query += " AND investor_id = (SELECT id FROM investors WHERE investor_id = %s)"
-                existing_payouts_params.append(investor_id)
-            
-            if series_id:
-                existing_payouts_query += " AND series_id = %s"
-                existing_payouts_params.append(series_id)
-            
-            existing_payouts_result = db.execute_query(existing_payouts_query, tuple(existing_payouts_params) if existing_payouts_params else ())
-            existing_payouts_lookup = {}
-            for payout in existing_payouts_result:
-                key = (payout['investor_id'], payout['series_id'], payout['payout_month'])
-                existing_payouts_lookup[key] = {
-                    'status': payout['status'],
-                    'amount': float(payout['amount'])
-                }
+            # Key: (investor_id, series_id, payout_period) - months up to the current one
+            existing_payouts_lookup = load_payout_records(
+                db,
+                period_to=next_payout_period(generate_payout_period(datetime.now().year, datetime.now().month)),
+                series_id=series_id,
+                investor_code=investor_id
+            )
             
             # Calculate payouts from series start till current month
             current_date = datetime.now()
@@ -3725,11 +3863,8 @@ async def get_investor_portfolio_report(
                                 interest_year
                             )
                         
-                        # Generate payout month
-                        payout_month = generate_payout_month(interest_year, interest_month)
-                        
                         # Check status from interest_payouts table
-                        payout_key = (inv_row['investor_db_id'], inv_row['series_id'], payout_month)
+                        payout_key = (inv_row['investor_db_id'], inv_row['series_id'], generate_payout_period(interest_year, interest_month))
                         if payout_key in existing_payouts_lookup:
                             payout_status = existing_payouts_lookup[payout_key]['status']
                         else:
@@ -3947,7 +4082,9 @@ async def get_investor_portfolio_report(
                 is_last_payout_before_maturity,
                 should_skip_payout,
                 get_last_payout_date,
-                generate_payout_month
+                generate_payout_period,
+                next_payout_period,
+                load_payout_records
             )
             
             # Get all investments (filtered by investor_id and series_id if provided)
@@ -3988,30 +4125,13 @@ async def get_investor_portfolio_report(
             investments_result = db.execute_query(investments_query, tuple(payouts_params) if payouts_params else ())
             
             # Get existing payouts from interest_payouts table for status checking
-            existing_payouts_query = """
-            SELECT investor_id, series_id, payout_month, status, amount, payout_date
-            FROM interest_payouts
-            WHERE is_active = 1
-            """
-            
-            existing_payouts_params = []
-            if investor_id:
-                existing_payouts_query += " AND investor_id = (SELECT id FROM investors WHERE investor_id = %s)"
-                existing_payouts_params.append(investor_id)
-            
-            if series_id:
-                existing_payouts_query += " AND series_id = %s"
-                existing_payouts_params.append(series_id)
-            
-            existing_payouts_result = db.execute_query(existing_payouts_query, tuple(existing_payouts_params) if existing_payouts_params else ())
-            existing_payouts_lookup = {}
-            for payout in existing_payouts_result:
-                key = (payout['investor_id'], payout['series_id'], payout['payout_month'])
-                existing_payouts_lookup[key] = {
-                    'status': payout['status'],
-                    'amount': float(payout['amount']),
-                    'payout_date': payout['payout_date']
-                }
+            # Key: (investor_id, series_id, payout_period) - months up to the current one
+            existing_payouts_lookup = load_payout_records(
+                db,
+                period_to=next_payout_period(generate_payout_period(datetime.now().year, datetime.now().month)),
+                series_id=series_id,
+                investor_code=investor_id
+            )
             
             # Calculate payouts and aggregate by investor + series
             current_date = datetime.now()
@@ -4127,11 +4247,8 @@ async def get_investor_portfolio_report(
                                 interest_year
                             )
                         
-                        # Generate payout month
-                        payout_month = generate_payout_month(interest_year, interest_month)
-                        
                         # Check status from interest_payouts table
-                        payout_key = (inv_row['investor_db_id'], inv_row['series_id'], payout_month)
+                        payout_key = (inv_row['investor_db_id'], inv_row['series_id'], generate_payout_period(interest_year, interest_month))
                         if payout_key in existing_payouts_lookup:
                             payout_status = existing_payouts_lookup[payout_key]['status']
                             last_payout_date_value = existing_payouts_lookup[payout_key]['payout_date']
@@ -4331,281 +4448,14 @@ async def get_investor_portfolio_report(
         
         # ============================================================
         # 8. INVESTOR-WISE BREAKDOWN TABLE
+        # 9. DETAILED INVESTOR DATA (per investor, fetched in batches)
         # ============================================================
-        investor_breakdown_query = """
-        SELECT 
-            inv.investor_id,
-            inv.full_name as investor_name,
-            inv.email,
-            inv.phone,
-            inv.pan,
-            COALESCE(SUM(CASE WHEN i.id IS NOT NULL THEN i.amount ELSE 0 END), 0) as total_investment,
-            COUNT(DISTINCT CASE WHEN i.series_id IS NOT NULL THEN i.series_id END) as series_count,
-            COUNT(CASE WHEN i.id IS NOT NULL THEN i.id END) as investment_count,
-            MIN(CASE WHEN i.date_received IS NOT NULL THEN i.date_received END) as first_investment_date,
-            MAX(CASE WHEN i.date_received IS NOT NULL THEN i.date_received END) as last_investment_date,
-            CASE 
-                WHEN COUNT(DISTINCT CASE WHEN s.status = 'active' AND i.series_id IS NOT NULL THEN i.series_id END) > 0 THEN 'Active'
-                ELSE 'Inactive'
-            END as status
-        FROM investors inv
-        LEFT JOIN investments i ON inv.id = i.investor_id
-        LEFT JOIN ncd_series s ON i.series_id = s.id
-        WHERE inv.status = 'active'
-        """
-        
-        params = []
-        
-        # Add investor filter if provided
-        if investor_id:
-            investor_breakdown_query += " AND inv.investor_id = %s"
-            params.append(investor_id)
-        
-        # Add series filter if provided
-        if series_id:
-            investor_breakdown_query += " AND i.series_id = %s"
-            params.append(series_id)
-        
-        investor_breakdown_query += """
-        GROUP BY inv.investor_id, inv.full_name, inv.email, inv.phone, inv.pan
-        ORDER BY total_investment DESC
-        """
-        
-        investor_breakdown_result = db.execute_query(investor_breakdown_query, tuple(params))
-        
-        # DEBUG: Log the query result
-        logger.info(f"Investor breakdown query returned {len(investor_breakdown_result) if investor_breakdown_result else 0} rows")
-        if investor_breakdown_result and len(investor_breakdown_result) > 0:
-            logger.info(f"First row sample: {investor_breakdown_result[0]}")
-        
-        investor_breakdown = []
-        for row in investor_breakdown_result:
-            investor_breakdown.append({
-                'investor_id': row['investor_id'],
-                'investor_name': row['investor_name'],
-                'email': row['email'],
-                'phone': row['phone'],
-                'pan': row['pan'],
-                'total_investment': float(row['total_investment'] or 0),
-                'series_count': row['series_count'] or 0,
-                'investment_count': row['investment_count'] or 0,
-                'total_payouts_received': 0,
-                'pending_payouts': 0,
-                'first_investment_date': row['first_investment_date'].strftime('%d/%m/%Y') if row['first_investment_date'] else None,
-                'last_investment_date': row['last_investment_date'].strftime('%d/%m/%Y') if row['last_investment_date'] else None,
-                'status': row['status']
-            })
+        investor_breakdown, detailed_investor_data, paging = investor_page()
         
         logger.info(f"Investor breakdown array has {len(investor_breakdown)} items")
         
         # ============================================================
-        # 9. DETAILED INVESTOR DATA (per investor)
-        # ============================================================
-        detailed_investor_data = []
-        
-        # Get list of investors to process
-        investors_to_process = []
-        if investor_id:
-            # Single investor
-            investors_to_process = [inv for inv in investor_breakdown if inv['investor_id'] == investor_id]
-        else:
-            # All investors (limit to top 50 for performance)
-            investors_to_process = investor_breakdown[:50]
-        
-        for investor in investors_to_process:
-            inv_id = investor['investor_id']
-            
-            # A. Investment Summary (already have from breakdown)
-            investment_summary = {
-                'total_invested': investor['total_investment'],
-                'number_of_series': investor['series_count'],
-                'number_of_investments': investor['investment_count'],
-                'average_investment_size': round(investor['total_investment'] / investor['investment_count'], 2) if investor['investment_count'] > 0 else 0,
-                'first_investment_date': investor['first_investment_date'],
-                'last_investment_date': investor['last_investment_date']
-            }
-            
-            # B. Series-wise Investment Details
-            series_investments_query = """
-            SELECT 
-                s.series_code,
-                s.name as series_name,
-                i.amount as investment_amount,
-                i.date_received,
-                i.date_transferred,
-                s.interest_rate,
-                s.interest_frequency,
-                s.maturity_date,
-                CASE 
-                    WHEN CURDATE() < s.maturity_date THEN 'Active'
-                    WHEN CURDATE() >= s.maturity_date THEN 'Matured'
-                    ELSE s.status
-                END as status
-            FROM investments i
-            JOIN ncd_series s ON i.series_id = s.id
-            WHERE i.investor_id = %s 
-                AND i.status = 'confirmed'
-            """
-            
-            series_params = [inv_id]
-            
-            if series_id:
-                series_investments_query += " AND i.series_id = %s"
-                series_params.append(series_id)
-            
-            series_investments_query += " ORDER BY i.date_received DESC"
-            
-            series_investments_result = db.execute_query(series_investments_query, tuple(series_params))
-            
-            series_investments = []
-            for row in series_investments_result:
-                series_investments.append({
-                    'series_code': row['series_code'],
-                    'series_name': row['series_name'],
-                    'investment_amount': float(row['investment_amount'] or 0),
-                    'date_received': row['date_received'].strftime('%d/%m/%Y') if row['date_received'] else None,
-                    'date_transferred': row['date_transferred'].strftime('%d/%m/%Y') if row['date_transferred'] else None,
-                    'interest_rate': float(row['interest_rate'] or 0),
-                    'interest_frequency': row['interest_frequency'],
-                    'maturity_date': row['maturity_date'].strftime('%d/%m/%Y') if row['maturity_date'] else None,
-                    'status': row['status']
-                })
-            
-            # C. Payout History Summary - DISABLED (no payouts table)
-            payout_history = {
-                'total_payouts_received': 0,
-                'paid_count': 0,
-                'paid_amount': 0,
-                'pending_count': 0,
-                'pending_amount': 0,
-                'last_payout_date': None,
-                'next_expected_payout': None
-            }
-            
-            # D. Payout Details Table - DISABLED (no payouts table)
-            payout_details = []
-            
-            # E. KYC & Compliance Status
-            kyc_query = """
-            SELECT 
-                kyc_status
-            FROM investors
-            WHERE investor_id = %s
-            """
-            
-            kyc_result = db.execute_query(kyc_query, (inv_id,))
-            kyc_data = kyc_result[0] if kyc_result else {}
-            
-            kyc_status = {
-                'kyc_status': kyc_data.get('kyc_status', 'Pending'),
-                'last_updated_date': None
-            }
-            
-            # F. Bank Details
-            bank_query = """
-            SELECT 
-                bank_name,
-                account_number,
-                ifsc_code
-            FROM investors
-            WHERE investor_id = %s
-            """
-            
-            bank_result = db.execute_query(bank_query, (inv_id,))
-            bank_data = bank_result[0] if bank_result else {}
-            
-            bank_details = {
-                'bank_name': bank_data.get('bank_name'),
-                'account_number': bank_data.get('account_number'),
-                'ifsc_code': bank_data.get('ifsc_code')
-            }
-            
-            # G. CHART DATA - Investment Distribution by Series (Pie Chart)
-            investment_by_series_query = """
-            SELECT 
-                s.series_code,
-                s.name as series_name,
-                SUM(i.amount) as total_amount
-            FROM investments i
-            JOIN ncd_series s ON i.series_id = s.id
-            WHERE i.investor_id = %s 
-                AND i.status = 'confirmed'
-            """
-            
-            chart_params = [inv_id]
-            
-            if series_id:
-                investment_by_series_query += " AND i.series_id = %s"
-                chart_params.append(series_id)
-            
-            investment_by_series_query += " GROUP BY s.series_code, s.name ORDER BY total_amount DESC"
-            
-            investment_by_series_result = db.execute_query(investment_by_series_query, tuple(chart_params))
-            
-            investment_distribution = []
-            for row in investment_by_series_result:
-                investment_distribution.append({
-                    'series_code': row['series_code'],
-                    'series_name': row['series_name'],
-                    'amount': float(row['total_amount'] or 0)
-                })
-            
-            # H. CHART DATA - Yearly Investment Trend (Line/Bar Chart)
-            yearly_investment_query = """
-            SELECT 
-                YEAR(i.date_received) as year,
-                SUM(i.amount) as total_amount,
-                COUNT(i.id) as investment_count
-            FROM investments i
-            WHERE i.investor_id = %s 
-                AND i.status = 'confirmed'
-            """
-            
-            yearly_params = [inv_id]
-            
-            if series_id:
-                yearly_investment_query += " AND i.series_id = %s"
-                yearly_params.append(series_id)
-            
-            yearly_investment_query += " GROUP BY YEAR(i.date_received) ORDER BY year ASC"
-            
-            yearly_investment_result = db.execute_query(yearly_investment_query, tuple(yearly_params))
-            
-            yearly_investment_trend = []
-            for row in yearly_investment_result:
-                yearly_investment_trend.append({
-                    'year': str(row['year']),
-                    'total_amount': float(row['total_amount'] or 0),
-                    'investment_count': row['investment_count'] or 0
-                })
-            
-            # I. CHART DATA - Payout Trend Over Time - DISABLED (no payouts table)
-            payout_trend = []
-            
-            # J. CHART DATA - Payout Status Distribution - DISABLED (no payouts table)
-            payout_status_distribution = []
-            
-            # Compile all data for this investor
-            detailed_investor_data.append({
-                'investor_id': inv_id,
-                'investor_name': investor['investor_name'],
-                'email': investor['email'],
-                'phone': investor['phone'],
-                'pan': investor['pan'],
-                'investment_summary': investment_summary,
-                'series_investments': series_investments,
-                'payout_history': payout_history,
-                'payout_details': payout_details,
-                'kyc_status': kyc_status,
-                'bank_details': bank_details,
-                'investment_distribution': investment_distribution,
-                'yearly_investment_trend': yearly_investment_trend,
-                'payout_trend': payout_trend,
-                'payout_status_distribution': payout_status_distribution
-            })
-        
-        # ============================================================
-        # RETURN COMPLETE REPORT DATA
+        # RETURN COMPLETE REPORT DATA
         # ============================================================
         return {
             "summary": summary,
@@ -4617,9 +4467,12 @@ async def get_investor_portfolio_report(
             "investor_grievances_table": investor_grievances_table,
             "investor_breakdown": investor_breakdown,
             "detailed_investor_data": detailed_investor_data,
+            **paging,
             "timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting investor portfolio report: {e}")
         raise HTTPException(
@@ -4668,60 +4521,23 @@ async def get_sebi_disclosure_report(
             series_params.append(series_id)
             logger.info(f"🔍 Filtering by series_id: {series_id}")
         
-        # ============================================================
-        # QUERY 1: SUMMARY STATISTICS
-        # ============================================================
-        
-        # Total Series Count
-        total_series_query = f"""
-        SELECT COUNT(*) as total_series
-        FROM ncd_series s
-        WHERE {series_where_clause}
-        """
-        total_series_result = db.execute_query(total_series_query, tuple(series_params) if series_params else None)
-        total_series = total_series_result[0]['total_series'] if total_series_result else 0
-        
-        # Active Series Count (status = 'active')
-        active_series_query = f"""
-        SELECT COUNT(*) as active_series
-        FROM ncd_series s
-        WHERE {series_where_clause}
-        AND s.status = 'active'
-        """
-        active_series_result = db.execute_query(active_series_query, tuple(series_params) if series_params else None)
-        active_series = active_series_result[0]['active_series'] if active_series_result else 0
-        
-        # Average Interest Rate
-        avg_interest_query = f"""
-        SELECT AVG(s.interest_rate) as avg_interest_rate
-        FROM ncd_series s
-        WHERE {series_where_clause}
-        """
-        avg_interest_result = db.execute_query(avg_interest_query, tuple(series_params) if series_params else None)
-        avg_interest_rate = float(avg_interest_result[0]['avg_interest_rate'] or 0) if avg_interest_result else 0
-        
-        # Average Investment Per Series
-        avg_investment_query = f"""
-        SELECT 
-            AVG(series_investment) as avg_investment_per_series
-        FROM (
-            SELECT 
-                s.id,
-                COALESCE(SUM(i.amount), 0) as series_investment
-            FROM ncd_series s
-            LEFT JOIN investments i ON s.id = i.series_id AND i.status = 'confirmed'
-            WHERE {series_where_clause}
-            GROUP BY s.id
-        ) as series_totals
-        """
-        avg_investment_result = db.execute_query(avg_investment_query, tuple(series_params) if series_params else None)
-        avg_investment_per_series = float(avg_investment_result[0]['avg_investment_per_series'] or 0) if avg_investment_result else 0
+        # The report runs a fixed number of queries, whatever the number of series:
+        # series details, investments, payout statuses, grievance counts + records,
+        # compliance master counts and series compliance counts
+        # None depends on another - they run concurrently on pooled connections
         
-        logger.info(f"📈 Summary: {total_series} total series, {active_series} active, avg interest: {avg_interest_rate:.2f}%")
+        from app.api.routes.payouts import (
+            series_payout_schedule,
+            load_series_payout_statuses,
+            generate_payout_period,
+            next_payout_period,
+            _add_months
+        )
+        import calendar
         
-        # ============================================================
-        # QUERY 2: SERIES DETAILS (SEBI Required Information)
-        # ============================================================
+        current_date = datetime.now()
+        current_month = (current_date.year, current_date.month)
+        last_interest_month = _add_months(*current_month, 2)
         
         series_details_query = f"""
         SELECT 
@@ -4743,7 +4559,8 @@ async def get_sebi_disclosure_report(
             s.subscription_start_date,
             s.subscription_end_date,
             COALESCE(SUM(CASE WHEN i.status = 'confirmed' THEN i.amount ELSE 0 END), 0) as funds_raised,
-            COUNT(DISTINCT CASE WHEN i.status = 'confirmed' THEN i.investor_id END) as investor_count
+            COUNT(DISTINCT CASE WHEN i.status = 'confirmed' THEN i.investor_id END) as investor_count,
+            MIN(CASE WHEN i.status = 'confirmed' THEN i.date_received END) as allotment_date
         FROM ncd_series s
         LEFT JOIN investments i ON s.id = i.series_id
         WHERE {series_where_clause}
@@ -4754,7 +4571,113 @@ async def get_sebi_disclosure_report(
         ORDER BY s.series_code
         """
         
-        series_details_result = db.execute_query(series_details_query, tuple(series_params) if series_params else None)
+        # Get investments for calculation
+        # RULE: Show payouts for ANY series that has started (series_start_date <= CURDATE())
+        #       regardless of series status (DRAFT, upcoming, accepting, active, matured, etc.)
+        # RULE: Exclude investments where maturity date is BEFORE the current date
+        investments_query = f"""
+        SELECT 
+            inv.id as investor_id,
+            i.amount as investment_amount,
+            i.exit_date,
+            i.series_id,
+            s.series_code,
+            s.name as series_name,
+            s.interest_rate,
+            s.interest_payment_day,
+            s.series_start_date,
+            s.maturity_date
+        FROM investors inv
+        INNER JOIN investments i ON inv.id = i.investor_id
+        INNER JOIN ncd_series s ON i.series_id = s.id
+        WHERE (
+            (i.status = 'confirmed' AND inv.is_active = 1)
+            OR 
+            (i.status = 'cancelled' AND i.exit_date IS NOT NULL)
+        )
+        AND s.is_active = 1
+        AND s.series_start_date <= CURDATE()
+        AND (s.maturity_date IS NULL OR s.maturity_date >= CURDATE())
+        AND {series_where_clause}
+        """
+        
+        grievance_counts_query = """
+        SELECT 
+            COUNT(*) as total_grievances,
+            COALESCE(SUM(status IN ('pending', 'in-progress')), 0) as open_grievances,
+            COALESCE(SUM(status IN ('resolved', 'closed')), 0) as resolved_grievances,
+            COALESCE(SUM(status IN ('pending', 'in-progress') AND priority IN ('high', 'critical')), 0) as high_priority_grievances
+        FROM grievances
+        WHERE is_active = 1
+        """
+        
+        grievance_details_query = """
+        SELECT 
+            g.grievance_id,
+            g.investor_id,
+            i.full_name as investor_name,
+            g.series_id,
+            s.series_code,
+            g.category,
+            g.grievance_type,
+            g.description,
+            g.status,
+            g.priority,
+            g.created_at,
+            g.resolved_at,
+            CASE 
+                WHEN g.resolved_at IS NOT NULL THEN DATEDIFF(g.resolved_at, g.created_at)
+                ELSE DATEDIFF(CURDATE(), g.created_at)
+            END as days_pending
+        FROM grievances g
+        LEFT JOIN investors i ON g.investor_id = i.investor_id
+        LEFT JOIN ncd_series s ON g.series_id = s.id
+        WHERE g.is_active = 1
+        ORDER BY g.created_at DESC
+        LIMIT 50
+        """
+        
+        master_counts_query = """
+        SELECT 
+            section,
+            COUNT(*) as total_items
+        FROM compliance_master_items
+        WHERE is_active = 1
+        GROUP BY section
+        """
+        
+        compliance_sections_query = f"""
+        SELECT 
+            c.series_id,
+            c.section,
+            SUM(CASE WHEN c.status IN ('received', 'submitted') THEN 1 ELSE 0 END) as completed_items
+        FROM series_compliance_status c
+        INNER JOIN ncd_series s ON s.id = c.series_id
+        WHERE {series_where_clause}
+        GROUP BY c.series_id, c.section
+        """
+        
+        series_query_params = tuple(series_params) if series_params else None
+        section_results, section_timings = run_report_sections({
+            'series_details': query_section(series_details_query, series_query_params),
+            'investments': query_section(investments_query, series_query_params),
+            'payout_statuses': lambda section_db: load_series_payout_statuses(
+                section_db,
+                None,
+                next_payout_period(generate_payout_period(*last_interest_month)),
+                series_id=series_id
+            ),
+            'grievance_counts': query_section(grievance_counts_query),
+            'grievance_details': query_section(grievance_details_query),
+            'master_counts': query_section(master_counts_query),
+            'compliance_sections': query_section(compliance_sections_query, series_query_params),
+        })
+        
+        # ============================================================
+        # QUERY 1: SERIES DETAILS (SEBI Required Information)
+        # ============================================================
+        
+        series_details_result = section_results['series_details']
         
         logger.info(f"📋 Retrieved {len(series_details_result)} series for SEBI disclosure")
         
@@ -4762,21 +4685,14 @@ async def get_sebi_disclosure_report(
         series_details = []
         
         for row in series_details_result:
-            series_id_current = row['id']
             funds_raised = float(row['funds_raised'] or 0)
             target_amount = float(row['target_amount'] or 0)
             
             # Calculate subscription percentage
             subscription_percentage = (funds_raised / target_amount * 100) if target_amount > 0 else 0
             
-            # Get allotment date (earliest confirmed investment date for this series)
-            allotment_query = """
-            SELECT MIN(date_received) as allotment_date
-            FROM investments
-            WHERE series_id = %s AND status = 'confirmed'
-            """
-            allotment_result = db.execute_query(allotment_query, (series_id_current,))
-            allotment_date = allotment_result[0]['allotment_date'] if allotment_result and allotment_result[0]['allotment_date'] else None
+            # Allotment date = earliest confirmed investment date of the series
+            allotment_date = row['allotment_date']
             
             # Calculate outstanding amount (funds raised - any redemptions if applicable)
             # For now, outstanding = funds_raised (no redemption tracking yet)
@@ -4790,7 +4706,7 @@ async def get_sebi_disclosure_report(
             subscription_end_str = row['subscription_end_date'].strftime('%d/%m/%Y') if row['subscription_end_date'] else ''
             
             series_details.append({
-                'series_id': series_id_current,
+                'series_id': row['id'],
                 'series_code': row['series_code'],
                 'series_name': row['series_name'],
                 'status': row['status'],
@@ -4817,9 +4733,19 @@ async def get_sebi_disclosure_report(
             logger.info(f"  ✓ {row['series_code']}: {funds_raised:,.2f} / {target_amount:,.2f} ({subscription_percentage:.1f}%)")
         
         # ============================================================
-        # PREPARE SUMMARY
+        # PREPARE SUMMARY (from the series rows - no extra queries)
         # ============================================================
         
+        total_series = len(series_details_result)
+        active_series = sum(1 for row in series_details_result if row['status'] == 'active')
+        interest_rates = [float(row['interest_rate']) for row in series_details_result if row['interest_rate'] is not None]
+        avg_interest_rate = sum(interest_rates) / len(interest_rates) if interest_rates else 0
+        avg_investment_per_series = (
+            sum(detail['funds_raised'] for detail in series_details) / total_series if total_series else 0
+        )
+        
+        logger.info(f"📈 Summary: {total_series} total series, {active_series} active, avg interest: {avg_interest_rate:.2f}%")
+        
         summary = {
             'total_series': total_series,
             'active_series': active_series,
@@ -4828,457 +4754,107 @@ async def get_sebi_disclosure_report(
         }
         
         # ============================================================
-        # QUERY 3: PAYMENT COMPLIANCE & DEFAULTS (LODR Regulation 57)
+        # QUERY 2: PAYMENT COMPLIANCE & DEFAULTS (LODR Regulation 57)
         # ============================================================
         
         logger.info("📋 Fetching Payment Compliance data...")
         
-        # Import calculation functions from payouts module
-        from app.api.routes.payouts import (
-            calculate_monthly_interest,
-            calculate_first_month_interest,
-            calculate_exit_interest,
-            calculate_maturity_interest,
-            is_first_payout,
-            is_final_payout_after_exit,
-            is_last_payout_before_maturity,
-            should_skip_payout,
-            get_last_payout_date
-        )
-        from datetime import date
-        import calendar
-        
-        # Calculate upcoming obligations dynamically (next 90 days = next 3 months)
-        current_date = datetime.now()
+        investments_result = section_results['investments']
         
-        # Get investments for calculation
-        # RULE: Show payouts for ANY series that has started (series_start_date <= CURDATE())
-        #       regardless of series status (DRAFT, upcoming, accepting, active, matured, etc.)
-        # RULE: Exclude investments where maturity date is BEFORE the current date
-        investments_query = f"""
-        SELECT 
-            inv.id as investor_id,
-            inv.investor_id as investor_code,
-            inv.full_name as investor_name,
-            i.id as investment_id,
-            i.amount as investment_amount,
-            i.exit_date,
-            i.status as investment_status,
-            i.series_id,
-            s.series_code,
-            s.name as series_name,
-            s.interest_rate,
-            s.interest_payment_day,
-            s.series_start_date,
-            s.maturity_date,
-            s.lock_in_date
-        FROM investors inv
-        INNER JOIN investments i ON inv.id = i.investor_id
-        INNER JOIN ncd_series s ON i.series_id = s.id
-        WHERE (
-            (i.status = 'confirmed' AND inv.is_active = 1)
-            OR 
-            (i.status = 'cancelled' AND i.exit_date IS NOT NULL)
-        )
-        AND s.is_active = 1
-        AND s.series_start_date <= CURDATE()
-        AND (s.maturity_date IS NULL OR s.maturity_date >= CURDATE())
-        AND {series_where_clause}
-        ORDER BY inv.investor_id, s.name
-        """
-        
-        investments_result = db.execute_query(investments_query, tuple(series_params) if series_params else None)
+        series_info = {}
+        for row in investments_result:
+            series_info.setdefault(row['series_id'], row)
         
-        # Calculate payouts for next 3 months
         # CRITICAL: Interest for month X is PAID in month X+1
-        # So for upcoming payouts in months M1, M2, M3, we calculate interest for M1-1, M2-1, M3-1
-        upcoming_obligations = []
-        upcoming_by_series_month = {}  # Track by (series_id, payout_month) for aggregation
-        
-        for month_offset in range(1, 4):  # Next 3 months (payout months)
-            payout_month = current_date.month + month_offset
-            payout_year = current_date.year
-            
-            # Handle year rollover
-            while payout_month > 12:
-                payout_month -= 12
-                payout_year += 1
-            
-            # Calculate interest for the PREVIOUS month (interest month)
-            interest_month = payout_month - 1
-            interest_year = payout_year
-            if interest_month < 1:
-                interest_month = 12
-                interest_year -= 1
-            
-            payout_month_str = f"{payout_year}-{payout_month:02d}"
-            
-            for row in investments_result:
-                # Get series start date
-                series_start_date = row['series_start_date']
-                if isinstance(series_start_date, str):
-                    try:
-                        series_start_date = datetime.strptime(series_start_date, '%Y-%m-%d').date()
-                    except:
-                        series_start_date = None
-                
-                # Skip if series hasn't started yet in the interest month
-                if series_start_date:
-                    series_start_year_month = series_start_date.year * 12 + series_start_date.month
-                    interest_year_month = interest_year * 12 + interest_month
-                    if series_start_year_month > interest_year_month:
-                        continue
-                
-                # Get maturity date
-                maturity_date = row.get('maturity_date')
-                if isinstance(maturity_date, str):
-                    try:
-                        maturity_date = datetime.strptime(maturity_date, '%Y-%m-%d').date()
-                    except:
-                        maturity_date = None
-                
-                # Get exit date
-                exit_date = row.get('exit_date')
-                if isinstance(exit_date, str):
-                    try:
-                        exit_date = datetime.strptime(exit_date, '%Y-%m-%d').date()
-                    except:
-                        exit_date = None
-                
-                # Generate payout date (in payout month)
-                payment_day = row['interest_payment_day'] or 15
-                max_day_in_month = calendar.monthrange(payout_year, payout_month)[1]
-                actual_payment_day = min(payment_day, max_day_in_month)
-                
-                payout_date_obj = date(payout_year, payout_month, actual_payment_day)
-                
-                # Get last payout date for period calculation
-                last_payout_date = get_last_payout_date(
-                    series_start_date if series_start_date else payout_date_obj,
-                    row['interest_payment_day'] or 15,
-                    payout_date_obj
-                )
-                
-                # Check if we should skip this payout
-                if should_skip_payout(payout_date_obj, maturity_date, exit_date, last_payout_date):
-                    continue
-                
-                # Calculate interest amount for the INTEREST MONTH (previous month)
-                if series_start_date and is_first_payout(series_start_date, interest_month, interest_year):
-                    monthly_interest = calculate_first_month_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        series_start_date,
-                        interest_month,
-                        interest_year
-                    )
-                elif exit_date and is_final_payout_after_exit(payout_date_obj, exit_date):
-                    monthly_interest = calculate_exit_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        exit_date,
-                        interest_month,
-                        interest_year
-                    )
-                elif maturity_date and is_last_payout_before_maturity(payout_date_obj, maturity_date):
-                    monthly_interest = calculate_maturity_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        maturity_date,
-                        interest_month,
-                        interest_year
-                    )
-                else:
-                    monthly_interest = calculate_monthly_interest(
-                        float(row['investment_amount']),
-                        float(row['interest_rate']),
-                        interest_month,
-                        interest_year
-                    )
-                
-                # Aggregate by series and payout month
-                key = (row['series_id'], payout_month_str)
-                if key not in upcoming_by_series_month:
-                    upcoming_by_series_month[key] = {
-                        'series_id': row['series_id'],
-                        'series_code': row['series_code'],
-                        'series_name': row['series_name'],
-                        'payout_date': payout_date_obj,
-                        'payout_month': payout_month_str,
-                        'amount': 0.0,
-                        'investor_count': set()
-                    }
-                
-                upcoming_by_series_month[key]['amount'] += monthly_interest
-                upcoming_by_series_month[key]['investor_count'].add(row['investor_id'])
-        
-        # Convert to list and check status in interest_payouts table
-        for key, data in upcoming_by_series_month.items():
-            # Check if this payout exists in interest_payouts table and get status
-            status_query = """
-            SELECT status
-            FROM interest_payouts
-            WHERE series_id = %s AND payout_month = %s
-            LIMIT 1
-            """
-            status_result = db.execute_query(status_query, (data['series_id'], data['payout_month']))
-            payout_status = status_result[0]['status'] if status_result and len(status_result) > 0 else 'Scheduled'
-            
-            upcoming_obligations.append({
-                'series_code': data['series_code'],
-                'series_name': data['series_name'],
-                'payout_date': data['payout_date'].strftime('%d-%b-%Y'),  # Format as DD-Mon-YYYY
-                'payout_month': data['payout_month'],
-                'amount': round(data['amount'], 2),
-                'status': payout_status,
-                'investor_count': len(data['investor_count'])
-            })
-        
-        # Sort by payout date
-        upcoming_obligations.sort(key=lambda x: datetime.strptime(x['payout_date'], '%d-%b-%Y'))
+        # History = interest months from series start till the current month (paid up to next month)
+        # Upcoming = the next 3 payment months (interest for the current month and the 2 after it)
+        # One batch walk covers both; amounts per (series, payment month)
+        upcoming_from = _add_months(*current_month, 1)
+        schedule = series_payout_schedule(investments_result, *last_interest_month, investors_from=upcoming_from)
         
-        logger.info(f"📅 Calculated {len(upcoming_obligations)} upcoming obligations for next 90 days")
+        # Stored status of every (series, interest month) in the window - ONE grouped query
+        payout_statuses = section_results['payout_statuses']
         
-        # Calculate ALL historical payouts dynamically from series start till current date
+        upcoming_obligations = []
         payment_records = []
-        all_payouts_by_series_month = {}
-        
-        # Calculate from series start till current month
-        for row in investments_result:
-            series_start_date = row['series_start_date']
-            if isinstance(series_start_date, str):
-                try:
-                    series_start_date = datetime.strptime(series_start_date, '%Y-%m-%d').date()
-                except:
-                    continue
-            
-            if not series_start_date:
-                continue
-            
-            # Get maturity date
-            maturity_date = row.get('maturity_date')
-            if isinstance(maturity_date, str):
-                try:
-                    maturity_date = datetime.strptime(maturity_date, '%Y-%m-%d').date()
-                except:
-                    maturity_date = None
-            
-            # Get exit date
-            exit_date = row.get('exit_date')
-            if isinstance(exit_date, str):
-                try:
-                    exit_date = datetime.strptime(exit_date, '%Y-%m-%d').date()
-                except:
-                    exit_date = None
-            
-            # Calculate interest from series start month till current month
-            # Payouts happen in the NEXT month
-            interest_year = series_start_date.year
-            interest_month = series_start_date.month
-            
-            while (interest_year < current_date.year) or (interest_year == current_date.year and interest_month <= current_date.month):
-                # Payout happens in the NEXT month
-                payout_month = interest_month + 1
-                payout_year = interest_year
-                if payout_month > 12:
-                    payout_month = 1
-                    payout_year += 1
-                
-                payout_month_str = f"{payout_year}-{payout_month:02d}"
-                
-                # Generate payout date (in payout month)
-                payment_day = row['interest_payment_day'] or 15
-                max_day_in_month = calendar.monthrange(payout_year, payout_month)[1]
-                actual_payment_day = min(payment_day, max_day_in_month)
-                
-                payout_date_obj = date(payout_year, payout_month, actual_payment_day)
-                
-                # Get last payout date
-                last_payout_date = get_last_payout_date(
-                    series_start_date,
-                    row['interest_payment_day'] or 15,
-                    payout_date_obj
-                )
-                
-                # Check if we should skip
-                if not should_skip_payout(payout_date_obj, maturity_date, exit_date, last_payout_date):
-                    # Calculate interest for the INTEREST MONTH (not payout month)
-                    if is_first_payout(series_start_date, interest_month, interest_year):
-                        monthly_interest = calculate_first_month_interest(
-                            float(row['investment_amount']),
-                            float(row['interest_rate']),
-                            series_start_date,
-                            interest_month,
-                            interest_year
-                        )
-                    elif exit_date and is_final_payout_after_exit(payout_date_obj, exit_date):
-                        monthly_interest = calculate_exit_interest(
-                            float(row['investment_amount']),
-                            float(row['interest_rate']),
-                            exit_date,
-                            interest_month,
-                            interest_year
-                        )
-                    elif maturity_date and is_last_payout_before_maturity(payout_date_obj, maturity_date):
-                        monthly_interest = calculate_maturity_interest(
-                            float(row['investment_amount']),
-                            float(row['interest_rate']),
-                            maturity_date,
-                            interest_month,
-                            interest_year
-                        )
-                    else:
-                        monthly_interest = calculate_monthly_interest(
-                            float(row['investment_amount']),
-                            float(row['interest_rate']),
-                            interest_month,
-                            interest_year
-                        )
-                    
-                    # Aggregate by series and PAYOUT month
-                    key = (row['series_id'], payout_month_str)
-                    if key not in all_payouts_by_series_month:
-                        all_payouts_by_series_month[key] = {
-                            'series_id': row['series_id'],
-                            'series_code': row['series_code'],
-                            'series_name': row['series_name'],
-                            'payout_date': payout_date_obj,
-                            'payout_month': payout_month_str,
-                            'amount': 0.0
-                        }
-                    
-                    all_payouts_by_series_month[key]['amount'] += monthly_interest
-                
-                # Move to next interest month
-                interest_month += 1
-                if interest_month > 12:
-                    interest_month = 1
-                    interest_year += 1
-        
-        # Check status in interest_payouts table and build payment records
         payouts_paid_count = 0
         total_paid_amount = 0.0
         total_overdue_amount = 0.0
         
-        for key, data in all_payouts_by_series_month.items():
-            # Check status in interest_payouts table
-            status_query = """
-            SELECT status, paid_date, payout_date
-            FROM interest_payouts
-            WHERE series_id = %s AND payout_month = %s
-            LIMIT 1
-            """
-            status_result = db.execute_query(status_query, (data['series_id'], data['payout_month']))
+        for (schedule_series_id, (payout_year, payout_month)), entry in schedule.items():
+            row = series_info[schedule_series_id]
+            payment_day = row['interest_payment_day'] or 15
+            payout_date_obj = date(payout_year, payout_month, min(payment_day, calendar.monthrange(payout_year, payout_month)[1]))
+            payout_month_str = f"{payout_year}-{payout_month:02d}"
+            payout_status = payout_statuses.get(
+                (schedule_series_id, generate_payout_period(*entry['interest_month'])), 'Scheduled'
+            )
             
-            if status_result and len(status_result) > 0:
-                payout_status = status_result[0]['status']
-                
-                if payout_status == 'Paid':
-                    payouts_paid_count += 1
-                    total_paid_amount += data['amount']
-            else:
-                payout_status = 'Scheduled'
+            if (payout_year, payout_month) >= upcoming_from:
+                upcoming_obligations.append({
+                    'series_code': row['series_code'],
+                    'series_name': row['series_name'],
+                    'payout_date': payout_date_obj,
+                    'payout_month': payout_month_str,
+                    'amount': round(entry['amount'], 2),
+                    'status': payout_status,
+                    'investor_count': len(entry['investor_ids'])
+                })
+            
+            if entry['interest_month'] > current_month:
+                continue
+            
+            if payout_status == 'Paid':
+                payouts_paid_count += 1
+                total_paid_amount += entry['amount']
             
             # Check if overdue
-            if payout_status in ('Pending', 'Scheduled') and data['payout_date'] < current_date.date():
-                total_overdue_amount += data['amount']
+            if payout_status in ('Pending', 'Scheduled') and payout_date_obj < current_date.date():
+                total_overdue_amount += entry['amount']
             
             payment_records.append({
-                'series_code': data['series_code'],
-                'series_name': data['series_name'],
-                'payout_date': data['payout_date'].strftime('%d-%b-%Y'),  # Format as DD-Mon-YYYY
-                'payout_month': data['payout_month'],
-                'amount': round(data['amount'], 2),
+                'series_code': row['series_code'],
+                'series_name': row['series_name'],
+                'payout_date': payout_date_obj,
+                'payout_month': payout_month_str,
+                'amount': round(entry['amount'], 2),
                 'status': payout_status
             })
         
-        # Sort by payout date descending and limit to 100
-        payment_records.sort(key=lambda x: datetime.strptime(x['payout_date'], '%d-%b-%Y'), reverse=True)
+        # Upcoming: by payout date; history: latest first, limited to 100
+        upcoming_obligations.sort(key=lambda x: (x['payout_date'], x['series_code']))
+        payment_records.sort(key=lambda x: (x['payout_date'], x['series_code']), reverse=True)
         payment_records = payment_records[:100]
         
-        # ============================================================
-        # QUERY 4: INVESTOR GRIEVANCE MECHANISM (LODR Regulation 13)
-        # ============================================================
-        
-        logger.info("📋 Fetching Investor Grievance data...")
-        
-        # Simple grievance counts - no quarter complexity
-        
-        # Total grievances (all time)
-        total_grievances_query = """
-        SELECT COUNT(*) as count
-        FROM grievances
-        WHERE is_active = 1
-        """
-        total_grievances_result = db.execute_query(total_grievances_query)
-        total_grievances = total_grievances_result[0]['count'] if total_grievances_result else 0
-        
-        # Open grievances (pending resolution)
-        open_grievances_query = """
-        SELECT COUNT(*) as count
-        FROM grievances
-        WHERE is_active = 1
-        AND status IN ('pending', 'in-progress')
-        """
-        open_grievances_result = db.execute_query(open_grievances_query)
-        open_grievances = open_grievances_result[0]['count'] if open_grievances_result else 0
-        
-        # Resolved grievances (all time)
-        resolved_grievances_query = """
-        SELECT COUNT(*) as count
-        FROM grievances
-        WHERE is_active = 1
-        AND status IN ('resolved', 'closed')
-        """
-        resolved_grievances_result = db.execute_query(resolved_grievances_query)
-        resolved_grievances = resolved_grievances_result[0]['count'] if resolved_grievances_result else 0
-        
-        # High priority grievances (open)
-        high_priority_query = """
-        SELECT COUNT(*) as count
-        FROM grievances
-        WHERE is_active = 1
-        AND status IN ('pending', 'in-progress')
-        AND priority IN ('high', 'critical')
-        """
-        high_priority_result = db.execute_query(high_priority_query)
-        high_priority_grievances = high_priority_result[0]['count'] if high_priority_result else 0
-        
-        grievance_summary = {
-            'total_grievances': total_grievances,
-            'open_grievances': open_grievances,
-            'resolved_grievances': resolved_grievances,
-            'high_priority_grievances': high_priority_grievances
-        }
-        
-        # Get detailed grievance records
-        grievance_details_query = """
-        SELECT 
-            g.grievance_id,
-            g.investor_id,
-            i.full_name as investor_name,
-            g.series_id,
-            s.series_code,
-            g.category,
-            g.grievance_type,
-            g.description,
-            g.status,
-            g.priority,
-            g.created_at,
-            g.resolved_at,
-            CASE 
-                WHEN g.resolved_at IS NOT NULL THEN DATEDIFF(g.resolved_at, g.created_at)
-                ELSE DATEDIFF(CURDATE(), g.created_at)
-            END as days_pending
-        FROM grievances g
-        LEFT JOIN investors i ON g.investor_id = i.investor_id
-        LEFT JOIN ncd_series s ON g.series_id = s.id
-        WHERE g.is_active = 1
-        ORDER BY g.created_at DESC
-        LIMIT 50
-        """
-        grievance_details_result = db.execute_query(grievance_details_query)
-        
+        for record in upcoming_obligations + payment_records:
+            record['payout_date'] = record['payout_date'].strftime('%d-%b-%Y')  # Format as DD-Mon-YYYY
+        
+        logger.info(f"📅 Calculated {len(upcoming_obligations)} upcoming obligations for next 90 days")
+        
+        # ============================================================
+        # QUERY 3: INVESTOR GRIEVANCE MECHANISM (LODR Regulation 13)
+        # ============================================================
+        
+        logger.info("📋 Fetching Investor Grievance data...")
+        
+        # All counts in one pass over the active grievances
+        grievance_counts = section_results['grievance_counts'][0]
+        
+        total_grievances = int(grievance_counts['total_grievances'] or 0)
+        open_grievances = int(grievance_counts['open_grievances'] or 0)
+        resolved_grievances = int(grievance_counts['resolved_grievances'] or 0)
+        high_priority_grievances = int(grievance_counts['high_priority_grievances'] or 0)
+        
+        grievance_summary = {
+            'total_grievances': total_grievances,
+            'open_grievances': open_grievances,
+            'resolved_grievances': resolved_grievances,
+            'high_priority_grievances': high_priority_grievances
+        }
+        
+        # Get detailed grievance records
+        grievance_details_result = section_results['grievance_details']
+        
         grievance_records = []
         for row in grievance_details_result:
             # Safely format created_at
@@ -5323,15 +4899,7 @@ async def get_sebi_disclosure_report(
         logger.info("=" * 80)
         
         # Get master item counts for each section (26 pre, 11 post, 5 recurring)
-        master_counts_query = """
-        SELECT 
-            section,
-            COUNT(*) as total_items
-        FROM compliance_master_items
-        WHERE is_active = 1
-        GROUP BY section
-        """
-        master_counts = db.execute_query(master_counts_query)
+        master_counts = section_results['master_counts']
         
         # Default totals
         pre_total = 26
@@ -5348,6 +4916,11 @@ async def get_sebi_disclosure_report(
         
         total_compliance_items = pre_total + post_total + recurring_total
         
+        # Completed documents per (series, section) for every reported series - ONE query
+        completed_by_series = {}
+        for sec_row in section_results['compliance_sections']:
+            completed_by_series.setdefault(sec_row['series_id'], {})[sec_row['section']] = int(sec_row['completed_items'] or 0)
+        
         # Build compliance attention items for each series
         compliance_attention_items = []
         
@@ -5360,33 +4933,13 @@ async def get_sebi_disclosure_report(
         total_recurring_completed = 0
         
         for series_row in series_details:
-            series_id = series_row['series_id']
             series_code = series_row['series_code']
-            
-            # Get compliance document counts by section for this series
-            compliance_sections_query = """
-            SELECT 
-                section,
-                COUNT(*) as total_items,
-                SUM(CASE WHEN status IN ('received', 'submitted') THEN 1 ELSE 0 END) as completed_items
-            FROM series_compliance_status
-            WHERE series_id = %s
-            GROUP BY section
-            """
-            sections_result = db.execute_query(compliance_sections_query, (series_id,))
-            
-            # Create lookup for section counts
-            section_counts = {}
-            for sec_row in sections_result:
-                section_counts[sec_row['section']] = {
-                    'total': sec_row['total_items'],
-                    'completed': sec_row['completed_items'] or 0
-                }
+            section_completed = completed_by_series.get(series_row['series_id'], {})
             
             # Calculate pending documents for each section
-            pre_completed = section_counts.get('pre', {}).get('completed', 0)
-            post_completed = section_counts.get('post', {}).get('completed', 0)
-            recurring_completed = section_counts.get('recurring', {}).get('completed', 0)
+            pre_completed = section_completed.get('pre', 0)
+            post_completed = section_completed.get('post', 0)
+            recurring_completed = section_completed.get('recurring', 0)
             
             pre_pending = pre_total - pre_completed
             post_pending = post_total - post_completed
@@ -5450,6 +5003,7 @@ async def get_sebi_disclosure_report(
             "grievance_records": grievance_records,
             "compliance_tracking_summary": compliance_tracking_summary,
             "compliance_attention_items": compliance_attention_items,
+            "section_timings": section_timings,
             "timestamp": datetime.now().isoformat()
         }
         
@@ -5520,6 +5074,8 @@ async def get_daily_activity_report(
         # SUMMARY CARDS
         # ============================================================
         
+        activity_condition, activity_params = date_range_condition("al.timestamp", start_date, end_date)
+        
         # Build role filter condition
         role_filter = ""
         role_params = []
@@ -5534,13 +5090,12 @@ async def get_daily_activity_report(
         INNER JOIN audit_logs al ON al.admin_name = u.full_name
         WHERE u.is_active = 1
         AND al.action = 'User Login'
-        AND DATE(al.timestamp) >= %s
-        AND DATE(al.timestamp) <= %s
+        AND {activity_condition}
         {role_filter}
         """
         total_users_result = db.execute_query(
             total_users_query,
-            [start_date, end_date] + role_params
+            activity_params + role_params
         )
         total_users = total_users_result[0]['count'] if total_users_result else 0
         
@@ -5566,14 +5121,13 @@ async def get_daily_activity_report(
         INNER JOIN audit_logs al ON al.admin_name = u.full_name
         WHERE u.is_active = 1
         AND al.action IN ('User Login', 'User Logout', 'Session End')
-        AND DATE(al.timestamp) >= %s
-        AND DATE(al.timestamp) <= %s
+        AND {activity_condition}
         {role_filter}
         ORDER BY u.id, al.timestamp
         """
         activities_result = db.execute_query(
             activities_query,
-            [start_date, end_date] + role_params
+            activity_params + role_params
         )
         
         # Calculate time spent for each user by matching login with logout/session end
@@ -5697,6 +5251,38 @@ async def get_daily_activity_report(
         
         logger.info(f"🎭 Role Breakdown: {len(role_breakdown)} roles")
         
+        # ============================================================
+        # DAY-WISE ACTIVITY (daily audit action facts)
+        # ============================================================
+        
+        refresh_report_facts(db, ['fact_daily_audit_actions'])
+        
+        trend_role_filter = ""
+        if role and role != 'all':
+            trend_role_filter = "AND admin_role = %s"
+        
+        activity_trend_query = f"""
+        SELECT 
+            day,
+            SUM(action_count) as action_count,
+            SUM(CASE WHEN action = 'User Login' THEN action_count ELSE 0 END) as login_count,
+            SUM(CASE WHEN action = 'User Login' THEN user_count ELSE 0 END) as active_users
+        FROM fact_daily_audit_actions
+        WHERE day BETWEEN %s AND %s
+        {trend_role_filter}
+        GROUP BY day
+        ORDER BY day
+        """
+        activity_trend = [
+            {
+                'date': row['day'].strftime('%Y-%m-%d'),
+                'action_count': int(row['action_count']),
+                'login_count': int(row['login_count']),
+                'active_users': int(row['active_users'])
+            }
+            for row in db.execute_query(activity_trend_query, [start_date, end_date] + role_params)
+        ]
+        
         logger.info("=" * 80)
         logger.info("✅ DAILY ACTIVITY REPORT GENERATED SUCCESSFULLY")
         logger.info("=" * 80)
@@ -5710,6 +5296,7 @@ async def get_daily_activity_report(
             "summary": summary,
             "user_activities": user_activities,
             "role_breakdown": role_breakdown,
+            "activity_trend": activity_trend,
             "all_roles": all_roles,
             "timestamp": datetime.now().isoformat()
         }
@@ -5747,33 +5334,126 @@ async def get_subscription_trend_analysis(
                 detail="Access Denied: You don't have permission to view reports"
             )
         
+        refresh_report_facts(db, ['fact_daily_investments', 'fact_daily_new_investors'])
+        
+        # Every query of the report is independent - they run concurrently on pooled
+        # connections and the sections below only read their results
+        total_series_query = "SELECT COUNT(*) as count FROM ncd_series"
+        
+        active_series_query = "SELECT COUNT(*) as count FROM ncd_series WHERE status = 'active'"
+        
+        total_investors_query = "SELECT COALESCE(SUM(active_investors), 0) as count FROM fact_daily_new_investors"
+        
+        active_investors_query = """
+        SELECT COUNT(DISTINCT investor_id) as count
+        FROM investor_series
+        WHERE status = 'active'
+        """
+        
+        investor_details_query = """
+        SELECT 
+            i.investor_id,
+            i.full_name as investor_name,
+            i.email,
+            i.phone,
+            COALESCE(SUM(inv.amount), 0) as total_investment,
+            COUNT(DISTINCT CASE WHEN inv.series_id IS NOT NULL THEN inv.series_id END) as series_count,
+            COALESCE(AVG(CASE WHEN inv.amount IS NOT NULL THEN inv.amount END), 0) as avg_investment
+        FROM investors i
+        LEFT JOIN investments inv ON i.id = inv.investor_id AND inv.status IN ('confirmed', 'cancelled')
+        WHERE i.is_active = 1
+        GROUP BY i.investor_id, i.full_name, i.email, i.phone
+        ORDER BY total_investment DESC
+        """
+        
+        retained_investors_query = """
+        SELECT COUNT(DISTINCT investor_id) as count
+        FROM investor_series
+        WHERE status = 'active'
+        GROUP BY investor_id
+        HAVING COUNT(DISTINCT series_id) > 1
+        """
+        
+        series_investor_counts_query = """
+        SELECT 
+            ns.id as series_id,
+            ns.name as series_name,
+            ns.subscription_start_date,
+            COUNT(DISTINCT isr.investor_id) as investor_count
+        FROM ncd_series ns
+        LEFT JOIN investor_series isr ON ns.id = isr.series_id AND isr.status = 'active'
+        GROUP BY ns.id, ns.name, ns.subscription_start_date
+        ORDER BY ns.subscription_start_date
+        """
+        
+        series_investment_totals_query = """
+        SELECT 
+            ns.id as series_id,
+            ns.name as series_name,
+            ns.subscription_start_date,
+            COALESCE(f.total_investment, 0) as total_investment
+        FROM ncd_series ns
+        LEFT JOIN (
+            SELECT series_id, SUM(total_amount) as total_investment
+            FROM fact_daily_investments
+            WHERE status IN ('confirmed', 'cancelled')
+            GROUP BY series_id
+        ) f ON ns.id = f.series_id
+        ORDER BY ns.subscription_start_date
+        """
+        
+        top_series_query = """
+        SELECT 
+            ns.id as series_id,
+            ns.name as series_name,
+            ns.interest_rate,
+            ns.debenture_trustee_name as trustee,
+            ns.security_type,
+            ns.subscription_start_date as start_date,
+            ns.maturity_date as end_date,
+            ns.target_amount,
+            COALESCE(f.total_invested, 0) as total_invested
+        FROM ncd_series ns
+        LEFT JOIN (
+            SELECT series_id, SUM(total_amount) as total_invested
+            FROM fact_daily_investments
+            WHERE status IN ('confirmed', 'cancelled')
+            GROUP BY series_id
+        ) f ON ns.id = f.series_id
+        ORDER BY (COALESCE(f.total_invested, 0) / NULLIF(ns.target_amount, 0)) DESC
+        """
+        
+        section_results, section_timings = run_report_sections({
+            'total_series': query_section(total_series_query),
+            'active_series': query_section(active_series_query),
+            'total_investors': query_section(total_investors_query),
+            'active_investors': query_section(active_investors_query),
+            'investor_details': query_section(investor_details_query),
+            'retained_investors': query_section(retained_investors_query),
+            'series_investor_counts': query_section(series_investor_counts_query),
+            'series_investment_totals': query_section(series_investment_totals_query),
+            'top_series': query_section(top_series_query),
+        })
+        
         # ============================================================
         # SECTION 1: SUMMARY CARDS (Top)
         # ============================================================
         
         # Total Series
-        total_series_query = "SELECT COUNT(*) as count FROM ncd_series"
-        total_series_result = db.execute_query(total_series_query)
+        total_series_result = section_results['total_series']
         total_series = total_series_result[0]['count'] if total_series_result else 0
         
         # Active Series
-        active_series_query = "SELECT COUNT(*) as count FROM ncd_series WHERE status = 'active'"
-        active_series_result = db.execute_query(active_series_query)
+        active_series_result = section_results['active_series']
         active_series = active_series_result[0]['count'] if active_series_result else 0
         
-        # Total Investors
-        total_investors_query = "SELECT COUNT(*) as count FROM investors WHERE is_active = 1"
-        total_investors_result = db.execute_query(total_investors_query)
-        total_investors = total_investors_result[0]['count'] if total_investors_result else 0
+        # Total Investors (active investors, summed over registration days)
+        total_investors_result = section_results['total_investors']
+        total_investors = int(total_investors_result[0]['count']) if total_investors_result else 0
         
         # Active Investors (investors who have at least one ACTIVE investment)
         # FIXED: Filter by status = 'active' to exclude exited investors
-        active_investors_query = """
-        SELECT COUNT(DISTINCT investor_id) as count
-        FROM investor_series
-        WHERE status = 'active'
-        """
-        active_investors_result = db.execute_query(active_investors_query)
+        active_investors_result = section_results['active_investors']
         active_investors = active_investors_result[0]['count'] if active_investors_result else 0
         
         summary_top = {
@@ -5790,22 +5470,7 @@ async def get_subscription_trend_analysis(
         # SECTION 2: INVESTOR DETAILS TABLE (LIFETIME totals)
         # ============================================================
         
-        investor_details_query = """
-        SELECT 
-            i.investor_id,
-            i.full_name as investor_name,
-            i.email,
-            i.phone,
-            COALESCE(SUM(inv.amount), 0) as total_investment,
-            COUNT(DISTINCT CASE WHEN inv.series_id IS NOT NULL THEN inv.series_id END) as series_count,
-            COALESCE(AVG(CASE WHEN inv.amount IS NOT NULL THEN inv.amount END), 0) as avg_investment
-        FROM investors i
-        LEFT JOIN investments inv ON i.id = inv.investor_id AND inv.status IN ('confirmed', 'cancelled')
-        WHERE i.is_active = 1
-        GROUP BY i.investor_id, i.full_name, i.email, i.phone
-        ORDER BY total_investment DESC
-        """
-        investor_details_result = db.execute_query(investor_details_query)
+        investor_details_result = section_results['investor_details']
         
         investor_details = []
         for row in investor_details_result:
@@ -5827,14 +5492,7 @@ async def get_subscription_trend_analysis(
         
         # Retained Investors (invested in more than 1 ACTIVE series)
         # FIXED: Filter by status = 'active' to exclude exited series
-        retained_investors_query = """
-        SELECT COUNT(DISTINCT investor_id) as count
-        FROM investor_series
-        WHERE status = 'active'
-        GROUP BY investor_id
-        HAVING COUNT(DISTINCT series_id) > 1
-        """
-        retained_investors_result = db.execute_query(retained_investors_query)
+        retained_investors_result = section_results['retained_investors']
         retained_investors = len(retained_investors_result) if retained_investors_result else 0
         
         # Retention Rate (percentage of active investors who are retained)
@@ -5842,18 +5500,7 @@ async def get_subscription_trend_analysis(
         
         # Average Investors Increasing Per Series
         # FIXED: Filter by status = 'active' to count only active investors
-        series_investor_counts_query = """
-        SELECT 
-            ns.id as series_id,
-            ns.name as series_name,
-            ns.subscription_start_date,
-            COUNT(DISTINCT isr.investor_id) as investor_count
-        FROM ncd_series ns
-        LEFT JOIN investor_series isr ON ns.id = isr.series_id AND isr.status = 'active'
-        GROUP BY ns.id, ns.name, ns.subscription_start_date
-        ORDER BY ns.subscription_start_date
-        """
-        series_investor_counts_result = db.execute_query(series_investor_counts_query)
+        series_investor_counts_result = section_results['series_investor_counts']
         
         # Calculate average increase in investors per series
         investor_increases = []
@@ -5866,18 +5513,7 @@ async def get_subscription_trend_analysis(
         avg_investors_increase = round(sum(investor_increases) / len(investor_increases), 2) if investor_increases else 0
         
         # Average Investment Increasing Per Series (LIFETIME totals)
-        series_investment_totals_query = """
-        SELECT 
-            ns.id as series_id,
-            ns.name as series_name,
-            ns.subscription_start_date,
-            COALESCE(SUM(inv.amount), 0) as total_investment
-        FROM ncd_series ns
-        LEFT JOIN investments inv ON ns.id = inv.series_id AND inv.status IN ('confirmed', 'cancelled')
-        GROUP BY ns.id, ns.name, ns.subscription_start_date
-        ORDER BY ns.subscription_start_date
-        """
-        series_investment_totals_result = db.execute_query(series_investment_totals_query)
+        series_investment_totals_result = section_results['series_investment_totals']
         
         # Calculate average increase in investment per series
         investment_increases = []
@@ -5945,56 +5581,7 @@ async def get_subscription_trend_analysis(
         # SECTION 5: TOP PERFORMING SERIES TABLE (By Investment %)
         # ============================================================
         
-        # DEBUG: Check investor_series data for verification
-        debug_investor_series_query = """
-        SELECT 
-            isr.series_id,
-            ns.name as series_name,
-            isr.investor_id,
-            isr.total_invested,
-            isr.investment_count
-        FROM investor_series isr
-        INNER JOIN ncd_series ns ON isr.series_id = ns.id
-        ORDER BY isr.series_id, isr.investor_id
-        """
-        debug_isr_result = db.execute_query(debug_investor_series_query)
-        
-        logger.info("=" * 80)
-        logger.info("🔍 DEBUG: INVESTOR_SERIES TABLE DATA:")
-        series_totals = {}
-        for row in debug_isr_result:
-            series_id = row['series_id']
-            series_name = row['series_name']
-            if series_id not in series_totals:
-                series_totals[series_id] = {'name': series_name, 'total': 0, 'count': 0}
-            series_totals[series_id]['total'] += float(row['total_invested'])
-            series_totals[series_id]['count'] += 1
-            logger.info(f"  Series: {series_name} (ID: {series_id}), Investor: {row['investor_id']}, Invested: {row['total_invested']}")
-        
-        logger.info("-" * 80)
-        logger.info("CALCULATED TOTALS PER SERIES:")
-        for series_id, data in series_totals.items():
-            logger.info(f"  {data['name']}: ₹{data['total']:,.2f} (from {data['count']} investor records)")
-        logger.info("=" * 80)
-        
-        top_series_query = """
-        SELECT 
-            ns.id as series_id,
-            ns.name as series_name,
-            ns.interest_rate,
-            ns.debenture_trustee_name as trustee,
-            ns.security_type,
-            ns.subscription_start_date as start_date,
-            ns.maturity_date as end_date,
-            ns.target_amount,
-            COALESCE(SUM(inv.amount), 0) as total_invested
-        FROM ncd_series ns
-        LEFT JOIN investments inv ON ns.id = inv.series_id AND inv.status IN ('confirmed', 'cancelled')
-        GROUP BY ns.id, ns.name, ns.interest_rate, ns.debenture_trustee_name, 
-                 ns.security_type, ns.subscription_start_date, ns.maturity_date, ns.target_amount
-        ORDER BY (COALESCE(SUM(inv.amount), 0) / NULLIF(ns.target_amount, 0)) DESC
-        """
-        top_series_result = db.execute_query(top_series_query)
+        top_series_result = section_results['top_series']
         
         logger.info("=" * 80)
         logger.info("🔍 TOP PERFORMING SERIES - RAW DATABASE RESULTS:")
@@ -6037,6 +5624,7 @@ async def get_subscription_trend_analysis(
             "summary_retention": summary_retention,
             "series_trend": series_trend,
             "top_performing_series": top_performing_series,
+            "section_timings": section_timings,
             "timestamp": datetime.now().isoformat()
         }
         
@@ -6444,11 +6032,313 @@ async def get_last_generated_dates(
 # ============================================================================
 
 from fastapi.responses import FileResponse, StreamingResponse
-import csv
-import io
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from starlette.background import BackgroundTask
+from pathlib import Path
+import asyncio
+import time
+from app.services.jobs.report_jobs import REPORT_JOB_TYPES, REPORT_JOB_FORMATS, report_file_name, normalize_report_filters
+from app.services.storage.report_cache import report_cache_key, lookup_report_cache, cache_report_file
+from app.services.storage.report_artifacts import iter_report_artifact, staging_path
+from app.utils.report_logger import log_report_generation
+from app.utils.report_renderer import render_report, report_sheet, fields_block, table_block
+from app.services.jobs.report_pdf_pool import render_pdf_async
+
+
+def write_report_download(sheets: list, file_format: str, path: Path):
+    """Render CSV / xlsx sheets into path (blocking - run it in a worker thread)"""
+    with open(path, 'wb') as file:
+        for chunk in render_report(sheets, file_format):
+            file.write(chunk)
+
+
+async def serve_report_download(db, report_key: str, file_format: str, filters: dict, current_user: UserInDB, render):
+    """
+    CSV / Excel / PDF download through the report cache
+    render() → (layout sheets, file name, record count) - only awaited on a cache miss
+    CSV / Excel are written to a staging file in a worker thread, PDFs are laid out
+    in the PDF process pool - the event loop keeps serving other requests; the file is sent from there and moves into the cache
+    after the response has gone out
+    Every download is written to report_logs with its generation time, size, pages and cache hit / miss
+    """
+    started = time.perf_counter()
+    report_name = REPORT_JOB_TYPES[report_key]['name']
+    report_type, _, media_type = REPORT_JOB_FORMATS[file_format]
+
+    # One spelling per filter value (3,5 = 5,3, 01/01/2026 = 2026-01-01) for the cache key
+    try:
+        filters = normalize_report_filters(report_key, filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Laid out with the per-report download sheets - never shares a file with report jobs
+    cache_key = report_cache_key(db, report_key, file_format, filters, renderer='layout')
+    cached = lookup_report_cache(db, cache_key)
+
+    if cached:
+        log_report_generation(
+            db=db,
+            report_name=report_name,
+            report_type=report_type,
+            user_id=current_user.id,
+            user_name=current_user.full_name or current_user.username,
+            user_role=current_user.role,
+            report_filters=filters,
+            record_count=cached['record_count'] or 0,
+            file_size_kb=round(cached['size_bytes'] / 1024, 2),
+            generation_time_ms=int((time.perf_counter() - started) * 1000),
+            status="success",
+            cache_status="hit",
+            page_count=cached['page_count']
+        )
+        headers = {"Content-Disposition": f"attachment; filename={cached['file_name']}"}
+        if cached['page_count'] is not None:
+            headers["X-Page-Count"] = str(cached['page_count'])
+        return StreamingResponse(
+            iter_report_artifact(cached['storage'], cached['artifact_location']),
+            media_type=media_type,
+            headers=headers
+        )
+
+    sheets, filename, record_count = await render()
+
+    staged = staging_path(filename)
+    page_count = None
+    headers = {}
+    try:
+        if file_format == 'pdf':
+            metrics = await render_pdf_async(sheets, staged)
+            page_count = metrics['page_count']
+            headers = {"X-Page-Count": str(page_count), "X-Render-Time-Ms": str(metrics['render_time_ms'])}
+            logger.info(
+                f"🖨️ Rendered {report_name} PDF: {page_count} pages, "
+                f"{round(metrics['size_bytes'] / 1024, 2)} KB in {metrics['render_time_ms']} ms"
+            )
+        else:
+            await asyncio.to_thread(write_report_download, sheets, file_format, staged)
+    except Exception:
+        staged.unlink(missing_ok=True)
+        raise
+
+    size_bytes = staged.stat().st_size
+    generation_time_ms = int((time.perf_counter() - started) * 1000)
+
+    log_report_generation(
+        db=db,
+        report_name=report_name,
+        report_type=report_type,
+        user_id=current_user.id,
+        user_name=current_user.full_name or current_user.username,
+        user_role=current_user.role,
+        report_filters=filters,
+        record_count=record_count,
+        file_size_kb=round(size_bytes / 1024, 2),
+        generation_time_ms=generation_time_ms,
+        status="success",
+        cache_status="miss" if cache_key else None,
+        page_count=page_count
+    )
+
+    async def cache_after_send():
+        try:
+            cache_report_file(
+                db, cache_key, report_key, report_name, file_format, filters,
+                filename, staged, media_type, record_count, generation_time_ms, page_count
+            )
+        finally:
+            Path(staged).unlink(missing_ok=True)
+
+    return FileResponse(
+        staged,
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+        background=BackgroundTask(cache_after_send)
+    )
+
+
+DOWNLOAD_FORMATS = ('csv', 'excel', 'pdf')
+
+
+# Report layouts - shared by the CSV, Excel and PDF downloads
+
+def monthly_collection_layout(report_data: dict) -> list:
+    summary = report_data.get('summary', {})
+    statistics = report_data.get('investor_statistics', {})
+    series_breakdown = report_data.get('series_breakdown', [])
+
+    return [
+        report_sheet('Monthly Collection', 'Monthly Collection Report', [
+            fields_block('Summary', [
+                ('From Date', report_data.get('from_date'), None),
+                ('To Date', report_data.get('to_date'), None),
+                ('Total Funds Raised', summary.get('total_funds_raised', 0), 'currency'),
+                ('Investment This Period', summary.get('total_investment_this_month', 0), 'currency'),
+                ('Fulfillment', summary.get('fulfillment_percentage', 0), 'percent'),
+                ('New Investors', statistics.get('new_investors', 0), None),
+                ('Returning Investors', statistics.get('returning_investors', 0), None),
+                ('Retention Rate', statistics.get('retention_rate', 0), 'percent'),
+            ]),
+            table_block('Series-wise Collection', [
+                ('Series Name', 'series_name', None),
+                ('Series Code', 'series_code', None),
+                ('Target Amount', 'target_amount', 'currency'),
+                ('Collected', 'collected_amount', 'currency'),
+                ('Achievement', 'achievement_percentage', 'percent'),
+                ('Investors', 'investor_count', None),
+                ('Transactions', 'transaction_count', None),
+                ('Average Investment', 'average_investment', 'currency'),
+            ], series_breakdown, total={
+                'target_amount': sum(series['target_amount'] or 0 for series in series_breakdown),
+                'collected_amount': sum(series['collected_amount'] or 0 for series in series_breakdown),
+                'investor_count': sum(series['investor_count'] or 0 for series in series_breakdown),
+                'transaction_count': sum(series['transaction_count'] or 0 for series in series_breakdown),
+            }),
+        ]),
+        report_sheet('Investments', 'Investment Details', [
+            table_block(None, [
+                ('Investor ID', 'investor_id', None),
+                ('Investor Name', 'investor_name', None),
+                ('Series Name', 'series_name', None),
+                ('Series Code', 'series_code', None),
+                ('Amount', 'amount', 'currency'),
+                ('Date Received', 'date_received', None),
+                ('Date Transferred', 'date_transferred', None),
+                ('Created At', 'created_at', None),
+            ], report_data.get('investment_details', [])),
+        ]),
+    ]
+
+
+def payout_statement_layout(report_data: dict) -> list:
+    summary = report_data.get('summary', {})
+    series_breakdown = report_data.get('series_breakdown', [])
+
+    return [
+        report_sheet('Payout Statement', 'Payout Statement Report', [
+            fields_block('Summary', [
+                ('From Date', report_data.get('from_date'), None),
+                ('To Date', report_data.get('to_date'), None),
+                ('Total Payout', summary.get('total_payout', 0), 'currency'),
+                ('Paid Amount', summary.get('paid_amount', 0), 'currency'),
+                ('To Be Paid', summary.get('to_be_paid_amount', 0), 'currency'),
+                ('Number of Payouts', summary.get('total_records', 0), None),
+                ('Paid', summary.get('paid_count', 0), None),
+                ('Pending', summary.get('pending_count', 0), None),
+            ]),
+            table_block('Series-wise Breakdown', [
+                ('Series Name', 'series_name', None),
+                ('Series Code', 'series_code', None),
+                ('Total Payout', 'total_payout', 'currency'),
+                ('Paid Amount', 'paid_amount', 'currency'),
+                ('Pending Amount', 'pending_amount', 'currency'),
+                ('Investors', 'investor_count', None),
+            ], series_breakdown, total={
+                'total_payout': sum(series['total_payout'] or 0 for series in series_breakdown),
+                'paid_amount': sum(series['paid_amount'] or 0 for series in series_breakdown),
+                'pending_amount': sum(series['pending_amount'] or 0 for series in series_breakdown),
+            }),
+            table_block('Status-wise Breakdown', [
+                ('Status', 'status', None),
+                ('Payouts', 'count', None),
+                ('Total Amount', 'total_amount', 'currency'),
+            ], report_data.get('status_breakdown', [])),
+            table_block('Monthly Trend', [
+                ('Month', 'month', None),
+                ('Total Amount', 'total_amount', 'currency'),
+                ('Paid Amount', 'paid_amount', 'currency'),
+                ('Payouts', 'payout_count', None),
+            ], report_data.get('monthly_trend', [])),
+        ]),
+        report_sheet('Payouts', 'Payout Details', [
+            table_block(None, [
+                ('Investor ID', 'investor_id', None),
+                ('Investor Name', 'investor_name', None),
+                ('PAN', 'investor_pan', None),
+                ('Series Name', 'series_name', None),
+                ('Series Code', 'series_code', None),
+                ('Payout Month', 'payout_month', None),
+                ('Amount', 'amount', 'currency'),
+                ('Status', 'status', None),
+                ('Payout Date', 'payout_date', None),
+                ('Paid Date', 'paid_date', None),
+                ('Bank Name', 'bank_name', None),
+                ('Account Number', 'account_number', None),
+                ('IFSC Code', 'ifsc_code', None),
+            ], report_data.get('payout_details', [])),
+        ]),
+    ]
+
+
+def series_performance_layout(report_data: dict) -> list:
+    summary = report_data.get('summary', {})
+
+    sheets = [
+        report_sheet('Series Performance', 'Series-wise Performance Report', [
+            fields_block('Summary', [
+                ('Total Series', summary.get('total_series', 0), None),
+                ('Active Series', summary.get('active_series', 0), None),
+                ('Total Investments', summary.get('total_investments', 0), 'currency'),
+                ('Total Investors', summary.get('total_investors', 0), None),
+            ]),
+            table_block('Series Comparison', [
+                ('Series Name', 'name', None),
+                ('Series Code', 'series_code', None),
+                ('Status', 'status_display', None),
+                ('Target Amount', 'target_amount', 'currency'),
+                ('Funds Raised', 'funds_raised', 'currency'),
+                ('Remaining Target', 'remaining_target', 'currency'),
+                ('Subscription', 'subscription_ratio', 'percent'),
+                ('Investments', 'total_investments', None),
+                ('Investors', 'total_investors', None),
+                ('Repeat Investors', 'repeated_investors', None),
+                ('Average Ticket', 'avg_ticket_size', 'currency'),
+                ('Interest Rate', 'interest_rate', 'percent'),
+                ('Frequency', 'interest_frequency', None),
+                ('Issue Date', 'issue_date', None),
+                ('Maturity Date', 'maturity_date', None),
+            ], report_data.get('series_comparison', [])),
+        ])
+    ]
+
+    # One sheet per series
+    for series in report_data.get('detailed_series_data', []):
+        payout_stats = series.get('payout_stats', {})
+        compliance_stats = series.get('compliance_stats', {})
+
+        sheets.append(report_sheet(series['series_code'] or series['series_name'], series['series_name'], [
+            fields_block('Payouts & Compliance', [
+                ('Paid Payouts', payout_stats.get('paid_count', 0), None),
+                ('Paid Amount', payout_stats.get('paid_amount', 0), 'currency'),
+                ('Pending Payouts', payout_stats.get('pending_count', 0), None),
+                ('Pending Amount', payout_stats.get('pending_amount', 0), 'currency'),
+                ('Compliance Completed', compliance_stats.get('completion_percentage', 0), 'percent'),
+                ('Compliance Pending Actions', compliance_stats.get('pending_actions', 0), None),
+            ]),
+            table_block('Monthly Trend', [
+                ('Month', 'month', None),
+                ('Investments', 'investment_count', None),
+                ('Total Amount', 'total_amount', 'currency'),
+                ('Investors', 'investor_count', None),
+            ], series.get('monthly_trend', [])),
+            table_block('Ticket Size Distribution', [
+                ('Category', 'category', None),
+                ('Investments', 'count', None),
+                ('Total Amount', 'total_amount', 'currency'),
+            ], series.get('ticket_distribution', [])),
+            table_block('Investors', [
+                ('Investor ID', 'investor_id', None),
+                ('Investor Name', 'investor_name', None),
+                ('Email', 'email', None),
+                ('Phone', 'phone', None),
+                ('PAN', 'pan', None),
+                ('Investment Amount', 'investment_amount', 'currency'),
+                ('Date Received', 'date_received', None),
+                ('Date Transferred', 'date_transferred', None),
+                ('Status', 'investment_status', None),
+            ], series.get('investor_details', [])),
+        ]))
+
+    return sheets
 
 
 @router.get("/download/monthly-collection")
@@ -6474,101 +6364,27 @@ async def download_monthly_collection_report(
                 detail="Access Denied: You don't have permission to download reports"
             )
         
-        # Fetch report data
-        report_data = await get_monthly_collection_report(from_date, to_date, series_id, current_user)
-        
-        if format.lower() == 'csv':
-            # Generate CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Write header
-            writer.writerow(['Monthly Collection Report'])
-            writer.writerow(['Generated on', datetime.now().strftime('%d/%m/%Y %H:%M:%S')])
-            writer.writerow([])
-            
-            # Write series data
-            writer.writerow(['Series Name', 'Total Collected', 'Number of Investors', 'Average Investment'])
-            for series in report_data.get('series_breakdown', []):
-                writer.writerow([
-                    series['series_name'],
-                    f"₹{series['total_collected']:,.2f}",
-                    series['investor_count'],
-                    f"₹{series['average_investment']:,.2f}"
-                ])
-            
-            writer.writerow([])
-            writer.writerow(['Total', f"₹{report_data.get('total_collected', 0):,.2f}"])
-            
-            # Return CSV file
-            output.seek(0)
-            filename = f"Monthly_Collection_Report_{datetime.now().strftime('%Y%m%d')}.csv"
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
+        file_format = format.lower()
+        if file_format not in DOWNLOAD_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid format '{format}'. Must be one of: {', '.join(DOWNLOAD_FORMATS)}"
             )
         
-        elif format.lower() == 'excel':
-            # Generate Excel
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Monthly Collection"
-            
-            # Add header
-            ws['A1'] = 'Monthly Collection Report'
-            ws['A1'].font = Font(bold=True, size=14)
-            ws['A2'] = f"Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
-            
-            # Add column headers
-            headers = ['Series Name', 'Total Collected', 'Number of Investors', 'Average Investment']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=4, column=col)
-                cell.value = header
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="2563EB", end_color="2563EB", fill_type="solid")
-            
-            # Add data
-            row = 5
-            for series in report_data.get('series_breakdown', []):
-                ws.cell(row=row, column=1).value = series['series_name']
-                ws.cell(row=row, column=2).value = series['total_collected']
-                ws.cell(row=row, column=3).value = series['investor_count']
-                ws.cell(row=row, column=4).value = series['average_investment']
-                row += 1
-            
-            # Add total
-            ws.cell(row=row, column=1).value = 'TOTAL'
-            ws.cell(row=row, column=1).font = Font(bold=True)
-            ws.cell(row=row, column=2).value = report_data.get('total_collected', 0)
-            ws.cell(row=row, column=2).font = Font(bold=True)
-            
-            # Adjust column widths
-            ws.column_dimensions['A'].width = 25
-            ws.column_dimensions['B'].width = 18
-            ws.column_dimensions['C'].width = 18
-            ws.column_dimensions['D'].width = 20
-            
-            # Save to bytes
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
-            
-            filename = f"Monthly_Collection_Report_{datetime.now().strftime('%Y%m%d')}.xlsx"
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
+        async def render():
+            report_data = await get_monthly_collection_report(from_date, to_date, series_id, current_user)
+            report_name = REPORT_JOB_TYPES['monthly-collection']['name']
+            return (
+                monthly_collection_layout(report_data),
+                report_file_name(report_name, file_format),
+                len(report_data.get('investment_details', []))
             )
         
-        else:
-            # PDF format - return JSON data for frontend to generate PDF
-            return {
-                "status": "success",
-                "format": "pdf",
-                "data": report_data,
-                "message": "Use frontend PDF generation for PDF format"
-            }
+        return await serve_report_download(
+            db, 'monthly-collection', file_format,
+            {'from_date': from_date, 'to_date': to_date, 'series_id': series_id},
+            current_user, render
+        )
     
     except HTTPException:
         raise
@@ -6604,113 +6420,27 @@ async def download_payout_statement_report(
                 detail="Access Denied: You don't have permission to download reports"
             )
         
-        # Fetch report data
-        report_data = await get_payout_statement_report(from_date, to_date, month, series_id, current_user)
-        
-        if format.lower() == 'csv':
-            # Generate CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Write header
-            writer.writerow(['Payout Statement Report'])
-            writer.writerow(['Generated on', datetime.now().strftime('%d/%m/%Y %H:%M:%S')])
-            writer.writerow([])
-            
-            # Write summary
-            writer.writerow(['Summary'])
-            writer.writerow(['Total Payouts', f"₹{report_data.get('total_payouts', 0):,.2f}"])
-            writer.writerow(['Number of Payouts', report_data.get('payout_count', 0)])
-            writer.writerow(['Average Payout', f"₹{report_data.get('average_payout', 0):,.2f}"])
-            writer.writerow([])
-            
-            # Write series breakdown
-            writer.writerow(['Series-wise Breakdown'])
-            writer.writerow(['Series Name', 'Total Payout', 'Number of Payouts', 'Average Payout'])
-            for series in report_data.get('series_breakdown', []):
-                writer.writerow([
-                    series['series_name'],
-                    f"₹{series['total_payout']:,.2f}",
-                    series['payout_count'],
-                    f"₹{series['average_payout']:,.2f}"
-                ])
-            
-            # Return CSV file
-            output.seek(0)
-            filename = f"Payout_Statement_Report_{datetime.now().strftime('%Y%m%d')}.csv"
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
+        file_format = format.lower()
+        if file_format not in DOWNLOAD_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid format '{format}'. Must be one of: {', '.join(DOWNLOAD_FORMATS)}"
             )
         
-        elif format.lower() == 'excel':
-            # Generate Excel
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Payout Statement"
-            
-            # Add header
-            ws['A1'] = 'Payout Statement Report'
-            ws['A1'].font = Font(bold=True, size=14)
-            ws['A2'] = f"Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
-            
-            # Add summary section
-            ws['A4'] = 'Summary'
-            ws['A4'].font = Font(bold=True, size=12)
-            ws['A5'] = 'Total Payouts'
-            ws['B5'] = report_data.get('total_payouts', 0)
-            ws['A6'] = 'Number of Payouts'
-            ws['B6'] = report_data.get('payout_count', 0)
-            ws['A7'] = 'Average Payout'
-            ws['B7'] = report_data.get('average_payout', 0)
-            
-            # Add series breakdown
-            ws['A9'] = 'Series-wise Breakdown'
-            ws['A9'].font = Font(bold=True, size=12)
-            
-            headers = ['Series Name', 'Total Payout', 'Number of Payouts', 'Average Payout']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=10, column=col)
-                cell.value = header
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="2563EB", end_color="2563EB", fill_type="solid")
-            
-            # Add data
-            row = 11
-            for series in report_data.get('series_breakdown', []):
-                ws.cell(row=row, column=1).value = series['series_name']
-                ws.cell(row=row, column=2).value = series['total_payout']
-                ws.cell(row=row, column=3).value = series['payout_count']
-                ws.cell(row=row, column=4).value = series['average_payout']
-                row += 1
-            
-            # Adjust column widths
-            ws.column_dimensions['A'].width = 25
-            ws.column_dimensions['B'].width = 18
-            ws.column_dimensions['C'].width = 20
-            ws.column_dimensions['D'].width = 18
-            
-            # Save to bytes
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
-            
-            filename = f"Payout_Statement_Report_{datetime.now().strftime('%Y%m%d')}.xlsx"
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
+        async def render():
+            report_data = await get_payout_statement_report(from_date, to_date, month, series_id, current_user)
+            report_name = REPORT_JOB_TYPES['payout-statement']['name']
+            return (
+                payout_statement_layout(report_data),
+                report_file_name(report_name, file_format),
+                len(report_data.get('payout_details', []))
             )
         
-        else:
-            # PDF format - return JSON data for frontend to generate PDF
-            return {
-                "status": "success",
-                "format": "pdf",
-                "data": report_data,
-                "message": "Use frontend PDF generation for PDF format"
-            }
+        return await serve_report_download(
+            db, 'payout-statement', file_format,
+            {'from_date': from_date, 'to_date': to_date, 'month': month, 'series_id': series_id},
+            current_user, render
+        )
     
     except HTTPException:
         raise
@@ -6725,6 +6455,7 @@ async def download_payout_statement_report(
 @router.get("/download/series-performance")
 async def download_series_performance_report(
     format: str = 'pdf',
+    series_ids: Optional[str] = None,
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
@@ -6742,96 +6473,27 @@ async def download_series_performance_report(
                 detail="Access Denied: You don't have permission to download reports"
             )
         
-        # Fetch report data
-        report_data = await get_series_performance_report(current_user)
-        
-        if format.lower() == 'csv':
-            # Generate CSV
-            output = io.StringIO()
-            writer = csv.writer(output)
-            
-            # Write header
-            writer.writerow(['Series-wise Performance Report'])
-            writer.writerow(['Generated on', datetime.now().strftime('%d/%m/%Y %H:%M:%S')])
-            writer.writerow([])
-            
-            # Write series data
-            writer.writerow(['Series Name', 'Status', 'Target Amount', 'Funds Raised', 'Progress %', 'Investors', 'Interest Rate'])
-            for series in report_data.get('series_breakdown', []):
-                writer.writerow([
-                    series['series_name'],
-                    series['status'],
-                    f"₹{series['target_amount']:,.2f}",
-                    f"₹{series['funds_raised']:,.2f}",
-                    f"{series['progress_percentage']}%",
-                    series['investor_count'],
-                    f"{series['interest_rate']}%"
-                ])
-            
-            # Return CSV file
-            output.seek(0)
-            filename = f"Series_Performance_Report_{datetime.now().strftime('%Y%m%d')}.csv"
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
+        file_format = format.lower()
+        if file_format not in DOWNLOAD_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid format '{format}'. Must be one of: {', '.join(DOWNLOAD_FORMATS)}"
             )
         
-        elif format.lower() == 'excel':
-            # Generate Excel
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Series Performance"
-            
-            # Add header
-            ws['A1'] = 'Series-wise Performance Report'
-            ws['A1'].font = Font(bold=True, size=14)
-            ws['A2'] = f"Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
-            
-            # Add column headers
-            headers = ['Series Name', 'Status', 'Target Amount', 'Funds Raised', 'Progress %', 'Investors', 'Interest Rate']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=4, column=col)
-                cell.value = header
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="2563EB", end_color="2563EB", fill_type="solid")
-            
-            # Add data
-            row = 5
-            for series in report_data.get('series_breakdown', []):
-                ws.cell(row=row, column=1).value = series['series_name']
-                ws.cell(row=row, column=2).value = series['status']
-                ws.cell(row=row, column=3).value = series['target_amount']
-                ws.cell(row=row, column=4).value = series['funds_raised']
-                ws.cell(row=row, column=5).value = f"{series['progress_percentage']}%"
-                ws.cell(row=row, column=6).value = series['investor_count']
-                ws.cell(row=row, column=7).value = f"{series['interest_rate']}%"
-                row += 1
-            
-            # Adjust column widths
-            for col in range(1, 8):
-                ws.column_dimensions[get_column_letter(col)].width = 18
-            
-            # Save to bytes
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
-            
-            filename = f"Series_Performance_Report_{datetime.now().strftime('%Y%m%d')}.xlsx"
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
+        async def render():
+            report_data = await get_series_performance_report(series_ids, current_user)
+            report_name = REPORT_JOB_TYPES['series-performance']['name']
+            return (
+                series_performance_layout(report_data),
+                report_file_name(report_name, file_format),
+                len(report_data.get('series_comparison', []))
             )
         
-        else:
-            # PDF format - return JSON data for frontend to generate PDF
-            return {
-                "status": "success",
-                "format": "pdf",
-                "data": report_data,
-                "message": "Use frontend PDF generation for PDF format"
-            }
+        return await serve_report_download(
+            db, 'series-performance', file_format,
+            {'series_ids': series_ids},
+            current_user, render
+        )
     
     except HTTPException:
         raise
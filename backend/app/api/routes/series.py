@@ -27,6 +27,7 @@ from app.core.auth import get_current_user
 from app.core.database import get_db
 from app.core.permissions import has_permission, log_unauthorized_access
 from app.utils.series_status_updater import update_series_status_by_dates
+from app.utils.date_utils import date_range_condition
 from datetime import datetime, date
 from decimal import Decimal
 import json
@@ -1812,13 +1813,10 @@ async def get_series_recent_payouts(
         params = [series_id]
         
         # Add date filters if provided
-        if from_date_obj:
-            payouts_query += " AND DATE(ip.updated_at) >= %s"
-            params.append(from_date_obj)
-        
-        if to_date_obj:
-            payouts_query += " AND DATE(ip.updated_at) <= %s"
-            params.append(to_date_obj)
+        date_condition, date_params = date_range_condition("ip.updated_at", from_date_obj, to_date_obj)
+        if date_condition:
+            payouts_query += f" AND {date_condition}"
+            params.extend(date_params)
         
         payouts_query += """
         ORDER BY ip.updated_at DESC, ip.payout_date DESC
@@ -0,0 +1,261 @@
+"""
+TDS API Routes
+==============
+Annual TDS computation on NCD interest and certificate batches
+
+IMPORTANT: ALL business logic in backend, NO logic in frontend
+Processing itself lives in app/services/tax/tds.py
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from typing import Optional
+from pathlib import Path
+from app.models.pydantic.models import UserInDB, TDSBatchCreate
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.core.permissions import has_permission, log_unauthorized_access
+from app.services.tax.tds import (
+    TDS_RATE_TABLE,
+    parse_financial_year,
+    financial_year_label,
+    tds_rule_for,
+    submit_tds_batch,
+    get_tds_batch,
+    list_tds_batches
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/tds", tags=["TDS"])
+
+
+def _check_permission(db, current_user: UserInDB, permission: str, endpoint: str, detail: str):
+    if not has_permission(current_user, permission, db):
+        log_unauthorized_access(db, current_user, endpoint, permission)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Access Denied: You don't have permission to {detail}"
+        )
+
+
+def _get_completed_batch(db, batch_id: int) -> dict:
+    batch = get_tds_batch(db, batch_id, include_paths=True)
+
+    if not batch:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"TDS batch with ID {batch_id} not found"
+        )
+
+    if batch['status'] != 'completed':
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"TDS batch {batch_id} is {batch['status']} - files are available once it has completed"
+        )
+
+    return batch
+
+
+@router.get("/rates")
+async def get_tds_rates(
+    financial_year: Optional[str] = None,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    TDS threshold / rate table (or the rule for one financial year)
+    PERMISSION REQUIRED: view_interestPayout
+    """
+    try:
+        db = get_db()
+        _check_permission(db, current_user, "view_interestPayout", "get_tds_rates", "view TDS rates")
+
+        if financial_year:
+            try:
+                start_year = parse_financial_year(financial_year)
+                rule = tds_rule_for(start_year)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+            return {'financial_year': financial_year_label(start_year), **rule}
+
+        return {'rates': TDS_RATE_TABLE}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error fetching TDS rates: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching TDS rates: {str(e)}"
+        )
+
+
+@router.post("/batches")
+async def create_tds_batch(
+    request: TDSBatchCreate,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Start the annual TDS batch for a financial year ("2025-26")
+    Returns the batch id immediately - poll GET /tds/batches/{batch_id} for progress
+    PERMISSION REQUIRED: edit_interestPayout
+    """
+    try:
+        db = get_db()
+        _check_permission(db, current_user, "edit_interestPayout", "create_tds_batch", "generate TDS certificates")
+
+        try:
+            start_year = parse_financial_year(request.financial_year)
+            tds_rule_for(start_year)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        batch = submit_tds_batch(db, start_year, current_user)
+
+        return {
+            'success': True,
+            'message': f"TDS batch queued for FY {financial_year_label(start_year)} (batch {batch['id']})",
+            'batch_id': batch['id'],
+            'batch': batch
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error queueing TDS batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error queueing TDS batch: {str(e)}"
+        )
+
+
+@router.get("/batches")
+async def get_tds_batches(
+    financial_year: Optional[str] = None,
+    limit: int = 20,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Recent TDS batches (newest first)
+    PERMISSION REQUIRED: view_interestPayout
+    """
+    try:
+        db = get_db()
+        _check_permission(db, current_user, "view_interestPayout", "get_tds_batches", "view TDS batches")
+
+        label = None
+        if financial_year:
+            try:
+                label = financial_year_label(parse_financial_year(financial_year))
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        batches = list_tds_batches(db, label, min(max(limit, 1), 100))
+        return {'batches': batches, 'count': len(batches)}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error listing TDS batches: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error listing TDS batches: {str(e)}"
+        )
+
+
+@router.get("/batches/{batch_id}")
+async def get_tds_batch_status(
+    batch_id: int,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Batch status and progress: investors, certificates rendered, total interest / TDS
+    PERMISSION REQUIRED: view_interestPayout
+    """
+    try:
+        db = get_db()
+        _check_permission(db, current_user, "view_interestPayout", "get_tds_batch_status", "view TDS batches")
+
+        batch = get_tds_batch(db, batch_id)
+        if not batch:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"TDS batch with ID {batch_id} not found"
+            )
+        return batch
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error fetching TDS batch {batch_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching TDS batch: {str(e)}"
+        )
+
+
+@router.get("/batches/{batch_id}/certificates")
+async def download_tds_certificates(
+    batch_id: int,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Download the batch archive: certificates/*.pdf + summary.csv
+    PERMISSION REQUIRED: edit_interestPayout
+    """
+    try:
+        db = get_db()
+        _check_permission(db, current_user, "edit_interestPayout", "download_tds_certificates", "download TDS certificates")
+
+        batch = _get_completed_batch(db, batch_id)
+        archive_path = Path(batch['archive_path'] or '')
+        if not archive_path.is_file():
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail=f"The archive of TDS batch {batch_id} is no longer on the server - run the batch again"
+            )
+
+        return FileResponse(archive_path, media_type="application/zip", filename=archive_path.name)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error downloading TDS certificates for batch {batch_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error downloading TDS certificates: {str(e)}"
+        )
+
+
+@router.get("/batches/{batch_id}/summary")
+async def download_tds_summary(
+    batch_id: int,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Download the batch summary CSV (one row per investor with interest in the year)
+    PERMISSION REQUIRED: view_interestPayout
+    """
+    try:
+        db = get_db()
+        _check_permission(db, current_user, "view_interestPayout", "download_tds_summary", "view TDS batches")
+
+        batch = _get_completed_batch(db, batch_id)
+        summary_path = Path(batch['summary_path'] or '')
+        if not summary_path.is_file():
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail=f"The summary of TDS batch {batch_id} is no longer on the server - run the batch again"
+            )
+
+        return FileResponse(summary_path, media_type="text/csv; charset=utf-8", filename=summary_path.name)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Error downloading TDS summary for batch {batch_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error downloading TDS summary: {str(e)}"
+        )
@@ -25,6 +25,21 @@ class Settings(BaseSettings):
     # Security settings
     allowed_origins: str = "http://localhost:5173,http://localhost:3000"
     
+    # Bank payment files - company account the payouts are debited from
+    bank_debit_account: str = ""
+
+    # TDS certificates - deductor details printed on every certificate
+    tds_deductor_name: str = ""
+    tds_deductor_tan: str = ""
+    tds_deductor_pan: str = ""
+    tds_deductor_address: str = ""
+    # Where TDS batch archives are written (default: backend/generated/tds)
+    tds_output_dir: str = ""
+
+    # Report job artifacts - "local" (report_artifact_dir, default backend/generated/reports) or "s3"
+    report_artifact_storage: str = "local"
+    report_artifact_dir: str = ""
+
     class Config:
         env_file = str(ENV_FILE)  # Explicitly use backend/.env
         extra = "ignore"  # Ignore extra environment variables
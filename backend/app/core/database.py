@@ -1,4 +1,6 @@
 import mysql.connector
+from contextlib import contextmanager
+from contextvars import ContextVar
 from mysql.connector import Error
 from app.core.config import settings
 import logging
@@ -77,6 +79,54 @@ class Database:
             logger.error(f"Params: {params}")
             raise e
     
+    def iter_query(self, query, params=None, batch_size=1000):
+        """
+        Execute a SELECT and yield rows as they arrive (unbuffered)
+        Memory stays flat for large result sets. Finish (or close) the
+        generator before running another query on this connection.
+        """
+        if not self.connection or not self.connection.is_connected():
+            self.connect()
+
+        cursor = self.connection.cursor(dictionary=True)
+        try:
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        except Error as e:
+            logger.error(f"Error executing query: {e}")
+            logger.error(f"Query: {query}")
+            logger.error(f"Params: {params}")
+            raise e
+        finally:
+            # Drain anything unread (generator closed early) so the connection stays usable
+            try:
+                if self.connection.unread_result:
+                    cursor.fetchall()
+            except Error:
+                pass
+            cursor.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run the enclosed statements as ONE transaction
+        Commits when the block finishes, rolls back if it raises
+        """
+        if not self.connection or not self.connection.is_connected():
+            self.connect()
+
+        self.connection.start_transaction()
+        try:
+            yield self
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+
     def execute_many(self, query, params_list):
         """Execute query with multiple parameter sets"""
         try:
@@ -93,8 +143,30 @@ class Database:
 # Create global database instance
 db = Database()
 
+# Connection that get_db() hands out in the current context instead of the global one
+_context_db = ContextVar('context_db', default=None)
+
+
+@contextmanager
+def use_connection(connection: Database):
+    """
+    Make get_db() return this connection inside the block
+    Background workers use it to run request-handler code (e.g. a report
+    function) on their OWN connection - the global one is not thread-safe.
+    The override is per thread / task, so request handlers are unaffected.
+    """
+    token = _context_db.set(connection)
+    try:
+        yield connection
+    finally:
+        _context_db.reset(token)
+
+
 def get_db():
     """Dependency to get database instance"""
+    context_db = _context_db.get()
+    if context_db is not None:
+        return context_db
     if not db.connection or not db.connection.is_connected():
         db.connect()
     return db
\ No newline at end of file
@@ -59,7 +59,29 @@ ENDPOINT_PERMISSIONS = {
     "get_all_payouts": "view_payouts",
     "get_export_payouts": "view_payouts",
     "get_payout_summary": "view_payouts",
+    "get_payout_count": "view_payouts",
+    "get_payout_totals": "view_payouts",
+    "get_payout_forecast": "view_payouts",
     "import_payouts": "manage_payouts",
+    "bulk_update_payout_status": "manage_payouts",
+    "get_bank_file_layouts": "view_payouts",
+    "download_bank_payment_file": "manage_payouts",
+    "reconcile_bank_statement": "manage_payouts",
+    "get_reconciliations": "view_payouts",
+    "download_reconciliation_exceptions": "view_payouts",
+    "get_tds_rates": "view_payouts",
+    "create_tds_batch": "manage_payouts",
+    "get_tds_batches": "view_payouts",
+    "get_tds_batch_status": "view_payouts",
+    "download_tds_certificates": "manage_payouts",
+    "download_tds_summary": "view_payouts",
+    
+    # Reports
+    "get_report_job_types": "view_reports",
+    "create_report_job": "view_reports",
+    "get_my_report_jobs": "view_reports",
+    "get_report_job_status": "view_reports",
+    "download_report_job": "view_reports",
     
     # Authentication (no permission required - public)
     "login": None,
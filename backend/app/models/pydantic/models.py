@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
 
@@ -415,6 +415,14 @@ class InvestmentValidationRequest(BaseModel):
     amount: float
 
 
+class AccruedInterestRequest(BaseModel):
+    as_of: Optional[str] = None  # YYYY-MM-DD or DD/MM/YYYY, default today
+    investor_ids: Optional[List[str]] = None  # Investor codes like "INV001", default all investors
+    series_id: Optional[int] = None
+    include_exited: bool = False
+    include_investments: bool = False
+
+
 class InvestorSeriesResponse(BaseModel):
     id: int
     investor_id: int
@@ -475,6 +483,7 @@ class ReportType(str, Enum):
     PDF = "PDF"
     EXCEL = "Excel"
     CSV = "CSV"
+    JSON = "JSON"
 
 
 class ReportStatus(str, Enum):
@@ -513,6 +522,19 @@ class ReportLogResponse(BaseModel):
     generated_at: datetime
 
 
+class ReportJobCreate(BaseModel):
+    report: str  # Report path under /reports, e.g. "monthly-collection"
+    format: str = "excel"  # csv, excel or json
+    filters: Dict[str, Any] = {}  # Same query parameters as GET /reports/<report>
+
+
+class ReportScheduleUpdate(BaseModel):
+    cron_spec: Optional[str] = None  # "minute hour day month weekday", e.g. "0 1 * * *"
+    is_active: Optional[bool] = None
+    report_filters: Optional[Dict[str, Any]] = None  # Fixed filters, the period filters are added on top
+    run_as_user_id: Optional[int] = None
+
+
 # Grievance Management Models
 class GrievanceType(str, Enum):
     INVESTOR = "investor"
@@ -647,6 +669,20 @@ class PayoutResponse(BaseModel):
     updated_at: datetime
 
 
+class PayoutBulkStatusUpdate(BaseModel):
+    new_status: PayoutStatus
+    # Either an explicit id list...
+    payout_ids: Optional[List[int]] = None
+    # ...or filters (month is required in filter mode)
+    month: Optional[str] = None  # Interest month, "2026-03"
+    series_id: Optional[int] = None
+    current_status: Optional[PayoutStatus] = None
+
+
+class TDSBatchCreate(BaseModel):
+    financial_year: str  # "2025-26"
+
+
 class PayoutImportRow(BaseModel):
     investor_id: str  # Investor code like "INV001"
     series_name: str
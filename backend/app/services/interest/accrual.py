@@ -0,0 +1,226 @@
+"""
+Accrued Interest Index
+======================
+"Interest accrued on investment X up to date D" as a constant-time lookup
+
+Interest accrues daily at (Principal × Rate%) / Days_in_Year, with the leap-year
+aware day count of the day's own year - the same rule the payout engine uses for
+full months, first months, exits and maturities (see calculate_monthly_interest).
+
+For every series the cumulative day-count factor is precomputed once:
+
+    factors[k] = Σ 1 / Days_in_Year(day)   for the first k days from series start
+
+It only depends on the series start date (and how far it runs), so all investments
+in a series - and all series starting on the same day - share one array. Accrued
+interest between two dates is then one subtraction:
+
+    Principal × Rate% × (factors[end] - factors[start])
+
+Nothing walks months, so valuing a whole portfolio costs one pass over its investments.
+
+Accrual stops at maturity - series without one are indexed up to the requested
+date, so valuation dates are limited to MAX_AS_OF_YEARS_AHEAD years from today and
+the cache keeps the arrays of the FACTOR_CACHE_MAX_ENTRIES most recently used start dates.
+"""
+
+from array import array
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Optional
+import calendar
+import os
+import threading
+
+MAX_AS_OF_YEARS_AHEAD = int(os.getenv('ACCRUAL_MAX_AS_OF_YEARS_AHEAD', 5))
+FACTOR_CACHE_MAX_ENTRIES = int(os.getenv('ACCRUAL_FACTOR_CACHE_MAX_ENTRIES', 256))
+
+# series start date → factor array, least recently used first
+_factor_cache = OrderedDict()
+_factor_cache_lock = threading.Lock()
+
+
+def latest_as_of(today: Optional[date] = None) -> date:
+    """Latest date interest can be valued at: today plus MAX_AS_OF_YEARS_AHEAD years"""
+    today = today or date.today()
+    year = today.year + MAX_AS_OF_YEARS_AHEAD
+    # 29 February → 28 February of a non-leap year
+    return today.replace(year=year, day=min(today.day, calendar.monthrange(year, today.month)[1]))
+
+
+def _build_day_count_factors(start: date, days: int) -> array:
+    """factors[k] = cumulative day-count fraction of the first k days from start"""
+    factors = array('d', [0.0])
+    total = 0.0
+    current = start
+    remaining = days
+
+    while remaining > 0:
+        days_in_year = 366 if calendar.isleap(current.year) else 365
+        year_left = (date(current.year, 12, 31) - current).days + 1
+        step = 1.0 / days_in_year
+
+        for _ in range(min(remaining, year_left)):
+            total += step
+            factors.append(total)
+
+        taken = min(remaining, year_left)
+        remaining -= taken
+        current += timedelta(days=taken)
+
+    return factors
+
+
+def day_count_factors(start: date, days: int) -> array:
+    """
+    Cumulative day-count factors covering at least `days` days from start (cached)
+    A longer array for the same start date is reused for shorter requests
+    """
+    with _factor_cache_lock:
+        factors = _factor_cache.get(start)
+        if factors is not None and len(factors) > days:
+            _factor_cache.move_to_end(start)
+            return factors
+
+    factors = _build_day_count_factors(start, days)
+
+    with _factor_cache_lock:
+        cached = _factor_cache.get(start)
+        if cached is None or len(cached) < len(factors):
+            _factor_cache[start] = factors
+        _factor_cache.move_to_end(start)
+        while len(_factor_cache) > FACTOR_CACHE_MAX_ENTRIES:
+            _factor_cache.popitem(last=False)
+        return _factor_cache[start]
+
+
+class SeriesAccrual:
+    """Accrual schedule of one series: rate, start, maturity and the shared factor array"""
+
+    __slots__ = ('series_id', 'series_name', 'rate', 'start', 'maturity', 'factors')
+
+    def __init__(self, series_id: int, series_name: str, interest_rate: float,
+                 start: date, maturity: Optional[date], horizon: date):
+        self.series_id = series_id
+        self.series_name = series_name
+        self.rate = float(interest_rate or 0) / 100
+        self.start = start
+        self.maturity = maturity
+
+        end = min(maturity, horizon) if maturity else horizon
+        self.factors = day_count_factors(start, max((end - start).days + 1, 0))
+
+    def _factor_through(self, day: date) -> float:
+        """Cumulative factor from series start up to and including `day`"""
+        offset = (day - self.start).days + 1
+        if offset <= 0:
+            return 0.0
+        return self.factors[min(offset, len(self.factors) - 1)]
+
+    def accrual_end(self, as_of: date, exit_date: Optional[date] = None) -> date:
+        """Last day interest accrues for: as_of, capped at exit and maturity"""
+        end = as_of
+        if exit_date and exit_date < end:
+            end = exit_date
+        if self.maturity and self.maturity < end:
+            end = self.maturity
+        return end
+
+    def accrued(self, principal: float, as_of: date, exit_date: Optional[date] = None) -> dict:
+        """
+        Interest accrued on `principal` up to as_of (inclusive)
+
+        - accrued_interest:        since series start
+        - current_period_interest: since the 1st of the month of the last accrual day -
+                                   the part not covered by monthly payouts yet; on the
+                                   exit / maturity date it is the final prorated payout
+        """
+        end = self.accrual_end(as_of, exit_date)
+        if end < self.start:
+            return {
+                'accrued_through': None,
+                'accrual_days': 0,
+                'accrued_interest': 0.0,
+                'current_period_interest': 0.0
+            }
+
+        period_start = max(self.start, end.replace(day=1))
+        through_end = self._factor_through(end)
+        base = principal * self.rate
+
+        return {
+            'accrued_through': end,
+            'accrual_days': (end - self.start).days + 1,
+            'accrued_interest': round(base * through_end, 2),
+            'current_period_interest': round(base * (through_end - self._factor_through(period_start - timedelta(days=1))), 2)
+        }
+
+
+class AccrualIndex:
+    """
+    SeriesAccrual for every series, built once for an as_of date
+
+    Usage:
+        index = AccrualIndex.load(db, as_of)
+        index.accrued_for(investment_row, as_of)
+    """
+
+    def __init__(self, series_rows, horizon: date):
+        if horizon > latest_as_of():
+            raise ValueError(
+                f"Interest can be valued at most {MAX_AS_OF_YEARS_AHEAD} years ahead (until {latest_as_of().isoformat()})"
+            )
+        self.horizon = horizon
+        self.series = {}
+        for row in series_rows:
+            start = row['series_start_date']
+            if not start:
+                continue
+            self.series[row['id']] = SeriesAccrual(
+                row['id'],
+                row['name'],
+                row['interest_rate'],
+                start,
+                row.get('maturity_date'),
+                horizon
+            )
+
+    @classmethod
+    def load(cls, db, horizon: date, series_ids=None):
+        query = """
+        SELECT id, name, interest_rate, series_start_date, maturity_date
+        FROM ncd_series
+        """
+        params = ()
+        if series_ids:
+            placeholders = ', '.join(['%s'] * len(series_ids))
+            query += f" WHERE id IN ({placeholders})"
+            params = tuple(series_ids)
+        return cls(db.execute_query(query, params), horizon)
+
+    def accrued_for(self, investment: dict, as_of: date) -> Optional[dict]:
+        """
+        investment: {'investment_id', 'series_id', 'amount', 'exit_date', 'status'}
+        Returns the accrual dict (plus identifying fields) or None for an unknown series
+        """
+        series = self.series.get(investment['series_id'])
+        if series is None:
+            return None
+
+        principal = float(investment['amount'])
+        result = series.accrued(principal, as_of, investment.get('exit_date'))
+        accrued_through = result['accrued_through']
+
+        return {
+            'investment_id': investment['investment_id'],
+            'series_id': series.series_id,
+            'series_name': series.series_name,
+            'principal': principal,
+            'interest_rate': round(series.rate * 100, 4),
+            'status': investment.get('status'),
+            'accrual_start': series.start.isoformat(),
+            'accrued_through': accrued_through.isoformat() if accrued_through else None,
+            'accrual_days': result['accrual_days'],
+            'accrued_interest': result['accrued_interest'],
+            'current_period_interest': result['current_period_interest']
+        }
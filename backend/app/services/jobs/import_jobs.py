@@ -0,0 +1,311 @@
+"""
+Background Import Jobs
+======================
+Runs large payout / investor uploads outside the HTTP request
+
+FLOW:
+- Upload endpoint stores a row in import_jobs and returns the job id immediately
+- A worker thread reads the sheet, processes it in chunks and records progress
+- Rejected rows (with their original values) are kept so they can be downloaded
+  as a sheet, fixed and re-uploaded
+
+Each worker uses its OWN database connection - the global connection from
+get_db() is shared by request handlers and is not thread-safe.
+
+Jobs carry the id of the process running them and its heartbeat (job_heartbeat.py),
+so only jobs of a process that is gone are failed as interrupted.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+import json
+import logging
+import os
+
+from app.core.database import Database
+from app.services.jobs.job_heartbeat import WORKER_ID, register_job_table, fail_orphaned_jobs
+
+logger = logging.getLogger(__name__)
+
+IMPORT_JOB_WORKERS = int(os.getenv('IMPORT_JOB_WORKERS', 2))
+IMPORT_JOB_CHUNK_SIZE = int(os.getenv('IMPORT_JOB_CHUNK_SIZE', 5000))
+
+_executor = ThreadPoolExecutor(max_workers=IMPORT_JOB_WORKERS, thread_name_prefix='import-job')
+
+register_job_table(
+    'import_jobs', 'import job',
+    'Server restarted before the job finished. Please upload the file again.'
+)
+
+
+def _payout_import_handler():
+    from app.api.routes import payouts
+
+    return {
+        'label': 'payout',
+        'required_columns': payouts.PAYOUT_IMPORT_REQUIRED_COLUMNS,
+        'normalize': payouts.normalize_payout_import_frame,
+        'apply': payouts.apply_payout_import,
+        'audit': payouts.log_payout_import_audit,
+    }
+
+
+def _investor_import_handler():
+    from app.api.routes import investors
+
+    return {
+        'label': 'investor',
+        'required_columns': investors.INVESTOR_IMPORT_REQUIRED_COLUMNS,
+        'normalize': investors.normalize_investor_import_frame,
+        'apply': investors.apply_investor_import,
+        'audit': investors.log_investor_import_audit,
+    }
+
+
+# job_type → handler factory (route modules are imported lazily to avoid cycles)
+IMPORT_JOB_HANDLERS = {
+    'payout_import': _payout_import_handler,
+    'investor_import': _investor_import_handler,
+}
+
+# job_type → permission required to create / view the job
+IMPORT_JOB_PERMISSIONS = {
+    'payout_import': ('edit_interestPayout', 'view_interestPayout'),
+    'investor_import': ('create_investors', 'view_investors'),
+}
+
+
+def submit_import_job(db, job_type: str, file_name: str, contents: bytes, current_user) -> dict:
+    """
+    Create the job row and hand the file to a background worker
+    Returns the job (status 'queued')
+    """
+    if job_type not in IMPORT_JOB_HANDLERS:
+        raise ValueError(f"Unknown import job type: {job_type}")
+
+    db.execute_query("""
+    INSERT INTO import_jobs (
+        job_type, file_name, status, worker_id, heartbeat_at, created_by, created_by_name, created_by_role
+    ) VALUES (%s, %s, 'queued', %s, NOW(), %s, %s, %s)
+    """, (
+        job_type,
+        file_name,
+        WORKER_ID,
+        current_user.id,
+        current_user.full_name or current_user.username,
+        current_user.role
+    ))
+
+    job_id = db.execute_query("SELECT LAST_INSERT_ID() as id")[0]['id']
+
+    _executor.submit(
+        run_import_job,
+        job_id,
+        job_type,
+        file_name,
+        contents,
+        current_user.full_name or current_user.username,
+        current_user.role
+    )
+
+    logger.info(f"📥 Queued {job_type} job {job_id} for file: {file_name}")
+    return get_import_job(db, job_id)
+
+
+def _update_job(job_db, job_id: int, **fields):
+    assignments = ', '.join(f"{column} = %s" for column in fields)
+    job_db.execute_query(
+        f"UPDATE import_jobs SET {assignments} WHERE id = %s",
+        tuple(fields.values()) + (job_id,)
+    )
+
+
+def _error_rows_with_values(chunk, row_errors, source_columns):
+    """Attach the original sheet values to each rejected row"""
+    originals = chunk.set_index('sheet_row')[source_columns]
+    rows = []
+    for error in row_errors:
+        values = originals.loc[error['row']].to_dict() if error['row'] in originals.index else {}
+        rows.append({
+            'row': error['row'],
+            'error': error['error'],
+            'values': {column: (None if value is None or value != value else str(value)) for column, value in values.items()}
+        })
+    return rows
+
+
+def run_import_job(job_id: int, job_type: str, file_name: str, contents: bytes, admin_name: str, admin_role: str):
+    """
+    Worker entry point: read → validate columns → process in chunks → record results
+    Never raises - failures are recorded on the job row
+    """
+    from app.utils.import_utils import read_import_sheet
+
+    job_db = Database()
+    job_db.connect()
+
+    try:
+        handler = IMPORT_JOB_HANDLERS[job_type]()
+        _update_job(job_db, job_id, status='processing', started_at=datetime.now())
+
+        df = read_import_sheet(contents, file_name)
+        source_columns = [column for column in df.columns if column != 'sheet_row']
+
+        missing_columns = [col for col in handler['required_columns'] if col not in df.columns]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+
+        total_rows = len(df)
+        _update_job(job_db, job_id, total_rows=total_rows)
+        logger.info(f"⚙️ Import job {job_id}: processing {total_rows} {handler['label']} rows")
+
+        success_count = 0
+        error_rows = []
+
+        for start in range(0, total_rows, IMPORT_JOB_CHUNK_SIZE):
+            chunk = df.iloc[start:start + IMPORT_JOB_CHUNK_SIZE].copy()
+            normalized = handler['normalize'](chunk.copy())
+            chunk_success, chunk_errors = handler['apply'](job_db, normalized)
+
+            success_count += chunk_success
+            error_rows.extend(_error_rows_with_values(chunk, chunk_errors, source_columns))
+
+            _update_job(
+                job_db, job_id,
+                processed_rows=min(start + IMPORT_JOB_CHUNK_SIZE, total_rows),
+                success_count=success_count,
+                error_count=len(error_rows)
+            )
+
+        _update_job(
+            job_db, job_id,
+            status='completed',
+            error_rows=json.dumps(error_rows) if error_rows else None,
+            completed_at=datetime.now()
+        )
+
+        handler['audit'](
+            job_db,
+            file_name,
+            admin_name,
+            admin_role,
+            success_count,
+            [f"Row {error['row']}: {error['error']}" for error in error_rows]
+        )
+
+        logger.info(f"✅ Import job {job_id} complete: {success_count} imported, {len(error_rows)} errors")
+
+    except Exception as e:
+        logger.error(f"❌ Import job {job_id} failed: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        try:
+            _update_job(job_db, job_id, status='failed', error_message=str(e), completed_at=datetime.now())
+        except Exception as update_error:
+            logger.error(f"❌ Could not record failure for import job {job_id}: {update_error}")
+    finally:
+        job_db.disconnect()
+
+
+def get_import_job(db, job_id: int, include_errors: bool = False) -> Optional[dict]:
+    """Job status row (error rows only when include_errors=True)"""
+    columns = """
+        id, job_type, file_name, status, total_rows, processed_rows,
+        success_count, error_count, error_message, created_by, created_by_name,
+        created_at, started_at, completed_at
+    """
+    if include_errors:
+        columns += ", error_rows"
+
+    result = db.execute_query(f"SELECT {columns} FROM import_jobs WHERE id = %s", (job_id,))
+    if not result:
+        return None
+
+    job = result[0]
+    job['progress_percent'] = round(job['processed_rows'] * 100 / job['total_rows'], 1) if job['total_rows'] else (100.0 if job['status'] == 'completed' else 0.0)
+
+    if include_errors:
+        job['error_rows'] = json.loads(job['error_rows']) if job.get('error_rows') else []
+
+    return job
+
+
+def list_import_jobs(db, user_id: Optional[int] = None, job_type: Optional[str] = None, limit: int = 20) -> list:
+    """Most recent jobs, optionally for one user / job type"""
+    query = """
+    SELECT id, job_type, file_name, status, total_rows, processed_rows,
+           success_count, error_count, created_by_name, created_at, completed_at
+    FROM import_jobs
+    WHERE 1=1
+    """
+    params = []
+
+    if user_id:
+        query += " AND created_by = %s"
+        params.append(user_id)
+
+    if job_type:
+        query += " AND job_type = %s"
+        params.append(job_type)
+
+    query += " ORDER BY created_at DESC, id DESC LIMIT %s"
+    params.append(limit)
+
+    return db.execute_query(query, tuple(params))
+
+
+def build_error_sheet(job: dict, file_format: str = 'xlsx') -> bytes:
+    """
+    Rejected rows as a sheet: original columns + 'Row' + 'Error'
+    so users can fix them and upload the file again
+    """
+    error_rows = job.get('error_rows') or []
+
+    value_columns = []
+    for error in error_rows:
+        for column in error['values']:
+            if column not in value_columns:
+                value_columns.append(column)
+
+    headers = value_columns + ['Row', 'Error']
+
+    def iter_rows():
+        for error in error_rows:
+            yield [error['values'].get(column) for column in value_columns] + [error['row'], error['error']]
+
+    if file_format == 'csv':
+        import csv
+        import io
+
+        output = io.StringIO()
+        output.write('\ufeff')
+        writer = csv.writer(output)
+        writer.writerow(headers)
+        writer.writerows(iter_rows())
+        return output.getvalue().encode('utf-8')
+
+    from openpyxl import Workbook
+    import io
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Errors')
+    worksheet.append(headers)
+    for row in iter_rows():
+        worksheet.append(row)
+
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def fail_interrupted_jobs(db):
+    """
+    Jobs run in-process, so a restart loses anything queued or running.
+    Mark the jobs of processes that are gone (no heartbeat) as failed on startup
+    instead of leaving them 'processing' forever - jobs of other live workers are kept.
+    """
+    try:
+        fail_orphaned_jobs(db, 'import_jobs')
+    except Exception as e:
+        logger.error(f"❌ Could not clean up interrupted import jobs: {e}")
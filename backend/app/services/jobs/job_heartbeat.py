@@ -0,0 +1,107 @@
+"""
+Background Job Heartbeat
+========================
+Tells jobs of a live process apart from jobs a dead process left behind
+
+Jobs run in-process (thread pools), so a job whose process is gone never finishes.
+With several uvicorn workers / a rolling deploy the job tables are shared, and a
+starting process must not fail the jobs another live process is still running.
+
+- every job row records the process that owns it (worker_id) and when that process
+  last confirmed it is alive (heartbeat_at)
+- a daemon thread refreshes heartbeat_at of this process's queued / processing jobs
+  every JOB_HEARTBEAT_SECONDS, and fails jobs whose heartbeat is older than
+  JOB_STALE_SECONDS (their process died - crash, restart, deploy)
+- the same sweep runs once on startup, so jobs of a process that died long ago are
+  failed at once; jobs of a process that just restarted follow within JOB_STALE_SECONDS
+
+Job modules register their table with register_job_table().
+"""
+
+from typing import Optional
+import logging
+import os
+import socket
+import threading
+import uuid
+
+from app.core.database import Database
+
+logger = logging.getLogger(__name__)
+
+JOB_HEARTBEAT_SECONDS = int(os.getenv('JOB_HEARTBEAT_SECONDS', 30))
+JOB_STALE_SECONDS = int(os.getenv('JOB_STALE_SECONDS', 120))
+
+# This process - host, pid and a random part (pids repeat across container restarts)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# table → (job label for the log, error message for orphaned jobs)
+JOB_TABLES = {}
+
+_stop = threading.Event()
+_thread = None
+
+
+def register_job_table(table: str, label: str, error_message: str):
+    JOB_TABLES[table] = (label, error_message)
+
+
+def heartbeat(db):
+    """Confirm this process still runs its queued / processing jobs"""
+    for table in JOB_TABLES:
+        db.execute_query(f"""
+        UPDATE {table}
+        SET heartbeat_at = NOW()
+        WHERE worker_id = %s AND status IN ('queued', 'processing')
+        """, (WORKER_ID,))
+
+
+def fail_orphaned_jobs(db, table: str, stale_seconds: Optional[int] = None) -> int:
+    """Fail queued / processing jobs whose process stopped sending heartbeats; returns how many"""
+    label, error_message = JOB_TABLES[table]
+    stale_seconds = JOB_STALE_SECONDS if stale_seconds is None else stale_seconds
+
+    # Rows from before heartbeats existed have none - nobody runs them any more
+    count = db.execute_query(f"""
+    UPDATE {table}
+    SET status = 'failed',
+        error_message = %s,
+        completed_at = NOW()
+    WHERE status IN ('queued', 'processing')
+      AND NOT (worker_id <=> %s)
+      AND (heartbeat_at IS NULL OR heartbeat_at < NOW() - INTERVAL %s SECOND)
+    """, (error_message, WORKER_ID, stale_seconds))
+    if count:
+        logger.warning(f"⚠️ Marked {count} interrupted {label}(s) as failed")
+    return count
+
+
+def _heartbeat_loop():
+    heartbeat_db = Database()
+    heartbeat_db.connect()
+    try:
+        while not _stop.wait(JOB_HEARTBEAT_SECONDS):
+            try:
+                heartbeat(heartbeat_db)
+                for table in JOB_TABLES:
+                    fail_orphaned_jobs(heartbeat_db, table)
+            except Exception as e:
+                logger.error(f"❌ Job heartbeat failed: {e}")
+    finally:
+        heartbeat_db.disconnect()
+
+
+def start_job_heartbeat():
+    """Start the heartbeat thread (once per process)"""
+    global _thread
+    if _thread and _thread.is_alive():
+        return
+
+    _stop.clear()
+    _thread = threading.Thread(target=_heartbeat_loop, name='job-heartbeat', daemon=True)
+    _thread.start()
+    logger.info(f"💓 Job heartbeat started for worker {WORKER_ID} (every {JOB_HEARTBEAT_SECONDS}s)")
+
+
+def stop_job_heartbeat():
+    _stop.set()
@@ -0,0 +1,470 @@
+"""
+Background Report Jobs
+======================
+Generates report files outside the HTTP request
+
+FLOW:
+- POST /reports/jobs stores a row in report_jobs and returns the job id immediately
+- A worker thread runs the same report function as GET /reports/<report>,
+  writes the file (CSV / xlsx / JSON / PDF) and stores it locally or in S3
+- PDFs are laid out in the PDF process pool (report_pdf_pool.py)
+- Every finished job - successful or failed - is written to report_logs with
+  the measured generation time and file size
+- The cache gets its own copy of every file: the same report with the same
+  filters over unchanged data completes at once with the cached file, and evicting
+  it never removes a file a job still points to
+- report_scheduler.py queues the nightly precomputed reports through the same
+  path (schedule_id / report_period set)
+
+The report functions fetch their connection with get_db(); the worker runs
+them inside use_connection() so they use the worker's OWN connection.
+
+Jobs carry the id of the process running them and its heartbeat (job_heartbeat.py),
+so only jobs of a process that is gone are failed as interrupted.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+import asyncio
+import json
+import logging
+import os
+import shutil
+import time
+
+from fastapi import HTTPException
+
+from app.core.database import Database, use_connection
+from app.services.jobs.job_heartbeat import WORKER_ID, register_job_table, fail_orphaned_jobs
+from app.services.jobs.report_pdf_pool import render_pdf
+from app.services.storage.report_artifacts import (
+    staging_path,
+    store_report_artifact,
+    delete_report_artifact
+)
+from app.services.storage.report_cache import (
+    report_cache_key,
+    lookup_report_cache,
+    cache_report_file
+)
+from app.utils.date_utils import parse_date_flexible
+from app.utils.report_logger import log_report_generation
+from app.utils.report_tables import (
+    flatten_report,
+    count_report_records,
+    write_report_csv,
+    stream_report_xlsx,
+    report_json_bytes,
+    report_layout
+)
+from app.utils.xlsx_stream import XLSX_MEDIA_TYPE
+
+logger = logging.getLogger(__name__)
+
+REPORT_JOB_WORKERS = int(os.getenv('REPORT_JOB_WORKERS', 2))
+
+_executor = ThreadPoolExecutor(max_workers=REPORT_JOB_WORKERS, thread_name_prefix='report-job')
+
+register_job_table(
+    'report_jobs', 'report job',
+    'Server restarted before the report finished. Please generate it again.'
+)
+
+# report key (path under /reports) → report name as shown on the Reports page,
+# the report function in reports.py and the filters it accepts
+REPORT_JOB_TYPES = {
+    'monthly-collection': {
+        'name': 'Monthly Collection Report',
+        'function': 'get_monthly_collection_report',
+        'filters': ('from_date', 'to_date', 'series_id'),
+    },
+    'payout-statement': {
+        'name': 'Payout Statement',
+        'function': 'get_payout_statement_report',
+        'filters': ('from_date', 'to_date', 'month', 'series_id'),
+    },
+    'series-performance': {
+        'name': 'Series-wise Performance',
+        'function': 'get_series_performance_report',
+        'filters': ('series_ids',),
+    },
+    'investor-portfolio': {
+        'name': 'Investor Portfolio Summary',
+        'function': 'get_investor_portfolio_book',
+        'filters': ('from_date', 'to_date', 'investor_id', 'series_id'),
+    },
+    'kyc-status': {
+        'name': 'KYC Status Report',
+        'function': 'get_kyc_status_report',
+        'filters': (),
+    },
+    'new-investors': {
+        'name': 'New Investor Report',
+        'function': 'get_new_investors_report',
+        'filters': ('from_date', 'to_date', 'investor_id'),
+    },
+    'rbi-compliance': {
+        'name': 'RBI Compliance Report',
+        'function': 'get_rbi_compliance_report',
+        'filters': ('series_id', 'security_type'),
+    },
+    'sebi-disclosure': {
+        'name': 'SEBI Disclosure Report',
+        'function': 'get_sebi_disclosure_report',
+        'filters': ('series_id',),
+    },
+    'audit-trail': {
+        'name': 'Audit Trail Report',
+        'function': 'get_audit_trail_report',
+        'filters': ('from_date', 'to_date', 'series_id'),
+    },
+    'daily-activity': {
+        'name': 'Daily Activity Report',
+        'function': 'get_daily_activity_report',
+        'filters': ('from_date', 'to_date', 'role'),
+    },
+    'subscription-trend-analysis': {
+        'name': 'Subscription Trend Analysis',
+        'function': 'get_subscription_trend_analysis',
+        'filters': (),
+    },
+    'series-maturity': {
+        'name': 'Series Maturity Report',
+        'function': 'get_series_maturity_report',
+        'filters': (),
+    },
+}
+
+INTEGER_FILTERS = {'series_id'}
+DATE_FILTERS = {'from_date', 'to_date'}
+
+# file format → (report_logs.report_type, extension, media type)
+REPORT_JOB_FORMATS = {
+    'csv': ('CSV', 'csv', 'text/csv; charset=utf-8'),
+    'excel': ('Excel', 'xlsx', XLSX_MEDIA_TYPE),
+    'json': ('JSON', 'json', 'application/json'),
+    'pdf': ('PDF', 'pdf', 'application/pdf'),
+}
+
+REPORT_JOB_COLUMNS = """
+    id, report_key, report_name, file_format, report_filters, schedule_id, report_period, status, record_count,
+    page_count, file_name, file_size_kb, generation_time_ms, error_message, created_by,
+    created_by_name, created_at, started_at, completed_at
+"""
+
+
+def _report_function(function_name: str):
+    # Imported lazily: reports.py is a route module
+    from app.api.routes import reports
+
+    return getattr(reports, function_name)
+
+
+def normalize_report_filters(report_key: str, filters: Optional[dict]) -> dict:
+    """
+    Keep the filters the report accepts (empty values dropped); ValueError on anything else
+    Values are brought to one spelling - dates as YYYY-MM-DD, series_ids sorted - so
+    the same report always gets the same cache key
+    """
+    if report_key not in REPORT_JOB_TYPES:
+        raise ValueError(
+            f"Unknown report '{report_key}'. Must be one of: {', '.join(REPORT_JOB_TYPES)}"
+        )
+
+    allowed = REPORT_JOB_TYPES[report_key]['filters']
+    normalized = {}
+
+    for name, value in (filters or {}).items():
+        if name not in allowed:
+            accepted = ', '.join(allowed) if allowed else 'none'
+            raise ValueError(f"Filter '{name}' is not supported by this report (accepted: {accepted})")
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        if name in INTEGER_FILTERS:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Filter '{name}' must be a number")
+        elif name in DATE_FILTERS:
+            parsed = parse_date_flexible(value)
+            if parsed is None:
+                raise ValueError(f"Filter '{name}' must be a date (YYYY-MM-DD or DD/MM/YYYY)")
+            value = parsed.isoformat()
+        elif name == 'series_ids':
+            # Imported lazily: reports.py is a route module
+            from app.api.routes.reports import parse_series_ids
+
+            series_ids = parse_series_ids(str(value))
+            if not series_ids:
+                continue
+            value = ','.join(str(series_id) for series_id in series_ids)
+        else:
+            value = str(value).strip()
+        normalized[name] = value
+
+    return normalized
+
+
+def report_file_name(report_name: str, file_format: str) -> str:
+    extension = REPORT_JOB_FORMATS[file_format][1]
+    stem = ''.join(char if char.isalnum() else '_' for char in report_name).strip('_')
+    return f"{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+
+def submit_report_job(db, report_key: str, file_format: str, filters: dict, current_user,
+                      schedule_id: Optional[int] = None, report_period: Optional[str] = None) -> dict:
+    """
+    Create the job row and hand the report to a background worker
+    schedule_id / report_period: set for runs queued by the report scheduler
+    Returns the job (status 'queued')
+    """
+    if file_format not in REPORT_JOB_FORMATS:
+        raise ValueError(f"Invalid format '{file_format}'. Must be one of: {', '.join(REPORT_JOB_FORMATS)}")
+
+    filters = normalize_report_filters(report_key, filters)
+    report_name = REPORT_JOB_TYPES[report_key]['name']
+
+    db.execute_query("""
+    INSERT INTO report_jobs (
+        report_key, report_name, file_format, report_filters, schedule_id, report_period, status,
+        worker_id, heartbeat_at, created_by, created_by_name, created_by_role
+    ) VALUES (%s, %s, %s, %s, %s, %s, 'queued', %s, NOW(), %s, %s, %s)
+    """, (
+        report_key,
+        report_name,
+        file_format,
+        json.dumps(filters) if filters else None,
+        schedule_id,
+        report_period,
+        WORKER_ID,
+        current_user.id,
+        current_user.full_name or current_user.username,
+        current_user.role
+    ))
+    job_id = db.execute_query("SELECT LAST_INSERT_ID() as id")[0]['id']
+
+    _executor.submit(run_report_job, job_id, report_key, file_format, filters, current_user)
+
+    logger.info(f"📊 Queued report job {job_id}: {report_name} ({file_format})")
+    return get_report_job(db, job_id)
+
+
+def _update_job(job_db, job_id: int, **fields):
+    assignments = ', '.join(f"{column} = %s" for column in fields)
+    job_db.execute_query(
+        f"UPDATE report_jobs SET {assignments} WHERE id = %s",
+        tuple(fields.values()) + (job_id,)
+    )
+
+
+def render_report_file(report_name: str, data: dict, file_format: str, path) -> tuple:
+    """Write the report to path; returns (number of table rows, page count - PDF only)"""
+    if file_format == 'csv':
+        with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+            return write_report_csv(report_name, data, file), None
+
+    if file_format == 'pdf':
+        sheets = report_layout(report_name, data)
+        metrics = render_pdf(sheets, path)
+        record_count = sum(
+            len(block['items']) for sheet in sheets for block in sheet['blocks'] if block['kind'] == 'table'
+        )
+        return record_count, metrics['page_count']
+
+    if file_format == 'excel':
+        with open(path, 'wb') as file:
+            for chunk in stream_report_xlsx(report_name, data):
+                file.write(chunk)
+    else:
+        with open(path, 'wb') as file:
+            file.write(report_json_bytes(data))
+
+    return count_report_records(flatten_report(data)[1]), None
+
+
+def run_report_job(job_id: int, report_key: str, file_format: str, filters: dict, current_user):
+    """
+    Worker entry point: cache lookup → compute → render → store → log
+    Never raises - failures are recorded on the job row and in report_logs
+    """
+    definition = REPORT_JOB_TYPES[report_key]
+    report_type, _, media_type = REPORT_JOB_FORMATS[file_format]
+    started = time.perf_counter()
+    stored = None
+    cache_copy = None
+    cache_status = None
+
+    job_db = Database()
+    job_db.connect()
+
+    try:
+        _update_job(job_db, job_id, status='processing', started_at=datetime.now())
+
+        cache_key = report_cache_key(job_db, report_key, file_format, filters)
+        cached = lookup_report_cache(job_db, cache_key)
+
+        if cached:
+            # Same report over unchanged data - hand out the stored file
+            cache_status = 'hit'
+            file_name = cached['file_name']
+            record_count = cached['record_count'] or 0
+            page_count = cached['page_count']
+            size_bytes = cached['size_bytes']
+            storage, location = cached['storage'], cached['artifact_location']
+        else:
+            cache_status = 'miss' if cache_key else None
+
+            report_function = _report_function(definition['function'])
+            with use_connection(job_db):
+                data = asyncio.run(report_function(**filters, current_user=current_user))
+
+            file_name = report_file_name(definition['name'], file_format)
+            staged = staging_path(file_name)
+            try:
+                record_count, page_count = render_report_file(definition['name'], data, file_format, staged)
+                if cache_key:
+                    cache_copy = staging_path(file_name)
+                    shutil.copyfile(staged, cache_copy)
+                stored = store_report_artifact(
+                    staged,
+                    f"{datetime.now().strftime('%Y/%m')}/{job_id}-{file_name}",
+                    media_type
+                )
+            finally:
+                staged.unlink(missing_ok=True)
+
+            size_bytes = stored['size_bytes']
+            storage, location = stored['storage'], stored['location']
+
+        generation_time_ms = int((time.perf_counter() - started) * 1000)
+        file_size_kb = round(size_bytes / 1024, 2)
+
+        if cache_copy:
+            cache_report_file(
+                job_db, cache_key, report_key, definition['name'], file_format, filters,
+                file_name, cache_copy, media_type, record_count, generation_time_ms, page_count
+            )
+
+        _update_job(
+            job_db, job_id,
+            status='completed',
+            record_count=record_count,
+            page_count=page_count,
+            file_name=file_name,
+            storage=storage,
+            artifact_location=location,
+            file_size_kb=file_size_kb,
+            generation_time_ms=generation_time_ms,
+            completed_at=datetime.now()
+        )
+
+        log_report_generation(
+            db=job_db,
+            report_name=definition['name'],
+            report_type=report_type,
+            user_id=current_user.id,
+            user_name=current_user.full_name or current_user.username,
+            user_role=current_user.role,
+            report_filters=filters,
+            record_count=record_count,
+            file_size_kb=file_size_kb,
+            generation_time_ms=generation_time_ms,
+            status="success",
+            cache_status=cache_status,
+            page_count=page_count
+        )
+
+        logger.info(
+            f"✅ Report job {job_id} complete: {definition['name']} ({file_format}) - "
+            f"{record_count} rows, {file_size_kb} KB in {generation_time_ms} ms"
+            f"{' (cached)' if cache_status == 'hit' else ''}"
+        )
+
+    except Exception as e:
+        generation_time_ms = int((time.perf_counter() - started) * 1000)
+        message = str(e.detail) if isinstance(e, HTTPException) else str(e)
+        logger.error(f"❌ Report job {job_id} failed: {message}")
+        import traceback
+        logger.error(traceback.format_exc())
+
+        if stored:
+            delete_report_artifact(stored['storage'], stored['location'])
+
+        try:
+            _update_job(
+                job_db, job_id,
+                status='failed',
+                error_message=message,
+                generation_time_ms=generation_time_ms,
+                completed_at=datetime.now()
+            )
+        except Exception as update_error:
+            logger.error(f"❌ Could not record failure for report job {job_id}: {update_error}")
+
+        log_report_generation(
+            db=job_db,
+            report_name=definition['name'],
+            report_type=report_type,
+            user_id=current_user.id,
+            user_name=current_user.full_name or current_user.username,
+            user_role=current_user.role,
+            report_filters=filters,
+            generation_time_ms=generation_time_ms,
+            status="failed",
+            error_message=message,
+            cache_status=cache_status
+        )
+    finally:
+        if cache_copy:
+            cache_copy.unlink(missing_ok=True)
+        job_db.disconnect()
+
+
+def _job_response(job: dict) -> dict:
+    if isinstance(job.get('report_filters'), str):
+        job['report_filters'] = json.loads(job['report_filters'])
+    job['report_filters'] = job.get('report_filters') or {}
+    job['download_ready'] = job['status'] == 'completed'
+    return job
+
+
+def get_report_job(db, job_id: int, include_location: bool = False) -> Optional[dict]:
+    """Job status row (storage / artifact location only when include_location=True)"""
+    columns = REPORT_JOB_COLUMNS
+    if include_location:
+        columns += ", storage, artifact_location"
+
+    result = db.execute_query(f"SELECT {columns} FROM report_jobs WHERE id = %s", (job_id,))
+    return _job_response(result[0]) if result else None
+
+
+def list_report_jobs(db, user_id: Optional[int] = None, report_key: Optional[str] = None, limit: int = 20) -> list:
+    """Most recent jobs, optionally for one user / report"""
+    query = f"SELECT {REPORT_JOB_COLUMNS} FROM report_jobs WHERE 1=1"
+    params = []
+
+    if user_id:
+        query += " AND created_by = %s"
+        params.append(user_id)
+
+    if report_key:
+        query += " AND report_key = %s"
+        params.append(report_key)
+
+    query += " ORDER BY created_at DESC, id DESC LIMIT %s"
+    params.append(limit)
+
+    return [_job_response(job) for job in db.execute_query(query, tuple(params))]
+
+
+def fail_interrupted_report_jobs(db):
+    """
+    Jobs run in-process, so a restart loses anything queued or running.
+    Mark the jobs of processes that are gone (no heartbeat) as failed on startup
+    instead of leaving them 'processing' forever - jobs of other live workers are kept.
+    """
+    try:
+        fail_orphaned_jobs(db, 'report_jobs')
+    except Exception as e:
+        logger.error(f"❌ Could not clean up interrupted report jobs: {e}")
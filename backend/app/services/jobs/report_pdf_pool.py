@@ -0,0 +1,77 @@
+"""
+Report PDF Pool
+===============
+Renders report PDFs in worker processes so a few thousand pages of layout
+never hold up the API's event loop (or the GIL of the report job threads)
+
+The pool is bounded: at most REPORT_PDF_PROCESSES PDFs render at the same time,
+further requests queue. Processes are started with 'spawn' on first use - a
+worker imports only the PDF modules, not the app's threads / connections.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+
+from app.utils.report_pdf import render_report_pdf
+
+logger = logging.getLogger(__name__)
+
+REPORT_PDF_PROCESSES = int(os.getenv('REPORT_PDF_PROCESSES', 2))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=REPORT_PDF_PROCESSES,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            logger.info(f"🖨️ Started PDF render pool ({REPORT_PDF_PROCESSES} processes)")
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """A worker died (e.g. killed for memory) - the next render starts a fresh pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def render_pdf(sheets: list, path: Path) -> dict:
+    """Render in the pool and wait (for worker threads); returns the render metrics"""
+    pool = _get_pool()
+    try:
+        return pool.submit(render_report_pdf, sheets, str(path)).result()
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise RuntimeError("PDF rendering process stopped unexpectedly - please try again")
+
+
+async def render_pdf_async(sheets: list, path: Path) -> dict:
+    """Render in the pool without blocking the event loop; returns the render metrics"""
+    pool = _get_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, render_report_pdf, sheets, str(path))
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise RuntimeError("PDF rendering process stopped unexpectedly - please try again")
+
+
+def shutdown_pdf_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool:
+        pool.shutdown(wait=False, cancel_futures=True)
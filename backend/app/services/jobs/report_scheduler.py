@@ -0,0 +1,329 @@
+"""
+Report Scheduler
+================
+Precomputes the standard regulatory reports overnight
+
+FLOW:
+- report_schedules holds one row per scheduled report: cron spec, format, period
+  ('previous_month' or 'current') and optional fixed filters
+- a daemon thread wakes every REPORT_SCHEDULER_POLL_SECONDS and queues every due
+  schedule as an ordinary report job (report_jobs.py) - the file is stored as a job
+  artifact, registered in the report cache, and every success / failure is written
+  to report_logs by the job itself
+- GET /reports/schedules/{id}/download hands out the latest generated file at once,
+  stamped with when it was generated
+
+- a schedule is claimed by moving its next_run_at with a conditional UPDATE, so
+  several app processes never queue the same run twice
+- a run missed while the server was down is queued once on the next start
+- the report runs as run_as_user_id, or the first active Super Admin
+- anything that stops a run from being queued (no user, bad filters) is kept in
+  report_schedules.last_error and, when there is a user, logged in report_logs
+
+REPORT_SCHEDULER_ENABLED=false turns the thread off (e.g. on all but one host).
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Optional
+import json
+import logging
+import os
+import threading
+
+from app.core.database import Database
+from app.models.pydantic.models import UserInDB
+from app.services.jobs.report_jobs import (
+    REPORT_JOB_TYPES,
+    REPORT_JOB_FORMATS,
+    REPORT_JOB_COLUMNS,
+    normalize_report_filters,
+    submit_report_job,
+    _job_response
+)
+from app.utils.cron import next_cron_time
+from app.utils.report_logger import log_report_generation
+
+logger = logging.getLogger(__name__)
+
+REPORT_SCHEDULER_ENABLED = os.getenv('REPORT_SCHEDULER_ENABLED', 'true').strip().lower() not in ('0', 'false', 'no')
+REPORT_SCHEDULER_POLL_SECONDS = int(os.getenv('REPORT_SCHEDULER_POLL_SECONDS', 60))
+
+SCHEDULE_PERIODS = ('previous_month', 'current')
+
+REPORT_SCHEDULE_COLUMNS = """
+    id, report_key, file_format, cron_spec, period, report_filters, run_as_user_id,
+    is_active, next_run_at, last_run_at, last_job_id, last_error, created_at, updated_at
+"""
+
+_stop = threading.Event()
+_thread = None
+
+
+def period_filters(report_key: str, period: str, today: Optional[date] = None) -> tuple:
+    """
+    (filters, period label) a run covers
+    previous_month: the report's month / date-range filters set to last month
+    current: no period filters - the report as of the run
+    """
+    if period not in SCHEDULE_PERIODS:
+        raise ValueError(f"Invalid period '{period}'. Must be one of: {', '.join(SCHEDULE_PERIODS)}")
+    if period == 'current':
+        return {}, None
+
+    today = today or date.today()
+    last_day = today.replace(day=1) - timedelta(days=1)
+    first_day = last_day.replace(day=1)
+    label = first_day.strftime('%Y-%m')
+
+    accepted = REPORT_JOB_TYPES[report_key]['filters']
+    if 'month' in accepted:
+        return {'month': label}, label
+    if 'from_date' in accepted and 'to_date' in accepted:
+        return {'from_date': first_day.isoformat(), 'to_date': last_day.isoformat()}, label
+    raise ValueError(f"Report '{report_key}' has no period filters - schedule it with period 'current'")
+
+
+def validate_schedule(report_key: str, file_format: str, cron_spec: str, period: str,
+                      filters: Optional[dict] = None):
+    """Raises ValueError when the schedule could never run"""
+    if file_format not in REPORT_JOB_FORMATS:
+        raise ValueError(f"Invalid format '{file_format}'. Must be one of: {', '.join(REPORT_JOB_FORMATS)}")
+    next_cron_time(cron_spec, datetime.now())
+    normalize_report_filters(report_key, {**(filters or {}), **period_filters(report_key, period)[0]})
+
+
+def _schedule_response(schedule: dict) -> dict:
+    if isinstance(schedule.get('report_filters'), str):
+        schedule['report_filters'] = json.loads(schedule['report_filters'])
+    schedule['report_filters'] = schedule.get('report_filters') or {}
+    schedule['is_active'] = bool(schedule['is_active'])
+    definition = REPORT_JOB_TYPES.get(schedule['report_key'])
+    schedule['report_name'] = definition['name'] if definition else schedule['report_key']
+    return schedule
+
+
+def _run_as_user(db, schedule: dict) -> Optional[UserInDB]:
+    query = """
+    SELECT id, user_id, username, full_name, email, phone, password_hash, role,
+           created_at, updated_at, last_login, is_active
+    FROM users
+    WHERE is_active = 1
+    """
+    if schedule['run_as_user_id']:
+        result = db.execute_query(query + " AND id = %s", (schedule['run_as_user_id'],))
+    else:
+        result = db.execute_query(query + " AND role = 'Super Admin' ORDER BY id LIMIT 1")
+
+    if not result:
+        return None
+    user = result[0]
+    user['is_active'] = bool(user['is_active'])
+    return UserInDB(**user)
+
+
+def _claim(db, schedule: dict, now: datetime) -> bool:
+    """Move next_run_at on - True if this process owns the run"""
+    try:
+        next_run_at = next_cron_time(schedule['cron_spec'], now)
+    except ValueError as e:
+        next_run_at = None
+        logger.error(f"❌ Report schedule {schedule['id']}: {e}")
+
+    claimed = db.execute_query("""
+    UPDATE report_schedules
+    SET next_run_at = %s, last_run_at = %s
+    WHERE id = %s AND next_run_at = %s
+    """, (next_run_at, now, schedule['id'], schedule['next_run_at']))
+    return claimed == 1
+
+
+def queue_scheduled_report(db, schedule: dict, today: Optional[date] = None) -> Optional[dict]:
+    """Queue one run of the schedule as a report job; returns the job, or None if it could not be queued"""
+    report_key = schedule['report_key']
+    definition = REPORT_JOB_TYPES.get(report_key)
+    user = None
+
+    try:
+        if not definition:
+            raise ValueError(f"Unknown report '{report_key}'")
+        user = _run_as_user(db, schedule)
+        if not user:
+            raise ValueError("No active user to run the report as (run_as_user_id / Super Admin)")
+
+        fixed_filters = schedule['report_filters']
+        if isinstance(fixed_filters, str):
+            fixed_filters = json.loads(fixed_filters)
+        filters, period_label = period_filters(report_key, schedule['period'], today)
+
+        job = submit_report_job(
+            db, report_key, schedule['file_format'], {**(fixed_filters or {}), **filters}, user,
+            schedule_id=schedule['id'], report_period=period_label
+        )
+        db.execute_query(
+            "UPDATE report_schedules SET last_job_id = %s, last_error = NULL WHERE id = %s",
+            (job['id'], schedule['id'])
+        )
+        logger.info(f"🗓️ Scheduled {job['report_name']} ({schedule['file_format']}) queued as job {job['id']}")
+        return job
+
+    except Exception as e:
+        logger.error(f"❌ Could not queue scheduled report {schedule['id']} ({report_key}): {e}")
+        db.execute_query(
+            "UPDATE report_schedules SET last_error = %s WHERE id = %s",
+            (str(e), schedule['id'])
+        )
+        if user:
+            log_report_generation(
+                db=db,
+                report_name=definition['name'],
+                report_type=REPORT_JOB_FORMATS[schedule['file_format']][0],
+                user_id=user.id,
+                user_name=user.full_name or user.username,
+                user_role=user.role,
+                report_filters=schedule['report_filters'] or None,
+                status="failed",
+                error_message=f"Scheduled run not queued: {e}"
+            )
+        return None
+
+
+def run_due_schedules(db, now: Optional[datetime] = None) -> list:
+    """Queue every active schedule whose time has come; returns the queued jobs"""
+    now = now or datetime.now()
+
+    # New / re-enabled schedules get their first run time - they do not run at once
+    for schedule in db.execute_query(
+        "SELECT id, cron_spec FROM report_schedules WHERE is_active = 1 AND next_run_at IS NULL"
+    ):
+        try:
+            db.execute_query(
+                "UPDATE report_schedules SET next_run_at = %s WHERE id = %s AND next_run_at IS NULL",
+                (next_cron_time(schedule['cron_spec'], now), schedule['id'])
+            )
+        except ValueError as e:
+            logger.error(f"❌ Report schedule {schedule['id']}: {e}")
+
+    due = db.execute_query(f"""
+    SELECT {REPORT_SCHEDULE_COLUMNS}
+    FROM report_schedules
+    WHERE is_active = 1 AND next_run_at <= %s
+    ORDER BY next_run_at, id
+    """, (now,))
+
+    jobs = []
+    for schedule in due:
+        if _claim(db, schedule, now):
+            job = queue_scheduled_report(db, schedule, now.date())
+            if job:
+                jobs.append(job)
+    return jobs
+
+
+def list_report_schedules(db) -> list:
+    """Schedules with their latest generated file (generated_at = when the job completed)"""
+    schedules = [
+        _schedule_response(schedule)
+        for schedule in db.execute_query(f"SELECT {REPORT_SCHEDULE_COLUMNS} FROM report_schedules ORDER BY id")
+    ]
+
+    latest = {}
+    if schedules:
+        for job in db.execute_query(f"""
+        SELECT {REPORT_JOB_COLUMNS}
+        FROM report_jobs
+        WHERE id IN (
+            SELECT MAX(id) FROM report_jobs
+            WHERE status = 'completed' AND schedule_id IS NOT NULL
+            GROUP BY schedule_id
+        )
+        """):
+            latest[job['schedule_id']] = _job_response(job)
+
+    for schedule in schedules:
+        job = latest.get(schedule['id'])
+        schedule['latest_result'] = job
+        schedule['generated_at'] = job['completed_at'] if job else None
+    return schedules
+
+
+def get_report_schedule(db, schedule_id: int) -> Optional[dict]:
+    result = db.execute_query(f"SELECT {REPORT_SCHEDULE_COLUMNS} FROM report_schedules WHERE id = %s", (schedule_id,))
+    return _schedule_response(result[0]) if result else None
+
+
+def update_report_schedule(db, schedule_id: int, changes: dict) -> Optional[dict]:
+    """
+    Change cron spec / active flag / fixed filters / run-as user (None values are left as they are)
+    The next run is worked out again from now. ValueError if the result could never run
+    """
+    schedule = get_report_schedule(db, schedule_id)
+    if not schedule:
+        return None
+
+    changes = {name: value for name, value in changes.items() if value is not None}
+    updated = {**schedule, **changes}
+    validate_schedule(
+        updated['report_key'], updated['file_format'], updated['cron_spec'],
+        updated['period'], updated['report_filters']
+    )
+
+    next_run_at = next_cron_time(updated['cron_spec'], datetime.now()) if updated['is_active'] else None
+    db.execute_query("""
+    UPDATE report_schedules
+    SET cron_spec = %s, is_active = %s, report_filters = %s, run_as_user_id = %s,
+        next_run_at = %s, last_error = NULL
+    WHERE id = %s
+    """, (
+        updated['cron_spec'].strip(),
+        1 if updated['is_active'] else 0,
+        json.dumps(updated['report_filters']) if updated['report_filters'] else None,
+        updated['run_as_user_id'],
+        next_run_at,
+        schedule_id
+    ))
+    return get_report_schedule(db, schedule_id)
+
+
+def latest_scheduled_job(db, schedule_id: int) -> Optional[dict]:
+    """Most recent completed job of the schedule, with its storage location"""
+    result = db.execute_query(f"""
+    SELECT {REPORT_JOB_COLUMNS}, storage, artifact_location
+    FROM report_jobs
+    WHERE schedule_id = %s AND status = 'completed'
+    ORDER BY id DESC
+    LIMIT 1
+    """, (schedule_id,))
+    return _job_response(result[0]) if result else None
+
+
+def _scheduler_loop():
+    scheduler_db = Database()
+    scheduler_db.connect()
+    try:
+        while not _stop.is_set():
+            try:
+                run_due_schedules(scheduler_db)
+            except Exception as e:
+                logger.error(f"❌ Report scheduler run failed: {e}")
+            _stop.wait(REPORT_SCHEDULER_POLL_SECONDS)
+    finally:
+        scheduler_db.disconnect()
+
+
+def start_report_scheduler():
+    """Start the scheduler thread (once per process)"""
+    global _thread
+    if not REPORT_SCHEDULER_ENABLED:
+        logger.info("🗓️ Report scheduler disabled (REPORT_SCHEDULER_ENABLED)")
+        return
+    if _thread and _thread.is_alive():
+        return
+
+    _stop.clear()
+    _thread = threading.Thread(target=_scheduler_loop, name='report-scheduler', daemon=True)
+    _thread.start()
+    logger.info(f"🗓️ Report scheduler started (every {REPORT_SCHEDULER_POLL_SECONDS}s)")
+
+
+def stop_report_scheduler():
+    _stop.set()
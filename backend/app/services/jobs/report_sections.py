@@ -0,0 +1,118 @@
+"""
+Report Sections
+===============
+Runs the independent parts of a large report at the same time
+
+A report declares its sections as name → function(db); every section runs on its
+own pooled connection in a worker thread, so the report takes as long as its
+slowest section instead of the sum of all of them. Results come back by name,
+together with per-section timings for the response metadata.
+
+- sections must not depend on each other's results - anything that does is
+  computed after run_report_sections() returns
+- each section runs inside use_connection(), so code that fetches its connection
+  with get_db() uses the section's connection as well
+- connections are reused between reports; at most REPORT_SECTION_WORKERS are open
+- REPORT_SECTION_WORKERS=0 runs the sections one after another on the caller's
+  connection (debugging / single-connection deployments)
+- concurrent sections read through separate connections, so they do not share one
+  snapshot - the same as the sequential queries they replace
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+import logging
+import os
+import queue
+import time
+
+from app.core.database import Database, get_db, use_connection
+
+logger = logging.getLogger(__name__)
+
+REPORT_SECTION_WORKERS = int(os.getenv('REPORT_SECTION_WORKERS', 4))
+
+_executor = (
+    ThreadPoolExecutor(max_workers=REPORT_SECTION_WORKERS, thread_name_prefix='report-section')
+    if REPORT_SECTION_WORKERS > 0 else None
+)
+
+# Idle section connections - a worker thread holds at most one at a time,
+# so the pool never grows past REPORT_SECTION_WORKERS
+_idle_connections = queue.LifoQueue()
+
+
+@contextmanager
+def pooled_connection():
+    """An idle section connection, or a new one; handed back afterwards"""
+    try:
+        connection = _idle_connections.get_nowait()
+    except queue.Empty:
+        connection = Database()
+        connection.connect()
+
+    try:
+        yield connection
+    finally:
+        if connection.connection and connection.connection.is_connected():
+            _idle_connections.put(connection)
+        else:
+            connection.disconnect()
+
+
+def query_section(query: str, params=None) -> Callable:
+    """Section that is a single query - returns its rows (SELECT) or row count"""
+    return lambda db: db.execute_query(query, params)
+
+
+def _timed(function: Callable, db) -> tuple:
+    started = time.perf_counter()
+    with use_connection(db):
+        result = function(db)
+    return result, int((time.perf_counter() - started) * 1000)
+
+
+def _run_pooled(function: Callable) -> tuple:
+    with pooled_connection() as db:
+        return _timed(function, db)
+
+
+def run_report_sections(sections: Dict[str, Callable], db: Optional[Database] = None) -> tuple:
+    """
+    Run the sections concurrently and wait for all of them
+    db is only used when sections run sequentially (REPORT_SECTION_WORKERS=0)
+    Returns (results, metadata):
+    - results: {section name: what its function returned}
+    - metadata: {'wall_time_ms', 'section_time_ms', 'sections': {name: time_ms}}
+    Raises the first failing section's error (in declaration order) once all have finished
+    """
+    started = time.perf_counter()
+    results = {}
+    timings = {}
+
+    if _executor is None:
+        db = db or get_db()
+        for name, function in sections.items():
+            results[name], timings[name] = _timed(function, db)
+    else:
+        futures = {name: _executor.submit(_run_pooled, function) for name, function in sections.items()}
+        wait(futures.values())
+
+        failed = None
+        for name, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                logger.error(f"❌ Report section '{name}' failed: {error}")
+                failed = failed or error
+                continue
+            results[name], timings[name] = future.result()
+        if failed:
+            raise failed
+
+    metadata = {
+        'wall_time_ms': int((time.perf_counter() - started) * 1000),
+        'section_time_ms': sum(timings.values()),
+        'sections': timings
+    }
+    return results, metadata
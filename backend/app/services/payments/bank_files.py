@@ -0,0 +1,345 @@
+"""
+Bank Payment Files
+==================
+Turns computed interest payouts into bulk-payment upload files (NEFT / RTGS)
+
+FLOW:
+- Payout rows come straight from the payout engine (iter_month_payouts)
+- Each row becomes one payment record: mode, beneficiary account / IFSC, amount ...
+- Records are written in the bank's layout (CSV or fixed width) into a zip,
+  starting a new file every `max_records` records
+- Rows that cannot be paid (no account, bad IFSC, zero amount) go to
+  exceptions.csv in the same zip; summary.csv lists every file with its totals
+
+Nothing is collected per payout except the rejected rows: the zip is streamed
+to the client while the payouts are still being calculated.
+
+Layouts are plain data in BANK_FILE_LAYOUTS - a bank with its own format is one
+more entry there (field order, widths, header / trailer).
+"""
+
+from datetime import date
+from typing import Optional
+import csv
+import io
+import re
+import tempfile
+import zipfile
+
+from app.utils.xlsx_stream import ChunkBuffer
+
+# RTGS is only for amounts of Rs. 2 lakh and above - smaller payments go by NEFT
+RTGS_MIN_AMOUNT_PAISE = 2_00_000_00
+
+BANK_FILE_DEFAULT_MAX_RECORDS = 5000
+BANK_FILE_MAX_RECORDS_LIMIT = 50000
+
+# Flush zipped bytes to the client every N records
+RECORDS_PER_FLUSH = 500
+
+IFSC_PATTERN = re.compile(r'^[A-Z]{4}0[A-Z0-9]{6}$')
+ACCOUNT_NUMBER_PATTERN = re.compile(r'^[0-9A-Z]{6,18}$')
+_ACCOUNT_SEPARATORS = re.compile(r'[\s-]')
+_UNSAFE_TEXT = re.compile(r'[\s|,"]+')
+
+# Rejected rows are spooled to a temp file once they pass this size
+EXCEPTIONS_SPOOL_BYTES = 1024 * 1024
+
+# Field kinds: 'text' (left aligned, padded with spaces), 'amount' (rupees with
+# 2 decimals; right aligned and zero padded in fixed width), 'date' (date_format)
+BANK_FILE_LAYOUTS = {
+    'neft_csv': {
+        'label': 'NEFT / RTGS bulk upload (CSV)',
+        'format': 'csv',
+        'extension': 'csv',
+        'header': True,
+        'date_format': '%d/%m/%Y',
+        'fields': [
+            ('Payment Mode', 'payment_mode', None, 'text'),
+            ('Beneficiary Account Number', 'account_number', None, 'text'),
+            ('IFSC Code', 'ifsc_code', None, 'text'),
+            ('Beneficiary Name', 'beneficiary_name', None, 'text'),
+            ('Amount', 'amount', None, 'amount'),
+            ('Value Date', 'value_date', None, 'date'),
+            ('Debit Account Number', 'debit_account', None, 'text'),
+            ('Customer Reference', 'reference', None, 'text'),
+            ('Remarks', 'remarks', None, 'text'),
+        ],
+    },
+    'neft_fixed': {
+        'label': 'NEFT / RTGS bulk upload (fixed width)',
+        'format': 'fixed',
+        'extension': 'txt',
+        'header': False,
+        'trailer': True,
+        'date_format': '%d%m%Y',
+        'fields': [
+            ('Payment Mode', 'payment_mode', 4, 'text'),
+            ('Debit Account Number', 'debit_account', 18, 'text'),
+            ('Beneficiary Account Number', 'account_number', 18, 'text'),
+            ('IFSC Code', 'ifsc_code', 11, 'text'),
+            ('Beneficiary Name', 'beneficiary_name', 35, 'text'),
+            ('Amount', 'amount', 15, 'amount'),
+            ('Value Date', 'value_date', 8, 'date'),
+            ('Customer Reference', 'reference', 20, 'text'),
+            ('Remarks', 'remarks', 30, 'text'),
+        ],
+    },
+}
+
+EXCEPTION_HEADERS = ['Investor ID', 'Investor Name', 'Series', 'Amount', 'Account Number', 'IFSC Code', 'Reason']
+SUMMARY_HEADERS = ['File', 'Records', 'NEFT Records', 'RTGS Records', 'Total Amount']
+
+
+def _clean_text(value) -> str:
+    """Bank files accept plain ASCII without separators or line breaks"""
+    text = str(value or '').encode('ascii', 'ignore').decode('ascii')
+    return _UNSAFE_TEXT.sub(' ', text).strip()
+
+
+def normalize_account_number(value) -> str:
+    """'1234 5678-90' → '1234567890' (also used to match bank statements). Blank / 'N/A' → ''"""
+    account_number = _ACCOUNT_SEPARATORS.sub('', str(value or '')).upper()
+    return '' if account_number == 'N/A' else account_number
+
+
+def amount_to_paise(amount) -> int:
+    """Rupees → whole paise, rounded the way the bank file writes them"""
+    return int(round(float(amount or 0) * 100))
+
+
+def _format_paise(paise: int) -> str:
+    return f"{paise // 100}.{paise % 100:02d}"
+
+
+def payment_reference(payout: dict, interest_year: int, interest_month: int) -> str:
+    """Unique per investment and month, so a re-uploaded file is recognisable: INT202603-0000123"""
+    return f"INT{interest_year}{interest_month:02d}-{payout['investment_id']:07d}"
+
+
+def build_payment_record(
+    payout: dict,
+    interest_year: int,
+    interest_month: int,
+    value_date: date,
+    debit_account: str = ''
+):
+    """
+    One payout → (record, None) or (None, reason it cannot be paid)
+    Amounts are kept in paise so file totals add up exactly
+    """
+    account_number = normalize_account_number(payout.get('bank_account_number'))
+    ifsc_code = str(payout.get('ifsc_code') or '').strip().upper().replace('N/A', '')
+    amount_paise = amount_to_paise(payout.get('amount'))
+
+    if not account_number:
+        return None, 'Missing bank account number'
+    if not ACCOUNT_NUMBER_PATTERN.match(account_number):
+        return None, 'Invalid bank account number'
+    if not ifsc_code:
+        return None, 'Missing IFSC code'
+    if not IFSC_PATTERN.match(ifsc_code):
+        return None, 'Invalid IFSC code'
+    if amount_paise <= 0:
+        return None, 'Amount is zero'
+
+    return {
+        'payment_mode': 'RTGS' if amount_paise >= RTGS_MIN_AMOUNT_PAISE else 'NEFT',
+        'account_number': account_number,
+        'ifsc_code': ifsc_code,
+        'beneficiary_name': _clean_text(payout.get('investor_name')),
+        'amount_paise': amount_paise,
+        'value_date': value_date,
+        'debit_account': _clean_text(debit_account),
+        'reference': payment_reference(payout, interest_year, interest_month),
+        'remarks': _clean_text(f"Interest {payout.get('series_name') or ''} {date(interest_year, interest_month, 1).strftime('%b %Y')}"),
+    }, None
+
+
+def _field_value(record: dict, key: str, kind: str, layout: dict) -> str:
+    if kind == 'amount':
+        return _format_paise(record['amount_paise'])
+    if kind == 'date':
+        return record[key].strftime(layout['date_format'])
+    # Text fields were cleaned by build_payment_record
+    return record.get(key) or ''
+
+
+def _fixed_width_line(values, fields) -> str:
+    parts = []
+    for value, (_, _, width, kind) in zip(values, fields):
+        if kind == 'amount':
+            parts.append(value.rjust(width, '0')[-width:])
+        else:
+            parts.append(value[:width].ljust(width))
+    return ''.join(parts)
+
+
+class _LayoutWriter:
+    """Formats records of one layout as text lines (header / records / trailer)"""
+
+    def __init__(self, layout: dict):
+        self.layout = layout
+        self.fields = layout['fields']
+
+    def _csv_line(self, values) -> str:
+        output = io.StringIO()
+        csv.writer(output, lineterminator='\r\n').writerow(values)
+        return output.getvalue()
+
+    def header(self) -> str:
+        if not self.layout.get('header'):
+            return ''
+        titles = [title for title, _, _, _ in self.fields]
+        if self.layout['format'] == 'csv':
+            return self._csv_line(titles)
+        return 'H' + ''.join(title[:width].ljust(width) for title, _, width, _ in self.fields) + '\r\n'
+
+    def record(self, record: dict) -> str:
+        values = [_field_value(record, key, kind, self.layout) for _, key, _, kind in self.fields]
+        if self.layout['format'] == 'csv':
+            return self._csv_line(values)
+        return _fixed_width_line(values, self.fields) + '\r\n'
+
+    def trailer(self, record_count: int, total_paise: int) -> str:
+        if not self.layout.get('trailer'):
+            return ''
+        # T + record count (9) + total amount (18)
+        return f"T{record_count:09d}{_format_paise(total_paise).rjust(18, '0')}\r\n"
+
+
+def stream_bank_payment_zip(
+    payouts,
+    interest_year: int,
+    interest_month: int,
+    layout_key: str,
+    value_date: date,
+    max_records: int = BANK_FILE_DEFAULT_MAX_RECORDS,
+    file_prefix: str = 'payouts',
+    debit_account: str = '',
+    totals: Optional[dict] = None
+):
+    """
+    Generator yielding the bytes of a zip of bank payment files
+
+    payouts: iterable of payout dicts from iter_month_payouts
+    totals:  optional dict filled in while streaming (files, record_count,
+             total_amount, exception_count) - read it after the generator finishes
+    """
+    layout = BANK_FILE_LAYOUTS[layout_key]
+    writer = _LayoutWriter(layout)
+
+    buffer = ChunkBuffer()
+    archive = zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED)
+
+    totals = totals if totals is not None else {}
+    totals.update({'files': 0, 'record_count': 0, 'total_amount': 0.0, 'exception_count': 0})
+
+    file_summaries = []
+    # Rejected rows: only one zip member can be open at a time, so they are
+    # collected in a spooled file (memory, then disk) and added at the end
+    exceptions_file = tempfile.SpooledTemporaryFile(max_size=EXCEPTIONS_SPOOL_BYTES, mode='w+', newline='', encoding='utf-8')
+    exceptions_writer = csv.writer(exceptions_file)
+    exceptions_writer.writerow(EXCEPTION_HEADERS)
+    exception_count = 0
+    current = None  # {'name', 'handle', 'count', 'neft', 'rtgs', 'paise'}
+    pending = []
+
+    def close_current():
+        nonlocal pending
+        pending.append(writer.trailer(current['count'], current['paise']))
+        current['handle'].write(''.join(pending).encode('ascii', 'ignore'))
+        pending = []
+        current['handle'].close()
+        file_summaries.append(current)
+
+    for payout in payouts:
+        record, reason = build_payment_record(payout, interest_year, interest_month, value_date, debit_account)
+        if reason:
+            exception_count += 1
+            exceptions_writer.writerow([
+                payout.get('investor_id'),
+                payout.get('investor_name'),
+                payout.get('series_name'),
+                payout.get('amount'),
+                payout.get('bank_account_number') or '',
+                payout.get('ifsc_code') or '',
+                reason
+            ])
+            continue
+
+        if current is None or current['count'] >= max_records:
+            if current is not None:
+                close_current()
+            name = f"{file_prefix}_{len(file_summaries) + 1:03d}.{layout['extension']}"
+            current = {
+                'name': name,
+                'handle': archive.open(name, mode='w', force_zip64=True),
+                'count': 0, 'neft': 0, 'rtgs': 0, 'paise': 0
+            }
+            pending.append(writer.header())
+
+        pending.append(writer.record(record))
+        current['count'] += 1
+        current['paise'] += record['amount_paise']
+        current['rtgs' if record['payment_mode'] == 'RTGS' else 'neft'] += 1
+
+        if len(pending) >= RECORDS_PER_FLUSH:
+            current['handle'].write(''.join(pending).encode('ascii', 'ignore'))
+            pending = []
+            data = buffer.drain()
+            if data:
+                yield data
+
+    if current is not None:
+        close_current()
+
+    record_count = sum(summary['count'] for summary in file_summaries)
+    total_paise = sum(summary['paise'] for summary in file_summaries)
+    summary_rows = [
+        [summary['name'], summary['count'], summary['neft'], summary['rtgs'], _format_paise(summary['paise'])]
+        for summary in file_summaries
+    ]
+    summary_rows.append([
+        'TOTAL',
+        record_count,
+        sum(summary['neft'] for summary in file_summaries),
+        sum(summary['rtgs'] for summary in file_summaries),
+        _format_paise(total_paise)
+    ])
+    archive.writestr('summary.csv', _csv_text(SUMMARY_HEADERS, summary_rows))
+
+    if exception_count:
+        exceptions_file.seek(0)
+        with archive.open('exceptions.csv', mode='w', force_zip64=True) as member:
+            member.write('\ufeff'.encode('utf-8'))
+            while True:
+                block = exceptions_file.read(64 * 1024)
+                if not block:
+                    break
+                member.write(block.encode('utf-8'))
+                data = buffer.drain()
+                if data:
+                    yield data
+    exceptions_file.close()
+    archive.close()
+
+    totals.update({
+        'files': len(file_summaries),
+        'record_count': record_count,
+        'total_amount': total_paise / 100,
+        'exception_count': exception_count
+    })
+
+    data = buffer.drain()
+    if data:
+        yield data
+
+
+def _csv_text(headers: list, rows: list) -> str:
+    output = io.StringIO()
+    output.write('\ufeff')
+    csv_writer = csv.writer(output)
+    csv_writer.writerow(headers)
+    csv_writer.writerows(rows)
+    return output.getvalue()
@@ -0,0 +1,416 @@
+"""
+Bank Statement Reconciliation
+=============================
+Matches bank statement lines to expected interest payouts so they can be marked Paid
+
+FLOW:
+- parse_statement() reads a CSV / Excel statement or an MT940-style file into
+  compact StatementLine tuples (account, amount in paise, value date, reference)
+- build_expected_index() hashes the expected payouts on
+  (account number, amount in paise) - one pass over the payouts
+- match_statement() probes that index once per line and keeps the candidates
+  whose payout date is within the value-date window - one pass over the lines
+
+Both passes are linear, so hundreds of thousands of lines reconcile in seconds.
+
+A line matches when exactly one open candidate is left, or when its reference /
+narration contains the candidate's payment reference (INT202603-0000123, written
+by the bank payment files). Identical candidates (same account, amount and date)
+are matched in order when the statement has exactly as many lines for them.
+Everything else is an exception: unmatched, ambiguous or duplicate.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple, Optional
+import csv
+import io
+import re
+
+from app.services.payments.bank_files import amount_to_paise, normalize_account_number
+
+RECONCILIATION_DEFAULT_WINDOW_DAYS = 3
+RECONCILIATION_MAX_WINDOW_DAYS = 15
+
+# Statement column headings (case-insensitive) → field
+STATEMENT_COLUMN_ALIASES = {
+    'account_number': [
+        'account number', 'account no', 'account no.', 'beneficiary account', 'beneficiary account number',
+        'beneficiary account no', 'credit account', 'credit account number', 'bene account no'
+    ],
+    'amount': [
+        'amount', 'transaction amount', 'txn amount', 'debit', 'debit amount', 'withdrawal',
+        'withdrawal amount', 'credit', 'credit amount', 'instrument amount'
+    ],
+    'value_date': ['value date', 'transaction date', 'txn date', 'date', 'posting date', 'payment date'],
+    'reference': ['reference', 'reference no', 'ref no', 'ref no.', 'utr', 'utr number', 'utr no',
+                  'customer reference', 'cheque/ref no', 'chq/ref no'],
+    'narration': ['narration', 'description', 'remarks', 'particulars', 'details'],
+}
+
+STATEMENT_DATE_FORMATS = ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d', '%d-%b-%Y', '%d-%b-%y', '%d/%m/%y', '%d.%m.%Y', '%d %b %Y']
+
+PAYMENT_REFERENCE_PATTERN = re.compile(r'INT\d{6}-\d{7}')
+# :61:YYMMDD[MMDD]D/C[funds code]amount,decimals ...
+MT940_STATEMENT_LINE = re.compile(r'^:61:(\d{6})(\d{4})?(R?[DC])[A-Z]?(\d+,\d{0,2})')
+MT940_ACCOUNT_IN_NARRATIVE = re.compile(r'\b(?:A/?C|ACCOUNT|BENE(?:FICIARY)?)\D{0,15}([0-9]{6,18})\b', re.IGNORECASE)
+
+EXCEPTION_REPORT_HEADERS = [
+    'Line', 'Account Number', 'Amount', 'Value Date', 'Reference', 'Reason', 'Candidates'
+]
+
+
+class StatementLine(NamedTuple):
+    line_number: int
+    account_number: str
+    amount_paise: int
+    value_date: Optional[date]
+    reference: str
+
+
+class ExpectedPayout(NamedTuple):
+    investor_code: str
+    series_id: int
+    interest_year: int
+    interest_month: int
+    payout_date: date
+    payout_date_str: str
+    amount: float
+    status: str
+    reference: str
+
+
+def _parse_amount_paise(value) -> Optional[int]:
+    """'1,23,456.70 Dr' / 'Rs.1234.5' / 1234.5 → paise (absolute value), None if not a number"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return abs(amount_to_paise(value))
+    text = re.sub(r'(?i)rs\.|[^0-9.\-]', '', str(value))
+    if not text or text in ('-', '.'):
+        return None
+    try:
+        return abs(int((Decimal(text) * 100).quantize(Decimal('1'))))
+    except InvalidOperation:
+        return None
+
+
+class _DateParser:
+    """Statements repeat a handful of dates - parse each distinct text once"""
+
+    def __init__(self):
+        self._cache = {}
+
+    def __call__(self, value) -> Optional[date]:
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        text = str(value or '').strip()
+        if text not in self._cache:
+            parsed = None
+            for date_format in STATEMENT_DATE_FORMATS:
+                try:
+                    parsed = datetime.strptime(text, date_format).date()
+                    break
+                except ValueError:
+                    continue
+            self._cache[text] = parsed
+        return self._cache[text]
+
+
+def _is_mt940(text: str) -> bool:
+    return ':61:' in text and (':20:' in text or ':25:' in text or ':60F:' in text)
+
+
+def _parse_mt940(text: str):
+    """
+    MT940-style statement: each :61: statement line (value date, D/C, amount)
+    followed by an optional :86: narrative holding the beneficiary account / reference
+    """
+    lines = []
+    errors = []
+    current = None
+
+    def finish():
+        if current is None:
+            return
+        narrative = ' '.join(current['narrative'])
+        account_match = MT940_ACCOUNT_IN_NARRATIVE.search(narrative)
+        lines.append(StatementLine(
+            current['line_number'],
+            normalize_account_number(account_match.group(1)) if account_match else '',
+            current['amount_paise'],
+            current['value_date'],
+            f"{current['reference']} {narrative}".strip()
+        ))
+
+    in_narrative = False
+    for line_number, raw_line in enumerate(text.splitlines(), start=1):
+        line = raw_line.strip()
+        if line.startswith(':61:'):
+            finish()
+            current = None
+            in_narrative = False
+            match = MT940_STATEMENT_LINE.match(line)
+            if not match:
+                errors.append({'line': line_number, 'error': 'Unreadable :61: statement line'})
+                continue
+            if match.group(3) != 'D':
+                # Receipts and reversals - payouts are debits
+                continue
+            rupees, _, paise = match.group(4).partition(',')
+            current = {
+                'line_number': line_number,
+                'value_date': datetime.strptime(match.group(1), '%y%m%d').date(),
+                'amount_paise': int(rupees) * 100 + int(paise.ljust(2, '0')),
+                'reference': line[match.end():].strip(),
+                'narrative': []
+            }
+        elif line.startswith(':86:') and current is not None:
+            in_narrative = True
+            current['narrative'].append(line[4:].strip())
+        elif line.startswith(':'):
+            in_narrative = False
+        elif in_narrative and current is not None:
+            current['narrative'].append(line)
+
+    finish()
+    return lines, errors
+
+
+def _iter_table_rows(contents: bytes, filename: str):
+    lower_name = (filename or '').lower()
+    if lower_name.endswith('.xlsx'):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(io.BytesIO(contents), read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    else:
+        text = contents.decode('utf-8-sig', errors='replace')
+        yield from csv.reader(io.StringIO(text))
+
+
+def _parse_table(contents: bytes, filename: str):
+    """CSV / Excel statement - the heading row is the first row naming an amount and a date column"""
+    lines = []
+    errors = []
+    parse_date = _DateParser()
+    columns = None
+
+    for line_number, values in enumerate(_iter_table_rows(contents, filename), start=1):
+        if not values or all(value is None or str(value).strip() == '' for value in values):
+            continue
+
+        if columns is None:
+            headings = [str(value or '').strip().lower() for value in values]
+            # Aliases are in order of preference ('Value Date' before 'Transaction Date')
+            found = {}
+            for field, aliases in STATEMENT_COLUMN_ALIASES.items():
+                for alias in aliases:
+                    if alias in headings:
+                        found[field] = headings.index(alias)
+                        break
+            if 'amount' in found and 'value_date' in found:
+                columns = found
+            continue
+
+        def cell(field):
+            index = columns.get(field)
+            return values[index] if index is not None and index < len(values) else None
+
+        amount_paise = _parse_amount_paise(cell('amount'))
+        value_date = parse_date(cell('value_date'))
+        if not amount_paise:
+            # Opening / closing balance rows and blank amount columns
+            continue
+        if value_date is None:
+            errors.append({'line': line_number, 'error': f"Invalid value date '{cell('value_date')}'"})
+            continue
+
+        reference = ' '.join(str(cell(field) or '').strip() for field in ('reference', 'narration')).strip()
+        lines.append(StatementLine(
+            line_number,
+            normalize_account_number(cell('account_number')),
+            amount_paise,
+            value_date,
+            reference
+        ))
+
+    if columns is None:
+        raise ValueError("Could not find the statement columns. Expected at least 'Amount' and 'Value Date' headings")
+
+    return lines, errors
+
+
+def parse_statement(contents: bytes, filename: str):
+    """
+    Statement file → (lines, errors)
+    .csv / .xlsx tables (column names from STATEMENT_COLUMN_ALIASES) or MT940-style text
+    errors: [{'line', 'error'}] for lines that could not be read
+    """
+    lower_name = (filename or '').lower()
+    if not lower_name.endswith('.xlsx'):
+        text = contents.decode('utf-8-sig', errors='replace')
+        if lower_name.endswith(('.sta', '.mt940', '.940', '.txt')) or _is_mt940(text):
+            return _parse_mt940(text)
+    return _parse_table(contents, filename)
+
+
+def statement_interest_months(lines, window_days: int):
+    """
+    Interest (year, month) pairs whose payouts can appear in the statement
+    Interest for month M is paid in M + 1, so the value-date range is shifted back a month
+    """
+    dates = [line.value_date for line in lines if line.value_date]
+    if not dates:
+        return []
+
+    first = min(dates) - timedelta(days=window_days)
+    last = max(dates) + timedelta(days=window_days)
+
+    months = []
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        interest_year, interest_month = (year - 1, 12) if month == 1 else (year, month - 1)
+        months.append((interest_year, interest_month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def build_expected_index(payouts_by_month):
+    """
+    payouts_by_month: iterable of (interest_year, interest_month, payouts iterable)
+    Returns {(account number, amount in paise): [ExpectedPayout, ...]}
+    Payouts without a bank account number cannot be matched and are left out
+    """
+    index = {}
+    date_cache = {}
+
+    for interest_year, interest_month, payouts in payouts_by_month:
+        for payout in payouts:
+            account_number = normalize_account_number(payout.get('bank_account_number'))
+            if not account_number:
+                continue
+
+            payout_date_str = payout['interest_date']
+            payout_date = date_cache.get(payout_date_str)
+            if payout_date is None:
+                payout_date = datetime.strptime(payout_date_str, '%d-%b-%Y').date()
+                date_cache[payout_date_str] = payout_date
+
+            key = (account_number, amount_to_paise(payout['amount']))
+            index.setdefault(key, []).append(ExpectedPayout(
+                payout['investor_id'],
+                payout['series_id'],
+                interest_year,
+                interest_month,
+                payout_date,
+                payout_date_str,
+                payout['amount'],
+                payout['status'],
+                f"INT{interest_year}{interest_month:02d}-{payout['investment_id']:07d}"
+            ))
+
+    return index
+
+
+def match_statement(lines, index: dict, window_days: int = RECONCILIATION_DEFAULT_WINDOW_DAYS):
+    """
+    Hash join of statement lines against build_expected_index()
+
+    Returns (matches, exceptions):
+    - matches:    [(StatementLine, ExpectedPayout)]
+    - exceptions: [{'line', 'account_number', 'amount', 'value_date', 'reference', 'reason', 'candidates'}]
+    """
+    window = timedelta(days=window_days)
+    matches = []
+    exceptions = []
+    consumed = set()  # id() of matched ExpectedPayouts
+    ambiguous = {}    # bucket key → [(line, open candidates)]
+
+    def exception(line, reason, candidates=0):
+        exceptions.append({
+            'line': line.line_number,
+            'account_number': line.account_number,
+            'amount': line.amount_paise / 100,
+            'value_date': line.value_date.isoformat() if line.value_date else None,
+            'reference': line.reference,
+            'reason': reason,
+            'candidates': candidates
+        })
+
+    for line in lines:
+        if not line.account_number:
+            exception(line, 'No beneficiary account number on the statement line')
+            continue
+
+        bucket = index.get((line.account_number, line.amount_paise))
+        if not bucket:
+            exception(line, 'No expected payout for this account and amount')
+            continue
+
+        in_window = [
+            candidate for candidate in bucket
+            if abs(candidate.payout_date - line.value_date) <= window
+        ]
+        if not in_window:
+            exception(line, f"No expected payout within {window_days} days of the value date", len(bucket))
+            continue
+
+        open_candidates = [candidate for candidate in in_window if id(candidate) not in consumed]
+        if not open_candidates:
+            exception(line, 'Duplicate - the expected payout was already matched by another line', len(in_window))
+            continue
+
+        referenced = [candidate for candidate in open_candidates if candidate.reference in line.reference]
+        if len(referenced) == 1:
+            chosen = referenced[0]
+        elif len(open_candidates) == 1:
+            chosen = open_candidates[0]
+        else:
+            ambiguous.setdefault((line.account_number, line.amount_paise), []).append((line, open_candidates))
+            continue
+
+        consumed.add(id(chosen))
+        matches.append((line, chosen))
+
+    # Several identical candidates: if the statement pays exactly that many, every one of them was paid
+    for bucket_lines in ambiguous.values():
+        open_candidates = []
+        seen = set()
+        for _, candidates in bucket_lines:
+            for candidate in candidates:
+                if id(candidate) not in consumed and id(candidate) not in seen:
+                    seen.add(id(candidate))
+                    open_candidates.append(candidate)
+
+        if len(open_candidates) == len(bucket_lines):
+            open_candidates.sort(key=lambda candidate: (candidate.payout_date, candidate.reference))
+            for (line, _), candidate in zip(sorted(bucket_lines, key=lambda item: item[0].value_date), open_candidates):
+                consumed.add(id(candidate))
+                matches.append((line, candidate))
+        else:
+            for line, candidates in bucket_lines:
+                exception(line, f"Ambiguous - {len(candidates)} expected payouts match this line", len(candidates))
+
+    matches.sort(key=lambda match: match[0].line_number)
+    exceptions.sort(key=lambda row: row['line'])
+    return matches, exceptions
+
+
+def exception_report_rows(exceptions: list):
+    """Exception dicts → rows for EXCEPTION_REPORT_HEADERS"""
+    for row in exceptions:
+        yield [
+            row['line'],
+            row['account_number'],
+            row['amount'],
+            row['value_date'],
+            row['reference'],
+            row['reason'],
+            row['candidates']
+        ]
@@ -0,0 +1,274 @@
+"""
+Columnar Exports
+================
+Full / incremental dataset pulls as typed, compressed columnar files for analytics
+
+- formats: Parquet (zstd) or Arrow IPC file (zstd) - amounts stay DECIMAL(15,2),
+  dates / timestamps stay dates / timestamps, flags are booleans
+- rows stream from an unbuffered cursor and are written EXPORT_ROW_GROUP_SIZE at a
+  time (one Parquet row group / Arrow record batch each) - memory stays flat
+- incremental: pass the watermark returned by the previous export as `since`
+  - updated_at datasets: rows changed at or after it (read back with
+    EXPORT_WATERMARK_OVERLAP_SECONDS of overlap for late commits - a row can
+    appear in two consecutive exports, consumers upsert by id)
+  - append-only datasets (communication_history has no updated_at and is never
+    updated): rows with a higher id
+- identity document numbers (PAN / Aadhaar) and bank account numbers are not exported
+
+pyarrow (requirements.txt) is imported only when an export runs, so a server
+without it still starts - columnar_export_available() tells whether it is there.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+EXPORT_ROW_GROUP_SIZE = int(os.getenv('EXPORT_ROW_GROUP_SIZE', 50000))
+
+EXPORT_WATERMARK_OVERLAP_SECONDS = 5
+
+# format → (file extension, media type)
+COLUMNAR_EXPORT_FORMATS = {
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('arrow', 'application/vnd.apache.arrow.file'),
+}
+
+# dataset → source table, watermark ('updated_at' or 'id') and exported columns
+# column types: int, decimal (15,2), date, datetime, bool, string
+EXPORT_DATASETS = {
+    'investors': {
+        'table': 'investors',
+        'watermark': 'updated_at',
+        'columns': (
+            ('id', 'int'),
+            ('investor_id', 'string'),
+            ('full_name', 'string'),
+            ('email', 'string'),
+            ('phone', 'string'),
+            ('dob', 'date'),
+            ('occupation', 'string'),
+            ('source_of_funds', 'string'),
+            ('kyc_status', 'string'),
+            ('bank_name', 'string'),
+            ('ifsc_code', 'string'),
+            ('nominee_name', 'string'),
+            ('nominee_relationship', 'string'),
+            ('total_investment', 'decimal'),
+            ('is_active', 'bool'),
+            ('status', 'string'),
+            ('date_joined', 'datetime'),
+            ('created_at', 'datetime'),
+            ('updated_at', 'datetime'),
+        ),
+    },
+    'investments': {
+        'table': 'investments',
+        'watermark': 'updated_at',
+        'columns': (
+            ('id', 'int'),
+            ('investor_id', 'int'),
+            ('series_id', 'int'),
+            ('amount', 'decimal'),
+            ('date_transferred', 'date'),
+            ('date_received', 'date'),
+            ('exit_date', 'date'),
+            ('status', 'string'),
+            ('created_at', 'datetime'),
+            ('updated_at', 'datetime'),
+        ),
+    },
+    'interest_payouts': {
+        'table': 'interest_payouts',
+        'watermark': 'updated_at',
+        'columns': (
+            ('id', 'int'),
+            ('investor_id', 'int'),
+            ('series_id', 'int'),
+            ('payout_month', 'string'),
+            ('payout_period', 'date'),
+            ('payout_date', 'string'),
+            ('amount', 'decimal'),
+            ('status', 'string'),
+            ('paid_date', 'date'),
+            ('is_active', 'bool'),
+            ('created_at', 'datetime'),
+            ('updated_at', 'datetime'),
+        ),
+    },
+    'communication_history': {
+        'table': 'communication_history',
+        'watermark': 'id',
+        'columns': (
+            ('id', 'int'),
+            ('type', 'string'),
+            ('recipient_name', 'string'),
+            ('recipient_contact', 'string'),
+            ('investor_id', 'string'),
+            ('series_name', 'string'),
+            ('subject', 'string'),
+            ('message', 'string'),
+            ('status', 'string'),
+            ('error_message', 'string'),
+            ('message_id', 'string'),
+            ('sent_by', 'string'),
+            ('sent_by_role', 'string'),
+            ('sent_at', 'datetime'),
+            ('created_at', 'datetime'),
+        ),
+    },
+}
+
+
+def columnar_export_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _arrow_schema(spec: dict):
+    import pyarrow as pa
+
+    types = {
+        'int': pa.int64(),
+        'decimal': pa.decimal128(15, 2),
+        'date': pa.date32(),
+        'datetime': pa.timestamp('s'),
+        'bool': pa.bool_(),
+        'string': pa.string(),
+    }
+    return pa.schema([(column, types[kind]) for column, kind in spec['columns']])
+
+
+def parse_export_watermark(dataset: str, since: Optional[str]):
+    """Watermark string → datetime (updated_at datasets) or int (id datasets); ValueError if invalid"""
+    if dataset not in EXPORT_DATASETS:
+        raise ValueError(f"Unknown dataset '{dataset}'. Must be one of: {', '.join(EXPORT_DATASETS)}")
+    if since is None or not str(since).strip():
+        return None
+
+    if EXPORT_DATASETS[dataset]['watermark'] == 'id':
+        try:
+            return int(since)
+        except ValueError:
+            raise ValueError(f"Invalid watermark '{since}' - {dataset} exports use the last exported id")
+
+    try:
+        return datetime.fromisoformat(str(since).strip())
+    except ValueError:
+        raise ValueError(f"Invalid watermark '{since}' - expected a timestamp like 2026-10-18T09:30:00")
+
+
+def _export_query(db, dataset: str, since) -> tuple:
+    """(query, params, next watermark) - the watermark is read before any row is"""
+    spec = EXPORT_DATASETS[dataset]
+    columns = ', '.join(column for column, _ in spec['columns'])
+    conditions = []
+    params = []
+
+    if spec['watermark'] == 'id':
+        watermark = db.execute_query(f"SELECT COALESCE(MAX(id), 0) AS last_id FROM {spec['table']}")[0]['last_id']
+        conditions.append("id <= %s")
+        params.append(watermark)
+        if since is not None:
+            conditions.append("id > %s")
+            params.append(since)
+    else:
+        watermark = db.execute_query("SELECT NOW() AS now")[0]['now']
+        if since is not None:
+            conditions.append("updated_at >= %s")
+            params.append(since - timedelta(seconds=EXPORT_WATERMARK_OVERLAP_SECONDS))
+
+    query = f"SELECT {columns} FROM {spec['table']}"
+    if conditions:
+        query += f" WHERE {' AND '.join(conditions)}"
+    query += " ORDER BY id"
+    return query, tuple(params), watermark
+
+
+def write_columnar_export(db, dataset: str, file_format: str, path: Path, since=None,
+                          row_group_size: Optional[int] = None) -> dict:
+    """
+    Stream the dataset (rows after `since`, or all) into path
+    Returns {'row_count', 'row_groups', 'watermark', 'size_bytes', 'export_time_ms'}
+    watermark is what the next incremental export passes as `since`
+    """
+    import pyarrow as pa
+
+    if file_format not in COLUMNAR_EXPORT_FORMATS:
+        raise ValueError(f"Invalid format '{file_format}'. Must be one of: {', '.join(COLUMNAR_EXPORT_FORMATS)}")
+
+    started = time.perf_counter()
+    spec = EXPORT_DATASETS[dataset]
+    schema = _arrow_schema(spec)
+    bool_columns = [column for column, kind in spec['columns'] if kind == 'bool']
+    row_group_size = row_group_size or EXPORT_ROW_GROUP_SIZE
+
+    query, params, watermark = _export_query(db, dataset, since)
+
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(str(path), schema, compression='zstd')
+        write = lambda batch: writer.write_table(pa.Table.from_batches([batch]), row_group_size=row_group_size)
+    else:
+        writer = pa.ipc.new_file(str(path), schema, options=pa.ipc.IpcWriteOptions(compression='zstd'))
+        write = writer.write_batch
+
+    row_count = 0
+    row_groups = 0
+    rows = []
+
+    def flush():
+        nonlocal row_groups
+        for row in rows:
+            for column in bool_columns:
+                if row[column] is not None:
+                    row[column] = bool(row[column])
+        write(pa.RecordBatch.from_pylist(rows, schema=schema))
+        row_groups += 1
+        rows.clear()
+
+    try:
+        for row in db.iter_query(query, params):
+            rows.append(row)
+            row_count += 1
+            if len(rows) >= row_group_size:
+                flush()
+        if rows:
+            flush()
+    finally:
+        writer.close()
+
+    export_time_ms = int((time.perf_counter() - started) * 1000)
+    size_bytes = Path(path).stat().st_size
+    logger.info(
+        f"📦 Exported {row_count} {dataset} rows as {file_format} "
+        f"({row_groups} row groups, {size_bytes} bytes) in {export_time_ms} ms"
+    )
+
+    return {
+        'row_count': row_count,
+        'row_groups': row_groups,
+        'watermark': watermark.isoformat() if isinstance(watermark, datetime) else str(watermark),
+        'size_bytes': size_bytes,
+        'export_time_ms': export_time_ms
+    }
+
+
+def run_columnar_export(dataset: str, file_format: str, path: Path, since=None) -> dict:
+    """write_columnar_export() on its OWN connection (runs in a worker thread)"""
+    from app.core.database import Database
+
+    export_db = Database()
+    export_db.connect()
+    try:
+        return write_columnar_export(export_db, dataset, file_format, path, since)
+    finally:
+        export_db.disconnect()
@@ -0,0 +1,125 @@
+"""
+Report Artifacts
+================
+Files produced by background report jobs, kept on local disk or in S3
+
+REPORT_ARTIFACT_STORAGE=local (default) writes under REPORT_ARTIFACT_DIR
+(default backend/generated/reports). REPORT_ARTIFACT_STORAGE=s3 uploads to
+the document bucket under reports/ - the S3 service is only loaded then.
+
+Workers render into a staging file first; store_report_artifact() moves or
+uploads it, so a half-written file is never visible to a download.
+"""
+
+from pathlib import Path
+from typing import Iterator
+import logging
+import os
+import uuid
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_CHUNK_SIZE = 1024 * 1024
+S3_ARTIFACT_PREFIX = 'reports'
+
+
+def report_artifact_storage() -> str:
+    from app.core.config import settings
+
+    storage = (settings.report_artifact_storage or 'local').strip().lower()
+    if storage not in ('local', 's3'):
+        raise ValueError(f"Invalid REPORT_ARTIFACT_STORAGE '{storage}'. Must be 'local' or 's3'")
+    return storage
+
+
+def report_artifact_dir() -> Path:
+    from app.core.config import settings, BACKEND_DIR
+
+    directory = Path(settings.report_artifact_dir) if settings.report_artifact_dir else BACKEND_DIR / 'generated' / 'reports'
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def staging_path(file_name: str) -> Path:
+    """A fresh local path to render into before the file is stored"""
+    directory = report_artifact_dir() / 'staging'
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{uuid.uuid4().hex}-{file_name}"
+
+
+def _s3():
+    from app.services.storage.s3_service import s3_service
+
+    if not s3_service:
+        raise ValueError("S3 Service not initialized - set the AWS_* variables or use REPORT_ARTIFACT_STORAGE=local")
+    return s3_service
+
+
+def store_report_artifact(source: Path, relative_name: str, content_type: str) -> dict:
+    """
+    Move / upload a rendered file to its final place
+    Returns {'storage', 'location', 'size_bytes'} - location is a path or an S3 key
+    """
+    size_bytes = source.stat().st_size
+    storage = report_artifact_storage()
+
+    if storage == 's3':
+        s3 = _s3()
+        key = f"{S3_ARTIFACT_PREFIX}/{relative_name}"
+        try:
+            s3.s3_client.upload_file(
+                str(source),
+                s3.bucket_name,
+                key,
+                ExtraArgs={'ContentType': content_type, 'ServerSideEncryption': 'AES256'}
+            )
+        finally:
+            source.unlink(missing_ok=True)
+        logger.info(f"📤 Stored report artifact in S3: {key} ({size_bytes} bytes)")
+        return {'storage': 's3', 'location': key, 'size_bytes': size_bytes}
+
+    target = report_artifact_dir() / relative_name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, target)
+    return {'storage': 'local', 'location': str(target), 'size_bytes': size_bytes}
+
+
+def report_artifact_exists(storage: str, location: str) -> bool:
+    if not location:
+        return False
+    if storage == 's3':
+        return _s3().check_file_exists(location)
+    return Path(location).is_file()
+
+
+def iter_report_artifact(storage: str, location: str, chunk_size: int = ARTIFACT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the stored file in chunks (for StreamingResponse)"""
+    if storage == 's3':
+        s3 = _s3()
+        body = s3.s3_client.get_object(Bucket=s3.bucket_name, Key=location)['Body']
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+        return
+
+    with open(location, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def delete_report_artifact(storage: str, location: str) -> bool:
+    if not location:
+        return False
+    try:
+        if storage == 's3':
+            success, _ = _s3().delete_file(location)
+            return success
+        Path(location).unlink(missing_ok=True)
+        return True
+    except Exception as e:
+        logger.error(f"❌ Could not delete report artifact {location}: {e}")
+        return False
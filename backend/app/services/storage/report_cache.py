@@ -0,0 +1,271 @@
+"""
+Report Cache
+============
+Rendered report files (CSV / xlsx / JSON / PDF) served again while the data behind them is unchanged
+
+KEY: sha256 of report key + normalized filters + format + renderer + data fingerprint + today's date
+- renderer: which code laid the file out - report jobs write the generic flattened
+  tables ('report'), the /reports/download/* endpoints their own designed sheets
+  ('layout'); the same report and format from the two must not be served for each other
+- data fingerprint: highest id and latest change time of every table the report
+  reads (REPORT_SOURCE_TABLES) - an insert or update changes it. Both are read off
+  an index end (primary key, idx_updated_at), so the cost does not grow with the
+  table. Rows are never hard-deleted (soft deletes via status / is_active are
+  updates), so no row count is needed
+- today's date: reports are relative to "today" (current month, next 90 days ...),
+  so an entry never outlives the day it was generated on
+
+Files are kept through report_artifacts (local disk or S3) and tracked in the
+report_cache table. Least recently used entries are evicted once the total size
+exceeds REPORT_CACHE_MAX_MB. A cache hit in a report job points the job at the
+cached file, so an evicted entry's file is only deleted when no report_jobs row
+still refers to it.
+
+The cache never breaks a report: lookup / store errors are logged and the report
+is simply generated as if nothing was cached.
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Optional
+import hashlib
+import json
+import logging
+import os
+
+from app.services.storage.report_artifacts import (
+    store_report_artifact,
+    report_artifact_exists,
+    delete_report_artifact
+)
+
+logger = logging.getLogger(__name__)
+
+REPORT_CACHE_MAX_MB = int(os.getenv('REPORT_CACHE_MAX_MB', 512))
+
+# Data changed less than this many seconds ago is not cached - updated_at only has
+# one-second resolution, so a change in the same second would not move the fingerprint
+REPORT_CACHE_SETTLE_SECONDS = 2
+
+EVICTION_BATCH_SIZE = 100
+
+# table → column holding the last change time, indexed (None: append-only or no such column)
+TABLE_CHANGE_COLUMNS = {
+    'investors': 'updated_at',
+    'investments': 'updated_at',
+    'interest_payouts': 'updated_at',
+    'ncd_series': 'updated_at',
+    'series_compliance_status': 'updated_at',
+    'grievances': 'updated_at',
+    'investor_series': 'updated_at',
+    'users': 'updated_at',
+    'investor_documents': 'uploaded_at',
+    'series_documents': 'uploaded_at',
+    'compliance_master_items': None,
+    'audit_logs': None,
+}
+
+# report key → tables its numbers come from
+REPORT_SOURCE_TABLES = {
+    'monthly-collection': ('investments', 'investors', 'ncd_series', 'interest_payouts'),
+    'payout-statement': ('investments', 'investors', 'ncd_series', 'interest_payouts'),
+    'series-performance': ('investments', 'investors', 'ncd_series', 'series_compliance_status'),
+    'investor-portfolio': ('investments', 'investors', 'ncd_series', 'interest_payouts', 'grievances'),
+    'kyc-status': ('investors', 'investor_documents'),
+    'new-investors': ('investments', 'investors', 'ncd_series', 'interest_payouts', 'investor_documents'),
+    'rbi-compliance': (
+        'investments', 'investors', 'ncd_series', 'interest_payouts',
+        'series_compliance_status', 'compliance_master_items', 'series_documents'
+    ),
+    'sebi-disclosure': (
+        'investments', 'investors', 'ncd_series', 'interest_payouts',
+        'series_compliance_status', 'compliance_master_items', 'grievances'
+    ),
+    'audit-trail': ('investments', 'investors', 'ncd_series', 'interest_payouts'),
+    'daily-activity': ('audit_logs', 'users'),
+    'subscription-trend-analysis': ('investments', 'investors', 'ncd_series', 'investor_series'),
+    'series-maturity': ('investments', 'investors', 'ncd_series'),
+}
+
+
+def data_fingerprint(db, report_key: str) -> Optional[str]:
+    """
+    Hash of the state of the report's source tables (one query, index lookups only)
+    None when the report is not cacheable right now (unknown report / data just changed)
+    """
+    tables = REPORT_SOURCE_TABLES.get(report_key)
+    if not tables:
+        return None
+
+    columns = ['NOW() AS checked_at']
+    for table in tables:
+        columns.append(f"(SELECT MAX(id) FROM {table}) AS `{table}.max_id`")
+        change_column = TABLE_CHANGE_COLUMNS.get(table)
+        if change_column:
+            columns.append(f"(SELECT MAX({change_column}) FROM {table}) AS `{table}.changed`")
+
+    state = db.execute_query(f"SELECT {', '.join(columns)}")[0]
+    checked_at = state.pop('checked_at')
+
+    for name, changed in state.items():
+        if name.endswith('.changed') and changed:
+            if abs((checked_at - changed).total_seconds()) < REPORT_CACHE_SETTLE_SECONDS:
+                return None
+
+    return hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def report_cache_key(db, report_key: str, file_format: str, filters: Optional[dict],
+                     renderer: str = 'report') -> Optional[str]:
+    """Cache key for this report / filters / format / renderer over the current data (None: don't cache)"""
+    try:
+        fingerprint = data_fingerprint(db, report_key)
+    except Exception as e:
+        logger.warning(f"⚠️ Report cache fingerprint failed for {report_key}: {e}")
+        return None
+
+    if not fingerprint:
+        return None
+
+    key_source = {
+        'report': report_key,
+        'format': file_format,
+        'renderer': renderer,
+        'filters': {name: value for name, value in (filters or {}).items() if value not in (None, '')},
+        'data': fingerprint,
+        'day': date.today().isoformat(),
+    }
+    return hashlib.sha256(json.dumps(key_source, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def lookup_report_cache(db, cache_key: Optional[str]) -> Optional[dict]:
+    """Cached entry for the key (and mark it used), or None"""
+    if not cache_key:
+        return None
+
+    try:
+        result = db.execute_query("""
+        SELECT cache_key, report_key, report_name, file_format, file_name, storage,
+               artifact_location, size_bytes, record_count, page_count, generation_time_ms, hit_count
+        FROM report_cache
+        WHERE cache_key = %s
+        """, (cache_key,))
+        if not result:
+            return None
+
+        entry = result[0]
+        if not report_artifact_exists(entry['storage'], entry['artifact_location']):
+            logger.warning(f"⚠️ Cached report file is gone, dropping entry: {entry['artifact_location']}")
+            db.execute_query("DELETE FROM report_cache WHERE cache_key = %s", (cache_key,))
+            return None
+
+        db.execute_query("""
+        UPDATE report_cache
+        SET hit_count = hit_count + 1, last_accessed_at = NOW(3)
+        WHERE cache_key = %s
+        """, (cache_key,))
+        return entry
+
+    except Exception as e:
+        logger.warning(f"⚠️ Report cache lookup failed: {e}")
+        return None
+
+
+def store_report_cache(db, cache_key: Optional[str], report_key: str, report_name: str, file_format: str,
+                       filters: Optional[dict], file_name: str, stored: dict, record_count: int,
+                       generation_time_ms: int, page_count: Optional[int] = None) -> bool:
+    """Register an already stored artifact under the key; returns False if it was not cached"""
+    if not cache_key:
+        return False
+
+    try:
+        inserted = db.execute_query("""
+        INSERT IGNORE INTO report_cache (
+            cache_key, report_key, report_name, file_format, report_filters, file_name,
+            storage, artifact_location, size_bytes, record_count, page_count, generation_time_ms,
+            last_accessed_at
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(3))
+        """, (
+            cache_key,
+            report_key,
+            report_name,
+            file_format,
+            json.dumps(filters) if filters else None,
+            file_name,
+            stored['storage'],
+            stored['location'],
+            stored['size_bytes'],
+            record_count,
+            page_count,
+            generation_time_ms
+        ))
+
+        evict_report_cache(db)
+        return bool(inserted)
+
+    except Exception as e:
+        logger.warning(f"⚠️ Could not cache report {report_name}: {e}")
+        return False
+
+
+def cache_report_file(db, cache_key: Optional[str], report_key: str, report_name: str, file_format: str,
+                      filters: Optional[dict], file_name: str, source: Path, content_type: str,
+                      record_count: int, generation_time_ms: int, page_count: Optional[int] = None) -> bool:
+    """
+    Move a rendered file into the cache and register it under the key
+    The caller removes the source if it is still there afterwards (not cached)
+    """
+    if not cache_key:
+        return False
+
+    try:
+        stored = store_report_artifact(source, f"cache/{cache_key[:2]}/{cache_key}-{file_name}", content_type)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not store cached report {report_name}: {e}")
+        return False
+
+    if not store_report_cache(db, cache_key, report_key, report_name, file_format, filters,
+                              file_name, stored, record_count, generation_time_ms, page_count):
+        # Someone cached the same report meanwhile - keep theirs
+        delete_report_artifact(stored['storage'], stored['location'])
+        return False
+    return True
+
+
+def _artifact_in_use(db, storage: str, location: str) -> bool:
+    """True if a report job still serves the file (it completed from the cache)"""
+    return bool(db.execute_query(
+        "SELECT id FROM report_jobs WHERE artifact_location = %s AND storage = %s LIMIT 1",
+        (location, storage)
+    ))
+
+
+def evict_report_cache(db, max_bytes: Optional[int] = None) -> int:
+    """Drop least recently used entries until the cache fits; returns the number evicted"""
+    max_bytes = REPORT_CACHE_MAX_MB * 1024 * 1024 if max_bytes is None else max_bytes
+
+    total = int(db.execute_query("SELECT COALESCE(SUM(size_bytes), 0) AS total FROM report_cache")[0]['total'])
+    evicted = 0
+
+    while total > max_bytes:
+        oldest = db.execute_query(f"""
+        SELECT cache_key, storage, artifact_location, size_bytes
+        FROM report_cache
+        ORDER BY last_accessed_at ASC
+        LIMIT {EVICTION_BATCH_SIZE}
+        """)
+        if not oldest:
+            break
+
+        for entry in oldest:
+            if total <= max_bytes:
+                break
+            db.execute_query("DELETE FROM report_cache WHERE cache_key = %s", (entry['cache_key'],))
+            if not _artifact_in_use(db, entry['storage'], entry['artifact_location']):
+                delete_report_artifact(entry['storage'], entry['artifact_location'])
+            total -= int(entry['size_bytes'])
+            evicted += 1
+
+    if evicted:
+        logger.info(f"🧹 Evicted {evicted} report cache entr{'y' if evicted == 1 else 'ies'} ({total} bytes kept)")
+    return evicted
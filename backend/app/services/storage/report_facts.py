@@ -0,0 +1,346 @@
+"""
+Report Facts
+============
+Pre-aggregated fact tables the trend reports read instead of re-aggregating raw rows
+
+- fact_daily_investments   (day, series, status)     ← investments
+- fact_daily_new_investors (day)                     ← investors (by registration day)
+- fact_monthly_payouts     (month, series, status)   ← interest_payouts (active rows)
+- fact_daily_audit_actions (day, role, action)       ← audit_logs
+
+REFRESH (watermark based, incremental):
+- report_fact_watermarks keeps, per fact table, how far its source has been folded in:
+  the change time (updated_at) for investments / investors / interest_payouts, the
+  highest id for the append-only audit_logs
+- a refresh finds the days / months touched since the watermark and recomputes
+  exactly those from the source - the cost follows the number of changes, not the
+  length of the history
+- the watermark is read back with FACT_REFRESH_OVERLAP_SECONDS of overlap
+  (updated_at has one-second resolution, late commits) - recomputing is idempotent
+- a fact table that was never built is built in full by a background thread on
+  startup (start_report_facts_build) or by scripts/rebuild_report_facts.py - report
+  requests only refresh incrementally and skip it until it is built
+
+The app never moves a stored row to another day / month (date_received, created_at,
+payout_period are not edited), so recomputing the touched dates is enough. After
+manual data fixes run a rebuild (scripts/rebuild_report_facts.py).
+
+Refresh never breaks a report: errors are logged and the report reads the facts
+as they are.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Optional
+import logging
+import threading
+
+from app.core.database import Database
+from app.utils.import_utils import chunked
+
+logger = logging.getLogger(__name__)
+
+FACT_REFRESH_OVERLAP_SECONDS = 5
+
+# Dates recomputed per statement during a refresh
+FACT_REFRESH_DATE_BATCH = 200
+
+# Source range folded in per statement during a rebuild
+FACT_REBUILD_CHUNK_DAYS = 92
+
+# fact table → how it is derived
+# - source / watermark: source table and what the watermark tracks ('updated_at' or 'id')
+# - grain: 'day' or 'month' - the date column of the fact table is called the same
+# - source_date: source expression the fact date comes from (changed-date lookup)
+# - range_column: source column a [start, end) date range is applied to (sargable)
+# - select: grouped SELECT producing the fact rows in `columns` order, {where} is the range
+REPORT_FACTS = {
+    'fact_daily_investments': {
+        'source': 'investments',
+        'watermark': 'updated_at',
+        'grain': 'day',
+        'source_date': 'date_received',
+        'range_column': 'date_received',
+        'columns': ('day', 'series_id', 'status', 'investment_count', 'total_amount'),
+        'select': """
+        SELECT date_received, series_id, status, COUNT(*), SUM(amount)
+        FROM investments
+        WHERE status IS NOT NULL
+        AND ({where})
+        GROUP BY date_received, series_id, status
+        """,
+    },
+    'fact_daily_new_investors': {
+        'source': 'investors',
+        'watermark': 'updated_at',
+        'grain': 'day',
+        'source_date': 'DATE(created_at)',
+        'range_column': 'created_at',
+        'columns': ('day', 'new_investors', 'active_investors'),
+        'select': """
+        SELECT DATE(created_at), COUNT(*), SUM(is_active = 1)
+        FROM investors
+        WHERE created_at IS NOT NULL
+        AND ({where})
+        GROUP BY DATE(created_at)
+        """,
+    },
+    'fact_monthly_payouts': {
+        'source': 'interest_payouts',
+        'watermark': 'updated_at',
+        'grain': 'month',
+        'source_date': 'payout_period',
+        'range_column': 'payout_period',
+        'columns': ('month', 'series_id', 'status', 'payout_count', 'total_amount'),
+        'select': """
+        SELECT payout_period, series_id, status, COUNT(*), SUM(amount)
+        FROM interest_payouts
+        WHERE is_active = 1
+        AND status IS NOT NULL
+        AND ({where})
+        GROUP BY payout_period, series_id, status
+        """,
+    },
+    'fact_daily_audit_actions': {
+        'source': 'audit_logs',
+        'watermark': 'id',
+        'grain': 'day',
+        'source_date': 'DATE(timestamp)',
+        'range_column': 'timestamp',
+        'columns': ('day', 'admin_role', 'action', 'action_count', 'user_count'),
+        'select': """
+        SELECT DATE(timestamp), admin_role, action, COUNT(*), COUNT(DISTINCT admin_name)
+        FROM audit_logs
+        WHERE ({where})
+        GROUP BY DATE(timestamp), admin_role, action
+        """,
+    },
+}
+
+_refresh_lock = threading.Lock()
+_build_lock = threading.Lock()
+
+
+def _next_period(value: date, grain: str) -> date:
+    """Start of the day / month after the one value falls in"""
+    if grain == 'month':
+        return date(value.year + 1, 1, 1) if value.month == 12 else date(value.year, value.month + 1, 1)
+    return value + timedelta(days=1)
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _load_watermark(db, fact_table: str) -> Optional[dict]:
+    result = db.execute_query("""
+    SELECT changed_through, last_source_id
+    FROM report_fact_watermarks
+    WHERE fact_table = %s
+    """, (fact_table,))
+    return result[0] if result else None
+
+
+def _save_watermark(db, fact_table: str, changed_through=None, last_source_id=None, rebuilt: bool = False):
+    db.execute_query(f"""
+    INSERT INTO report_fact_watermarks (fact_table, changed_through, last_source_id, refreshed_at, rebuilt_at)
+    VALUES (%s, %s, %s, NOW(), {'NOW()' if rebuilt else 'NULL'})
+    ON DUPLICATE KEY UPDATE
+        changed_through = VALUES(changed_through),
+        last_source_id = VALUES(last_source_id),
+        refreshed_at = VALUES(refreshed_at),
+        rebuilt_at = COALESCE(VALUES(rebuilt_at), rebuilt_at)
+    """, (fact_table, changed_through, last_source_id))
+
+
+def _is_built(watermark: Optional[dict]) -> bool:
+    return bool(watermark) and (watermark['changed_through'] is not None or watermark['last_source_id'] is not None)
+
+
+def _source_position(db, spec: dict) -> dict:
+    """Current change time / highest id of the source - the watermark a refresh moves to"""
+    if spec['watermark'] == 'id':
+        result = db.execute_query(f"SELECT MAX(id) AS last_source_id FROM {spec['source']}")
+        return {'changed_through': None, 'last_source_id': result[0]['last_source_id'] or 0}
+    return {'changed_through': db.execute_query("SELECT NOW() AS now")[0]['now'], 'last_source_id': None}
+
+
+def _upsert_sql(fact_table: str, spec: dict, where: str) -> str:
+    columns = spec['columns']
+    grain = spec['grain']
+    updates = ', '.join(f"{column} = VALUES({column})" for column in columns if column != grain)
+    return f"""
+    INSERT INTO {fact_table} ({', '.join(columns)})
+    {spec['select'].format(where=where)}
+    ON DUPLICATE KEY UPDATE {updates}
+    """
+
+
+def recompute_fact_dates(db, fact_table: str, dates: list) -> int:
+    """Recompute the fact rows of these days / months from the source; returns the dates done"""
+    spec = REPORT_FACTS[fact_table]
+    grain = spec['grain']
+    dates = sorted({_as_date(value) for value in dates if value})
+
+    for batch in chunked(dates, FACT_REFRESH_DATE_BATCH):
+        placeholders = ','.join(['%s'] * len(batch))
+        ranges = ' OR '.join([f"({spec['range_column']} >= %s AND {spec['range_column']} < %s)"] * len(batch))
+        range_params = []
+        for value in batch:
+            range_params.extend([value, _next_period(value, grain)])
+
+        with db.transaction():
+            db.execute_query(f"DELETE FROM {fact_table} WHERE {grain} IN ({placeholders})", tuple(batch))
+            db.execute_query(_upsert_sql(fact_table, spec, ranges), tuple(range_params))
+
+    return len(dates)
+
+
+def rebuild_report_fact(db, fact_table: str, from_date: Optional[date] = None) -> int:
+    """
+    Rebuild one fact table from its source (everything, or from from_date on)
+    Works through the source in FACT_REBUILD_CHUNK_DAYS slices; returns the fact rows written
+    """
+    spec = REPORT_FACTS[fact_table]
+    grain = spec['grain']
+    range_column = spec['range_column']
+
+    # Watermark position first - changes made while rebuilding are picked up by the next refresh
+    position = _source_position(db, spec)
+
+    bounds = db.execute_query(f"""
+    SELECT MIN({range_column}) AS first_date, MAX({range_column}) AS last_date
+    FROM {spec['source']}
+    """)[0]
+
+    written = 0
+    if bounds['first_date'] is not None:
+        start = _as_date(bounds['first_date'])
+        if from_date and from_date > start:
+            start = from_date
+        if grain == 'month':
+            start = start.replace(day=1)
+        end = _next_period(_as_date(bounds['last_date']), grain)
+
+        chunk_start = start
+        while chunk_start < end:
+            chunk_end = min(chunk_start + timedelta(days=FACT_REBUILD_CHUNK_DAYS), end)
+            if grain == 'month':
+                chunk_end = _next_period(chunk_end - timedelta(days=1), 'month')
+            with db.transaction():
+                db.execute_query(
+                    f"DELETE FROM {fact_table} WHERE {grain} >= %s AND {grain} < %s",
+                    (chunk_start, chunk_end)
+                )
+                written += db.execute_query(
+                    _upsert_sql(fact_table, spec, f"{range_column} >= %s AND {range_column} < %s"),
+                    (chunk_start, chunk_end)
+                ) or 0
+            chunk_start = chunk_end
+
+        # Dates the source no longer has rows for
+        db.execute_query(f"DELETE FROM {fact_table} WHERE {grain} >= %s", (end,))
+        if not from_date:
+            db.execute_query(f"DELETE FROM {fact_table} WHERE {grain} < %s", (start,))
+    elif from_date:
+        db.execute_query(f"DELETE FROM {fact_table} WHERE {grain} >= %s", (from_date,))
+    else:
+        db.execute_query(f"DELETE FROM {fact_table}")
+
+    _save_watermark(db, fact_table, position['changed_through'], position['last_source_id'], rebuilt=True)
+    logger.info(f"🧱 Rebuilt {fact_table}{f' from {from_date}' if from_date else ''}")
+    return written
+
+
+def rebuild_report_facts(db, from_date: Optional[date] = None, fact_tables: Optional[list] = None) -> dict:
+    """Rebuild the fact tables (all by default); returns {fact_table: rows written}"""
+    with _refresh_lock:
+        return {
+            fact_table: rebuild_report_fact(db, fact_table, from_date)
+            for fact_table in (fact_tables or REPORT_FACTS)
+        }
+
+
+def refresh_report_fact(db, fact_table: str) -> Optional[int]:
+    """
+    Fold the source changes since the watermark into one fact table
+    Returns the dates recomputed, None when the table was never built (see build_missing_report_facts)
+    """
+    spec = REPORT_FACTS[fact_table]
+    watermark = _load_watermark(db, fact_table)
+
+    if not _is_built(watermark):
+        return None
+
+    position = _source_position(db, spec)
+
+    if spec['watermark'] == 'id':
+        if position['last_source_id'] <= watermark['last_source_id']:
+            return 0
+        changed = db.execute_query(f"""
+        SELECT DISTINCT {spec['source_date']} AS fact_date
+        FROM {spec['source']}
+        WHERE id > %s AND id <= %s
+        """, (watermark['last_source_id'], position['last_source_id']))
+    else:
+        since = watermark['changed_through'] - timedelta(seconds=FACT_REFRESH_OVERLAP_SECONDS)
+        changed = db.execute_query(f"""
+        SELECT DISTINCT {spec['source_date']} AS fact_date
+        FROM {spec['source']}
+        WHERE updated_at >= %s
+        """, (since,))
+
+    dates = [row['fact_date'] for row in changed]
+    if spec['grain'] == 'month':
+        dates = [_as_date(value).replace(day=1) for value in dates if value]
+
+    recomputed = recompute_fact_dates(db, fact_table, dates) if dates else 0
+    _save_watermark(db, fact_table, position['changed_through'], position['last_source_id'])
+    return recomputed
+
+
+def refresh_report_facts(db, fact_tables: Optional[list] = None) -> dict:
+    """
+    Bring the fact tables (all by default) up to date with their sources
+    Returns {fact_table: dates recomputed (None = not built yet / failed)}
+    """
+    refreshed = {}
+    with _refresh_lock:
+        for fact_table in (fact_tables or REPORT_FACTS):
+            try:
+                refreshed[fact_table] = refresh_report_fact(db, fact_table)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not refresh {fact_table}: {e}")
+                refreshed[fact_table] = None
+
+    changed = {name: count for name, count in refreshed.items() if count}
+    if changed:
+        logger.info(f"📈 Report facts refreshed: {changed}")
+    return refreshed
+
+
+def build_missing_report_facts(db) -> dict:
+    """Build the fact tables that were never built, in full; returns {fact_table: rows written}"""
+    built = {}
+    with _build_lock:
+        for fact_table in REPORT_FACTS:
+            if not _is_built(_load_watermark(db, fact_table)):
+                built[fact_table] = rebuild_report_fact(db, fact_table)
+    return built
+
+
+def _build_in_background():
+    build_db = Database()
+    build_db.connect()
+    try:
+        built = build_missing_report_facts(build_db)
+        if built:
+            logger.info(f"📈 Report facts built: {built}")
+    except Exception as e:
+        logger.error(f"❌ Could not build report facts: {e}")
+    finally:
+        build_db.disconnect()
+
+
+def start_report_facts_build():
+    """Build never-built fact tables in a background thread - startup does not wait for it"""
+    threading.Thread(target=_build_in_background, name='report-facts-build', daemon=True).start()
@@ -0,0 +1,207 @@
+"""
+Report Snapshots
+================
+A computed report kept so its detail tables can be read page by page
+
+GET /reports/{report}/summary runs the report once and answers with the summary
+values only; every detail table (a list in the report JSON) is replaced by its row
+count and a cursor to its first page. GET /reports/{report}/sections/{section}
+serves the pages from the stored computation - the report is not run again.
+
+- snapshot id = the report cache key (report + filters + data fingerprint + day),
+  so the same report over unchanged data reuses one snapshot
+- snapshots are kept in memory (least recently used, REPORT_SNAPSHOT_MAX_ENTRIES,
+  REPORT_SNAPSHOT_TTL_SECONDS) and also stored as the report's JSON file in the
+  report cache - another worker process / a restart loads it from there
+- when the report is not cacheable right now (data just changed) the snapshot gets
+  a random id and lives in memory only
+- a snapshot never changes, so a page cursor is just (snapshot, section, offset)
+"""
+
+from collections import OrderedDict
+from typing import Optional
+import base64
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+from app.services.storage.report_artifacts import staging_path, iter_report_artifact
+from app.services.storage.report_cache import report_cache_key, lookup_report_cache, cache_report_file
+from app.utils.report_tables import SKIP_KEYS, flatten_report, count_report_records, report_json_bytes
+
+logger = logging.getLogger(__name__)
+
+REPORT_SNAPSHOT_MAX_ENTRIES = int(os.getenv('REPORT_SNAPSHOT_MAX_ENTRIES', 16))
+REPORT_SNAPSHOT_TTL_SECONDS = int(os.getenv('REPORT_SNAPSHOT_TTL_SECONDS', 1800))
+
+SECTION_PAGE_DEFAULT_LIMIT = 100
+SECTION_PAGE_MAX_LIMIT = 1000
+
+# snapshot id → {'report', 'data', 'loaded_at'}
+_snapshots = OrderedDict()
+_snapshots_lock = threading.Lock()
+
+
+def _remember(snapshot_id: str, report_key: str, data: dict) -> dict:
+    snapshot = {'report': report_key, 'data': data, 'loaded_at': time.monotonic()}
+    with _snapshots_lock:
+        _snapshots[snapshot_id] = snapshot
+        _snapshots.move_to_end(snapshot_id)
+        while len(_snapshots) > REPORT_SNAPSHOT_MAX_ENTRIES:
+            _snapshots.popitem(last=False)
+    return snapshot
+
+
+def _recall(snapshot_id: str) -> Optional[dict]:
+    with _snapshots_lock:
+        snapshot = _snapshots.get(snapshot_id)
+        if not snapshot:
+            return None
+        if time.monotonic() - snapshot['loaded_at'] > REPORT_SNAPSHOT_TTL_SECONDS:
+            del _snapshots[snapshot_id]
+            return None
+        _snapshots.move_to_end(snapshot_id)
+        return snapshot
+
+
+def _load_cached(db, snapshot_id: str) -> Optional[dict]:
+    """The report JSON stored in the report cache under the id, or None"""
+    entry = lookup_report_cache(db, snapshot_id)
+    if not entry or entry['file_format'] != 'json':
+        return None
+    try:
+        data = json.loads(b''.join(iter_report_artifact(entry['storage'], entry['artifact_location'])))
+    except Exception as e:
+        logger.warning(f"⚠️ Could not load report snapshot {snapshot_id}: {e}")
+        return None
+    return _remember(snapshot_id, entry['report_key'], data)
+
+
+def _store_cached(db, snapshot_id: str, report_key: str, report_name: str, filters: dict,
+                  data: dict, generation_time_ms: int):
+    """Keep the report JSON in the report cache (the same file a JSON report job produces)"""
+    file_name = f"{report_key}.json"
+    staged = staging_path(file_name)
+    try:
+        staged.write_bytes(report_json_bytes(data))
+        cache_report_file(
+            db, snapshot_id, report_key, report_name, 'json', filters, file_name, staged,
+            'application/json', count_report_records(flatten_report(data)[1]), generation_time_ms
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ Could not store report snapshot for {report_name}: {e}")
+    finally:
+        staged.unlink(missing_ok=True)
+
+
+async def open_report_snapshot(db, report_key: str, report_name: str, report_function,
+                               filters: dict, current_user) -> tuple:
+    """
+    Snapshot of the report over the current data - reused when there is one, computed otherwise
+    Returns (snapshot id, report data)
+    """
+    snapshot_id = report_cache_key(db, report_key, 'json', filters)
+
+    if snapshot_id:
+        snapshot = _recall(snapshot_id) or _load_cached(db, snapshot_id)
+        if snapshot:
+            return snapshot_id, snapshot['data']
+
+    started = time.perf_counter()
+    computed = await report_function(**filters, current_user=current_user)
+    generation_time_ms = int((time.perf_counter() - started) * 1000)
+
+    # Stored as JSON - pages served from memory and from the cache look the same
+    data = json.loads(report_json_bytes(computed))
+
+    if snapshot_id:
+        _store_cached(db, snapshot_id, report_key, report_name, filters, data, generation_time_ms)
+    else:
+        snapshot_id = uuid.uuid4().hex
+
+    _remember(snapshot_id, report_key, data)
+    return snapshot_id, data
+
+
+def get_report_snapshot(db, snapshot_id: str) -> Optional[dict]:
+    """{'report', 'data'} of a snapshot, or None once it has expired"""
+    return _recall(snapshot_id) or _load_cached(db, snapshot_id)
+
+
+def report_sections(data: dict) -> dict:
+    """
+    Detail tables of a report: {section name: rows}
+    Lists at the top level are named by their key, lists one level down 'parent.key'
+    """
+    sections = {}
+    for key, value in data.items():
+        if key in SKIP_KEYS:
+            continue
+        if isinstance(value, list):
+            sections[key] = value
+        elif isinstance(value, dict):
+            for child_key, child_value in value.items():
+                if isinstance(child_value, list):
+                    sections[f"{key}.{child_key}"] = child_value
+    return sections
+
+
+def encode_section_cursor(snapshot_id: str, section: str, offset: int) -> str:
+    """Opaque cursor to the page of `section` starting at row `offset`"""
+    raw = json.dumps({'k': [snapshot_id, section, offset]}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_section_cursor(cursor: str) -> tuple:
+    """Cursor → (snapshot id, section, offset). Raises ValueError if it is malformed"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        snapshot_id, section, offset = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))['k']
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(snapshot_id, str) or not isinstance(section, str) or not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid cursor")
+    return snapshot_id, section, offset
+
+
+def report_summary(snapshot_id: str, data: dict) -> dict:
+    """The report without its detail tables, plus {'detail_sections': {name: {'count', 'cursor'}}}"""
+    sections = report_sections(data)
+
+    summary = {}
+    for key, value in data.items():
+        if isinstance(value, list) and key in sections:
+            continue
+        if isinstance(value, dict) and key not in SKIP_KEYS:
+            value = {child_key: child_value for child_key, child_value in value.items()
+                     if f"{key}.{child_key}" not in sections}
+        summary[key] = value
+
+    summary['detail_sections'] = {
+        name: {'count': len(rows), 'cursor': encode_section_cursor(snapshot_id, name, 0)}
+        for name, rows in sections.items()
+    }
+    summary['snapshot_id'] = snapshot_id
+    return summary
+
+
+def section_page(snapshot_id: str, data: dict, section: str, offset: int, limit: Optional[int] = None) -> dict:
+    """One page of a detail table; KeyError if the report has no such section"""
+    rows = report_sections(data)[section]
+    page_size = min(max(limit or SECTION_PAGE_DEFAULT_LIMIT, 1), SECTION_PAGE_MAX_LIMIT)
+    items = rows[offset:offset + page_size]
+    has_more = offset + page_size < len(rows)
+
+    return {
+        'section': section,
+        'items': items,
+        'count': len(items),
+        'total': len(rows),
+        'limit': page_size,
+        'has_more': has_more,
+        'next_cursor': encode_section_cursor(snapshot_id, section, offset + page_size) if has_more else None
+    }
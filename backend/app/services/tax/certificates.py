@@ -0,0 +1,109 @@
+"""
+TDS Certificates
+================
+Renders one PDF certificate per investor for a financial year's TDS
+
+Kept free of database / settings imports: render_certificate_chunk() runs in
+worker processes, which only need this module and the PDF writer.
+"""
+
+from app.utils.simple_pdf import PDFDocument, text_width, format_rupees
+
+QUARTER_LABELS = ['Q1 (Apr - Jun)', 'Q2 (Jul - Sep)', 'Q3 (Oct - Dec)', 'Q4 (Jan - Mar)']
+
+
+def certificate_file_name(record: dict) -> str:
+    safe_code = ''.join(char if char.isalnum() or char in '-_' else '_' for char in str(record['investor_code']))
+    return f"TDS_{record['financial_year']}_{safe_code}.pdf"
+
+
+def render_certificate(record: dict, deductor: dict) -> bytes:
+    """
+    record:   one row of the TDS summary (investor, PAN, quarterly interest, rate, TDS)
+    deductor: {'name', 'tan', 'pan', 'address'} of the company
+    """
+    document = PDFDocument(title=f"TDS Certificate {record['financial_year']} - {record['investor_code']}")
+    page = document.add_page()
+    left, right = 50, page.width - 50
+
+    page.text(page.width / 2, 60, 'CERTIFICATE OF TAX DEDUCTED AT SOURCE', size=15, bold=True, align='center')
+    page.text(page.width / 2, 78, f"Interest on Non-Convertible Debentures - Section {record['section']}", size=10, align='center')
+    page.text(page.width / 2, 93, f"Financial Year {record['financial_year']} (Assessment Year {record['assessment_year']})", size=10, align='center')
+    page.line(left, 105, right, 105, width=1)
+
+    # Deductor / deductee blocks
+    y = 128
+    page.text(left, y, 'Deductor', size=11, bold=True)
+    page.text(310, y, 'Deductee', size=11, bold=True)
+    y += 18
+    page.text(left, y, deductor.get('name') or '-', size=10)
+    page.text(310, y, record['investor_name'], size=10)
+    y += 15
+    page.text(left, y, f"TAN: {deductor.get('tan') or '-'}", size=10)
+    page.text(310, y, f"Investor ID: {record['investor_code']}", size=10)
+    y += 15
+    page.text(left, y, f"PAN: {deductor.get('pan') or '-'}", size=10)
+    page.text(310, y, f"PAN: {record['pan'] or 'Not provided'}", size=10)
+    y += 15
+    deductor_end = page.paragraph(left, y, deductor.get('address') or '', max_width=240, size=9)
+    deductee_end = page.paragraph(310, y, record.get('address') or '', max_width=235, size=9)
+    y = max(deductor_end, deductee_end) + 15
+
+    # Quarterly table
+    columns = [left, 250, 400, right]
+    table_top = y
+    page.rect(left, y, right - left, 20, fill_gray=0.88)
+    page.text(left + 8, y + 14, 'Quarter', size=10, bold=True)
+    page.text(columns[2] - 8, y + 14, 'Interest Paid', size=10, bold=True, align='right')
+    page.text(columns[3] - 8, y + 14, 'Payouts', size=10, bold=True, align='right')
+    y += 20
+    for label, amount, count in zip(QUARTER_LABELS, record['quarter_interest'], record['quarter_payouts']):
+        page.text(left + 8, y + 14, label, size=10)
+        page.text(columns[2] - 8, y + 14, format_rupees(amount), size=10, align='right')
+        page.text(columns[3] - 8, y + 14, str(count), size=10, align='right')
+        page.line(left, y + 20, right, y + 20, width=0.3)
+        y += 20
+    page.text(left + 8, y + 14, 'Total', size=10, bold=True)
+    page.text(columns[2] - 8, y + 14, format_rupees(record['total_interest']), size=10, bold=True, align='right')
+    page.text(columns[3] - 8, y + 14, str(record['payout_count']), size=10, bold=True, align='right')
+    page.rect(left, table_top, right - left, y + 20 - table_top)
+    y += 45
+
+    # Tax computation
+    rows = [
+        ('Gross interest paid / credited', format_rupees(record['total_interest'])),
+        ('Threshold for the year', format_rupees(record['threshold'])),
+        ('Rate of TDS', f"{record['tds_rate']:g}%"),
+        ('Tax deducted at source', format_rupees(record['tds_amount'])),
+        ('Net interest', format_rupees(record['net_interest'])),
+    ]
+    label_width = max(text_width(label, 10) for label, _ in rows)
+    for label, value in rows:
+        bold = label == 'Tax deducted at source'
+        page.text(left, y, label, size=10, bold=bold)
+        page.text(left + label_width + 150, y, value, size=10, bold=bold, align='right')
+        y += 17
+
+    if record.get('remarks'):
+        y += 5
+        y = page.paragraph(left, y, f"Note: {record['remarks']}", max_width=right - left, size=9)
+
+    y += 30
+    page.paragraph(
+        left, y,
+        'This is a computer generated statement of tax deducted on interest paid on the '
+        'debentures held by the deductee. The tax deducted is reported in the quarterly TDS '
+        'returns and can be verified in Form 26AS / AIS.',
+        max_width=right - left, size=8.5
+    )
+
+    page.line(left, page.height - 60, right, page.height - 60, width=0.3)
+    page.text(left, page.height - 45, f"Generated on {record['generated_on']}", size=8)
+    page.text(right, page.height - 45, deductor.get('name') or '', size=8, align='right')
+
+    return document.to_bytes()
+
+
+def render_certificate_chunk(records: list, deductor: dict) -> list:
+    """Worker process entry point: [(file name, pdf bytes)] for a chunk of records"""
+    return [(certificate_file_name(record), render_certificate(record, deductor)) for record in records]
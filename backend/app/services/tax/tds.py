@@ -0,0 +1,485 @@
+"""
+Annual TDS Batches
+==================
+Tax deducted at source on NCD interest, per investor per financial year
+
+FLOW:
+- POST /tds/batches stores a row in tds_batches and returns the batch id immediately
+- A worker thread aggregates the year's PAID payouts per investor in ONE grouped
+  query (interest_payouts is range-scanned on paid_date), then applies the rate table
+- Certificates are rendered in parallel worker PROCESSES (pure Python PDF, so
+  rendering is CPU bound) and written into one zip archive as they come back
+- summary.csv lists every investor with interest in the year (also inside the zip)
+
+Threshold and rates are plain data in TDS_RATE_TABLE - a Finance Act change is
+one more entry there. TDS is computed on the gross interest of the year; when
+the total does not exceed the threshold no tax is deducted.
+
+Batches carry the id of the process running them and its heartbeat
+(job_heartbeat.py) - a batch whose process died is failed, not left 'processing'.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import repeat
+from pathlib import Path
+from typing import Optional
+import csv
+import io
+import logging
+import multiprocessing
+import os
+import re
+import zipfile
+
+from app.core.database import Database
+from app.services.jobs.job_heartbeat import WORKER_ID, register_job_table, fail_orphaned_jobs
+from app.services.tax.certificates import certificate_file_name, render_certificate_chunk
+
+logger = logging.getLogger(__name__)
+
+TDS_SECTION = '193'
+
+# Financial year start → rule; the latest entry not after the year applies.
+# Resident individuals: interest above the threshold is taxed in full at
+# rate_with_pan, or rate_without_pan when no valid PAN is on record (206AA).
+TDS_RATE_TABLE = [
+    {'from_year': 2023, 'threshold': 5000.0, 'rate_with_pan': 10.0, 'rate_without_pan': 20.0},
+    {'from_year': 2025, 'threshold': 10000.0, 'rate_with_pan': 10.0, 'rate_without_pan': 20.0},
+]
+
+PAN_PATTERN = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]$')
+FINANCIAL_YEAR_PATTERN = re.compile(r'^(\d{4})(?:-(\d{2}|\d{4}))?$')
+
+TDS_BATCH_WORKERS = int(os.getenv('TDS_BATCH_WORKERS', 1))
+TDS_CERTIFICATE_PROCESSES = int(os.getenv('TDS_CERTIFICATE_PROCESSES', max((os.cpu_count() or 2) - 1, 1)))
+TDS_CERTIFICATE_CHUNK_SIZE = 250
+
+TDS_SUMMARY_HEADERS = [
+    'Investor ID', 'Investor Name', 'PAN', 'PAN Valid', 'Payouts',
+    'Q1 Interest', 'Q2 Interest', 'Q3 Interest', 'Q4 Interest', 'Total Interest',
+    'Threshold', 'TDS Rate %', 'TDS Amount', 'Net Interest', 'Certificate', 'Remarks'
+]
+
+_executor = ThreadPoolExecutor(max_workers=TDS_BATCH_WORKERS, thread_name_prefix='tds-batch')
+
+register_job_table(
+    'tds_batches', 'TDS batch',
+    'Server restarted before the batch finished. Please run it again.'
+)
+
+
+def parse_financial_year(value) -> int:
+    """'2025-26' / '2025-2026' / '2025' → 2025 (the year the financial year starts in April)"""
+    match = FINANCIAL_YEAR_PATTERN.match(str(value or '').strip())
+    if not match:
+        raise ValueError("Invalid financial year. Use the format '2025-26'")
+
+    start_year = int(match.group(1))
+    end = match.group(2)
+    if end and int(end) != (start_year + 1 if len(end) == 4 else (start_year + 1) % 100):
+        raise ValueError(f"Invalid financial year '{value}'. The second year must follow the first, e.g. '2025-26'")
+    return start_year
+
+
+def financial_year_label(start_year: int) -> str:
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+def financial_year_bounds(start_year: int):
+    """Half-open [1 April, next 1 April) date range of a financial year"""
+    return date(start_year, 4, 1), date(start_year + 1, 4, 1)
+
+
+def financial_year_quarters(start_year: int) -> list:
+    """Start dates of Q2, Q3 and Q4 (Q1 starts with the year)"""
+    return [date(start_year, 7, 1), date(start_year, 10, 1), date(start_year + 1, 1, 1)]
+
+
+def tds_rule_for(start_year: int) -> dict:
+    applicable = [rule for rule in TDS_RATE_TABLE if rule['from_year'] <= start_year]
+    if not applicable:
+        raise ValueError(f"No TDS rate configured for financial year {financial_year_label(start_year)}")
+    return max(applicable, key=lambda rule: rule['from_year'])
+
+
+def is_valid_pan(pan) -> bool:
+    return bool(pan) and bool(PAN_PATTERN.match(str(pan).strip().upper()))
+
+
+def compute_tds(total_interest: float, pan, rule: dict) -> dict:
+    """
+    TDS on a year's interest: nothing up to the threshold, then the full amount at
+    the PAN / no-PAN rate. Tax is rounded to the nearest rupee (section 288B).
+    """
+    pan_valid = is_valid_pan(pan)
+    total_interest = round(float(total_interest or 0), 2)
+
+    if total_interest <= rule['threshold']:
+        rate = 0.0
+        remarks = f"Interest does not exceed the threshold of Rs. {rule['threshold']:,.0f} - no tax deducted"
+    else:
+        rate = rule['rate_with_pan'] if pan_valid else rule['rate_without_pan']
+        remarks = '' if pan_valid else 'No valid PAN on record - higher rate applied (section 206AA)'
+
+    tds_amount = float(round(total_interest * rate / 100))
+
+    return {
+        'pan_valid': pan_valid,
+        'threshold': rule['threshold'],
+        'tds_rate': rate,
+        'tds_amount': tds_amount,
+        'net_interest': round(total_interest - tds_amount, 2),
+        'remarks': remarks
+    }
+
+
+def aggregate_financial_year_interest(db, start_year: int):
+    """
+    Generator: one row per investor with interest PAID in the financial year
+    One grouped pass over interest_payouts - quarters are conditional sums
+    """
+    year_start, year_end = financial_year_bounds(start_year)
+    q2, q3, q4 = financial_year_quarters(start_year)
+
+    query = """
+    SELECT
+        inv.id,
+        inv.investor_id AS investor_code,
+        inv.full_name,
+        inv.pan,
+        inv.residential_address,
+        totals.payout_count,
+        totals.q1_interest, totals.q2_interest, totals.q3_interest, totals.q4_interest,
+        totals.q1_payouts, totals.q2_payouts, totals.q3_payouts, totals.q4_payouts,
+        totals.total_interest
+    FROM (
+        SELECT
+            investor_id,
+            COUNT(*) AS payout_count,
+            SUM(CASE WHEN paid_date < %s THEN amount ELSE 0 END) AS q1_interest,
+            SUM(CASE WHEN paid_date >= %s AND paid_date < %s THEN amount ELSE 0 END) AS q2_interest,
+            SUM(CASE WHEN paid_date >= %s AND paid_date < %s THEN amount ELSE 0 END) AS q3_interest,
+            SUM(CASE WHEN paid_date >= %s THEN amount ELSE 0 END) AS q4_interest,
+            SUM(CASE WHEN paid_date < %s THEN 1 ELSE 0 END) AS q1_payouts,
+            SUM(CASE WHEN paid_date >= %s AND paid_date < %s THEN 1 ELSE 0 END) AS q2_payouts,
+            SUM(CASE WHEN paid_date >= %s AND paid_date < %s THEN 1 ELSE 0 END) AS q3_payouts,
+            SUM(CASE WHEN paid_date >= %s THEN 1 ELSE 0 END) AS q4_payouts,
+            SUM(amount) AS total_interest
+        FROM interest_payouts
+        WHERE status = 'Paid'
+        AND is_active = 1
+        AND paid_date >= %s AND paid_date < %s
+        GROUP BY investor_id
+    ) totals
+    INNER JOIN investors inv ON inv.id = totals.investor_id
+    ORDER BY inv.investor_id
+    """
+    params = (
+        q2, q2, q3, q3, q4, q4,
+        q2, q2, q3, q3, q4, q4,
+        year_start, year_end
+    )
+    yield from db.iter_query(query, params)
+
+
+def build_tds_records(rows, start_year: int) -> list:
+    """Aggregated rows → TDS summary records (certificate inputs)"""
+    rule = tds_rule_for(start_year)
+    label = financial_year_label(start_year)
+    assessment_year = financial_year_label(start_year + 1)
+    generated_on = datetime.now().strftime('%d/%m/%Y')
+
+    records = []
+    for row in rows:
+        total_interest = float(row['total_interest'] or 0)
+        record = {
+            'investor_code': row['investor_code'],
+            'investor_name': row['full_name'],
+            'pan': (row['pan'] or '').strip().upper(),
+            'address': row['residential_address'] or '',
+            'payout_count': int(row['payout_count']),
+            'quarter_interest': [round(float(row[f'q{quarter}_interest'] or 0), 2) for quarter in range(1, 5)],
+            'quarter_payouts': [int(row[f'q{quarter}_payouts'] or 0) for quarter in range(1, 5)],
+            'total_interest': round(total_interest, 2),
+            'financial_year': label,
+            'assessment_year': assessment_year,
+            'section': TDS_SECTION,
+            'generated_on': generated_on
+        }
+        record.update(compute_tds(total_interest, record['pan'], rule))
+        records.append(record)
+    return records
+
+
+def write_tds_summary_csv(records: list, certificate_names: set) -> str:
+    output = io.StringIO()
+    output.write('\ufeff')
+    writer = csv.writer(output)
+    writer.writerow(TDS_SUMMARY_HEADERS)
+    for record in records:
+        file_name = certificate_file_name(record)
+        writer.writerow([
+            record['investor_code'],
+            record['investor_name'],
+            record['pan'],
+            'Yes' if record['pan_valid'] else 'No',
+            record['payout_count'],
+            *record['quarter_interest'],
+            record['total_interest'],
+            record['threshold'],
+            record['tds_rate'],
+            record['tds_amount'],
+            record['net_interest'],
+            file_name if file_name in certificate_names else '',
+            record['remarks']
+        ])
+    return output.getvalue()
+
+
+def tds_output_dir() -> Path:
+    from app.core.config import settings, BACKEND_DIR
+
+    directory = Path(settings.tds_output_dir) if settings.tds_output_dir else BACKEND_DIR / 'generated' / 'tds'
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _deductor_details() -> dict:
+    from app.core.config import settings
+
+    return {
+        'name': settings.tds_deductor_name,
+        'tan': settings.tds_deductor_tan,
+        'pan': settings.tds_deductor_pan,
+        'address': settings.tds_deductor_address
+    }
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def generate_tds_archive(records: list, archive_path: Path, deductor: dict, progress=None,
+                         processes: int = TDS_CERTIFICATE_PROCESSES) -> dict:
+    """
+    Render certificates for every record with tax deducted and write them,
+    plus summary.csv, into archive_path (written to a temp name, then renamed)
+
+    progress(done_count) is called after each chunk of certificates
+    """
+    certified = [record for record in records if record['tds_amount'] > 0]
+    temp_path = archive_path.with_suffix('.tmp')
+    certificate_names = set()
+
+    with zipfile.ZipFile(temp_path, mode='w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        if certified:
+            chunks = list(_chunks(certified, TDS_CERTIFICATE_CHUNK_SIZE))
+            if processes > 1 and len(chunks) > 1:
+                # spawn: the worker imports only the certificate module, not the app's threads / connections
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=min(processes, len(chunks)), mp_context=context) as pool:
+                    rendered_chunks = pool.map(render_certificate_chunk, chunks, repeat(deductor))
+                    for rendered in rendered_chunks:
+                        for file_name, pdf_bytes in rendered:
+                            archive.writestr(f"certificates/{file_name}", pdf_bytes)
+                            certificate_names.add(file_name)
+                        if progress:
+                            progress(len(certificate_names))
+            else:
+                for chunk in chunks:
+                    for file_name, pdf_bytes in render_certificate_chunk(chunk, deductor):
+                        archive.writestr(f"certificates/{file_name}", pdf_bytes)
+                        certificate_names.add(file_name)
+                    if progress:
+                        progress(len(certificate_names))
+
+        archive.writestr('summary.csv', write_tds_summary_csv(records, certificate_names))
+
+    os.replace(temp_path, archive_path)
+
+    return {
+        'investor_count': len(records),
+        'certificate_count': len(certificate_names),
+        'total_interest': round(sum(record['total_interest'] for record in records), 2),
+        'total_tds': round(sum(record['tds_amount'] for record in records), 2)
+    }
+
+
+def tds_batch_paths(batch_id: int, start_year: int):
+    """(archive, summary csv) file paths of a batch"""
+    directory = tds_output_dir()
+    stem = f"tds-{financial_year_label(start_year)}-batch-{batch_id}"
+    return directory / f"{stem}.zip", directory / f"{stem}-summary.csv"
+
+
+def _update_batch(batch_db, batch_id: int, **fields):
+    assignments = ', '.join(f"{column} = %s" for column in fields)
+    batch_db.execute_query(
+        f"UPDATE tds_batches SET {assignments} WHERE id = %s",
+        tuple(fields.values()) + (batch_id,)
+    )
+
+
+def submit_tds_batch(db, start_year: int, current_user) -> dict:
+    """Create the batch row and hand it to a background worker; returns the batch (status 'queued')"""
+    tds_rule_for(start_year)  # fail fast on a year without rates
+
+    db.execute_query("""
+    INSERT INTO tds_batches (
+        financial_year, status, worker_id, heartbeat_at, created_by, created_by_name, created_by_role
+    ) VALUES (%s, 'queued', %s, NOW(), %s, %s, %s)
+    """, (
+        financial_year_label(start_year),
+        WORKER_ID,
+        current_user.id,
+        current_user.full_name or current_user.username,
+        current_user.role
+    ))
+    batch_id = db.execute_query("SELECT LAST_INSERT_ID() as id")[0]['id']
+
+    _executor.submit(
+        run_tds_batch,
+        batch_id,
+        start_year,
+        current_user.full_name or current_user.username,
+        current_user.role
+    )
+
+    logger.info(f"🧾 Queued TDS batch {batch_id} for FY {financial_year_label(start_year)}")
+    return get_tds_batch(db, batch_id)
+
+
+def run_tds_batch(batch_id: int, start_year: int, admin_name: str, admin_role: str):
+    """
+    Worker entry point: aggregate → compute → render certificates → archive
+    Never raises - failures are recorded on the batch row
+    """
+    batch_db = Database()
+    batch_db.connect()
+
+    try:
+        _update_batch(batch_db, batch_id, status='processing', started_at=datetime.now())
+        started = datetime.now()
+
+        records = build_tds_records(aggregate_financial_year_interest(batch_db, start_year), start_year)
+        certificate_total = sum(1 for record in records if record['tds_amount'] > 0)
+        _update_batch(batch_db, batch_id, investor_count=len(records), certificate_total=certificate_total)
+        logger.info(f"⚙️ TDS batch {batch_id}: {len(records)} investors, {certificate_total} certificates")
+
+        archive_path, summary_path = tds_batch_paths(batch_id, start_year)
+        totals = generate_tds_archive(
+            records,
+            archive_path,
+            _deductor_details(),
+            progress=lambda done: _update_batch(batch_db, batch_id, certificate_count=done)
+        )
+
+        with zipfile.ZipFile(archive_path) as archive:
+            summary_path.write_bytes(archive.read('summary.csv'))
+
+        _update_batch(
+            batch_db, batch_id,
+            status='completed',
+            certificate_count=totals['certificate_count'],
+            total_interest=totals['total_interest'],
+            total_tds=totals['total_tds'],
+            archive_path=str(archive_path),
+            summary_path=str(summary_path),
+            completed_at=datetime.now()
+        )
+
+        _log_tds_batch_audit(batch_db, batch_id, start_year, admin_name, admin_role, totals)
+
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info(f"✅ TDS batch {batch_id} complete: {totals['certificate_count']} certificates in {elapsed:.1f}s")
+
+    except Exception as e:
+        logger.error(f"❌ TDS batch {batch_id} failed: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        try:
+            _update_batch(batch_db, batch_id, status='failed', error_message=str(e), completed_at=datetime.now())
+        except Exception as update_error:
+            logger.error(f"❌ Could not record failure for TDS batch {batch_id}: {update_error}")
+    finally:
+        batch_db.disconnect()
+
+
+def _log_tds_batch_audit(batch_db, batch_id: int, start_year: int, admin_name: str, admin_role: str, totals: dict):
+    import json
+
+    try:
+        batch_db.execute_query("""
+        INSERT INTO audit_logs (action, admin_name, admin_role, details, entity_type, entity_id, changes, timestamp)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
+        """, (
+            'TDS Certificates Generated',
+            admin_name,
+            admin_role,
+            f"Generated {totals['certificate_count']} TDS certificate(s) for FY {financial_year_label(start_year)} - "
+            f"TDS Rs.{totals['total_tds']:,.2f} on interest Rs.{totals['total_interest']:,.2f}",
+            'Interest Payout',
+            f"TDS Batch {batch_id}",
+            json.dumps({
+                'batchId': batch_id,
+                'financialYear': financial_year_label(start_year),
+                'investorCount': totals['investor_count'],
+                'certificateCount': totals['certificate_count'],
+                'totalInterest': totals['total_interest'],
+                'totalTds': totals['total_tds'],
+                'action': 'tds_batch'
+            })
+        ))
+    except Exception as audit_error:
+        logger.error(f"⚠️ Failed to create audit log for TDS batch {batch_id}: {audit_error}")
+
+
+TDS_BATCH_COLUMNS = """
+    id, financial_year, status, investor_count, certificate_total, certificate_count,
+    total_interest, total_tds, error_message, created_by, created_by_name,
+    created_at, started_at, completed_at
+"""
+
+
+def _batch_response(batch: dict) -> dict:
+    batch['total_interest'] = float(batch['total_interest'] or 0)
+    batch['total_tds'] = float(batch['total_tds'] or 0)
+    batch['progress_percent'] = (
+        round(batch['certificate_count'] * 100 / batch['certificate_total'], 1) if batch['certificate_total']
+        else (100.0 if batch['status'] == 'completed' else 0.0)
+    )
+    return batch
+
+
+def get_tds_batch(db, batch_id: int, include_paths: bool = False) -> Optional[dict]:
+    columns = TDS_BATCH_COLUMNS + (", archive_path, summary_path" if include_paths else "")
+    result = db.execute_query(f"SELECT {columns} FROM tds_batches WHERE id = %s", (batch_id,))
+    return _batch_response(result[0]) if result else None
+
+
+def list_tds_batches(db, financial_year: Optional[str] = None, limit: int = 20) -> list:
+    query = f"SELECT {TDS_BATCH_COLUMNS} FROM tds_batches WHERE 1=1"
+    params = []
+
+    if financial_year:
+        query += " AND financial_year = %s"
+        params.append(financial_year)
+
+    query += " ORDER BY id DESC LIMIT %s"
+    params.append(limit)
+
+    return [_batch_response(row) for row in db.execute_query(query, tuple(params))]
+
+
+def fail_interrupted_tds_batches(db):
+    """
+    Batches run in-process, so a restart loses anything queued or running.
+    Mark the batches of processes that are gone (no heartbeat) as failed on startup
+    instead of leaving them 'processing' forever - batches of other live workers are kept.
+    """
+    try:
+        fail_orphaned_jobs(db, 'tds_batches')
+    except Exception as e:
+        logger.error(f"❌ Could not clean up interrupted TDS batches: {e}")
@@ -0,0 +1,89 @@
+"""
+Cron Specs
+Five-field cron expressions (minute hour day-of-month month day-of-week), server local time
+
+Each field: *  5  1,15  1-5  */10  1-20/5
+- day-of-week: 0-7, 0 and 7 are Sunday
+- when both day-of-month and day-of-week are restricted, a day matching EITHER runs
+  (standard cron behaviour)
+- names (JAN, MON) and @daily style shortcuts are not supported
+
+Usage:
+    next_cron_time('30 1 * * *', datetime.now())  → next 01:30
+"""
+
+from datetime import datetime, timedelta
+
+# (minimum, maximum) per field
+CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# How far ahead a matching day is searched (Feb 29 on a Monday ...)
+MAX_SEARCH_DAYS = 366 * 8
+
+
+def _parse_field(text: str, minimum: int, maximum: int) -> set:
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step_text = part.split('/', 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError
+        if part == '*':
+            start, end = minimum, maximum
+        elif '-' in part:
+            start, end = (int(value) for value in part.split('-', 1))
+        else:
+            start = int(part)
+            end = maximum if step > 1 else start
+        if start < minimum or end > maximum or start > end:
+            raise ValueError
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(spec: str) -> tuple:
+    """
+    spec → (minutes, hours, days, months, weekdays, day restricted, weekday restricted)
+    weekdays use Python numbering (Monday = 0). Raises ValueError if the spec is invalid
+    """
+    fields = (spec or '').split()
+    if len(fields) != 5:
+        raise ValueError(f"Invalid cron spec '{spec}' - expected 5 fields: minute hour day month weekday")
+
+    try:
+        minutes, hours, days, months, cron_weekdays = (
+            _parse_field(text, minimum, maximum) for text, (minimum, maximum) in zip(fields, CRON_FIELDS)
+        )
+    except ValueError:
+        raise ValueError(f"Invalid cron spec '{spec}'")
+
+    # cron: Sunday = 0 / 7 → Python: Monday = 0, Sunday = 6
+    weekdays = {(value - 1) % 7 for value in cron_weekdays}
+    return minutes, hours, days, months, weekdays, fields[2] != '*', fields[4] != '*'
+
+
+def next_cron_time(spec: str, after: datetime) -> datetime:
+    """First time strictly after `after` the spec matches (seconds dropped)"""
+    minutes, hours, days, months, weekdays, day_restricted, weekday_restricted = parse_cron(spec)
+    start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+
+    def day_matches(value) -> bool:
+        if value.month not in months:
+            return False
+        if day_restricted and weekday_restricted:
+            return value.day in days or value.weekday() in weekdays
+        return value.day in days and value.weekday() in weekdays
+
+    day = start.date()
+    for _ in range(MAX_SEARCH_DAYS):
+        if day_matches(day):
+            for hour in sorted(hours):
+                for minute in sorted(minutes):
+                    candidate = datetime(day.year, day.month, day.day, hour, minute)
+                    if candidate >= start:
+                        return candidate
+        day += timedelta(days=1)
+
+    raise ValueError(f"Cron spec '{spec}' never matches")
@@ -2,8 +2,8 @@
 Date utility functions for backend
 Handles date format conversions - ALL LOGIC IN BACKEND
 """
-from datetime import datetime, date
-from typing import Optional
+from datetime import datetime, date, timedelta
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -78,3 +78,49 @@ def format_date_for_db(date_input: any) -> Optional[str]:
     if parsed_date:
         return parsed_date.strftime('%Y-%m-%d')
     return None
+
+
+# ============================================
+# SARGABLE DATE FILTERS
+# DATE(column) / YEAR(column) * 12 + MONTH(column) comparisons hide the column from
+# its index. These helpers express the same filters as half-open [start, end)
+# ranges on the raw column, which MySQL answers with an index range scan.
+# Works for DATE, DATETIME and TIMESTAMP columns alike.
+# ============================================
+
+def _filter_date(value: any) -> date:
+    """Filter bound → date (a datetime counts as its day); ValueError if it can't be read"""
+    if isinstance(value, datetime):
+        return value.date()
+    parsed = parse_date_flexible(value)
+    if parsed is None:
+        raise ValueError(f"Invalid date: {value}")
+    return parsed
+
+
+def month_start(year: int, month: int) -> date:
+    """
+    First day of the month - month may run past 12 / below 1 (rolls the year)
+    YEAR(column) * 12 + MONTH(column) >= Y * 12 + M  is  column >= month_start(Y, M)
+    """
+    year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+    return date(year, month, 1)
+
+
+def date_range_condition(column: str, from_date: any = None, to_date: any = None) -> Tuple[str, list]:
+    """
+    Sargable form of DATE(column) BETWEEN from_date AND to_date (both days inclusive,
+    either may be None): column >= from_date AND column < to_date + 1 day
+
+    Returns (sql, params) - sql is '' when neither bound is given
+    """
+    conditions = []
+    params = []
+    if from_date not in (None, ''):
+        conditions.append(f"{column} >= %s")
+        params.append(_filter_date(from_date))
+    if to_date not in (None, ''):
+        conditions.append(f"{column} < %s")
+        params.append(_filter_date(to_date) + timedelta(days=1))
+    return ' AND '.join(conditions), params
+
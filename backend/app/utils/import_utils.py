@@ -0,0 +1,80 @@
+"""
+Import Utilities
+Shared helpers for bulk sheet imports (payouts, investors) - ALL LOGIC IN BACKEND
+"""
+
+import io
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Keep IN (...) lists and multi-row statements to a sane size
+IMPORT_LOOKUP_CHUNK_SIZE = 1000
+
+
+def chunked(items, size: int = IMPORT_LOOKUP_CHUNK_SIZE):
+    """Yield successive lists of at most `size` items"""
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def read_import_sheet(contents: bytes, filename: str):
+    """
+    Read an uploaded sheet into a DataFrame of raw cell values
+
+    - .csv  → parsed with the csv module
+    - .xlsx → streamed with openpyxl read-only mode (no full workbook in memory)
+    - .xls  → legacy fallback through pandas
+
+    Columns are taken from the first non-empty row. Blank rows are dropped but
+    the original sheet row number is kept in the `sheet_row` column so errors
+    point at the row the user sees in Excel.
+    """
+    import pandas as pd
+
+    lower_name = (filename or '').lower()
+    workbook = None
+
+    if lower_name.endswith('.csv'):
+        import csv
+
+        text = contents.decode('utf-8-sig', errors='replace')
+        row_iter = csv.reader(io.StringIO(text))
+    elif lower_name.endswith('.xlsx'):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(io.BytesIO(contents), read_only=True, data_only=True)
+        row_iter = workbook.worksheets[0].iter_rows(values_only=True)
+    else:
+        frame = pd.read_excel(io.BytesIO(contents), dtype=object)
+        frame['sheet_row'] = frame.index + 2
+        return frame
+
+    headers = None
+    records = []
+    row_numbers = []
+
+    try:
+        for row_number, values in enumerate(row_iter, start=1):
+            if not values or all(value is None or str(value).strip() == '' for value in values):
+                continue
+
+            if headers is None:
+                headers = [str(value).strip() if value is not None else '' for value in values]
+                continue
+
+            records.append(list(values[:len(headers)]) + [None] * (len(headers) - len(values)))
+            row_numbers.append(row_number)
+    finally:
+        if workbook is not None:
+            workbook.close()
+
+    frame = pd.DataFrame.from_records(records, columns=headers or [])
+    frame['sheet_row'] = row_numbers
+    return frame
+
+
+def clean_text_column(column):
+    """Cell values → stripped strings ('' for blanks)"""
+    return column.map(lambda v: '' if v is None or v != v else str(v).strip())
@@ -8,6 +8,8 @@ from typing import Optional, Dict, Any
 import logging
 import json
 
+from app.utils.date_utils import date_range_condition
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +25,9 @@ def log_report_generation(
     file_size_kb: Optional[float] = None,
     generation_time_ms: Optional[int] = None,
     status: str = "success",
-    error_message: Optional[str] = None
+    error_message: Optional[str] = None,
+    cache_status: Optional[str] = None,
+    page_count: Optional[int] = None
 ):
     """
     Log report generation to database
@@ -41,6 +45,8 @@ def log_report_generation(
         generation_time_ms: Time taken to generate in milliseconds (optional)
         status: Status of generation ("success", "failed", "in_progress")
         error_message: Error message if failed (optional)
+        cache_status: "hit" / "miss" when the report cache was consulted (optional)
+        page_count: Number of pages of a PDF (optional)
     """
     try:
         # Convert filters to JSON string
@@ -58,8 +64,10 @@ def log_report_generation(
             file_size_kb,
             generation_time_ms,
             status,
-            error_message
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            error_message,
+            cache_status,
+            page_count
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         
         db.execute_query(insert_query, (
@@ -73,7 +81,9 @@ def log_report_generation(
             file_size_kb,
             generation_time_ms,
             status,
-            error_message
+            error_message,
+            cache_status,
+            page_count
         ))
         
         logger.info(f"✅ Report log created: {report_name} ({report_type}) by {user_name}")
@@ -117,13 +127,10 @@ def get_report_logs(
             query += " AND report_name = %s"
             params.append(report_name)
         
-        if start_date:
-            query += " AND DATE(generated_at) >= %s"
-            params.append(start_date)
-        
-        if end_date:
-            query += " AND DATE(generated_at) <= %s"
-            params.append(end_date)
+        date_condition, date_params = date_range_condition("generated_at", start_date, end_date)
+        if date_condition:
+            query += f" AND {date_condition}"
+            params.extend(date_params)
         
         query += " ORDER BY generated_at DESC LIMIT %s"
         params.append(limit)
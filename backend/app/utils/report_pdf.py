@@ -0,0 +1,269 @@
+"""
+Report PDF
+Renders a report layout (app/utils/report_renderer.py sheets) as a paginated PDF
+
+- every sheet starts on a new page with its title
+- summary fields are label / value lines, tables get a shaded header row that is
+  repeated on every page the table continues on
+- column widths follow the content (header + first rows) and fill the page width;
+  text that does not fit is cut with '...' so every row is one line high
+- every page carries the report title and "Page X of Y"
+- A4 portrait, or landscape when a table has more than PORTRAIT_MAX_COLUMNS columns
+
+Kept free of database / settings imports: render_report_pdf() runs in worker
+processes (app/services/jobs/report_pdf_pool.py).
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+import time
+
+from app.utils.simple_pdf import PDFDocument, A4, A4_LANDSCAPE, text_width, format_rupees
+
+MARGIN = 36
+PAGE_HEADER_HEIGHT = 34
+PAGE_FOOTER_HEIGHT = 30
+
+FONT_SIZE = 8
+ROW_HEIGHT = 13
+CELL_PADDING = 4
+MIN_COLUMN_WIDTH = 36
+WIDTH_SAMPLE_ROWS = 200
+
+PORTRAIT_MAX_COLUMNS = 7
+
+# Widest Helvetica glyph (em) - text shorter than this bound needs no measuring
+_MAX_GLYPH_EM = 1.015
+
+_NUMERIC_STYLES = {'currency', 'bold_currency', 'percent'}
+
+
+def format_pdf_value(value, style=None) -> str:
+    if value is None or value == '':
+        return ''
+    if isinstance(value, bool):
+        return 'Yes' if value else 'No'
+    if isinstance(value, (int, float, Decimal)):
+        if style in ('currency', 'bold_currency'):
+            return format_rupees(value)
+        if style == 'percent':
+            return f"{float(value):.2f}%"
+        if isinstance(value, int):
+            return str(value)
+        return f"{float(value):,.2f}"
+    if isinstance(value, datetime):
+        return value.strftime('%d/%m/%Y %H:%M')
+    if isinstance(value, date):
+        return value.strftime('%d/%m/%Y')
+    return str(value).replace('\n', ' ')
+
+
+def fit_text(text: str, width: float, size: float = FONT_SIZE, bold: bool = False) -> str:
+    """Cut text with '...' so it fits width"""
+    if len(text) * size * _MAX_GLYPH_EM <= width or text_width(text, size, bold) <= width:
+        return text
+    ellipsis = '...'
+    available = width - text_width(ellipsis, size, bold)
+    used = 0
+    for index, char in enumerate(text):
+        used += text_width(char, size, bold)
+        if used > available:
+            return text[:index] + ellipsis
+    return text
+
+
+class _ReportPDFWriter:
+    """Keeps the current page and y position while blocks are laid out"""
+
+    def __init__(self, title: str, generated_on: str, landscape: bool):
+        self.title = title
+        self.generated_on = generated_on
+        self.document = PDFDocument(page_size=A4_LANDSCAPE if landscape else A4, title=title)
+        self.width, self.height = self.document.page_size
+        self.content_width = self.width - 2 * MARGIN
+        self.bottom = self.height - PAGE_FOOTER_HEIGHT
+        self.page = None
+        self.y = 0
+
+    def new_page(self):
+        if self.page:
+            self.page.flush()
+        self.page = self.document.add_page()
+        self.page.text(MARGIN, 22, fit_text(self.title, self.content_width / 2, 8, True), size=8, bold=True)
+        self.page.text(self.width - MARGIN, 22, f"Generated on {self.generated_on}", size=8, align='right')
+        self.page.line(MARGIN, 27, self.width - MARGIN, 27)
+        self.y = PAGE_HEADER_HEIGHT + 8
+
+    def ensure_space(self, height: float) -> bool:
+        """Start a new page when height does not fit; True if it did"""
+        if self.y + height > self.bottom:
+            self.new_page()
+            return True
+        return False
+
+    def sheet_title(self, title: str):
+        self.y += 16
+        self.page.text(MARGIN, self.y, fit_text(title, self.content_width, 14, True), size=14, bold=True)
+        self.y += 8
+
+    def heading(self, text: str):
+        self.ensure_space(18 + 2 * ROW_HEIGHT)
+        self.y += 16
+        self.page.text(MARGIN, self.y, fit_text(text, self.content_width, 11, True), size=11, bold=True)
+        self.y += 6
+
+    def fields(self, fields: list):
+        label_width = min(
+            max((text_width(str(label), FONT_SIZE + 1, True) for label, _, _ in fields), default=0) + 16,
+            self.content_width / 2
+        )
+        for label, value, style in fields:
+            self.ensure_space(ROW_HEIGHT + 1)
+            self.y += ROW_HEIGHT + 1
+            self.page.text(MARGIN, self.y, fit_text(str(label), label_width - 8, FONT_SIZE + 1, True),
+                           size=FONT_SIZE + 1, bold=True)
+            text = format_pdf_value(value, style)
+            if text:
+                self.page.text(MARGIN + label_width, self.y,
+                               fit_text(text, self.content_width - label_width, FONT_SIZE + 1), size=FONT_SIZE + 1)
+
+    def _column_layout(self, columns: list, items: list) -> tuple:
+        """
+        (widths, right-aligned flags) for the columns
+        Narrow columns get the width they need; whatever is left is shared equally by the
+        wide ones (their text is cut)
+        """
+        needed = [
+            max(text_width(title, FONT_SIZE, True) + 2 * CELL_PADDING, MIN_COLUMN_WIDTH)
+            for title, _, _ in columns
+        ]
+        numeric = [style in _NUMERIC_STYLES for _, _, style in columns]
+
+        for item in items[:WIDTH_SAMPLE_ROWS]:
+            for index, (_, key, style) in enumerate(columns):
+                value = item.get(key)
+                if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+                    numeric[index] = True
+                value_width = text_width(format_pdf_value(value, style), FONT_SIZE) + 2 * CELL_PADDING
+                needed[index] = max(needed[index], value_width)
+
+        if sum(needed) <= self.content_width:
+            scale = self.content_width / sum(needed)
+            return [width * scale for width in needed], numeric
+
+        widths = [0] * len(columns)
+        remaining = self.content_width
+        order = sorted(range(len(columns)), key=lambda index: needed[index])
+        for position, index in enumerate(order):
+            widths[index] = min(needed[index], remaining / (len(columns) - position))
+            remaining -= widths[index]
+        return widths, numeric
+
+    def _table_header(self, columns: list, widths: list, numeric: list):
+        self.page.rect(MARGIN, self.y, self.content_width, ROW_HEIGHT + 2, fill_gray=0.85, stroke=False)
+        x = MARGIN
+        for (title, _, _), width, right in zip(columns, widths, numeric):
+            text = fit_text(title, width - 2 * CELL_PADDING, FONT_SIZE, True)
+            if right:
+                self.page.text(x + width - CELL_PADDING, self.y + ROW_HEIGHT - 2, text, size=FONT_SIZE, bold=True, align='right')
+            else:
+                self.page.text(x + CELL_PADDING, self.y + ROW_HEIGHT - 2, text, size=FONT_SIZE, bold=True)
+            x += width
+        self.y += ROW_HEIGHT + 2
+
+    def _table_row(self, values: list, columns: list, widths: list, numeric: list,
+                   bold: bool = False, shaded: bool = False):
+        if shaded:
+            self.page.rect(MARGIN, self.y, self.content_width, ROW_HEIGHT, fill_gray=0.96, stroke=False)
+        x = MARGIN
+        for value, (_, _, style), width, right in zip(values, columns, widths, numeric):
+            text = format_pdf_value(value, style)
+            if text:
+                text = fit_text(text, width - 2 * CELL_PADDING, FONT_SIZE, bold)
+                if right:
+                    self.page.text(x + width - CELL_PADDING, self.y + ROW_HEIGHT - 3.5, text,
+                                   size=FONT_SIZE, bold=bold, align='right')
+                else:
+                    self.page.text(x + CELL_PADDING, self.y + ROW_HEIGHT - 3.5, text, size=FONT_SIZE, bold=bold)
+            x += width
+        self.y += ROW_HEIGHT
+
+    def table(self, heading, columns: list, items, total):
+        items = items if isinstance(items, list) else list(items)
+        widths, numeric = self._column_layout(columns, items)
+
+        self.ensure_space(3 * ROW_HEIGHT)
+        self.y += 6
+        self._table_header(columns, widths, numeric)
+
+        if not items:
+            self.y += ROW_HEIGHT
+            self.page.text(MARGIN + CELL_PADDING, self.y - 3.5, 'No records', size=FONT_SIZE)
+
+        for index, item in enumerate(items):
+            if self.ensure_space(ROW_HEIGHT):
+                if heading:
+                    self.y += 12
+                    self.page.text(MARGIN, self.y, fit_text(f"{heading} (continued)", self.content_width, 9, True),
+                                   size=9, bold=True)
+                self.y += 4
+                self._table_header(columns, widths, numeric)
+            self._table_row([item.get(key) for _, key, _ in columns], columns, widths, numeric, shaded=index % 2 == 1)
+
+        if total:
+            self.ensure_space(ROW_HEIGHT + 2)
+            self.page.line(MARGIN, self.y, self.width - MARGIN, self.y)
+            self._table_row(
+                ['TOTAL'] + [total.get(key) for _, key, _ in columns[1:]],
+                columns, widths, numeric, bold=True
+            )
+
+    def finish(self, file) -> int:
+        """Add "Page X of Y" to every page and write the document; returns the bytes written"""
+        page_count = len(self.document.pages)
+        for number, page in enumerate(self.document.pages, start=1):
+            page.text(self.width / 2, self.height - 16, f"Page {number} of {page_count}", size=8, align='center')
+            page.flush()
+        return self.document.write(file)
+
+
+def render_report_pdf(sheets: list, path: str) -> dict:
+    """
+    Write the layout to path as a PDF
+    Returns {'page_count', 'render_time_ms', 'size_bytes'}
+    """
+    started = time.perf_counter()
+
+    landscape = any(
+        block['kind'] == 'table' and len(block['columns']) > PORTRAIT_MAX_COLUMNS
+        for sheet in sheets for block in sheet['blocks']
+    )
+    writer = _ReportPDFWriter(
+        sheets[0]['title'] if sheets else 'Report',
+        datetime.now().strftime('%d/%m/%Y %H:%M:%S'),
+        landscape
+    )
+
+    for sheet in sheets:
+        writer.new_page()
+        writer.sheet_title(sheet['title'])
+
+        for block in sheet['blocks']:
+            if block['heading']:
+                writer.heading(block['heading'])
+            if block['kind'] == 'fields':
+                writer.fields(block['fields'])
+            else:
+                writer.table(block['heading'], block['columns'], block['items'], block['total'])
+
+    if not writer.page:
+        writer.new_page()
+
+    with open(path, 'wb') as file:
+        size_bytes = writer.finish(file)
+
+    return {
+        'page_count': len(writer.document.pages),
+        'render_time_ms': int((time.perf_counter() - started) * 1000),
+        'size_bytes': size_bytes
+    }
@@ -0,0 +1,194 @@
+"""
+Report Renderer
+Shared layout for report downloads - one definition renders the CSV and the .xlsx
+
+A layout is a list of sheets, each a title and blocks of rows:
+    sheets = [
+        report_sheet('Summary', 'Payout Statement Report', [
+            fields_block('Summary', [('Total Payout', 1250000.0, 'currency')]),
+            table_block('Series-wise Breakdown', SERIES_COLUMNS, report_data['series_breakdown']),
+        ]),
+        report_sheet('Payouts', 'Payout Details', [table_block(None, PAYOUT_COLUMNS, payouts)]),
+    ]
+    chunks = render_report(sheets, 'excel')   # generator of bytes
+
+Columns are (title, key, style) - style is a named xlsx_stream style
+('currency', 'percent', ...) or None. Rows are produced lazily from the items,
+so a 100k row sheet is never held as cells: the xlsx is written through
+xlsx_stream (write-only, styles cached by name) and the CSV row by row.
+"""
+
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+import csv
+import io
+
+from app.utils.xlsx_stream import stream_xlsx
+
+DEFAULT_COLUMN_WIDTH = 18
+
+# Flush CSV text every N rows
+CSV_ROWS_PER_CHUNK = 1000
+
+
+def fields_block(heading: Optional[str], fields: list) -> dict:
+    """Label / value pairs: [(label, value, style)]"""
+    return {'kind': 'fields', 'heading': heading, 'fields': fields}
+
+
+def table_block(heading: Optional[str], columns: list, items: Iterable[dict], total: Optional[dict] = None) -> dict:
+    """
+    One row per item: columns = [(title, key, style)]
+    total: optional {key: value} written as a bold last row (first column reads TOTAL)
+    """
+    return {'kind': 'table', 'heading': heading, 'columns': columns, 'items': items, 'total': total}
+
+
+def report_sheet(name: str, title: str, blocks: list, widths: Optional[list] = None) -> dict:
+    return {'name': name, 'title': title, 'blocks': blocks, 'widths': widths}
+
+
+def _generated_on() -> str:
+    return datetime.now().strftime('%d/%m/%Y %H:%M:%S')
+
+
+# ============================================
+# XLSX
+# ============================================
+
+def _sheet_rows(sheet: dict, generated_on: str) -> Iterator:
+    yield [sheet['title']], 'title'
+    yield [f"Generated on: {generated_on}"], None
+
+    for block in sheet['blocks']:
+        yield [], None
+        if block['heading']:
+            yield [block['heading']], 'section'
+
+        if block['kind'] == 'fields':
+            for label, value, style in block['fields']:
+                yield [label, value], ['bold', style]
+            continue
+
+        columns = block['columns']
+        keys = [key for _, key, _ in columns]
+        styles = [style for _, _, style in columns]
+
+        yield [title for title, _, _ in columns], 'header'
+        for item in block['items']:
+            yield [item.get(key) for key in keys], styles
+
+        if block['total']:
+            yield (
+                ['TOTAL'] + [block['total'].get(key) for key in keys[1:]],
+                ['bold'] + ['bold_currency' if style == 'currency' else 'bold' for style in styles[1:]]
+            )
+
+
+def _header_row(sheet: dict) -> int:
+    """Row of the first table header when the sheet starts with a table (frozen with the title), else 0"""
+    blocks = sheet['blocks']
+    if not blocks or blocks[0]['kind'] != 'table':
+        return 0
+    return 5 if blocks[0]['heading'] else 4
+
+
+def _widths(sheet: dict) -> list:
+    if sheet['widths']:
+        return sheet['widths']
+
+    column_count = 2
+    for block in sheet['blocks']:
+        if block['kind'] == 'table':
+            column_count = max(column_count, len(block['columns']))
+
+    widths = [DEFAULT_COLUMN_WIDTH] * column_count
+    for block in sheet['blocks']:
+        if block['kind'] == 'table':
+            for index, (title, _, _) in enumerate(block['columns']):
+                widths[index] = max(widths[index], len(title) + 4)
+        else:
+            for label, _, _ in block['fields']:
+                widths[0] = max(widths[0], min(len(str(label)) + 2, 40))
+    return widths
+
+
+def stream_report_workbook(sheets: list) -> Iterator[bytes]:
+    """Generator of .xlsx bytes, one worksheet per sheet"""
+    generated_on = _generated_on()
+    yield from stream_xlsx(
+        (
+            sheet['name'],
+            None,
+            _sheet_rows(sheet, generated_on),
+            {'widths': _widths(sheet), 'freeze_rows': _header_row(sheet)}
+        )
+        for sheet in sheets
+    )
+
+
+# ============================================
+# CSV
+# ============================================
+
+def _csv_value(value, style):
+    if value is None:
+        return ''
+    if style in ('currency', 'bold_currency') and isinstance(value, (int, float)):
+        return f"₹{value:,.2f}"
+    if style == 'percent' and isinstance(value, (int, float)):
+        return f"{value}%"
+    return value
+
+
+def _csv_rows(sheets: list, generated_on: str) -> Iterator[list]:
+    for index, sheet in enumerate(sheets):
+        if index:
+            yield []
+        yield [sheet['title']]
+        if not index:
+            yield ['Generated on', generated_on]
+
+        for block in sheet['blocks']:
+            yield []
+            if block['heading']:
+                yield [block['heading']]
+
+            if block['kind'] == 'fields':
+                for label, value, style in block['fields']:
+                    yield [label, _csv_value(value, style)]
+                continue
+
+            columns = block['columns']
+            yield [title for title, _, _ in columns]
+            for item in block['items']:
+                yield [_csv_value(item.get(key), style) for _, key, style in columns]
+
+            if block['total']:
+                yield ['TOTAL'] + [_csv_value(block['total'].get(key), style) for _, key, style in columns[1:]]
+
+
+def stream_report_csv(sheets: list) -> Iterator[bytes]:
+    """Generator of UTF-8 (with BOM, so Excel shows ₹) CSV bytes - sheets one below the other"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    output.write('\ufeff')
+
+    for count, row in enumerate(_csv_rows(sheets, _generated_on()), start=1):
+        writer.writerow(row)
+        if count % CSV_ROWS_PER_CHUNK == 0:
+            yield output.getvalue().encode('utf-8')
+            output.seek(0)
+            output.truncate()
+
+    if output.tell():
+        yield output.getvalue().encode('utf-8')
+
+
+def render_report(sheets: list, file_format: str) -> Iterator[bytes]:
+    """'csv' or 'excel' → generator of file bytes"""
+    if file_format == 'csv':
+        return stream_report_csv(sheets)
+    if file_format == 'excel':
+        return stream_report_workbook(sheets)
+    raise ValueError(f"Invalid format '{file_format}'. Must be 'csv' or 'excel'")
@@ -0,0 +1,178 @@
+"""
+Report Tables
+Turns the JSON returned by the /reports/* endpoints into files (CSV, xlsx, JSON)
+and into a report_renderer layout (used for PDF)
+
+Every report is a dict of summary values and lists of rows. flatten_report() splits it into:
+- summary: (label, value) for every scalar - nested dicts are labelled with their parent's name
+- tables:  (title, headers, rows) for every list - a list of dicts gets one column per key
+
+Usage:
+    with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+        record_count = write_report_csv('KYC Status Report', data, file)
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+import csv
+import json
+
+from app.utils.report_renderer import report_sheet, fields_block, table_block
+from app.utils.xlsx_stream import stream_xlsx
+
+# Top-level keys that are request metadata, not report content
+SKIP_KEYS = {'timestamp', 'section_timings'}
+
+# Words written in capitals in column / section titles
+UPPERCASE_WORDS = {'id', 'kyc', 'pan', 'rbi', 'sebi', 'aum', 'ifsc', 'tds', 'ncd', 'dp', 'cin'}
+
+COLUMN_WIDTH = 18
+MAX_COLUMN_WIDTH = 45
+
+
+def humanize(key) -> str:
+    """'kyc_details' → 'KYC Details'"""
+    words = str(key).replace('_', ' ').split()
+    return ' '.join(word.upper() if word.lower() in UPPERCASE_WORDS else word.capitalize() for word in words)
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def _cell(value):
+    """Scalars are kept as they are; nested lists / dicts become compact JSON"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=_json_default, ensure_ascii=False)
+    return value
+
+
+def _table(items) -> tuple:
+    """(headers, rows) for a list of dicts / lists / scalars"""
+    keys = []
+    seen = set()
+    for item in items:
+        if isinstance(item, dict):
+            for key in item:
+                if key not in seen:
+                    seen.add(key)
+                    keys.append(key)
+
+    if keys:
+        headers = [humanize(key) for key in keys]
+        rows = [
+            [_cell(item.get(key)) for key in keys] if isinstance(item, dict) else [_cell(item)]
+            for item in items
+        ]
+        return headers, rows
+
+    if items and all(isinstance(item, (list, tuple)) for item in items):
+        width = max(len(item) for item in items)
+        return [f"Column {index}" for index in range(1, width + 1)], [[_cell(value) for value in item] for item in items]
+
+    return ['Value'], [[_cell(item)] for item in items]
+
+
+def flatten_report(data: dict) -> tuple:
+    """Report JSON → (summary rows, tables)"""
+    summary = []
+    tables = []
+
+    def walk(path, value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if not path and key in SKIP_KEYS:
+                    continue
+                walk(path + [humanize(key)], item)
+        elif isinstance(value, (list, tuple)):
+            headers, rows = _table(value)
+            tables.append((' - '.join(path) or 'Rows', headers, rows))
+        else:
+            summary.append((' - '.join(path), _cell(value)))
+
+    walk([], data if isinstance(data, dict) else {'rows': data})
+    return summary, tables
+
+
+def count_report_records(tables) -> int:
+    return sum(len(rows) for _, _, rows in tables)
+
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.strftime('%d/%m/%Y %H:%M:%S')
+    if isinstance(value, date):
+        return value.strftime('%d/%m/%Y')
+    return '' if value is None else value
+
+
+def write_report_csv(report_name: str, data: dict, file) -> int:
+    """Title, summary block, then one block per table; returns the number of table rows"""
+    summary, tables = flatten_report(data)
+    writer = csv.writer(file)
+
+    writer.writerow([report_name])
+    writer.writerow(['Generated on', datetime.now().strftime('%d/%m/%Y %H:%M:%S')])
+
+    if summary:
+        writer.writerow([])
+        writer.writerow(['Summary'])
+        writer.writerows([label, _csv_value(value)] for label, value in summary)
+
+    for title, headers, rows in tables:
+        writer.writerow([])
+        writer.writerow([title])
+        writer.writerow(headers)
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+
+    return count_report_records(tables)
+
+
+def _column_widths(headers, rows, sample: int = 200) -> list:
+    widths = [max(COLUMN_WIDTH, len(str(header)) + 2) for header in headers]
+    for row in rows[:sample]:
+        for index, value in enumerate(row[:len(widths)]):
+            if isinstance(value, str):
+                widths[index] = min(max(widths[index], len(value) + 2), MAX_COLUMN_WIDTH)
+    return widths
+
+
+def stream_report_xlsx(report_name: str, data: dict):
+    """Generator of .xlsx bytes: a Summary sheet plus one sheet per table"""
+    summary, tables = flatten_report(data)
+
+    summary_rows = [
+        ([report_name], 'bold'),
+        ['Generated on', datetime.now().strftime('%d/%m/%Y %H:%M:%S')],
+        [],
+    ] + [[label, value] for label, value in summary]
+    if tables:
+        summary_rows += [[]] + [[title, f"{len(rows)} row(s) - see sheet"] for title, _, rows in tables]
+
+    sheets = [('Summary', ['Field', 'Value'], summary_rows, {'widths': [40, 30]})]
+
+    for title, headers, rows in tables:
+        sheets.append((title, headers, rows, {'widths': _column_widths(headers, rows)}))
+
+    yield from stream_xlsx(sheets)
+
+
+def report_layout(report_name: str, data: dict) -> list:
+    """Summary fields, then one sheet per table - for reports without a layout of their own"""
+    summary, tables = flatten_report(data)
+
+    sheets = [report_sheet('Summary', report_name, [fields_block('Summary', [(label, value, None) for label, value in summary])])]
+    for title, headers, rows in tables:
+        columns = [(header, index, None) for index, header in enumerate(headers)]
+        sheets.append(report_sheet(title, title, [table_block(None, columns, [dict(enumerate(row)) for row in rows])]))
+    return sheets
+
+
+def report_json_bytes(data: dict) -> bytes:
+    return json.dumps(data, default=_json_default, ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,226 @@
+"""
+Simple PDF Writer
+Builds small text-and-rule PDF documents (certificates, statements) without any
+third-party library, so it can run in worker processes and on any server
+
+Only the standard Helvetica fonts are used - they need no embedding, which keeps
+a one-page document at a few KB. Text is WinAnsi (Latin-1): other characters
+become '?', so amounts are written with 'Rs.' rather than the rupee sign.
+
+Coordinates are in points from the TOP-LEFT corner of the page (A4 = 595 × 842).
+
+Usage:
+    document = PDFDocument()
+    page = document.add_page()
+    page.text(40, 60, "Certificate", size=16, bold=True)
+    page.line(40, 70, 555, 70)
+    pdf_bytes = document.to_bytes()
+
+Long documents: page.flush() compresses what has been drawn so far (later
+drawing, e.g. a "Page 3 of 40" footer, becomes another content stream) and
+document.write(file) serializes page by page.
+"""
+
+import io
+import zlib
+
+A4 = (595, 842)
+A4_LANDSCAPE = (842, 595)
+
+# Glyph widths (1/1000 em) for ASCII 32-126 from the standard Helvetica AFM files
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584
+]
+
+
+def text_width(text: str, size: float, bold: bool = False) -> float:
+    """Width of text in points (characters outside ASCII count as an average glyph)"""
+    widths = _HELVETICA_BOLD_WIDTHS if bold else _HELVETICA_WIDTHS
+    total = 0
+    for char in text:
+        code = ord(char)
+        total += widths[code - 32] if 32 <= code <= 126 else 556
+    return total * size / 1000
+
+
+def format_rupees(amount) -> str:
+    """1234567.8 → 'Rs. 12,34,567.80' (Indian digit grouping)"""
+    amount = float(amount or 0)
+    sign = '-' if amount < 0 else ''
+    whole, fraction = f"{abs(amount):.2f}".split('.')
+    if len(whole) > 3:
+        head, tail = whole[:-3], whole[-3:]
+        groups = []
+        while len(head) > 2:
+            groups.insert(0, head[-2:])
+            head = head[:-2]
+        if head:
+            groups.insert(0, head)
+        whole = ','.join(groups + [tail])
+    return f"{sign}Rs. {whole}.{fraction}"
+
+
+def _pdf_string(text: str) -> bytes:
+    data = str(text).encode('latin-1', errors='replace')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+def wrap_text(text: str, max_width: float, size: float, bold: bool = False) -> list:
+    """Split text into lines no wider than max_width (breaks on spaces)"""
+    lines = []
+    for paragraph in str(text).splitlines() or ['']:
+        current = ''
+        for word in paragraph.split(' '):
+            candidate = f"{current} {word}" if current else word
+            if current and text_width(candidate, size, bold) > max_width:
+                lines.append(current)
+                current = word
+            else:
+                current = candidate
+        lines.append(current)
+    return lines
+
+
+class PDFPage:
+    """Drawing operations for one page, kept as a content stream"""
+
+    def __init__(self, width: float, height: float):
+        self.width = width
+        self.height = height
+        self._ops = []
+        self._streams = []
+
+    def text(self, x: float, y: float, text, size: float = 10, bold: bool = False, align: str = 'left'):
+        """Draw one line of text with its baseline at y ('left', 'right' or 'center' of x)"""
+        text = '' if text is None else str(text)
+        if align == 'right':
+            x -= text_width(text, size, bold)
+        elif align == 'center':
+            x -= text_width(text, size, bold) / 2
+        font = b'/F2' if bold else b'/F1'
+        self._ops.append(
+            b'BT ' + font + b' %.2f Tf %.2f %.2f Td ' % (size, x, self.height - y) + _pdf_string(text) + b' Tj ET'
+        )
+
+    def paragraph(self, x: float, y: float, text, max_width: float, size: float = 10,
+                  bold: bool = False, leading: float = None) -> float:
+        """Draw wrapped text starting at baseline y; returns the baseline after the last line"""
+        leading = leading or size * 1.35
+        for line in wrap_text(text, max_width, size, bold):
+            self.text(x, y, line, size=size, bold=bold)
+            y += leading
+        return y
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, width: float = 0.5):
+        self._ops.append(b'%.2f w %.2f %.2f m %.2f %.2f l S' % (width, x1, self.height - y1, x2, self.height - y2))
+
+    def rect(self, x: float, y: float, width: float, height: float, fill_gray: float = None, stroke: bool = True):
+        """Rectangle with its top-left corner at (x, y); fill_gray 0 (black) .. 1 (white)"""
+        op = b'%.2f %.2f %.2f %.2f re' % (x, self.height - y - height, width, height)
+        if fill_gray is not None:
+            paint = b'B' if stroke else b'f'
+            self._ops.append(b'q %.3f g ' % fill_gray + op + b' ' + paint + b' Q')
+        else:
+            self._ops.append(op + b' S')
+
+    def content(self) -> bytes:
+        return b'\n'.join(self._ops)
+
+    def flush(self):
+        """Compress the drawing so far into a content stream (frees the operations)"""
+        if self._ops:
+            self._streams.append(zlib.compress(self.content()))
+            self._ops = []
+
+    def streams(self) -> list:
+        self.flush()
+        return self._streams or [zlib.compress(b'')]
+
+
+class PDFDocument:
+    """A list of pages serialized into a PDF 1.4 file"""
+
+    def __init__(self, page_size=A4, title: str = None):
+        self.page_size = page_size
+        self.title = title
+        self.pages = []
+
+    def add_page(self) -> PDFPage:
+        page = PDFPage(*self.page_size)
+        self.pages.append(page)
+        return page
+
+    def to_bytes(self) -> bytes:
+        output = io.BytesIO()
+        self.write(output)
+        return output.getvalue()
+
+    def write(self, file) -> int:
+        """Serialize to a binary file object, one page at a time; returns the bytes written"""
+        if not self.pages:
+            self.add_page()
+
+        # 1 catalog, 2 pages, 3/4 fonts, 5 info, then per page: the page and its content streams
+        page_ids = []
+        next_id = 6
+        for page in self.pages:
+            page_ids.append(next_id)
+            next_id += 1 + len(page.streams())
+        object_count = next_id - 1
+
+        offsets = []
+        position = 0
+
+        def write_object(body: bytes):
+            nonlocal position
+            offsets.append(position)
+            data = b'%d 0 obj\n' % len(offsets) + body + b'\nendobj\n'
+            file.write(data)
+            position += len(data)
+
+        header = b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n'
+        file.write(header)
+        position += len(header)
+
+        write_object(b'<< /Type /Catalog /Pages 2 0 R >>')
+        write_object(
+            b'<< /Type /Pages /Kids [' + b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+            + b'] /Count %d >>' % len(page_ids)
+        )
+        write_object(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+        write_object(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>')
+        write_object(b'<< /Producer (VVPL NCD) ' + (b'/Title ' + _pdf_string(self.title) if self.title else b'') + b' >>')
+
+        for page_id, page in zip(page_ids, self.pages):
+            streams = page.streams()
+            contents = b' '.join(b'%d 0 R' % (page_id + index) for index in range(1, len(streams) + 1))
+            write_object(
+                b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] '
+                b'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents [%s] >>'
+                % (page.width, page.height, contents)
+            )
+            for stream in streams:
+                write_object(b'<< /Length %d /Filter /FlateDecode >>\nstream\n' % len(stream) + stream + b'\nendstream')
+
+        xref = bytearray(b'xref\n0 %d\n0000000000 65535 f \n' % (object_count + 1))
+        for offset in offsets:
+            xref += b'%010d 00000 n \n' % offset
+        xref += (
+            b'trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%EOF\n'
+            % (object_count + 1, position)
+        )
+        file.write(xref)
+        return position + len(xref)
@@ -0,0 +1,281 @@
+"""
+Streaming XLSX Writer
+Writes .xlsx files row by row and yields the zipped bytes as they are produced
+
+Unlike a full openpyxl Workbook, nothing is kept per cell: memory stays constant
+and the first bytes reach the client before the last row is computed.
+Cells are written as inline strings / numbers with a small set of named styles.
+
+Usage:
+    sheets = [('Payouts', header_row, rows_iterable, {'widths': [15, 30]})]
+    return StreamingResponse(stream_xlsx(sheets), media_type=XLSX_MEDIA_TYPE)
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from xml.sax.saxutils import escape
+import re
+import zipfile
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Flush zipped bytes to the client every N rows
+ROWS_PER_FLUSH = 500
+
+# Characters not allowed in XML 1.0
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Named styles → index into cellXfs in styles.xml (order must match _STYLES_XML)
+STYLE_IDS = {
+    'default': 0,
+    'header': 1,
+    'currency': 2,
+    'bold': 3,
+    'title': 4,
+    'section': 5,
+    'percent': 6,
+    'bold_currency': 7,
+}
+
+_STYLES_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<numFmts count="2"><numFmt numFmtId="164" formatCode="#,##0.00"/><numFmt numFmtId="165" formatCode="0.00&quot;%&quot;"/></numFmts>
+<fonts count="5">
+<font><sz val="11"/><name val="Calibri"/></font>
+<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/></font>
+<font><b/><sz val="11"/><name val="Calibri"/></font>
+<font><b/><sz val="14"/><name val="Calibri"/></font>
+<font><b/><sz val="12"/><name val="Calibri"/></font>
+</fonts>
+<fills count="3">
+<fill><patternFill patternType="none"/></fill>
+<fill><patternFill patternType="gray125"/></fill>
+<fill><patternFill patternType="solid"><fgColor rgb="FF366092"/><bgColor indexed="64"/></patternFill></fill>
+</fills>
+<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="8">
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>
+<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/>
+<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>
+<xf numFmtId="0" fontId="3" fillId="0" borderId="0" xfId="0" applyFont="1"/>
+<xf numFmtId="0" fontId="4" fillId="0" borderId="0" xfId="0" applyFont="1"/>
+<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>
+<xf numFmtId="164" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1" applyNumberFormat="1"/>
+</cellXfs>
+<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>
+</styleSheet>"""
+
+
+class ChunkBuffer:
+    """Write-only file object that hands its contents over on drain()"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+_column_letters = {}
+
+
+def column_letter(index: int) -> str:
+    """0 → A, 25 → Z, 26 → AA (cached)"""
+    letters = _column_letters.get(index)
+    if letters is None:
+        n = index + 1
+        letters = ''
+        while n:
+            n, remainder = divmod(n - 1, 26)
+            letters = chr(65 + remainder) + letters
+        _column_letters[index] = letters
+    return letters
+
+
+def _cell_xml(ref: str, value, style_id: int) -> str:
+    style = f' s="{style_id}"' if style_id else ''
+
+    if value is None or value == '':
+        return f'<c r="{ref}"{style}/>' if style_id else ''
+
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{style} t="b"><v>{int(value)}</v></c>'
+
+    if isinstance(value, (int, float, Decimal)):
+        if value != value:  # NaN
+            return ''
+        return f'<c r="{ref}"{style}><v>{value}</v></c>'
+
+    if isinstance(value, datetime):
+        value = value.strftime('%d/%m/%Y %H:%M:%S')
+    elif isinstance(value, date):
+        value = value.strftime('%d/%m/%Y')
+
+    text = escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _row_xml(row_number: int, values, styles) -> str:
+    if isinstance(styles, str) or styles is None:
+        style_ids = [STYLE_IDS.get(styles or 'default', 0)] * len(values)
+    else:
+        style_ids = [STYLE_IDS.get(name or 'default', 0) for name in styles]
+
+    cells = ''.join(
+        _cell_xml(f"{column_letter(index)}{row_number}", value, style_ids[index] if index < len(style_ids) else 0)
+        for index, value in enumerate(values)
+    )
+    return f'<row r="{row_number}">{cells}</row>'
+
+
+def stream_xlsx(sheets):
+    """
+    Generator yielding the bytes of an .xlsx file
+
+    sheets: iterable of (sheet_name, header, rows, options)
+      - header:  list of column titles (written with the 'header' style) or None
+      - rows:    iterable of lists, or of (values, styles) tuples where styles is
+                 a style name for the whole row or a list of names per cell
+      - options: {'widths': [..], 'freeze_header': True, 'freeze_rows': 0, 'column_styles': [..]}
+                 column_styles applies named styles to plain rows per column,
+                 freeze_rows keeps the first N rows in view (when there is no header row)
+    Sheet names are made valid and unique (Excel refuses duplicates)
+    """
+    buffer = ChunkBuffer()
+    archive = zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED)
+    sheet_names = []
+    used_names = set()
+
+    for sheet_index, (sheet_name, header, rows, options) in enumerate(sheets, start=1):
+        options = options or {}
+        base_name = re.sub(r'[\[\]\*\?/\\:]', '-', str(sheet_name))[:31] or f'Sheet{sheet_index}'
+        safe_name = base_name
+        suffix = 2
+        while safe_name.lower() in used_names:
+            safe_name = f"{base_name[:26]} ({suffix})"
+            suffix += 1
+        used_names.add(safe_name.lower())
+        sheet_names.append(safe_name)
+        column_styles = options.get('column_styles')
+
+        with archive.open(f'xl/worksheets/sheet{sheet_index}.xml', mode='w', force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            )
+
+            freeze_rows = 1 if header and options.get('freeze_header', True) else options.get('freeze_rows', 0)
+            if freeze_rows:
+                sheet.write((
+                    f'<sheetViews><sheetView workbookViewId="0">'
+                    f'<pane ySplit="{freeze_rows}" topLeftCell="A{freeze_rows + 1}" activePane="bottomLeft" state="frozen"/>'
+                    f'</sheetView></sheetViews>'
+                ).encode('utf-8'))
+
+            widths = options.get('widths')
+            if widths:
+                cols = ''.join(
+                    f'<col min="{i}" max="{i}" width="{width}" customWidth="1"/>'
+                    for i, width in enumerate(widths, start=1) if width
+                )
+                sheet.write(f'<cols>{cols}</cols>'.encode('utf-8'))
+
+            sheet.write(b'<sheetData>')
+
+            row_number = 0
+            pending = []
+
+            if header:
+                row_number += 1
+                pending.append(_row_xml(row_number, header, 'header'))
+
+            for row in rows:
+                row_number += 1
+                if isinstance(row, tuple) and len(row) == 2 and isinstance(row[0], (list, tuple)):
+                    values, styles = row
+                else:
+                    values, styles = row, column_styles
+                pending.append(_row_xml(row_number, list(values), styles))
+
+                if len(pending) >= ROWS_PER_FLUSH:
+                    sheet.write(''.join(pending).encode('utf-8'))
+                    pending = []
+                    data = buffer.drain()
+                    if data:
+                        yield data
+
+            if pending:
+                sheet.write(''.join(pending).encode('utf-8'))
+
+            sheet.write(b'</sheetData></worksheet>')
+
+        data = buffer.drain()
+        if data:
+            yield data
+
+    if not sheet_names:
+        raise ValueError("An xlsx file needs at least one sheet")
+
+    sheet_overrides = ''.join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        f'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for i in range(1, len(sheet_names) + 1)
+    )
+    archive.writestr('[Content_Types].xml', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        f'{sheet_overrides}'
+        '</Types>'
+    ))
+    archive.writestr('_rels/.rels', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ))
+
+    sheets_xml = ''.join(
+        f'<sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>'
+        for i, name in enumerate(sheet_names, start=1)
+    )
+    archive.writestr('xl/workbook.xml', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets>{sheets_xml}</sheets>'
+        '</workbook>'
+    ))
+
+    sheet_rels = ''.join(
+        f'<Relationship Id="rId{i}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, len(sheet_names) + 1)
+    )
+    styles_id = len(sheet_names) + 1
+    archive.writestr('xl/_rels/workbook.xml.rels', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'{sheet_rels}'
+        f'<Relationship Id="rId{styles_id}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    ))
+    archive.writestr('xl/styles.xml', _STYLES_XML)
+    archive.close()
+
+    data = buffer.drain()
+    if data:
+        yield data
@@ -167,7 +167,8 @@ CREATE TABLE `grievances` (
   KEY `idx_series_id` (`series_id`),
   KEY `idx_created_at` (`created_at`),
   KEY `idx_priority` (`priority`),
-  KEY `idx_category` (`category`)
+  KEY `idx_category` (`category`),
+  KEY `idx_updated_at` (`updated_at`)
 ) ENGINE=InnoDB AUTO_INCREMENT=3 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 
@@ -180,6 +181,7 @@ CREATE TABLE `interest_payouts` (
   `investor_id` int NOT NULL,
   `series_id` int NOT NULL,
   `payout_month` varchar(50) NOT NULL COMMENT 'e.g., February 2026',
+  `payout_period` date DEFAULT NULL COMMENT 'First day of the interest month, e.g. 2026-02-01',
   `payout_date` varchar(20) NOT NULL COMMENT 'e.g., 15-Feb-2026',
   `amount` decimal(15,2) NOT NULL COMMENT 'Interest amount in rupees',
   `status` enum('Paid','Pending','Scheduled') DEFAULT 'Scheduled',
@@ -193,6 +195,9 @@ CREATE TABLE `interest_payouts` (
   KEY `idx_series` (`series_id`),
   KEY `idx_status` (`status`),
   KEY `idx_payout_month` (`payout_month`),
+  KEY `idx_payout_period_series_investor` (`payout_period`,`series_id`,`investor_id`),
+  KEY `idx_status_paid_date` (`status`,`paid_date`,`is_active`,`investor_id`,`amount`),
+  KEY `idx_updated_at` (`updated_at`),
   CONSTRAINT `interest_payouts_ibfk_1` FOREIGN KEY (`investor_id`) REFERENCES `investors` (`id`) ON DELETE CASCADE,
   CONSTRAINT `interest_payouts_ibfk_2` FOREIGN KEY (`series_id`) REFERENCES `ncd_series` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=33 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT='Interest payout records for investors';
@@ -220,6 +225,8 @@ CREATE TABLE `investments` (
   KEY `idx_investor_id` (`investor_id`),
   KEY `idx_series_id` (`series_id`),
   KEY `idx_status` (`status`),
+  KEY `idx_updated_at` (`updated_at`),
+  KEY `idx_date_received_series` (`date_received`,`series_id`),
   CONSTRAINT `investments_ibfk_1` FOREIGN KEY (`investor_id`) REFERENCES `investors` (`id`) ON DELETE CASCADE,
   CONSTRAINT `investments_ibfk_2` FOREIGN KEY (`series_id`) REFERENCES `ncd_series` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=10 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -243,6 +250,7 @@ CREATE TABLE `investor_documents` (
   PRIMARY KEY (`id`),
   KEY `idx_investor_id` (`investor_id`),
   KEY `idx_document_type` (`document_type`),
+  KEY `idx_uploaded_at` (`uploaded_at`),
   CONSTRAINT `investor_documents_ibfk_1` FOREIGN KEY (`investor_id`) REFERENCES `investors` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=8 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -294,6 +302,7 @@ CREATE TABLE `investor_series` (
   UNIQUE KEY `unique_investor_series` (`investor_id`,`series_id`),
   KEY `idx_investor_id` (`investor_id`),
   KEY `idx_series_id` (`series_id`),
+  KEY `idx_updated_at` (`updated_at`),
   CONSTRAINT `investor_series_ibfk_1` FOREIGN KEY (`investor_id`) REFERENCES `investors` (`id`) ON DELETE CASCADE,
   CONSTRAINT `investor_series_ibfk_2` FOREIGN KEY (`series_id`) REFERENCES `ncd_series` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=10 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -340,7 +349,9 @@ CREATE TABLE `investors` (
   UNIQUE KEY `unique_account_number` (`account_number`),
   KEY `idx_investor_id` (`investor_id`),
   KEY `idx_kyc_status` (`kyc_status`),
-  KEY `idx_status` (`status`)
+  KEY `idx_status` (`status`),
+  KEY `idx_updated_at` (`updated_at`),
+  KEY `idx_created_at` (`created_at`)
 ) ENGINE=InnoDB AUTO_INCREMENT=24 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 
@@ -396,6 +407,7 @@ CREATE TABLE `ncd_series` (
   KEY `fk_approved_by` (`approved_by`),
   KEY `fk_rejected_by` (`rejected_by`),
   KEY `fk_last_modified_by` (`last_modified_by`),
+  KEY `idx_updated_at` (`updated_at`),
   CONSTRAINT `fk_approved_by` FOREIGN KEY (`approved_by`) REFERENCES `users` (`id`) ON DELETE SET NULL,
   CONSTRAINT `fk_last_modified_by` FOREIGN KEY (`last_modified_by`) REFERENCES `users` (`id`) ON DELETE SET NULL,
   CONSTRAINT `fk_rejected_by` FOREIGN KEY (`rejected_by`) REFERENCES `users` (`id`) ON DELETE SET NULL
@@ -409,15 +421,17 @@ CREATE TABLE `ncd_series` (
 CREATE TABLE `report_logs` (
   `id` int NOT NULL AUTO_INCREMENT,
   `report_name` varchar(100) COLLATE utf8mb4_unicode_ci NOT NULL,
-  `report_type` enum('PDF','Excel','CSV') COLLATE utf8mb4_unicode_ci NOT NULL,
+  `report_type` enum('PDF','Excel','CSV','JSON','Parquet','Arrow') COLLATE utf8mb4_unicode_ci NOT NULL,
   `user_id` int NOT NULL,
   `user_name` varchar(255) COLLATE utf8mb4_unicode_ci NOT NULL,
   `user_role` varchar(50) COLLATE utf8mb4_unicode_ci NOT NULL,
   `report_filters` json DEFAULT NULL,
   `record_count` int DEFAULT '0',
+  `page_count` int DEFAULT NULL COMMENT 'PDF only',
   `file_size_kb` decimal(10,2) DEFAULT NULL,
   `generation_time_ms` int DEFAULT NULL,
   `status` enum('success','failed','in_progress') COLLATE utf8mb4_unicode_ci DEFAULT 'success',
+  `cache_status` enum('hit','miss') COLLATE utf8mb4_unicode_ci DEFAULT NULL,
   `error_message` text COLLATE utf8mb4_unicode_ci,
   `generated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP,
   PRIMARY KEY (`id`),
@@ -506,6 +520,7 @@ CREATE TABLE `series_compliance_status` (
   KEY `idx_series_year_month` (`series_id`,`year`,`month`),
   KEY `idx_series_status` (`series_id`,`status`),
   KEY `idx_period` (`year`,`month`),
+  KEY `idx_updated_at` (`updated_at`),
   CONSTRAINT `series_compliance_status_ibfk_1` FOREIGN KEY (`series_id`) REFERENCES `ncd_series` (`id`) ON DELETE CASCADE,
   CONSTRAINT `series_compliance_status_ibfk_2` FOREIGN KEY (`master_item_id`) REFERENCES `compliance_master_items` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=14 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Compliance status per series per month - like role_permissions pattern';
@@ -532,6 +547,7 @@ CREATE TABLE `series_documents` (
   UNIQUE KEY `unique_series_document` (`series_id`,`document_type`),
   KEY `idx_series_id` (`series_id`),
   KEY `idx_document_type` (`document_type`),
+  KEY `idx_uploaded_at` (`uploaded_at`),
   CONSTRAINT `series_documents_ibfk_1` FOREIGN KEY (`series_id`) REFERENCES `ncd_series` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB AUTO_INCREMENT=31 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -562,6 +578,7 @@ CREATE TABLE `users` (
   KEY `idx_user_id` (`user_id`),
   KEY `idx_username` (`username`),
   KEY `idx_email` (`email`),
-  KEY `idx_is_active` (`is_active`)
+  KEY `idx_is_active` (`is_active`),
+  KEY `idx_updated_at` (`updated_at`)
 ) ENGINE=InnoDB AUTO_INCREMENT=21 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -1,7 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from app.api.routes import auth, users, audit, permissions, series, compliance, compliance_documents, dashboard, investors, communication, grievances, payouts, reports
+from app.api.routes import auth, users, audit, permissions, series, compliance, compliance_documents, dashboard, investors, communication, grievances, payouts, reports, report_jobs, report_schedules, report_snapshots, exports, jobs, tds
 from app.core.database import get_db
 from app.core.config import settings
 import uvicorn
@@ -28,8 +28,47 @@ app = FastAPI(
 async def startup_event():
     """Run on application startup"""
     logger.info("🚀 NCD Management System - Starting...")
+    
+    # Background import jobs run in-process - fail what a dead process left behind
+    from app.services.jobs.import_jobs import fail_interrupted_jobs
+    fail_interrupted_jobs(get_db())
+    from app.services.jobs.report_jobs import fail_interrupted_report_jobs
+    fail_interrupted_report_jobs(get_db())
+    from app.services.tax.tds import fail_interrupted_tds_batches
+    fail_interrupted_tds_batches(get_db())
+    # Keeps this process's jobs alive for the other workers and fails orphaned ones
+    from app.services.jobs.job_heartbeat import start_job_heartbeat
+    start_job_heartbeat()
+    
+    # Payout lookups filter on payout_period - fill it for rows stored before the column existed
+    from app.api.routes.payouts import backfill_payout_periods
+    try:
+        backfill_payout_periods(get_db())
+    except Exception as e:
+        logger.error(f"❌ Could not backfill payout periods: {e}")
+    
+    # Trend reports read pre-aggregated facts - a first build runs in the background,
+    # report requests catch them up incrementally
+    from app.services.storage.report_facts import start_report_facts_build
+    start_report_facts_build()
+    
+    # Standard regulatory reports are precomputed overnight from report_schedules
+    from app.services.jobs.report_scheduler import start_report_scheduler
+    start_report_scheduler()
+    
     logger.info("✅ System ready")
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the report scheduler, the job heartbeat and the PDF render processes"""
+    from app.services.jobs.report_scheduler import stop_report_scheduler
+    stop_report_scheduler()
+    from app.services.jobs.job_heartbeat import stop_job_heartbeat
+    stop_job_heartbeat()
+    from app.services.jobs.report_pdf_pool import shutdown_pdf_pool
+    shutdown_pdf_pool()
+
 # Log all requests middleware
 @app.middleware("http")
 async def log_requests(request, call_next):
@@ -87,6 +126,12 @@ app.include_router(communication.router)
 app.include_router(grievances.router)
 app.include_router(payouts.router)
 app.include_router(reports.router)
+app.include_router(report_jobs.router)
+app.include_router(report_schedules.router)
+app.include_router(report_snapshots.router)
+app.include_router(exports.router)
+app.include_router(jobs.router)
+app.include_router(tds.router)
 
 # Health check endpoint
 @app.get("/")
@@ -0,0 +1,27 @@
+-- Import Jobs Table
+-- Tracks background processing of large payout / investor upload files
+-- The upload request returns the job id immediately; a worker updates progress here
+
+CREATE TABLE IF NOT EXISTS import_jobs (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    job_type ENUM('payout_import', 'investor_import') NOT NULL,
+    file_name VARCHAR(255) NOT NULL,
+    status ENUM('queued', 'processing', 'completed', 'failed') NOT NULL DEFAULT 'queued',
+    total_rows INT DEFAULT 0,
+    processed_rows INT DEFAULT 0,
+    success_count INT DEFAULT 0,
+    error_count INT DEFAULT 0,
+    error_rows LONGTEXT COMMENT 'JSON list of rejected rows: sheet row, error, original values',
+    error_message TEXT COMMENT 'Fatal error when the whole job failed',
+    created_by INT NOT NULL,
+    created_by_name VARCHAR(255) NOT NULL,
+    created_by_role VARCHAR(50) NOT NULL,
+    created_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at DATETIME DEFAULT NULL,
+    completed_at DATETIME DEFAULT NULL,
+    updated_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    
+    INDEX idx_status (status),
+    INDEX idx_job_type (job_type),
+    INDEX idx_created_by (created_by, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,15 @@
+-- Canonical payout period for interest_payouts
+-- payout_month holds two string formats ("March 2026" and the legacy "2026-03"),
+-- so month filters had to match both strings and could never use a range scan.
+-- payout_period is the first day of the interest month as a real DATE.
+--
+-- Existing rows are backfilled in id-range chunks by backfill_payout_periods()
+-- (app/api/routes/payouts.py), which runs on startup and from
+-- scripts/backfill_payout_periods.py - a single UPDATE over the whole table
+-- would hold row locks for the entire run.
+
+ALTER TABLE interest_payouts
+    ADD COLUMN payout_period DATE NULL COMMENT 'First day of the interest month, e.g. 2026-03-01' AFTER payout_month;
+
+ALTER TABLE interest_payouts
+    ADD KEY idx_payout_period_series_investor (payout_period, series_id, investor_id);
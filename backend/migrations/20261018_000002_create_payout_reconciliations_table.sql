@@ -0,0 +1,22 @@
+-- Payout Reconciliations Table
+-- One row per bank statement reconciled against the expected interest payouts
+-- Matched payouts are marked Paid in interest_payouts, unmatched / ambiguous lines are kept here
+
+CREATE TABLE IF NOT EXISTS payout_reconciliations (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    file_name VARCHAR(255) NOT NULL,
+    window_days INT NOT NULL DEFAULT 3,
+    applied TINYINT(1) NOT NULL DEFAULT 0 COMMENT '0 = dry run, nothing was marked Paid',
+    total_lines INT DEFAULT 0,
+    matched_count INT DEFAULT 0,
+    applied_count INT DEFAULT 0,
+    already_paid_count INT DEFAULT 0,
+    exception_count INT DEFAULT 0,
+    matched_amount DECIMAL(15,2) DEFAULT 0.00,
+    exception_rows LONGTEXT COMMENT 'JSON list of unmatched / ambiguous / duplicate statement lines',
+    created_by INT NOT NULL,
+    created_by_name VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+
+    INDEX idx_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
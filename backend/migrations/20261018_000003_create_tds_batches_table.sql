@@ -0,0 +1,32 @@
+-- TDS Batches Table
+-- One row per annual TDS run: per-investor tax on the financial year's paid interest,
+-- certificate PDFs in one zip archive and a summary CSV (files live on the server)
+
+CREATE TABLE IF NOT EXISTS tds_batches (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    financial_year VARCHAR(7) NOT NULL COMMENT 'e.g. 2025-26',
+    status ENUM('queued', 'processing', 'completed', 'failed') NOT NULL DEFAULT 'queued',
+    investor_count INT DEFAULT 0,
+    certificate_total INT DEFAULT 0 COMMENT 'Investors with tax deducted',
+    certificate_count INT DEFAULT 0 COMMENT 'Certificates rendered so far',
+    total_interest DECIMAL(15,2) DEFAULT 0.00,
+    total_tds DECIMAL(15,2) DEFAULT 0.00,
+    archive_path VARCHAR(500) DEFAULT NULL,
+    summary_path VARCHAR(500) DEFAULT NULL,
+    error_message TEXT COMMENT 'Fatal error when the whole batch failed',
+    created_by INT NOT NULL,
+    created_by_name VARCHAR(255) NOT NULL,
+    created_by_role VARCHAR(50) NOT NULL,
+    created_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at DATETIME DEFAULT NULL,
+    completed_at DATETIME DEFAULT NULL,
+    updated_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    INDEX idx_financial_year (financial_year),
+    INDEX idx_status (status)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- The yearly aggregation reads paid payouts by paid_date range.
+-- Covering index: the grouped pass never touches the table rows.
+ALTER TABLE interest_payouts
+    ADD KEY idx_status_paid_date (status, paid_date, is_active, investor_id, amount);
@@ -0,0 +1,33 @@
+-- Report Jobs Table
+-- Reports generated in the background: the request returns a job id, a worker
+-- computes the report, writes the file and stores it locally or in S3
+
+CREATE TABLE IF NOT EXISTS report_jobs (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    report_key VARCHAR(50) NOT NULL COMMENT 'Report path under /reports, e.g. monthly-collection',
+    report_name VARCHAR(100) NOT NULL,
+    file_format ENUM('csv', 'excel', 'json') NOT NULL,
+    report_filters JSON DEFAULT NULL,
+    status ENUM('queued', 'processing', 'completed', 'failed') NOT NULL DEFAULT 'queued',
+    record_count INT DEFAULT 0,
+    file_name VARCHAR(255) DEFAULT NULL,
+    storage ENUM('local', 's3') DEFAULT NULL,
+    artifact_location VARCHAR(500) DEFAULT NULL COMMENT 'Local file path or S3 key',
+    file_size_kb DECIMAL(10,2) DEFAULT NULL,
+    generation_time_ms INT DEFAULT NULL,
+    error_message TEXT COMMENT 'Why the report could not be generated',
+    created_by INT NOT NULL,
+    created_by_name VARCHAR(255) NOT NULL,
+    created_by_role VARCHAR(50) NOT NULL,
+    created_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at DATETIME DEFAULT NULL,
+    completed_at DATETIME DEFAULT NULL,
+    updated_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    INDEX idx_status (status),
+    INDEX idx_created_by (created_by, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Report jobs can also produce the raw report data as JSON
+ALTER TABLE report_logs
+    MODIFY report_type ENUM('PDF', 'Excel', 'CSV', 'JSON') COLLATE utf8mb4_unicode_ci NOT NULL;
@@ -0,0 +1,34 @@
+-- Report Cache Table
+-- Rendered report files (CSV / xlsx / JSON) keyed by report, filters, format and
+-- a fingerprint of the source tables - an unchanged report is served from here.
+-- Least recently used entries are evicted once the total size exceeds the limit.
+
+CREATE TABLE IF NOT EXISTS report_cache (
+    cache_key CHAR(64) PRIMARY KEY COMMENT 'sha256 of report, filters, format, data fingerprint and day',
+    report_key VARCHAR(50) NOT NULL,
+    report_name VARCHAR(100) NOT NULL,
+    file_format ENUM('csv', 'excel', 'json') NOT NULL,
+    report_filters JSON DEFAULT NULL,
+    file_name VARCHAR(255) NOT NULL,
+    storage ENUM('local', 's3') NOT NULL,
+    artifact_location VARCHAR(500) NOT NULL COMMENT 'Local file path or S3 key',
+    size_bytes BIGINT NOT NULL,
+    record_count INT DEFAULT 0,
+    generation_time_ms INT DEFAULT NULL COMMENT 'Time the original generation took',
+    hit_count INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+    last_accessed_at DATETIME(3) NOT NULL,
+
+    INDEX idx_last_accessed (last_accessed_at),
+    INDEX idx_report_key (report_key)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Whether a generated report was served from the cache (NULL = not cacheable / not looked up)
+ALTER TABLE report_logs
+    ADD COLUMN cache_status ENUM('hit', 'miss') DEFAULT NULL AFTER status;
+
+-- The data fingerprint reads MAX(updated_at) per source table - keep it an index lookup
+ALTER TABLE investors ADD KEY idx_updated_at (updated_at);
+ALTER TABLE investments ADD KEY idx_updated_at (updated_at);
+ALTER TABLE interest_payouts ADD KEY idx_updated_at (updated_at);
+ALTER TABLE ncd_series ADD KEY idx_updated_at (updated_at);
@@ -0,0 +1,14 @@
+-- PDF Reports
+-- Reports can now be rendered as PDF on the server (downloads and background jobs).
+-- page_count records how many pages the PDF had.
+
+ALTER TABLE report_jobs
+    MODIFY COLUMN file_format ENUM('csv', 'excel', 'json', 'pdf') NOT NULL,
+    ADD COLUMN page_count INT DEFAULT NULL COMMENT 'PDF only' AFTER record_count;
+
+ALTER TABLE report_cache
+    MODIFY COLUMN file_format ENUM('csv', 'excel', 'json', 'pdf') NOT NULL,
+    ADD COLUMN page_count INT DEFAULT NULL COMMENT 'PDF only' AFTER record_count;
+
+ALTER TABLE report_logs
+    ADD COLUMN page_count INT DEFAULT NULL COMMENT 'PDF only' AFTER record_count;
@@ -0,0 +1,52 @@
+-- Report Fact Tables
+-- Pre-aggregated daily / monthly figures the trend reports read instead of
+-- re-aggregating investments, investors, interest_payouts and audit_logs on every call.
+-- Kept up to date by app/services/storage/report_facts.py (watermark refresh),
+-- rebuilt with scripts/rebuild_report_facts.py.
+
+CREATE TABLE IF NOT EXISTS fact_daily_investments (
+    day DATE NOT NULL COMMENT 'investments.date_received',
+    series_id INT NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    investment_count INT NOT NULL DEFAULT 0,
+    total_amount DECIMAL(17,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, series_id, status),
+    INDEX idx_series_day (series_id, day)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS fact_daily_new_investors (
+    day DATE NOT NULL PRIMARY KEY COMMENT 'DATE(investors.created_at)',
+    new_investors INT NOT NULL DEFAULT 0 COMMENT 'Registered that day',
+    active_investors INT NOT NULL DEFAULT 0 COMMENT 'Of those, still active'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS fact_monthly_payouts (
+    month DATE NOT NULL COMMENT 'interest_payouts.payout_period',
+    series_id INT NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    payout_count INT NOT NULL DEFAULT 0,
+    total_amount DECIMAL(17,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (month, series_id, status),
+    INDEX idx_series_month (series_id, month)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS fact_daily_audit_actions (
+    day DATE NOT NULL COMMENT 'DATE(audit_logs.timestamp)',
+    admin_role VARCHAR(50) NOT NULL,
+    action VARCHAR(255) NOT NULL,
+    action_count INT NOT NULL DEFAULT 0,
+    user_count INT NOT NULL DEFAULT 0 COMMENT 'Distinct admin_name that day',
+    PRIMARY KEY (day, admin_role, action)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS report_fact_watermarks (
+    fact_table VARCHAR(64) PRIMARY KEY,
+    changed_through DATETIME DEFAULT NULL COMMENT 'Source rows changed up to here are folded in',
+    last_source_id BIGINT DEFAULT NULL COMMENT 'Append-only sources - highest id folded in',
+    refreshed_at DATETIME DEFAULT NULL,
+    rebuilt_at DATETIME DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Recomputing a day reads the source by date - keep it a range scan
+ALTER TABLE investments ADD KEY idx_date_received_series (date_received, series_id);
+ALTER TABLE investors ADD KEY idx_created_at (created_at);
@@ -0,0 +1,5 @@
+-- Columnar Data Exports
+-- Super Admin dataset exports (Parquet / Arrow IPC) are logged in report_logs like reports.
+
+ALTER TABLE report_logs
+    MODIFY COLUMN report_type ENUM('PDF', 'Excel', 'CSV', 'JSON', 'Parquet', 'Arrow') NOT NULL;
@@ -0,0 +1,40 @@
+-- Report Schedules
+-- Standard regulatory reports precomputed overnight (app/services/jobs/report_scheduler.py).
+-- A due schedule queues an ordinary report job - the file is stored like any other job
+-- artifact, failures land in report_jobs and report_logs.
+-- period: previous_month fills the report's date filters with last month, current
+-- runs the report as of the run (reports without date filters).
+
+CREATE TABLE IF NOT EXISTS report_schedules (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    report_key VARCHAR(50) NOT NULL COMMENT 'Report path under /reports, e.g. rbi-compliance',
+    file_format ENUM('csv', 'excel', 'json', 'pdf') NOT NULL,
+    cron_spec VARCHAR(100) NOT NULL COMMENT 'minute hour day month weekday, server local time',
+    period ENUM('previous_month', 'current') NOT NULL DEFAULT 'current',
+    report_filters JSON DEFAULT NULL COMMENT 'Fixed filters, the period filters are added on top',
+    run_as_user_id INT DEFAULT NULL COMMENT 'User the report runs as - first active Super Admin when NULL',
+    is_active TINYINT(1) NOT NULL DEFAULT 1,
+    next_run_at DATETIME DEFAULT NULL,
+    last_run_at DATETIME DEFAULT NULL,
+    last_job_id INT DEFAULT NULL,
+    last_error TEXT COMMENT 'Why the last run could not be queued',
+    created_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    UNIQUE KEY unique_report_schedule (report_key, file_format, period),
+    INDEX idx_due (is_active, next_run_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Jobs queued by a schedule, and the period they cover
+ALTER TABLE report_jobs
+    ADD COLUMN schedule_id INT DEFAULT NULL AFTER report_filters,
+    ADD COLUMN report_period VARCHAR(20) DEFAULT NULL COMMENT 'e.g. 2026-09 for previous_month runs' AFTER schedule_id,
+    ADD INDEX idx_schedule (schedule_id, status, completed_at);
+
+-- Month-start packs, refreshed every night
+INSERT IGNORE INTO report_schedules (report_key, file_format, cron_spec, period) VALUES
+    ('rbi-compliance', 'pdf', '0 1 * * *', 'current'),
+    ('sebi-disclosure', 'pdf', '10 1 * * *', 'current'),
+    ('payout-statement', 'excel', '20 1 * * *', 'previous_month'),
+    ('monthly-collection', 'excel', '30 1 * * *', 'previous_month'),
+    ('series-maturity', 'excel', '40 1 * * *', 'current');
@@ -0,0 +1,6 @@
+-- Report Job Artifacts
+-- Cache eviction checks whether a report job still serves a file before deleting it
+-- (jobs completed from the cache point at the cached file).
+
+ALTER TABLE report_jobs
+    ADD INDEX idx_artifact_location (artifact_location(255));
@@ -0,0 +1,10 @@
+-- Report Job Heartbeat
+-- The process running a report job and when it last confirmed it is alive
+-- (app/services/jobs/job_heartbeat.py). Only jobs whose process stopped sending
+-- heartbeats are failed as interrupted - other live workers keep theirs.
+
+ALTER TABLE report_jobs
+    ADD COLUMN worker_id VARCHAR(100) DEFAULT NULL COMMENT 'host:pid:random of the owning process' AFTER status,
+    ADD COLUMN heartbeat_at DATETIME DEFAULT NULL AFTER worker_id,
+    ADD INDEX idx_worker (worker_id, status),
+    ADD INDEX idx_status_heartbeat (status, heartbeat_at);
@@ -0,0 +1,10 @@
+-- TDS Batch Heartbeat
+-- The process running a batch and when it last confirmed it is alive
+-- (app/services/jobs/job_heartbeat.py). A batch whose process died is failed
+-- instead of staying 'processing' forever.
+
+ALTER TABLE tds_batches
+    ADD COLUMN worker_id VARCHAR(100) DEFAULT NULL COMMENT 'host:pid:random of the owning process' AFTER status,
+    ADD COLUMN heartbeat_at DATETIME DEFAULT NULL AFTER worker_id,
+    ADD INDEX idx_worker (worker_id, status),
+    ADD INDEX idx_status_heartbeat (status, heartbeat_at);
@@ -0,0 +1,11 @@
+-- Report Cache Fingerprint Indexes
+-- The report cache fingerprint reads MAX(id) and MAX(change column) of every source
+-- table - index the remaining change columns so each is an index lookup and a cache
+-- hit costs the same however large the tables grow.
+
+ALTER TABLE series_compliance_status ADD KEY idx_updated_at (updated_at);
+ALTER TABLE grievances ADD KEY idx_updated_at (updated_at);
+ALTER TABLE investor_series ADD KEY idx_updated_at (updated_at);
+ALTER TABLE users ADD KEY idx_updated_at (updated_at);
+ALTER TABLE investor_documents ADD KEY idx_uploaded_at (uploaded_at);
+ALTER TABLE series_documents ADD KEY idx_uploaded_at (uploaded_at);
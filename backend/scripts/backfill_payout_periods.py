@@ -0,0 +1,48 @@
+"""
+Backfill Payout Periods Script
+==============================
+Fills interest_payouts.payout_period for rows stored before the column existed
+(migration 20261018_000001). Safe to run repeatedly - only NULL rows are touched.
+
+Usage:
+    python scripts/backfill_payout_periods.py [chunk_size]
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import get_db
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run_backfill(chunk_size: int):
+    """Backfill payout_period in id-range chunks"""
+    from app.api.routes.payouts import backfill_payout_periods
+
+    try:
+        db = get_db()
+        logger.info(f"🔄 Backfilling payout_period in chunks of {chunk_size}...")
+        updated = backfill_payout_periods(db, chunk_size)
+        logger.info(f"✅ Done - {updated} payout records updated")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Error backfilling payout periods: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return False
+
+
+if __name__ == "__main__":
+    from app.api.routes.payouts import PAYOUT_PERIOD_BACKFILL_CHUNK_SIZE
+
+    chunk_size = int(sys.argv[1]) if len(sys.argv) > 1 else PAYOUT_PERIOD_BACKFILL_CHUNK_SIZE
+    success = run_backfill(chunk_size)
+    sys.exit(0 if success else 1)
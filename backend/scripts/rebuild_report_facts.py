@@ -0,0 +1,60 @@
+"""
+Rebuild Report Facts Script
+===========================
+Rebuilds the report fact tables (migration 20261018_000007) from their source
+tables - for backfills, or after data was fixed by hand. The API keeps the facts
+current on its own; this is only needed when history changed underneath them.
+
+Usage:
+    python scripts/rebuild_report_facts.py [from_date YYYY-MM-DD] [fact_table ...]
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.database import get_db
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run_rebuild(from_date=None, fact_tables=None):
+    """Rebuild the fact tables (all, or the given ones) from from_date on"""
+    from app.services.storage.report_facts import rebuild_report_facts
+
+    try:
+        db = get_db()
+        logger.info(f"🔄 Rebuilding report facts{f' from {from_date}' if from_date else ''}...")
+        written = rebuild_report_facts(db, from_date, fact_tables)
+        for fact_table, rows in written.items():
+            logger.info(f"✅ {fact_table}: {rows} rows")
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ Error rebuilding report facts: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return False
+
+
+if __name__ == "__main__":
+    from app.services.storage.report_facts import REPORT_FACTS
+
+    args = sys.argv[1:]
+    from_date = None
+    if args and args[0] not in REPORT_FACTS:
+        from_date = datetime.strptime(args.pop(0), '%Y-%m-%d').date()
+
+    unknown = [name for name in args if name not in REPORT_FACTS]
+    if unknown:
+        logger.error(f"❌ Unknown fact table(s): {', '.join(unknown)} - expected one of {', '.join(REPORT_FACTS)}")
+        sys.exit(1)
+
+    success = run_rebuild(from_date, args or None)
+    sys.exit(0 if success else 1)
@@ -2106,6 +2106,17 @@ const ReportPreview = ({ reportName, onClose, onDownload, onReportGenerated }) =
           </div>
         )}
 
+        {reportData?.has_more && (
+          <div className="report-card">
+            <div className="card-content">
+              <p style={{ color: '#b45309', fontWeight: '600' }}>
+                Showing the first {reportData.investor_breakdown?.length || 0} investors only - the remaining
+                investors could not be loaded. Generate the report again or download it as a file for the full book.
+              </p>
+            </div>
+          </div>
+        )}
+
         {/* NEW TABLE: Investor Investments Summary - Shows each investor's investments per series */}
         {reportData?.investor_breakdown && reportData.investor_breakdown.length > 0 && (
           <div className="report-card">
@@ -44,6 +44,9 @@ const InterestPayout = () => {
     totalPayouts: 0,
     totalInvestorsCount: 0
   });
+  const [nextCursor, setNextCursor] = useState(null);
+  const [totalPayoutCount, setTotalPayoutCount] = useState(0);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [uniqueSeriesNames, setUniqueSeriesNames] = useState([]);
   const [uniqueSeriesForExport, setUniqueSeriesForExport] = useState([]);
   const [loading, setLoading] = useState(true);
@@ -72,6 +75,9 @@ const InterestPayout = () => {
     fetchPayoutData();
   }, [searchTerm, filterSeries]);
 
+  const PAYOUT_PAGE_SIZE = 100;
+
+  // First page of payouts + total count (backend pages with keyset cursors)
   const fetchPayoutData = async () => {
     try {
       setError(null);
@@ -80,13 +86,35 @@ const InterestPayout = () => {
       const seriesId = filterSeries === 'all' ? null : getSeriesIdByName(filterSeries);
       const search = searchTerm || null;
       
-      const response = await api.getAllPayouts(seriesId, null, search);
+      const [response, countResponse] = await Promise.all([
+        api.getAllPayouts(seriesId, null, search, { limit: PAYOUT_PAGE_SIZE }),
+        api.getPayoutCount(seriesId, null, search)
+      ]);
       setPayoutData(response.payouts || []);
+      setNextCursor(response.has_more ? response.next_cursor : null);
+      setTotalPayoutCount(countResponse.count || 0);
     } catch (err) {
       setError(err.message || 'Failed to fetch payouts');
     }
   };
 
+  const loadMorePayouts = async () => {
+    if (!nextCursor || loadingMore) return;
+    try {
+      setLoadingMore(true);
+      const seriesId = filterSeries === 'all' ? null : getSeriesIdByName(filterSeries);
+      const search = searchTerm || null;
+      
+      const response = await api.getAllPayouts(seriesId, null, search, { limit: PAYOUT_PAGE_SIZE, cursor: nextCursor });
+      setPayoutData(prev => [...prev, ...(response.payouts || [])]);
+      setNextCursor(response.has_more ? response.next_cursor : null);
+    } catch (err) {
+      setError(err.message || 'Failed to fetch payouts');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Helper to get series ID by name (from cached data)
   const getSeriesIdByName = (seriesName) => {
     if (!seriesName || seriesName === 'all') return null;
@@ -235,12 +263,31 @@ const InterestPayout = () => {
     }
   };
 
-  // Process uploaded Excel file
+  // Poll a background import job and map it to the import response shape
+  const waitForImportJob = async (jobId) => {
+    while (true) {
+      const job = await api.getJob(jobId);
+      if (job.status === 'completed' || job.status === 'failed') {
+        return {
+          success: job.status === 'completed' && job.success_count > 0,
+          message: job.error_message || `Processed ${job.success_count} payout(s). ${job.error_count} error(s) encountered.`,
+          updated_count: job.success_count,
+          error_count: job.error_count,
+          errors: job.errors || []
+        };
+      }
+      setImportStatus(`success:Processing file... ${job.progress_percent}%`);
+      await new Promise(resolve => setTimeout(resolve, 1500));
+    }
+  };
+
+  // Process uploaded Excel file (in a background job so large files don't time out)
   const handleImportSubmit = async () => {
 
     try {
       setImportStatus('');
-      const response = await api.importPayouts(uploadedFile);
+      const queued = await api.importPayoutsInBackground(uploadedFile);
+      const response = await waitForImportJob(queued.job_id);
       
       if (response.success) {
         setImportStatus(`success:Successfully imported ${response.updated_count} payout(s)`);
@@ -303,7 +350,7 @@ const InterestPayout = () => {
         documentType: 'Interest Payouts List',
         fileName: result.filename,
         format: 'CSV',
-        recordCount: payoutData.length
+        recordCount: totalPayoutCount
       }, user).catch(error => {
       });
     } catch (error) {
@@ -501,6 +548,16 @@ const InterestPayout = () => {
             </tbody>
           </table>
 
+          {/* Next page */}
+          {nextCursor && (
+            <div className="load-more-container" style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', gap: '12px', padding: '16px' }}>
+              <span>Showing {payoutData.length} of {totalPayoutCount}</span>
+              <button className="export-button" onClick={loadMorePayouts} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
+
           {/* No Results Message */}
           {payoutData.length === 0 && (
             <div className="no-results">
@@ -665,7 +722,7 @@ const InterestPayout = () => {
                     </button>
                     <input
                       type="file"
-                      accept=".xlsx,.xls"
+                      accept=".xlsx,.xls,.csv"
                       onChange={handleFileUpload}
                       id="payout-file-upload"
                       style={{ display: 'none' }}
@@ -773,6 +773,26 @@ class ApiService {
     return await this.request(`/investors/${investorId}/investments`);
   }
 
+  // Interest accrued on each investment up to asOf (YYYY-MM-DD, default today)
+  async getInvestorAccruedInterest(investorId, asOf = null) {
+    const query = asOf ? `?as_of=${asOf}` : '';
+    return await this.request(`/investors/${investorId}/accrued${query}`);
+  }
+
+  // Accrued interest for many investors (omit investorIds for the whole portfolio)
+  async getBulkAccruedInterest({ asOf = null, investorIds = null, seriesId = null, includeExited = false, includeInvestments = false } = {}) {
+    return await this.request('/investors/accrued', {
+      method: 'POST',
+      body: JSON.stringify({
+        as_of: asOf,
+        investor_ids: investorIds,
+        series_id: seriesId,
+        include_exited: includeExited,
+        include_investments: includeInvestments
+      })
+    });
+  }
+
   async uploadInvestorDocument(investorId, documentType, file) {
     const formData = new FormData();
     formData.append('document_type', documentType);
@@ -952,16 +972,41 @@ class ApiService {
   // ============================================
 
   // Get all payouts (main table view)
-  async getAllPayouts(seriesId = null, statusFilter = null, search = null) {
+  // Pass { limit, cursor, sort } to get one page at a time (response has next_cursor / has_more)
+  async getAllPayouts(seriesId = null, statusFilter = null, search = null, { limit = null, cursor = null, sort = null } = {}) {
     const queryParams = new URLSearchParams();
     if (seriesId) queryParams.append('series_id', seriesId);
     if (statusFilter) queryParams.append('status_filter', statusFilter);
     if (search) queryParams.append('search', search);
+    if (limit) queryParams.append('limit', limit);
+    if (cursor) queryParams.append('cursor', cursor);
+    if (sort) queryParams.append('sort', sort);
     
     const url = `/payouts${queryParams.toString() ? '?' + queryParams.toString() : ''}`;
     return await this.request(url);
   }
 
+  // Number of payouts matching the list filters (cheap - no rows)
+  async getPayoutCount(seriesId = null, statusFilter = null, search = null) {
+    const queryParams = new URLSearchParams();
+    if (seriesId) queryParams.append('series_id', seriesId);
+    if (statusFilter) queryParams.append('status_filter', statusFilter);
+    if (search) queryParams.append('search', search);
+    
+    const url = `/payouts/count${queryParams.toString() ? '?' + queryParams.toString() : ''}`;
+    return await this.request(url);
+  }
+
+  // Totals for the current month (count, investors, amount per status)
+  async getPayoutTotals(seriesId = null, search = null) {
+    const queryParams = new URLSearchParams();
+    if (seriesId) queryParams.append('series_id', seriesId);
+    if (search) queryParams.append('search', search);
+    
+    const url = `/payouts/totals${queryParams.toString() ? '?' + queryParams.toString() : ''}`;
+    return await this.request(url);
+  }
+
   // Get export payouts (for export modal)
   async getExportPayouts(seriesId = null, monthType = 'current') {
     const queryParams = new URLSearchParams();
@@ -972,6 +1017,15 @@ class ApiService {
     return await this.request(url);
   }
 
+  // Cash-flow forecast: interest + principal per payment month and per series
+  async getPayoutForecast(fromMonth = null, months = 12) {
+    const queryParams = new URLSearchParams();
+    if (fromMonth) queryParams.append('from', fromMonth);
+    queryParams.append('months', months);
+    
+    return await this.request(`/payouts/forecast?${queryParams.toString()}`);
+  }
+
   // Get payout summary statistics
   async getPayoutSummary() {
     return await this.request('/payouts/summary');
@@ -988,6 +1042,22 @@ class ApiService {
     });
   }
 
+  // Import payout data as a background job (returns job_id immediately)
+  async importPayoutsInBackground(file) {
+    const formData = new FormData();
+    formData.append('file', file);
+    
+    return await this.request('/payouts/import?background=true', {
+      method: 'POST',
+      body: formData
+    });
+  }
+
+  // Get background job status / progress
+  async getJob(jobId) {
+    return await this.request(`/jobs/${jobId}`);
+  }
+
   // Update payout status
   async updatePayoutStatus(payoutId, newStatus) {
     return await this.request(`/payouts/update-status/${payoutId}?new_status=${newStatus}`, {
@@ -995,6 +1065,21 @@ class ApiService {
     });
   }
 
+  // Bulk update payout status - by id list or by filters
+  // selection: { payoutIds } or { month: 'YYYY-MM', seriesId, currentStatus }
+  async bulkUpdatePayoutStatus(newStatus, { payoutIds = null, month = null, seriesId = null, currentStatus = null } = {}) {
+    return await this.request('/payouts/bulk-update-status', {
+      method: 'PUT',
+      body: JSON.stringify({
+        new_status: newStatus,
+        payout_ids: payoutIds,
+        month,
+        series_id: seriesId,
+        current_status: currentStatus
+      })
+    });
+  }
+
   // Download payouts as CSV (backend generates file)
   async downloadPayoutsCSV(seriesId = null, statusFilter = null) {
     const queryParams = new URLSearchParams();
@@ -1030,6 +1115,156 @@ class ApiService {
     return { success: true, filename };
   }
 
+  // Download NEFT/RTGS bank payment files as a zip (backend generates files)
+  async downloadBankPaymentFile({ layout = 'neft_csv', monthType = 'current', seriesId = null, maxRecords = null, valueDate = null } = {}) {
+    const queryParams = new URLSearchParams();
+    queryParams.append('layout', layout);
+    queryParams.append('month_type', monthType);
+    if (seriesId) queryParams.append('series_id', seriesId);
+    if (maxRecords) queryParams.append('max_records', maxRecords);
+    if (valueDate) queryParams.append('value_date', valueDate);
+    
+    const response = await fetch(`${API_BASE_URL}/payouts/download/bank-file?${queryParams.toString()}`, {
+      headers: this.getHeaders()
+    });
+    
+    if (!response.ok) {
+      throw new Error('Failed to generate bank payment file');
+    }
+    
+    const blob = await response.blob();
+    const downloadUrl = window.URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = downloadUrl;
+    
+    const contentDisposition = response.headers.get('Content-Disposition');
+    const filename = contentDisposition 
+      ? contentDisposition.split('filename=')[1].replace(/"/g, '')
+      : 'bank-payments.zip';
+    
+    a.download = filename;
+    a.click();
+    window.URL.revokeObjectURL(downloadUrl);
+    
+    return { success: true, filename };
+  }
+
+  // Bank payment file layouts available for download
+  async getBankFileLayouts() {
+    return await this.request('/payouts/bank-file-layouts');
+  }
+
+  // Reconcile a bank statement (.csv / .xlsx / MT940) - matched payouts are marked Paid
+  // apply=false previews the result without changing any payout
+  async reconcileBankStatement(file, { windowDays = 3, apply = true } = {}) {
+    const formData = new FormData();
+    formData.append('file', file);
+    
+    return await this.request(`/payouts/reconcile?window_days=${windowDays}&apply=${apply}`, {
+      method: 'POST',
+      body: formData
+    });
+  }
+
+  // Recent bank statement reconciliations
+  async getReconciliations(limit = 20) {
+    return await this.request(`/payouts/reconciliations?limit=${limit}`);
+  }
+
+  // Download unmatched / ambiguous statement lines of a reconciliation
+  async downloadReconciliationExceptions(reconciliationId, format = 'csv') {
+    const response = await fetch(`${API_BASE_URL}/payouts/reconciliations/${reconciliationId}/exceptions?format=${format}`, {
+      headers: this.getHeaders()
+    });
+    
+    if (!response.ok) {
+      throw new Error('Failed to download reconciliation exceptions');
+    }
+    
+    const blob = await response.blob();
+    const downloadUrl = window.URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = downloadUrl;
+    
+    const contentDisposition = response.headers.get('Content-Disposition');
+    const filename = contentDisposition 
+      ? contentDisposition.split('filename=')[1].replace(/"/g, '')
+      : `reconciliation-${reconciliationId}-exceptions.${format}`;
+    
+    a.download = filename;
+    a.click();
+    window.URL.revokeObjectURL(downloadUrl);
+    
+    return { success: true, filename };
+  }
+
+  // ============================================
+  // TDS CERTIFICATES
+  // ============================================
+
+  // TDS threshold / rate table (or the rule for one financial year, e.g. "2025-26")
+  async getTdsRates(financialYear = null) {
+    const query = financialYear ? `?financial_year=${encodeURIComponent(financialYear)}` : '';
+    return await this.request(`/tds/rates${query}`);
+  }
+
+  // Start the annual TDS batch - returns immediately, poll getTdsBatch for progress
+  async createTdsBatch(financialYear) {
+    return await this.request('/tds/batches', {
+      method: 'POST',
+      body: JSON.stringify({ financial_year: financialYear })
+    });
+  }
+
+  // Recent TDS batches (newest first)
+  async getTdsBatches(financialYear = null, limit = 20) {
+    const queryParams = new URLSearchParams();
+    if (financialYear) queryParams.append('financial_year', financialYear);
+    queryParams.append('limit', limit);
+    return await this.request(`/tds/batches?${queryParams.toString()}`);
+  }
+
+  // TDS batch status and progress
+  async getTdsBatch(batchId) {
+    return await this.request(`/tds/batches/${batchId}`);
+  }
+
+  // Download a completed TDS batch file (certificates archive or summary CSV)
+  async downloadTdsBatchFile(batchId, file = 'certificates') {
+    const response = await fetch(`${API_BASE_URL}/tds/batches/${batchId}/${file}`, {
+      headers: this.getHeaders()
+    });
+    
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({}));
+      throw new Error(error.detail || `Failed to download TDS ${file}`);
+    }
+    
+    const blob = await response.blob();
+    const downloadUrl = window.URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = downloadUrl;
+    
+    const contentDisposition = response.headers.get('Content-Disposition');
+    const filename = contentDisposition 
+      ? contentDisposition.split('filename=')[1].replace(/"/g, '')
+      : `tds-batch-${batchId}-${file}.${file === 'summary' ? 'csv' : 'zip'}`;
+    
+    a.download = filename;
+    a.click();
+    window.URL.revokeObjectURL(downloadUrl);
+    
+    return { success: true, filename };
+  }
+
+  async downloadTdsCertificates(batchId) {
+    return await this.downloadTdsBatchFile(batchId, 'certificates');
+  }
+
+  async downloadTdsSummary(batchId) {
+    return await this.downloadTdsBatchFile(batchId, 'summary');
+  }
+
   // Download export CSV (backend generates file)
   async downloadExportCSV(seriesId = null, monthType = 'current') {
     const queryParams = new URLSearchParams();
@@ -1143,8 +1378,27 @@ class ApiService {
     if (toDate) queryParams.append('to_date', toDate);
     if (investorId) queryParams.append('investor_id', investorId);
     if (seriesId) queryParams.append('series_id', seriesId);
-    const url = `/reports/investor-portfolio${queryParams.toString() ? '?' + queryParams.toString() : ''}`;
-    return await this.request(url);
+    queryParams.append('limit', 1000);
+    const report = await this.request(`/reports/investor-portfolio?${queryParams.toString()}`);
+
+    // The backend pages the investor book - follow next_cursor so the report covers every investor.
+    // If a page fails, has_more stays true and the preview shows the report as incomplete.
+    while (report.has_more && report.next_cursor) {
+      const pageParams = new URLSearchParams(queryParams);
+      pageParams.append('cursor', report.next_cursor);
+      try {
+        const page = await this.request(`/reports/investor-portfolio?${pageParams.toString()}`);
+        report.investor_breakdown.push(...(page.investor_breakdown || []));
+        report.detailed_investor_data.push(...(page.detailed_investor_data || []));
+        report.count = report.investor_breakdown.length;
+        report.has_more = page.has_more;
+        report.next_cursor = page.next_cursor;
+      } catch (error) {
+        console.error('Investor portfolio: could not load the next page of investors', error);
+        break;
+      }
+    }
+    return report;
   }
 
   async getKYCStatusReport() {
@@ -1237,6 +1491,40 @@ class ApiService {
     return await this.requestBlob(url);
   }
 
+  // ============================================
+  // REPORT JOBS (background generation)
+  // ============================================
+
+  // Reports that can be generated in the background, with their filters and formats
+  async getReportJobTypes() {
+    return await this.request('/reports/jobs/types');
+  }
+
+  // Queue a report - returns the job id immediately, poll getReportJob until completed
+  async createReportJob(report, format = 'excel', filters = {}) {
+    return await this.request('/reports/jobs', {
+      method: 'POST',
+      body: JSON.stringify({ report, format, filters })
+    });
+  }
+
+  // Recent report jobs of the current user
+  async getReportJobs(report = null, limit = 20) {
+    const queryParams = new URLSearchParams();
+    if (report) queryParams.append('report', report);
+    queryParams.append('limit', limit);
+    return await this.request(`/reports/jobs?${queryParams.toString()}`);
+  }
+
+  async getReportJob(jobId) {
+    return await this.request(`/reports/jobs/${jobId}`);
+  }
+
+  // File of a completed report job (Blob)
+  async downloadReportJob(jobId) {
+    return await this.requestBlob(`/reports/jobs/${jobId}/download`);
+  }
+
   // Helper method for blob requests
   async requestBlob(url) {
     const config = {